@@ -1,8 +1,9 @@
-__all__ = ["Result", "Watchdog"]
+__all__ = ["Result", "WorkspaceSnapshot", "Watchdog"]
 
 import os
-from typing import List, Dict, Any, Optional, Literal, Union
+from typing import List, Dict, Any, Optional, Literal, Union, Iterator
 from dbacademy.clients.dbrest import DBAcademyRestClient
+from dbacademy.clients.dbrest.accounts_client import AccountsClient
 
 # noinspection PyPep8Naming
 DISABLED = False
@@ -49,23 +50,118 @@ class Result:
         return string
 
 
+class WorkspaceSnapshot:
+    """
+    One workspace as seen by the Watchdog's analyzers. The workspace's policies, jobs, users and clusters are each fetched
+    once, on first use, and then shared by every analyzer; the results are collected until the workspace is done.
+    """
+
+    def __init__(self, *, _workspace: Dict[str, Any], _client: DBAcademyRestClient):
+        self.__workspace = _workspace
+        self.__client = _client
+        self.__results: List[Result] = list()
+
+        self.__policies: Optional[Dict[str, Dict[str, Any]]] = None
+        self.__jobs: Optional[List[Dict[str, Any]]] = None
+        self.__users: Optional[List[Dict[str, Any]]] = None
+        self.__clusters: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def workspace(self) -> Dict[str, Any]:
+        return self.__workspace
+
+    @property
+    def client(self) -> DBAcademyRestClient:
+        return self.__client
+
+    @property
+    def results(self) -> List[Result]:
+        return self.__results
+
+    @property
+    def workspace_name(self) -> str:
+        return self.workspace.get("workspace_name")
+
+    @property
+    def workspace_domain(self) -> str:
+        return Watchdog.to_workspace_domain(self.workspace_name)
+
+    @property
+    def workspace_endpoint(self) -> str:
+        return Watchdog.to_workspace_endpoint(self.workspace_name)
+
+    @property
+    def policies(self) -> Dict[str, Dict[str, Any]]:
+        """The workspace's cluster policies keyed by policy id."""
+        if self.__policies is None:
+            self.__policies = {p.get("policy_id"): p for p in self.client.cluster_policies.list()}
+        return self.__policies
+
+    @property
+    def jobs(self) -> List[Dict[str, Any]]:
+        if self.__jobs is None:
+            self.__jobs = self.client.jobs.list(expand_tasks=True)
+        return self.__jobs
+
+    @property
+    def users(self) -> List[Dict[str, Any]]:
+        if self.__users is None:
+            self.__users = self.client.scim.users.list()
+        return self.__users
+
+    @property
+    def clusters(self) -> List[Dict[str, Any]]:
+        if self.__clusters is None:
+            self.__clusters = self.client.clusters.list()
+        return self.__clusters
+
+    def log_error(self, _message: str, _failures: Union[str, List[str]], _scope: str = None) -> None:
+        if type(_failures) is str:
+            _failures = [_failures]
+
+        self.__results.append(Result(_result_type="ERROR",
+                                     _workspace_name=self.workspace_name,
+                                     _workspace_endpoint=self.workspace_endpoint,
+                                     _message=_message,
+                                     _scope=_scope,
+                                     _failures=_failures))
+
+    def log_warning(self, _message: str) -> None:
+        self.__results.append(Result(_result_type="WARNING",
+                                     _workspace_name=self.workspace_name,
+                                     _workspace_endpoint=self.workspace_endpoint,
+                                     _message=_message))
+
+    def log_info(self, message: str) -> None:
+        self.__results.append(Result(_result_type="INFO",
+                                     _workspace_name=self.workspace_name,
+                                     _workspace_endpoint=self.workspace_endpoint,
+                                     _message=message))
+
+
 class Watchdog:
-    def __init__(self):
-        from dbacademy.common import Cloud
-        from dbacademy.clients.dbrest import accounts_client
+    def __init__(self, max_workers: int = 16, accounts_client: AccountsClient = None):
+        from dbacademy.common import Cloud, validate
+        from dbacademy.clients.rest.transport import Transport
 
         self.__results: List[Result] = list()
+        self.__max_workers = validate(max_workers=max_workers).required.int(min_value=1)
 
-        self.__workspace_client: Optional[DBAcademyRestClient] = None
-        self.__workspace: Optional[Dict[str, Any]] = None
+        # One set of connection pools, one per workspace being scanned concurrently, shared by every workspace's client.
+        self.__transport = Transport(pool_connections=self.__max_workers)
 
         self.__username = os.environ.get("WORKSPACE_SETUP_PROSVC_USERNAME")
         self.__password = os.environ.get("WORKSPACE_SETUP_PROSVC_PASSWORD")
 
-        self.accounts_client = accounts_client.from_args(cloud=Cloud.AWS,
-                                                         account_id=os.environ.get("WORKSPACE_SETUP_PROSVC_ACCOUNT_ID"),
-                                                         username=self.username,
-                                                         password=self.password)
+        if accounts_client is None:
+            from dbacademy.clients.dbrest import accounts_client as accounts
+
+            accounts_client = accounts.from_args(cloud=Cloud.AWS,
+                                                 account_id=os.environ.get("WORKSPACE_SETUP_PROSVC_ACCOUNT_ID"),
+                                                 username=self.username,
+                                                 password=self.password)
+
+        self.accounts_client = validate(accounts_client=accounts_client).required.as_type(AccountsClient)
 
     @property
     def username(self) -> str:
@@ -76,43 +172,49 @@ class Watchdog:
         return self.__password
 
     @property
-    def workspace_client(self) -> DBAcademyRestClient:
-        return self.__workspace_client
+    def max_workers(self) -> int:
+        return self.__max_workers
 
     @property
-    def workspace(self) -> Optional[Dict[str, Any]]:
-        return self.__workspace
+    def results(self) -> List[Result]:
+        return self.__results
 
-    @property
-    def workspace_name(self) -> str:
-        return self.workspace.get("workspace_name")
-
-    @property
-    def workspace_domain(self) -> str:
-        if self.workspace_name == "survey-dashboards":
+    @staticmethod
+    def to_workspace_domain(workspace_name: str) -> str:
+        if workspace_name == "survey-dashboards":
             return "training-surveys"
-        elif self.workspace_name == "trainers":
+        elif workspace_name == "trainers":
             return "training"
         else:
-            return f"training-{self.workspace_name}"
+            return f"training-{workspace_name}"
 
-    @property
-    def workspace_endpoint(self) -> str:
-        return f"https://{self.workspace_domain}.cloud.databricks.com"
+    @staticmethod
+    def to_workspace_endpoint(workspace_name: str) -> str:
+        return f"https://{Watchdog.to_workspace_domain(workspace_name)}.cloud.databricks.com"
 
-    def __analyse_serving_endpoints(self):
-        modern_endpoints = self.workspace_client.serving_endpoints.list()
-        mlflow_endpoints = self.workspace_client.ml.mlflow_endpoints.list()
+    def create_client(self, workspace_name: str) -> DBAcademyRestClient:
+        """The client for the named workspace, using the Watchdog's credentials and shared connection pools."""
+        from dbacademy.clients import dbrest
+
+        return dbrest.from_args(endpoint=self.to_workspace_endpoint(workspace_name),
+                                username=self.__username,
+                                password=self.__password,
+                                transport=self.__transport)
+
+    @staticmethod
+    def __analyse_serving_endpoints(snapshot: WorkspaceSnapshot):
+        modern_endpoints = snapshot.client.serving_endpoints.list()
+        mlflow_endpoints = snapshot.client.ml.mlflow_endpoints.list()
         if len(modern_endpoints) > 0 or len(mlflow_endpoints) > 0:
-            self.__log_error(f"Serving Endpoints: {len(modern_endpoints)} ({len(mlflow_endpoints)})", "ML-SERVING-RUNNING")
+            snapshot.log_error(f"Serving Endpoints: {len(modern_endpoints)} ({len(mlflow_endpoints)})", "ML-SERVING-RUNNING")
 
-    def ___analyse_workflows(self, _pause: bool):
+    @staticmethod
+    def ___analyse_workflows(snapshot: WorkspaceSnapshot, _pause: bool):
         from datetime import datetime
 
         max_hours = 4
-        jobs = self.workspace_client.jobs.list(expand_tasks=True)
 
-        for job in jobs:
+        for job in snapshot.jobs:
             job_id = job.get("job_id")
             creator = job.get("creator_user_name")
 
@@ -137,9 +239,9 @@ class Watchdog:
 
             if name in ["DBAcademy Workspace-Setup"]:
                 continue
-            elif self.workspace_name == "trainers" and name in ["DBAcademy Workspace-Setup"]:
+            elif snapshot.workspace_name == "trainers" and name in ["DBAcademy Workspace-Setup"]:
                 continue
-            elif self.workspace_name == "survey-dashboards" and name in ["daily_refresh_of_DLT"]:
+            elif snapshot.workspace_name == "survey-dashboards" and name in ["daily_refresh_of_DLT"]:
                 continue
 
             failed = False
@@ -170,30 +272,31 @@ class Watchdog:
 
             if schedule_failure is not None and _pause:
                 message += f"\n  | Paused schedule."
-                self.workspace_client.jobs.update_schedule(job_id=job_id,
-                                                           paused=True,
-                                                           quartz_cron_expression=None,
-                                                           timezone_id=None)
+                snapshot.client.jobs.update_schedule(job_id=job_id,
+                                                     paused=True,
+                                                     quartz_cron_expression=None,
+                                                     timezone_id=None)
             if continuous_failure is not None and _pause:
                 message += f"\n  | Paused continuous."
-                self.workspace_client.jobs.update_continuous(job_id=job_id, paused=True)
+                snapshot.client.jobs.update_continuous(job_id=job_id, paused=True)
 
             if trigger_paused is not None and _pause:
                 message += f"\n  | Paused trigger."
-                self.workspace_client.jobs.update_trigger(job_id=job_id,
-                                                          paused=True,
-                                                          url=None,
-                                                          min_time_between_triggers_seconds=None,
-                                                          wait_after_last_change_seconds=None)
+                snapshot.client.jobs.update_trigger(job_id=job_id,
+                                                    paused=True,
+                                                    url=None,
+                                                    min_time_between_triggers_seconds=None,
+                                                    wait_after_last_change_seconds=None)
 
             if failed:
-                self.__log_error(message, _scope="JOBS", _failures=failures)
+                snapshot.log_error(message, _scope="JOBS", _failures=failures)
 
-    def __analyse_clusters(self, _terminate: bool):
+    @staticmethod
+    def __analyse_clusters(snapshot: WorkspaceSnapshot, _terminate: bool):
         from datetime import datetime
         from dbacademy.dbhelper import dbh_constants
 
-        clusters = [c for c in self.workspace_client.clusters.list() if c.get("state") not in ["TERMINATED"]]
+        clusters = [c for c in snapshot.clusters if c.get("state") not in ["TERMINATED"]]
         if len(clusters) > 0:
             for cluster in clusters:
                 cluster_name = cluster.get("cluster_name")
@@ -205,7 +308,7 @@ class Watchdog:
                 num_workers = cluster.get("num_workers")
                 cluster_source = cluster.get("cluster_source")
                 policy_id = cluster.get("policy_id")
-                policy = None if policy_id is None else self.workspace_client.cluster_policies.get_by_id(policy_id)
+                policy = None if policy_id is None else snapshot.policies.get(policy_id)
                 policy_name = None if policy is None else policy.get("name")
 
                 restarted_time_ep = cluster.get("last_restarted_time") / 1000
@@ -241,39 +344,39 @@ class Watchdog:
                     message += f"\n  | CLUSTER TERMINATION ABORTED"
 
                 if failed:
-                    self.__log_error(message, _scope="CLUSTERS", _failures=failures)
+                    snapshot.log_error(message, _scope="CLUSTERS", _failures=failures)
                 elif hours < 2:
-                    self.__log_info(f"""\n{state[0]}{state[1:].lower()} Cluster: "{cluster_name}" ({hours:.3} hours)""")
+                    snapshot.log_info(f"""\n{state[0]}{state[1:].lower()} Cluster: "{cluster_name}" ({hours:.3} hours)""")
                 elif hours < 9:
-                    self.__log_warning(message)
+                    snapshot.log_warning(message)
                 else:
                     failures.append("UNKNOWN")
-                    self.__log_error(message, _scope="CLUSTERS", _failures=failures)
+                    snapshot.log_error(message, _scope="CLUSTERS", _failures=failures)
 
-    def __analyse_users(self, _add_missing_users: bool):
+    @staticmethod
+    def __analyse_users(snapshot: WorkspaceSnapshot, _add_missing_users: bool):
         import copy
 
         found_users = copy.deepcopy(_found_users)
-        users = self.workspace_client.scim.users.list()
 
-        for user in users:
+        for user in snapshot.users:
             username = user.get("userName")
 
             if username in found_users.keys():
                 found_users[username] = True
 
-            elif not username.endswith("@databricks.com") and self.workspace_name not in ["trainers"]:
-                self.__log_error(f"Unauthorized user: {username}", _failures=["USERS-NOT-DB"])
+            elif not username.endswith("@databricks.com") and snapshot.workspace_name not in ["trainers"]:
+                snapshot.log_error(f"Unauthorized user: {username}", _failures=["USERS-NOT-DB"])
 
         for username, found in found_users.items():
             if not found and _add_missing_users:
-                self.__log_info(f"Added user {username}")
-                user = self.workspace_client.scim.users.create(username)
+                snapshot.log_info(f"Added user {username}")
+                user = snapshot.client.scim.users.create(username)
                 user_id = user.get("id")
 
-                admins = self.workspace_client.scim.groups.get_by_name("admins")
+                admins = snapshot.client.scim.groups.get_by_name("admins")
                 admin_id = admins.get("id")
-                self.workspace_client.scim.groups.add_member(admin_id, user_id)
+                snapshot.client.scim.groups.add_member(admin_id, user_id)
 
     def __analyse_workspace(self, *,
                             _workspace: Dict[str, Any],
@@ -282,80 +385,73 @@ class Watchdog:
                             _analyse_workflows: bool,
                             _pause_workflow: bool,
                             _analyse_clusters: bool,
-                            _terminate_clusters: bool):
-
-        from dbacademy.clients import dbrest
-        self.__workspace = _workspace
-        self.__workspace_client = dbrest.from_args(endpoint=self.workspace_endpoint, username=self.__username, password=self.__password)
+                            _terminate_clusters: bool) -> WorkspaceSnapshot:
 
-        workspace_name = _workspace.get("workspace_name")
-        print(f"* Processing workspace {workspace_name}")
+        client = self.create_client(_workspace.get("workspace_name"))
+        snapshot = WorkspaceSnapshot(_workspace=_workspace, _client=client)
 
-        if _analyse_users:
-            self.__analyse_users(_add_missing_users=True)
+        try:
+            if _analyse_users:
+                self.__analyse_users(snapshot, _add_missing_users=True)
 
-        if _analyse_serving_endpoints:
-            self.__analyse_serving_endpoints()
+            if _analyse_serving_endpoints:
+                self.__analyse_serving_endpoints(snapshot)
 
-        if _analyse_workflows:
-            self.___analyse_workflows(_pause=_pause_workflow)
+            if _analyse_workflows:
+                self.___analyse_workflows(snapshot, _pause=_pause_workflow)
 
-        if _analyse_clusters:
-            self.__analyse_clusters(_terminate=_terminate_clusters)
+            if _analyse_clusters:
+                self.__analyse_clusters(snapshot, _terminate=_terminate_clusters)
 
-    def __log_error(self, _message: str, _failures: Union[str, List[str]], _scope: str = None) -> None:
-        if type(_failures) is str:
-            _failures = [_failures]
+        except Exception as e:
+            # One unreachable workspace must not end the scan of all the others.
+            snapshot.log_error(f"Analysis failed: {type(e).__name__}: {e}", _failures=["WORKSPACE-FAILED"])
 
-        result = Result(_result_type="ERROR",
-                        _workspace_name=self.workspace_name,
-                        _workspace_endpoint=self.workspace_endpoint,
-                        _message=_message,
-                        _scope=_scope,
-                        _failures=_failures)
+        return snapshot
 
-        self.__results.append(result)
-        print(result)
+    def scan(self, workspace_filter: List[str] = None) -> Iterator[WorkspaceSnapshot]:
+        """
+        Analyses the account's workspaces, max_workers at a time, yielding each workspace as soon as its analysis
+        completes, whether or not it has results.
+        :param workspace_filter: the names of the workspaces to analyse or None for all of them.
+        :return: the analysed workspaces, in the order they completed.
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
 
-    def __log_warning(self, _message: str) -> None:
-        result = Result(_result_type="WARNING",
-                        _workspace_name=self.workspace_name,
-                        _workspace_endpoint=self.workspace_endpoint,
-                        _message=_message)
+        workspaces = self.accounts_client.workspaces.list()
 
-        self.__results.append(result)
-        print(result)
+        if workspace_filter:
+            workspaces = [w for w in workspaces if w.get("workspace_name") in workspace_filter]
 
-    def __log_info(self, message: str) -> None:
-        result = Result(_result_type="INFO",
-                        _workspace_name=self.workspace_name,
-                        _workspace_endpoint=self.workspace_endpoint,
-                        _message=message)
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="dbacademy-watchdog") as executor:
+            futures = [executor.submit(self.__analyse_workspace,
+                                       _workspace=workspace,
+                                       _analyse_users=True,
+                                       _analyse_serving_endpoints=True,
+                                       _analyse_workflows=True,
+                                       _pause_workflow=True,
+                                       _analyse_clusters=True,
+                                       _terminate_clusters=True) for workspace in workspaces]
 
-        self.__results.append(result)
-        print(result)
+            for future in as_completed(futures):
+                snapshot = future.result()
+                self.__results.extend(snapshot.results)
+                yield snapshot
 
     def analyse(self) -> None:
         print()
 
         count = 0
-        workspaces = self.accounts_client.workspaces.list()
         workspace_filter = None  # ["classroom-868-83vgw"]
 
-        for workspace in workspaces:
+        for snapshot in self.scan(workspace_filter=workspace_filter):
             count += 1
-            workspace_name = workspace.get("workspace_name")
-            if workspace_filter and workspace_name not in workspace_filter:
-                continue
+            print(f"* Processed workspace {snapshot.workspace_name}")
+            for result in snapshot.results:
+                print(result)
 
-            self.__analyse_workspace(_workspace=workspace,
-                                     _analyse_users=True,
-                                     _analyse_serving_endpoints=True,
-                                     _analyse_workflows=True,
-                                     _pause_workflow=True,
-                                     _analyse_clusters=True,
-                                     _terminate_clusters=True)
         print(f"Processed {count} workspaces")
 
 
-Watchdog().analyse()
+if __name__ == "__main__":
+    Watchdog().analyse()
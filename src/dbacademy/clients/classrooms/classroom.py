@@ -85,7 +85,24 @@ class Classroom(object):
 
     #     self.databricks.clusters.delete(my_cluster_id)
 
-    def delete_folder(self, folder_name, last_student=None, first_student=0):
+    def __for_each_student(self, first_student, last_student, function, max_workers):
+        """
+        Applies function to the folder path of each student, max_workers students at a time. The first failure, if any,
+        is raised once every student was processed.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        if last_student is None:
+            last_student = self.num_students
+        user_names = [self.username_pattern.format(student_number=i) for i in range(first_student, last_student + 1)]
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dbacademy-classroom") as executor:
+            futures = [executor.submit(function, user_name) for user_name in user_names]
+
+        for future in futures:
+            future.result()
+
+    def delete_folder(self, folder_name, last_student=None, first_student=0, max_workers=8):
         """
         Remove folder from student directories.
         This is typically used to delete old courseware prior to uploading a new version.
@@ -93,16 +110,14 @@ class Classroom(object):
         >>> classroom = Classroom()
         >>> classroom.delete_folder("Spark-ILT")
         """
-        if last_student is None:
-            last_student = self.num_students
-        for i in range(first_student, last_student + 1):
-            user_name = self.username_pattern.format(student_number=i)
-            folder_path = f"/Users/{user_name}/{folder_name}"
-            self.databricks.workspace.delete(folder_path)
+        def delete(user_name):
+            self.databricks.workspace.delete(f"/Users/{user_name}/{folder_name}")
 
-    def upload_dbc(self, source_url, folder_name=None, last_student=None, first_student=0):
+        self.__for_each_student(first_student, last_student, delete, max_workers)
+
+    def upload_dbc(self, source_url, folder_name=None, last_student=None, first_student=0, max_workers=8):
         """
-        Upload courseware.
+        Upload courseware. The DBC is downloaded once and then imported for max_workers students at a time.
 
         >>> classroom = Classroom()
         >>> classroom.upload_dbc("https://files.training.databricks.com/courses/spark-ilt/Lessons.dbc", \
@@ -110,14 +125,14 @@ class Classroom(object):
         """
         if folder_name is None:
             folder_name = self.extract_filename(source_url)
-        if last_student is None:
-            last_student = self.num_students
         content = self.databricks.workspace.read_data_from_url(source_url, format="DBC")
-        for i in range(first_student, last_student + 1):
-            user_name = self.username_pattern.format(student_number=i)
+
+        def upload(user_name):
             folder_path = f"/Users/{user_name}/{folder_name}"
             self.databricks.workspace.import_from_data(content, folder_path, format="DBC", if_exists="ignore")
 
+        self.__for_each_student(first_student, last_student, upload, max_workers)
+
     def create_users(self, last_student=None, first_student=0, allow_cluster_create=False):
         """
         Add users class+000@databricks.com to class+050@databricks.com (or whatever limit is set by last_student).
@@ -1003,7 +1003,8 @@ class Commands(object):
                 return {"Cluster": cluster["cluster_name"], "Error": str(ex)}
 
         from multiprocessing.pool import ThreadPool
-        with ThreadPool(100) as pool:
+        # Threads beyond the transport's pooled connections to the workspace would only wait for one.
+        with ThreadPool(ws.transport.pool_maxsize) as pool:
             results = pool.map(update_cluster, ws.clusters.list())
         return [r for r in results if r is not None]
 
@@ -1075,8 +1076,14 @@ def scan_workspaces(function: Callable[[Workspace], Any], workspaces: List[Datab
     #     except Exception as e:
     #       yield (w, None, e)
 
+    # Each workspace is scanned through its transport's connection pool, so the fan-out is bounded by the pooled
+    # connections of the transports in use, e.g. one pool_maxsize when every workspace shares the same transport.
+    workspaces = list(workspaces)
+    transports = {id(w.transport): w.transport for w in workspaces}.values()
+    max_workers = max(1, min(len(workspaces), sum(t.pool_maxsize for t in transports)))
+
     from multiprocessing.pool import ThreadPool
-    with ThreadPool(500) as pool:
+    with ThreadPool(max_workers) as pool:
         map_results = pool.map(lambda w: list(check_workspace(w)), workspaces)
 
     # Determine the schema for the results and turn it into a pretty dataframe cs
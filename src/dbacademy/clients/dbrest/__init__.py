@@ -1,7 +1,10 @@
 __all__ = ["DBAcademyRestClient", "from_args", "from_notebook", "from_auth_header", "from_client", "from_token", "from_username"]
 
 from typing import Optional
-from dbacademy.clients.rest.common import ApiClient
+from dbacademy.common import Schema
+from dbacademy.clients.rest.common import ApiClient, cached_api
+from dbacademy.clients.rest.transport import Transport
+from dbacademy.clients.rest.rate_limiter import RateLimiter
 from dbacademy.clients import ClientErrorHandler
 from dbacademy.clients.dbrest.secrets_api import SecretsApi
 from dbacademy.clients.dbrest.clusters_api import ClustersApi
@@ -60,6 +63,9 @@ constants = Constants()
 class DBAcademyRestClient(ApiClient):
     """Databricks Academy REST API client."""
 
+    # The remaining parameters are validated by ApiClient.__init__
+    __SCHEMA = Schema(endpoint=Schema.required.str())
+
     def __init__(self, *,
                  token: Optional[str],
                  endpoint:  Optional[str],
@@ -69,7 +75,9 @@ class DBAcademyRestClient(ApiClient):
                  client:  Optional[ApiClient],
                  verbose: Optional[bool],
                  throttle_seconds: Optional[int],
-                 error_handler: Optional[ClientErrorHandler]):
+                 error_handler: Optional[ClientErrorHandler],
+                 transport: Optional[Transport] = None,
+                 rate_limiter: Optional[RateLimiter] = None):
         """
         Create a Databricks REST API client.
 
@@ -84,9 +92,9 @@ class DBAcademyRestClient(ApiClient):
                 By default, it's generated from the token or password.
             client: A parent ApiClient from which to clone settings.
             throttle_seconds: Number of seconds to sleep between requests.
+            transport: The connection pools to send requests through.  Defaults to the client's transport, if specified.
+            rate_limiter: The RateLimiter metering requests.  Defaults to the client's rate_limiter, if specified.
         """
-        from dbacademy.common import validate
-
         if client is not None:
             # We have a valid client, use it to initialize from.
             authorization_header = authorization_header or client.authorization_header
@@ -99,8 +107,7 @@ class DBAcademyRestClient(ApiClient):
                 if username is None and password is None:
                     token = token or client.token
 
-        validate(endpoint=endpoint).required.str()
-        endpoint = endpoint.rstrip("/")
+        endpoint = self.__SCHEMA.check("endpoint", endpoint).rstrip("/")
         endpoint = endpoint.rstrip("/api")
 
         super().__init__(endpoint,
@@ -111,77 +118,79 @@ class DBAcademyRestClient(ApiClient):
                          client=client,
                          verbose=verbose,
                          throttle_seconds=throttle_seconds,
-                         error_handler=error_handler)
+                         error_handler=error_handler,
+                         transport=transport,
+                         rate_limiter=rate_limiter)
 
-    @property
+    @cached_api
     def clusters(self) -> ClustersApi:
         return ClustersApi(self)
 
-    @property
+    @cached_api
     def cluster_policies(self) -> ClustersPolicyApi:
         return ClustersPolicyApi(self)
 
-    @property
+    @cached_api
     def instance_pools(self) -> InstancePoolsApi:
         return InstancePoolsApi(self)
 
-    @property
+    @cached_api
     def jobs(self) -> JobsApi:
         return JobsApi(self)
 
-    @property
+    @cached_api
     def ml(self) -> MlApi:
         return MlApi(self)
 
-    @property
+    @cached_api
     def permissions(self) -> PermissionsApi:
         return PermissionsApi(self)
 
-    @property
+    @cached_api
     def pipelines(self) -> PipelinesApi:
         return PipelinesApi(self)
 
-    @property
+    @cached_api
     def repos(self) -> ReposApi:
         return ReposApi(self)
 
-    @property
+    @cached_api
     def runs(self) -> RunsApi:
         return RunsApi(self)
 
-    @property
+    @cached_api
     def scim(self) -> ScimApi:
         return ScimApi(self)
 
-    @property
+    @cached_api
     def sql(self) -> SqlApi:
         return SqlApi(self)
 
-    @property
+    @cached_api
     def tokens(self) -> TokensApi:
         return TokensApi(self)
 
-    @property
+    @cached_api
     def token_management(self) -> TokenManagementApi:
         return TokenManagementApi(self)
 
-    @property
+    @cached_api
     def uc(self) -> UcApi:
         return UcApi(self)
 
-    @property
+    @cached_api
     def workspace(self) -> WorkspaceApi:
         return WorkspaceApi(self)
 
-    @property
+    @cached_api
     def workspace_config(self) -> WorkspaceConfigApi:
         return WorkspaceConfigApi(self)
 
-    @property
+    @cached_api
     def serving_endpoints(self) -> ServingEndpointsApi:
         return ServingEndpointsApi(self)
 
-    @property
+    @cached_api
     def secrets(self) -> SecretsApi:
         return SecretsApi(self)
 
@@ -207,7 +216,9 @@ def from_args(*,
               # Common parameters
               verbose: bool = False,
               throttle_seconds: int = 0,
-              error_handler: ClientErrorHandler = ClientErrorHandler()) -> DBAcademyRestClient:
+              error_handler: ClientErrorHandler = ClientErrorHandler(),
+              transport: Transport = None,
+              rate_limiter: RateLimiter = None) -> DBAcademyRestClient:
 
     return DBAcademyRestClient(token=token,
                                endpoint=endpoint,
@@ -217,7 +228,9 @@ def from_args(*,
                                client=client,
                                verbose=verbose,
                                throttle_seconds=throttle_seconds,
-                               error_handler=error_handler)
+                               error_handler=error_handler,
+                               transport=transport,
+                               rate_limiter=rate_limiter)
 
 
 def from_username(*,
@@ -228,14 +241,16 @@ def from_username(*,
                   scope: str = constants.DEFAULT_SCOPE,
                   verbose: bool = False,
                   throttle_seconds: int = 0,
-                  error_handler: ClientErrorHandler = ClientErrorHandler()) -> DBAcademyRestClient:
+                  error_handler: ClientErrorHandler = ClientErrorHandler(),
+                  transport: Transport = None) -> DBAcademyRestClient:
 
     return from_args(endpoint=__load(constants.ENDPOINT, endpoint, scope),
                      username=__load(constants.USERNAME, username, scope),
                      password=__load(constants.PASSWORD, password, scope),
                      verbose=verbose,
                      throttle_seconds=throttle_seconds,
-                     error_handler=error_handler)
+                     error_handler=error_handler,
+                     transport=transport)
 
 
 def from_token(token: str = None,
@@ -244,13 +259,15 @@ def from_token(token: str = None,
                scope: str = constants.DEFAULT_SCOPE,
                verbose: bool = False,
                throttle_seconds: int = 0,
-               error_handler: ClientErrorHandler = ClientErrorHandler()) -> DBAcademyRestClient:
+               error_handler: ClientErrorHandler = ClientErrorHandler(),
+               transport: Transport = None) -> DBAcademyRestClient:
 
     return from_args(endpoint=__load(constants.ENDPOINT, endpoint, scope),
                      token=__load(constants.TOKEN, token, scope),
                      verbose=verbose,
                      throttle_seconds=throttle_seconds,
-                     error_handler=error_handler)
+                     error_handler=error_handler,
+                     transport=transport)
 
 
 def from_auth_header(*,
@@ -260,13 +277,15 @@ def from_auth_header(*,
                      scope: str = constants.DEFAULT_SCOPE,
                      verbose: bool = False,
                      throttle_seconds: int = 0,
-                     error_handler: ClientErrorHandler = ClientErrorHandler()) -> DBAcademyRestClient:
+                     error_handler: ClientErrorHandler = ClientErrorHandler(),
+                     transport: Transport = None) -> DBAcademyRestClient:
 
     return from_args(endpoint=__load(constants.ENDPOINT, endpoint, scope),
                      authorization_header=__load(constants.AUTH_HEADER, authorization_header, scope),
                      verbose=verbose,
                      throttle_seconds=throttle_seconds,
-                     error_handler=error_handler)
+                     error_handler=error_handler,
+                     transport=transport)
 
 
 def from_client(client: ApiClient) -> DBAcademyRestClient:
@@ -276,17 +295,21 @@ def from_client(client: ApiClient) -> DBAcademyRestClient:
                      # Common parameters
                      verbose=client.verbose,
                      throttle_seconds=client.throttle_seconds,
-                     error_handler=client.error_handler)
+                     error_handler=client.error_handler,
+                     transport=client.transport,
+                     rate_limiter=client.rate_limiter)
 
 
 def from_notebook(*,
                   verbose: bool = False,
                   throttle_seconds: int = 0,
-                  error_handler: ClientErrorHandler = ClientErrorHandler()) -> DBAcademyRestClient:
+                  error_handler: ClientErrorHandler = ClientErrorHandler(),
+                  transport: Transport = None) -> DBAcademyRestClient:
     from dbacademy import dbgems
 
     return from_args(token=dbgems.get_notebooks_api_token(),
                      endpoint=dbgems.get_notebooks_api_endpoint(),
                      verbose=verbose,
                      throttle_seconds=throttle_seconds,
-                     error_handler=error_handler)
+                     error_handler=error_handler,
+                     transport=transport)
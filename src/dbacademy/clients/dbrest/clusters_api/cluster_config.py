@@ -2,7 +2,7 @@ __all__ = ["Availability", "ClusterConfig", "JobClusterConfig", "LibraryFactory"
 
 from enum import Enum
 from typing import Optional, Dict, Any, List, Union
-from dbacademy.common import validate
+from dbacademy.common import validate, Schema
 from dbacademy.common import Cloud
 
 
@@ -25,9 +25,12 @@ class Availability(Enum):
 
 
 class LibraryFactory:
+
+    __SCHEMA = Schema(libraries=Schema.optional.list(dict, auto_create=True))
+
     def __init__(self, libraries: Optional[List[Dict[str, Any]]]):
         # self.__definitions = libraries if libraries else list()
-        self.__definitions: List[Dict[str, Any]] = validate(libraries=libraries).optional.list(dict, auto_create=True)
+        self.__definitions: List[Dict[str, Any]] = self.__SCHEMA.check("libraries", libraries)
 
     @property
     def definitions(self) -> List[Dict[str, Any]]:
@@ -69,6 +72,23 @@ class LibraryFactory:
 
 class CommonConfig:
 
+    # Listed in the order validated, some of which are validated only under certain conditions.
+    __SCHEMA = Schema(cluster_name=Schema.optional.str(),
+                      spark_version=Schema.required.str(),
+                      num_workers=Schema.required.int(),
+                      extra_params=Schema.optional.dict(str, auto_create=True),
+                      spark_conf=Schema.optional.dict(str, auto_create=True),
+                      spark_env_vars=Schema.optional.dict(str, auto_create=True),
+                      custom_tags=Schema.optional.dict(str, auto_create=True),
+                      autotermination_minutes=Schema.required.int(),
+                      instance_pool_id=Schema.required.str(),
+                      node_type_id=Schema.required.str(),
+                      policy_id=Schema.required.str(),
+                      single_user_name=Schema.required.str(),
+                      driver_node_type_id=Schema.required.str(),
+                      cloud=Schema.required.enum(Cloud, auto_convert=True),
+                      availability=Schema.optional.enum(Availability, auto_convert=True))
+
     def __init__(self, *,
                  cloud: Union[str, Cloud],
                  cluster_name: Optional[str],
@@ -87,32 +107,34 @@ class CommonConfig:
                  extra_params: Optional[Dict[str, Any]],
                  libraries: Optional[List[Dict[str, Any]]]):
 
+        check = self.__SCHEMA.check
+
         self.__params = {
-            "cluster_name": validate(cluster_name=cluster_name).optional.str(),
-            "spark_version": validate(spark_version=spark_version).required.str(),
-            "num_workers": validate(num_workers=num_workers).required.int(),
+            "cluster_name": check("cluster_name", cluster_name),
+            "spark_version": check("spark_version", spark_version),
+            "num_workers": check("num_workers", num_workers),
         }
 
-        extra_params = validate(extra_params=extra_params).optional.dict(str, auto_create=True)
-        spark_conf = validate(spark_conf=spark_conf).optional.dict(str, auto_create=True)
-        spark_env_vars = validate(spark_env_vars=spark_env_vars).optional.dict(str, auto_create=True)
-        custom_tags = validate(custom_tags=custom_tags).optional.dict(str, auto_create=True)
+        extra_params = check("extra_params", extra_params)
+        spark_conf = check("spark_conf", spark_conf)
+        spark_env_vars = check("spark_env_vars", spark_env_vars)
+        custom_tags = check("custom_tags", custom_tags)
 
         if autotermination_minutes is not None:
             # Not set for job clusters
-            self.__params["autotermination_minutes"] = validate(autotermination_minutes=autotermination_minutes).required.int()
+            self.__params["autotermination_minutes"] = check("autotermination_minutes", autotermination_minutes)
 
         if instance_pool_id is not None:
-            extra_params["instance_pool_id"] = validate(instance_pool_id=instance_pool_id).required.str()
+            extra_params["instance_pool_id"] = check("instance_pool_id", instance_pool_id)
             assert node_type_id is None, f"""The parameter "node_type_id" should be None when the parameter "instance_pool_id" is specified."""
         else:
-            extra_params["node_type_id"] = validate(node_type_id=node_type_id).required.str()
+            extra_params["node_type_id"] = check("node_type_id", node_type_id)
 
         if policy_id is not None:
-            extra_params["policy_id"] = validate(policy_id=policy_id).required.str()
+            extra_params["policy_id"] = check("policy_id", policy_id)
 
         if single_user_name is not None:
-            extra_params["single_user_name"] = validate(single_user_name=single_user_name).required.str()
+            extra_params["single_user_name"] = check("single_user_name", single_user_name)
             extra_params["data_security_mode"] = "SINGLE_USER"
 
         if num_workers == 0:
@@ -123,7 +145,7 @@ class CommonConfig:
             assert driver_node_type_id is None, f"""The parameter "driver_node_type_id" should be None when "num_workers" is zero."""
         else:
             # More than one worker so define the driver_node_type_id and if necessary, default it to the node_type_id
-            extra_params["driver_node_type_id"] = validate(driver_node_type_id=driver_node_type_id or node_type_id).required.str()
+            extra_params["driver_node_type_id"] = check("driver_node_type_id", driver_node_type_id or node_type_id)
 
         assert extra_params.get("custom_tags") is None, f"The parameter \"extra_params.custom_tags\" should not be specified directly, use \"custom_tags\" instead."
         assert extra_params.get("spark_conf") is None, f"The parameter \"extra_params.spark_conf\" should not be specified directly, use \"spark_conf\" instead."
@@ -137,8 +159,8 @@ class CommonConfig:
             # Default to on-demand if the instance profile was not defined
             availability = Availability.ON_DEMAND
 
-        cloud = validate(cloud=cloud).required.enum(Cloud, auto_convert=True)
-        availability = validate(availability=availability).optional.enum(Availability, auto_convert=True)
+        cloud = check("cloud", cloud)
+        availability = check("availability", availability)
 
         if availability is not None:
             assert instance_pool_id is None, f"The parameter \"availability\" cannot be specified when \"instance_pool_id\" is specified."
@@ -1,7 +1,7 @@
 __all__ = ["JobsApi"]
 # Code Review: JDP on 11-26-2023
 
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, Optional, Union, List, Iterator
 from dbacademy.common import validate
 from dbacademy.clients.rest.common import ApiClient, ApiContainer
 from dbacademy.clients.dbrest.jobs_api.job_config import JobConfig
@@ -59,16 +59,26 @@ class JobsApi(ApiContainer):
 
         return self.__client.api("GET", url)
 
-    def list(self, *, limit: int = 100, expand_tasks: bool = False, job_name: Optional[str] = None) -> List[Dict[str, Any]]:
-        response = self.__list(limit=limit, expand_tasks=expand_tasks, job_name=job_name, page_token=None)
-        all_jobs = response.get("jobs", list())
-
-        while response.get("has_more", False):
-            page_token = response.get('next_page_token')
+    def iter_jobs(self, *, limit: int = 100, expand_tasks: bool = False, job_name: Optional[str] = None, prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Yields every job, or every job with the specified name, fetching up to limit (at most 100) jobs per request.
+        :param limit: the number of jobs requested per page.
+        :param expand_tasks: when True, each job's task and cluster details are included.
+        :param job_name: when specified, only jobs with this exact name are returned.
+        :param prefetch: when True, the next page is fetched on a background thread while the current page is consumed.
+        :return: an iterator over the jobs.
+        """
+        from dbacademy.clients.rest.pagination import paginate
+
+        def fetch_page(page_token: Optional[str]):
             response = self.__list(limit=limit, expand_tasks=expand_tasks, job_name=job_name, page_token=page_token)
-            all_jobs.extend(response.get("jobs", list()))
+            next_page_token = response.get("next_page_token") if response.get("has_more", False) else None
+            return response.get("jobs", list()), next_page_token
 
-        return all_jobs
+        yield from paginate(fetch_page, None, prefetch=prefetch)
+
+    def list(self, *, limit: int = 100, expand_tasks: bool = False, job_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        return list(self.iter_jobs(limit=limit, expand_tasks=expand_tasks, job_name=job_name))
 
     def delete_by_id(self, job_id: Union[str, int], *, skip_if_not_successful: bool = False, delete_by_name: bool = False) -> None:
         from dbacademy.clients import dbrest
@@ -2,12 +2,29 @@ __all__ = ["JobConfig"]
 # Code Review: JDP on 11-26-2023
 
 from typing import Dict, List, Optional, Any
-from dbacademy.common import validate
+from dbacademy.common import Schema
 from dbacademy.clients.dbrest.jobs_api.task_config import TaskConfig
 
 
 class JobConfig:
 
+    __SCHEMA = Schema(job_name=Schema.required.str(),
+                      tags=Schema.optional.dict(str, str, auto_create=True),
+                      timeout_seconds=Schema.required.int(),
+                      max_concurrent_runs=Schema.required.int())
+
+    __GIT_SCHEMA = Schema(provider=Schema.required.str(),
+                          url=Schema.required.str(),
+                          branch=Schema.required.str(),
+                          tag=Schema.required.str(),
+                          commit=Schema.required.str())
+
+    __NOTIFICATIONS_SCHEMA = Schema(on_start=Schema.optional.list(str, auto_create=True),
+                                    on_success=Schema.optional.list(str, auto_create=True),
+                                    on_failure=Schema.optional.list(str, auto_create=True),
+                                    on_duration_warning_threshold_exceeded=Schema.optional.list(str, auto_create=True),
+                                    no_alert_for_skipped_runs=Schema.required.bool())
+
     def __init__(self, *,
                  job_name: str,
                  timeout_seconds: int = 300,
@@ -16,34 +33,36 @@ class JobConfig:
 
         self.__tasks: List[Dict[str, Any]] = list()
 
+        values = self.__SCHEMA.validate(job_name=job_name, tags=tags, timeout_seconds=timeout_seconds, max_concurrent_runs=max_concurrent_runs)
+
         self.params = {
-            "name": validate(job_name=job_name).required.str(),
-            "tags": validate(tags=tags).optional.dict(str, str, auto_create=True),
-            "timeout_seconds": validate(timeout_seconds=timeout_seconds).required.int(),
-            "max_concurrent_runs": validate(max_concurrent_runs=max_concurrent_runs).required.int(),
+            "name": values["job_name"],
+            "tags": values["tags"],
+            "timeout_seconds": values["timeout_seconds"],
+            "max_concurrent_runs": values["max_concurrent_runs"],
             "format": "MULTI_TASK",
             "tasks": self.__tasks,
         }
 
     def git_branch(self, *, provider: str, url: str, branch: str):
         self.params["git_source"] = {
-            "git_provider": validate(provider=provider).required.str(),
-            "git_url": validate(url=url).required.str(),
-            "git_branch": validate(branch=branch).required.str()
+            "git_provider": self.__GIT_SCHEMA.check("provider", provider),
+            "git_url": self.__GIT_SCHEMA.check("url", url),
+            "git_branch": self.__GIT_SCHEMA.check("branch", branch)
         }
 
     def git_tag(self, *, provider: str, url: str, tag: str):
         self.params["git_source"] = {
-            "git_provider": validate(provider=provider).required.str(),
-            "git_url": validate(url=url).required.str(),
-            "git_tag": validate(tag=tag).required.str()
+            "git_provider": self.__GIT_SCHEMA.check("provider", provider),
+            "git_url": self.__GIT_SCHEMA.check("url", url),
+            "git_tag": self.__GIT_SCHEMA.check("tag", tag)
         }
 
     def git_commit(self, *, provider: str, url: str, commit: str):
         self.params["git_source"] = {
-            "git_provider": validate(provider=provider).required.str(),
-            "git_url": validate(url=url).required.str(),
-            "git_commit": validate(commit=commit).required.str()
+            "git_provider": self.__GIT_SCHEMA.check("provider", provider),
+            "git_url": self.__GIT_SCHEMA.check("url", url),
+            "git_commit": self.__GIT_SCHEMA.check("commit", commit)
         }
 
     def add_task(self, *,
@@ -76,11 +95,11 @@ class JobConfig:
                                 no_alert_for_skipped_runs: bool = False) -> None:
 
         self.params["email_notifications"] = {
-            "on_start": validate(on_start=on_start).optional.list(str, auto_create=True),
-            "on_success": validate(on_success=on_success).optional.list(str, auto_create=True),
-            "on_failure": validate(on_failure=on_failure).optional.list(str, auto_create=True),
-            "on_duration_warning_threshold_exceeded": validate(on_duration_warning_threshold_exceeded=on_duration_warning_threshold_exceeded).optional.list(str, auto_create=True),
-            "no_alert_for_skipped_runs": validate(no_alert_for_skipped_runs=no_alert_for_skipped_runs).required.bool(),
+            "on_start": self.__NOTIFICATIONS_SCHEMA.check("on_start", on_start),
+            "on_success": self.__NOTIFICATIONS_SCHEMA.check("on_success", on_success),
+            "on_failure": self.__NOTIFICATIONS_SCHEMA.check("on_failure", on_failure),
+            "on_duration_warning_threshold_exceeded": self.__NOTIFICATIONS_SCHEMA.check("on_duration_warning_threshold_exceeded", on_duration_warning_threshold_exceeded),
+            "no_alert_for_skipped_runs": self.__NOTIFICATIONS_SCHEMA.check("no_alert_for_skipped_runs", no_alert_for_skipped_runs),
         }
 
     def add_webhook_notifications(self, *,
@@ -90,8 +109,8 @@ class JobConfig:
                                   on_duration_warning_threshold_exceeded: Optional[List[str]]) -> None:
 
         self.params["webhook_notifications"] = {
-            "on_start": validate(on_start=on_start).optional.list(str, auto_create=True),
-            "on_success": validate(on_success=on_success).optional.list(str, auto_create=True),
-            "on_failure": validate(on_failure=on_failure).optional.list(str, auto_create=True),
-            "on_duration_warning_threshold_exceeded": validate(on_duration_warning_threshold_exceeded=on_duration_warning_threshold_exceeded).optional.list(str, auto_create=True),
+            "on_start": self.__NOTIFICATIONS_SCHEMA.check("on_start", on_start),
+            "on_success": self.__NOTIFICATIONS_SCHEMA.check("on_success", on_success),
+            "on_failure": self.__NOTIFICATIONS_SCHEMA.check("on_failure", on_failure),
+            "on_duration_warning_threshold_exceeded": self.__NOTIFICATIONS_SCHEMA.check("on_duration_warning_threshold_exceeded", on_duration_warning_threshold_exceeded),
         }
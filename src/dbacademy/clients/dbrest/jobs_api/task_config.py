@@ -4,7 +4,7 @@ __all__ = ["TaskConfig", "NotebookSource"]
 import inspect
 from enum import Enum
 from typing import Dict, Any, List, Optional, Union
-from dbacademy.common import validate
+from dbacademy.common import Schema
 from dbacademy.clients.dbrest.clusters_api.cluster_config import LibraryFactory, JobClusterConfig
 
 
@@ -16,6 +16,21 @@ class NotebookSource(Enum):
 class TaskConfig:
     # No defaults, those are done by the calling factory method in JobConfig
 
+    __SCHEMA = Schema(job_params=Schema.optional.dict(str, auto_create=True),
+                      task_key=Schema.required.str(),
+                      max_retries=Schema.required.int(),
+                      min_retry_interval_millis=Schema.required.int(),
+                      retry_on_timeout=Schema.required.bool(),
+                      depends_on=Schema.optional.list(str, auto_create=True),
+                      description=Schema.optional.str(),
+                      timeout_seconds=Schema.optional.int())
+
+    __NOTEBOOK_SCHEMA = Schema(source=Schema.required.enum(NotebookSource, auto_convert=True),
+                               notebook_path=Schema.required.str(),
+                               base_parameters=Schema.optional.dict(str, str, auto_create=True))
+
+    __CLUSTER_SCHEMA = Schema(cluster_config=Schema.optional.as_type(JobClusterConfig))
+
     def __init__(self, *,
                  task_key: str,
                  description: Optional[str],
@@ -32,19 +47,28 @@ class TaskConfig:
         self.__libraries = LibraryFactory(None)
         self.__params["libraries"] = self.__libraries.definitions
 
-        self.__job_params: Dict[str, Any] = validate(job_params=job_params).optional.dict(str, auto_create=True)
+        values = self.__SCHEMA.validate(task_key=task_key,
+                                        description=description,
+                                        max_retries=max_retries,
+                                        min_retry_interval_millis=min_retry_interval_millis,
+                                        retry_on_timeout=retry_on_timeout,
+                                        timeout_seconds=timeout_seconds,
+                                        job_params=job_params,
+                                        depends_on=depends_on)
+
+        self.__job_params: Dict[str, Any] = values["job_params"]
 
-        self.params["task_key"] = validate(task_key=task_key).required.str()
-        self.params["max_retries"] = validate(max_retries=max_retries).required.int()
-        self.params["min_retry_interval_millis"] = validate(min_retry_interval_millis=min_retry_interval_millis).required.int()
-        self.params["retry_on_timeout"] = validate(retry_on_timeout=retry_on_timeout).required.bool()
-        self.params["depends_on"] = validate(depends_on=depends_on).optional.list(str, auto_create=True)
+        self.params["task_key"] = values["task_key"]
+        self.params["max_retries"] = values["max_retries"]
+        self.params["min_retry_interval_millis"] = values["min_retry_interval_millis"]
+        self.params["retry_on_timeout"] = values["retry_on_timeout"]
+        self.params["depends_on"] = values["depends_on"]
 
         if description is not None:
-            self.params["description"] = validate(description=description).required.str()
+            self.params["description"] = values["description"]
 
         if timeout_seconds is not None:
-            self.params["timeout_seconds"] = validate(timeout_seconds=timeout_seconds).required.int()
+            self.params["timeout_seconds"] = values["timeout_seconds"]
 
     def assert_task_not_configured(self):
         assert self.__task_configured is False, f"""The task "{self.task_key}" has already been defined."""
@@ -65,15 +89,15 @@ class TaskConfig:
     def as_notebook(self, *, notebook_path: str, source: Union[str, NotebookSource], base_parameters: Optional[Dict[str, str]] = None) -> None:
         self.assert_task_not_configured()
 
-        source = validate(source=source).required.enum(NotebookSource, auto_convert=True)
+        source = self.__NOTEBOOK_SCHEMA.check("source", source)
 
         if source == NotebookSource.GIT:
             assert self.__job_params.get("git_source") is not None, f"The git source must be specified before defining a git notebook task"
 
         self.params["notebook_task"] = {
-            "notebook_path": validate(notebook_path=notebook_path).required.str(),
+            "notebook_path": self.__NOTEBOOK_SCHEMA.check("notebook_path", notebook_path),
             "source": source.value,
-            "base_parameters": validate(base_parameters=base_parameters).optional.dict(str, str, auto_create=True)
+            "base_parameters": self.__NOTEBOOK_SCHEMA.check("base_parameters", base_parameters)
         }
 
     def as_jar(self) -> None:  # , main_class_name: str, parameters: List[str]) -> AbstractTaskConfig:
@@ -127,5 +151,5 @@ class TaskConfig:
 
     def cluster_new(self, cluster_config: JobClusterConfig) -> None:
         self.__cluster_reset()
-        cluster_config = validate(cluster_config=cluster_config).optional.as_type(JobClusterConfig)
+        cluster_config = self.__CLUSTER_SCHEMA.check("cluster_config", cluster_config)
         self.params["new_cluster"] = cluster_config.params
@@ -2,7 +2,7 @@ __all__ = ["PermissionsApi"]
 # Code Review: JDP on 11-27-2023
 
 from dbacademy.common import validate
-from dbacademy.clients.rest.common import ApiContainer, ApiClient
+from dbacademy.clients.rest.common import ApiContainer, ApiClient, cached_api
 from dbacademy.clients.dbrest.permissions_api.clusters_permissions_api import ClustersPermissionsApi
 from dbacademy.clients.dbrest.permissions_api.directories_permissions_api import DirectoriesPermissionsApi
 from dbacademy.clients.dbrest.permissions_api.jobs_permissions_api import JobsPermissionsApi
@@ -18,7 +18,7 @@ class Authorization:
     def __init__(self, client: ApiClient):
         self.__client = validate(client=client).required.as_type(ApiClient)
 
-    @property
+    @cached_api
     def tokens(self) -> AuthTokensPermissionsApi:
         return AuthTokensPermissionsApi(self.__client)
 
@@ -28,34 +28,34 @@ class PermissionsApi(ApiContainer):
     def __init__(self, client: ApiClient):
         self.__client = validate(client=client).required.as_type(ApiClient)
 
-    @property
+    @cached_api
     def clusters(self) -> ClustersPermissionsApi:
         return ClustersPermissionsApi(self.__client)
 
-    @property
+    @cached_api
     def directories(self) -> DirectoriesPermissionsApi:
         return DirectoriesPermissionsApi(self.__client)
 
-    @property
+    @cached_api
     def jobs(self) -> JobsPermissionsApi:
         return JobsPermissionsApi(self.__client)
 
-    @property
+    @cached_api
     def pools(self) -> PoolsPermissionsApi:
         return PoolsPermissionsApi(self.__client)
 
-    @property
+    @cached_api
     def sql(self) -> SqlPermissionsApi:
         return SqlPermissionsApi(self.__client)
 
-    @property
+    @cached_api
     def cluster_policies(self) -> ClusterPoliciesPermissionsApi:
         return ClusterPoliciesPermissionsApi(self.__client)
 
-    @property
+    @cached_api
     def warehouses(self) -> WarehousesPermissionsApi:
         return WarehousesPermissionsApi(self.__client)
 
-    @property
+    @cached_api
     def authorizations(self) -> Authorization:
         return Authorization(self.__client)
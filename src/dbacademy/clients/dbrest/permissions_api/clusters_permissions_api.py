@@ -1,6 +1,6 @@
 __all__ = ["ClustersPermissionsApi"]
 
-from dbacademy.clients.rest.common import ApiClient
+from dbacademy.clients.rest.common import ApiClient, cached_api
 from dbacademy.clients.dbrest.permissions_api.permission_crud_api import PermissionsCrudApi
 
 
@@ -23,6 +23,6 @@ class ClustersPermissionsApi(PermissionsCrudApi):
         self.__client = validate(client=client).required.as_type(ApiClient)
         super().__init__(client, "/api/2.0/permissions/clusters", "cluster")
 
-    @property
+    @cached_api
     def policies(self) -> ClusterPoliciesPermissionsApi:
         return ClusterPoliciesPermissionsApi(self.__client)
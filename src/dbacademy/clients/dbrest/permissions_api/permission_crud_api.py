@@ -48,12 +48,7 @@ class PermissionsCrudApi(ApiContainer):
         self.name_key = name_key or noun + "_name"
 
         # Update doc strings, replacing placeholders with actual values.
-        cls = type(self)
-        methods = [attr for attr in dir(cls) if not attr.startswith("__") and callable(getattr(cls, attr))]
-        for name in methods:
-            m = getattr(cls, name)
-            if isinstance(m.__doc__, str):
-                m.__doc__ = m.__doc__.format(**self.__dict__)
+        self._format_docstrings()
 
     @staticmethod
     def _validate_what(what: What):
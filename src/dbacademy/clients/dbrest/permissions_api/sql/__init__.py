@@ -2,7 +2,7 @@ __all__ = ["SqlPermissionsApi"]
 # Code Review: JDP on 11-27-2023
 
 from dbacademy.common import validate
-from dbacademy.clients.rest.common import ApiContainer, ApiClient
+from dbacademy.clients.rest.common import ApiContainer, ApiClient, cached_api
 from dbacademy.clients.dbrest.permissions_api.sql.warehouses_permissions_api import SqlWarehousesPermissionsApi
 from dbacademy.clients.dbrest.permissions_api.sql.sql_crud_permissions_api import SqlCrudPermissions
 
@@ -12,7 +12,7 @@ class SqlPermissionsApi(ApiContainer):
     def __init__(self, client: ApiClient):
         self.__client = validate(client=client).required.as_type(ApiClient)
 
-    @property
+    @cached_api
     def warehouses(self) -> SqlWarehousesPermissionsApi:
         return SqlWarehousesPermissionsApi(self.__client)
 
@@ -1,6 +1,6 @@
 __all__ = ["RunsApi"]
 
-from typing import Any, Dict, Union, List
+from typing import Any, Dict, Union, List, Iterator, Iterable, Optional
 import builtins
 
 from dbacademy.clients.rest.common import ApiClient, ApiContainer
@@ -8,6 +8,11 @@ from dbacademy.clients.rest.common import ApiClient, ApiContainer
 
 class RunsApi(ApiContainer):
 
+    FINAL_STATES = ("TERMINATED", "INTERNAL_ERROR", "SKIPPED")
+
+    # At or below this many outstanding runs, polling each run is cheaper than listing every active run.
+    __BATCH_THRESHOLD = 3
+
     def __init__(self, client: ApiClient):
         from dbacademy.common import validate
 
@@ -16,27 +21,50 @@ class RunsApi(ApiContainer):
     def get(self, run_id: Union[str, int]) -> Dict[str, Any]:
         return self.__client.api("GET", f"{self.__client.endpoint}/api/2.0/jobs/runs/get?run_id={run_id}")
 
+    def iter_runs(self, *, job_id: Union[str, int] = None, active_only: bool = False, offset: int = 0, page_size: int = 1000, prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Yields every run, or every run of the specified job, fetching page_size runs per request.
+        :param job_id: when specified, only the runs of this job are returned.
+        :param active_only: when True, only PENDING, RUNNING and TERMINATING runs are returned.
+        :param offset: the number of runs to skip.
+        :param page_size: the number of runs requested per page.
+        :param prefetch: when True, the next page is fetched on a background thread while the current page is consumed.
+        :return: an iterator over the runs.
+        """
+        from dbacademy.common import validate
+        from dbacademy.clients.rest.pagination import paginate
+
+        validate(job_id=job_id).optional.as_type(int, str)
+        validate(active_only=active_only).required.bool()
+        validate(offset=offset).required.int(min_value=0)
+        validate(page_size=page_size).required.int(min_value=1)
+
+        def fetch_page(page_offset: int):
+            url = f"{self.__client.endpoint}/api/2.0/jobs/runs/list?limit={page_size}&offset={page_offset}"
+            if job_id is not None:
+                url += f"&job_id={job_id}"
+            if active_only:
+                url += "&active_only=true"
+
+            json_response = self.__client.api("GET", url)
+            new_runs = json_response.get("runs", builtins.list())
+
+            if not json_response.get("has_more", False):
+                return new_runs, None
+            else:
+                return new_runs, page_offset + len(new_runs)
+
+        yield from paginate(fetch_page, offset, prefetch=prefetch)
+
     def list(self, runs: List[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         runs = runs or builtins.list()
-        url = f"{self.__client.endpoint}/api/2.0/jobs/runs/list?limit=1000&offset={len(runs)}"
-        json_response = self.__client.api("GET", url)
-        runs.extend(json_response.get("runs", builtins.list()))
-
-        if not json_response.get("has_more", False):
-            return runs
-        else:
-            return self.list(runs)
+        runs.extend(self.iter_runs(offset=len(runs)))
+        return runs
 
     def list_by_job_id(self, job_id: Union[str, int], runs: List[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         runs = runs or builtins.list()
-        url = f"{self.__client.endpoint}/api/2.0/jobs/runs/list?limit=1000&offset={len(runs)}&job_id={job_id}"
-        json_response = self.__client.api("GET", url)
-        runs.extend(json_response.get("runs", builtins.list()))
-
-        if not json_response.get("has_more", False):
-            return runs
-        else:
-            return self.list_by_job_id(job_id, runs)
+        runs.extend(self.iter_runs(job_id=job_id, offset=len(runs)))
+        return runs
 
     def cancel_by_id(self, run_id: Union[str, int]) -> Dict[str, Any]:
         return self.__client.api("POST", f"{self.__client.endpoint}/api/2.0/jobs/runs/cancel", run_id=run_id)
@@ -47,19 +75,78 @@ class RunsApi(ApiContainer):
     def wait_for(self, run_id: Union[str, int]) -> Dict[str, Any]:
         import time
 
-        wait = 15
-        response = self.get(run_id)
-        state = response["state"]["life_cycle_state"]
-        job_id = response.get("job_id", 0)
+        while True:
+            response = self.get(run_id)
+            state = response["state"]["life_cycle_state"]
+            job_id = response.get("job_id", 0)
+
+            if state in self.FINAL_STATES:
+                return response
+
+            wait = 15 if state == "PENDING" or state == "RUNNING" else 5
+            print(f" - Job #{job_id}-{run_id} is {state}, checking again in {wait} seconds")
+            time.sleep(wait)
+
+    def wait_for_all(self, run_ids: Iterable[Union[str, int]], *,
+                     timeout: Optional[float] = None,
+                     min_interval: float = 5,
+                     max_interval: float = 60,
+                     backoff: float = 1.5,
+                     jitter: float = 0.2) -> Iterator[Dict[str, Any]]:
+        """
+        Waits on many runs at once, yielding each run's final response as soon as it is observed in one of RunsApi.FINAL_STATES.
+
+        All the runs share a single polling loop: each round lists the active runs (a handful of requests regardless of how
+        many runs are outstanding) and only runs that dropped out of that listing are fetched individually. The interval
+        between rounds starts at min_interval, grows by backoff after each round without completions up to max_interval,
+        resets once a run completes, and is randomized by +/- jitter so that concurrent waiters do not poll in lockstep.
+        :param run_ids: the runs to wait on.
+        :param timeout: the overall deadline, in seconds, after which TimeoutError is raised; None to wait indefinitely.
+        :param min_interval: the initial number of seconds between polling rounds.
+        :param max_interval: the maximum number of seconds between polling rounds.
+        :param backoff: the factor by which the interval grows after a round without completions.
+        :param jitter: the fraction by which each interval is randomly shortened or lengthened.
+        :return: an iterator over the final response of each run, in order of completion.
+        """
+        import time
+        import random
+        from dbacademy.common import validate
 
-        if state != "TERMINATED" and state != "INTERNAL_ERROR" and state != "SKIPPED":
-            if state == "PENDING" or state == "RUNNING":
-                print(f" - Job #{job_id}-{run_id} is {state}, checking again in {wait} seconds")
-                time.sleep(wait)
-            else:
-                print(f" - Job #{job_id}-{run_id} is {state}, checking again in 5 seconds")
-                time.sleep(5)
+        timeout = validate(timeout=timeout).optional.float(min_value=0)
+        min_interval = validate(min_interval=min_interval).required.float(min_value=0)
+        max_interval = validate(max_interval=max_interval).required.float(min_value=min_interval)
+        backoff = validate(backoff=backoff).required.float(min_value=1)
+        jitter = validate(jitter=jitter).required.float(min_value=0, max_value=1)
 
-            return self.wait_for(run_id)
+        pending = {int(r) for r in run_ids}
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = min_interval
 
-        return response
+        while pending:
+            if len(pending) <= self.__BATCH_THRESHOLD:
+                candidates = builtins.list(pending)
+            else:
+                active = {r.get("run_id") for r in self.iter_runs(active_only=True)}
+                candidates = [r for r in pending if r not in active]
+
+            completed = 0
+            for run_id in sorted(candidates):
+                response = self.get(run_id)
+                if response.get("state", dict()).get("life_cycle_state") in self.FINAL_STATES:
+                    pending.discard(run_id)
+                    completed += 1
+                    yield response
+
+            if not pending:
+                return
+
+            interval = min_interval if completed else min(interval * backoff, max_interval)
+            sleep = interval * random.uniform(1 - jitter, 1 + jitter)
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"Timed out waiting for {len(pending)} run(s): {sorted(pending)}")
+                sleep = min(sleep, remaining)
+
+            time.sleep(sleep)
@@ -3,7 +3,7 @@ __all__ = ["ScimApi"]
 
 from typing import Dict, Any
 from dbacademy.common import validate
-from dbacademy.clients.rest.common import ApiContainer, ApiClient
+from dbacademy.clients.rest.common import ApiContainer, ApiClient, cached_api
 from dbacademy.clients.dbrest.scim_api.users_api import ScimUsersApi
 from dbacademy.clients.dbrest.scim_api.service_principals_api import ScimServicePrincipalsApi
 from dbacademy.clients.dbrest.scim_api.groups_api import ScimGroupsApi
@@ -14,15 +14,15 @@ class ScimApi(ApiContainer):
     def __init__(self, client: ApiClient):
         self.__client = validate(client=client).required.as_type(ApiClient)
 
-    @property
+    @cached_api
     def users(self) -> ScimUsersApi:
         return ScimUsersApi(self.__client)
 
-    @property
+    @cached_api
     def service_principals(self) -> ScimServicePrincipalsApi:
         return ScimServicePrincipalsApi(self.__client)
 
-    @property
+    @cached_api
     def groups(self) -> ScimGroupsApi:
         return ScimGroupsApi(self.__client)
 
@@ -1,6 +1,6 @@
 __all__ = ["ScimUsersApi"]
 
-from typing import Dict, Any, Union, List, Optional
+from typing import Dict, Any, Union, List, Optional, Iterator
 from dbacademy.clients.rest.common import ApiClient, ApiContainer
 
 
@@ -11,16 +11,37 @@ class ScimUsersApi(ApiContainer):
         self.__client = validate(client=client).required.as_type(ApiClient)
         self.base_url = f"{self.__client.endpoint}/api/2.0/preview/scim/v2/Users"
 
-    def list(self, users: List[Dict[str, Any]] = None, start_index: int = 1, users_per_request: int = 1000) -> List[Dict[str, Any]]:
-        users = users or list()
+    def iter_users(self, *, start_index: int = 1, page_size: int = 1000, prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Yields every user in the workspace, fetching page_size users per request.
+        :param start_index: the 1-based index of the first user to return.
+        :param page_size: the number of users requested per page.
+        :param prefetch: when True, the next page is fetched on a background thread while the current page is consumed.
+        :return: an iterator over the users.
+        """
+        from dbacademy.common import validate
+        from dbacademy.clients.rest.pagination import paginate
+
+        validate(start_index=start_index).required.int(min_value=1)
+        validate(page_size=page_size).required.int(min_value=1)
+
+        def fetch_page(index: int):
+            response = self.__client.api("GET", self.base_url, startIndex=index, count=page_size, excludedAttributes="roles")
+            new_users = response.get("Resources", list())
+            next_index = index + len(new_users)
+            total_results = response.get("totalResults")
 
-        response = self.__client.api("GET", self.base_url, startIndex=start_index, count=users_per_request, excludedAttributes="roles")
-        new_users = response.get("Resources", list())
-        users.extend(new_users)
+            # Use totalResults, when available, to avoid requesting a final, empty page.
+            if len(new_users) == 0 or (total_results is not None and next_index > int(total_results)):
+                return new_users, None
+            else:
+                return new_users, next_index
 
-        if len(new_users) > 0:
-            return self.list(users, len(users)+1)
+        yield from paginate(fetch_page, start_index, prefetch=prefetch)
 
+    def list(self, users: List[Dict[str, Any]] = None, start_index: int = 1, users_per_request: int = 1000) -> List[Dict[str, Any]]:
+        users = users or list()
+        users.extend(self.iter_users(start_index=start_index, page_size=users_per_request))
         return users
 
     def get_by_id(self, user_id: str) -> Dict[str, Any]:
@@ -50,7 +71,7 @@ class ScimUsersApi(ApiContainer):
         return None
 
     def delete_by_username(self, username: str) -> None:
-        for user in self.list():
+        for user in self.iter_users():
             if username == user.get("userName"):
                 return self.delete_by_id(user.get("id"))
 
@@ -71,16 +92,23 @@ class ScimUsersApi(ApiContainer):
 
     def to_users_list(self, users: Union[None, str, Dict[str, Any]]) -> List[Dict[str, Any]]:
 
-        # One way or the other, we will use the full list
-        all_users = self.list()
-
         if users is None:
-            users = all_users
+            return self.list()
         elif type(users) == str or type(users) == dict:
             users = [users]  # Convert single argument users to a list
         else:
             assert type(users) == list, f"Expected the parameter \"users\" to be None, str or Dict, found {type(users)}"
 
+        if all(type(user) == dict for user in users):
+            return list(users)  # Nothing to look up, don't list every user
+
+        # List the users once, indexing them by both username and id
+        by_username = dict()
+        by_id = dict()
+        for u in self.iter_users():
+            by_username.setdefault(u.get("userName"), u)
+            by_id.setdefault(u.get("id"), u)
+
         new_users = list()
 
         for user in users:
@@ -88,14 +116,9 @@ class ScimUsersApi(ApiContainer):
                 new_users.append(user)
 
             elif type(user) == str:
-                if "@" in user:
-                    for u in all_users:
-                        if u.get("userName") == user: 
-                            new_users.append(u)
-                else:
-                    for u in all_users:
-                        if u.get("id") == user: 
-                            new_users.append(u)
+                index = by_username if "@" in user else by_id
+                if user in index:
+                    new_users.append(index[user])
 
         return new_users
     
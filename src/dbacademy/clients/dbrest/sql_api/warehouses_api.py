@@ -19,7 +19,8 @@ __all__ = ["SqlWarehousesApi",
            "CLUSTER_SIZE_4X_LARGE",
            "CLUSTER_SIZES"]
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Callable
+from dbacademy.common import Schema
 from dbacademy.clients.rest.common import ApiClient, ApiContainer
 
 COST_OPTIMIZED = "COST_OPTIMIZED"
@@ -53,6 +54,17 @@ CLUSTER_SIZES = [CLUSTER_SIZE_2X_SMALL,
 
 class SqlWarehousesApi(ApiContainer):
 
+    __CREATE_SCHEMA = Schema(name=Schema.required.str(min_length=1),
+                             cluster_size=Schema.required.as_one_of(str, CLUSTER_SIZES),
+                             enable_serverless_compute=Schema.required.bool(),
+                             min_num_clusters=Schema.required.int(min_value=1),
+                             max_num_clusters=Schema.required.int(min_value=1),
+                             auto_stop_mins=Schema.required.int(min_value=0),
+                             enable_photon=Schema.required.bool(),
+                             spot_instance_policy=Schema.required.as_one_of(str, SPOT_POLICIES),
+                             channel=Schema.required.as_one_of(str, CHANNELS),
+                             tags=Schema.optional.dict(str, auto_create=True))
+
     def __init__(self, client: ApiClient):
         from dbacademy.common import validate
 
@@ -141,30 +153,36 @@ class SqlWarehousesApi(ApiContainer):
                channel: str = CHANNEL_NAME_CURRENT,
                tags: Dict[str, Any] = None):
 
-        tags = dict() if tags is None else tags
-        assert spot_instance_policy in SPOT_POLICIES, f"Expected spot_instance_policy to be one of {SPOT_POLICIES}, found {spot_instance_policy}"
-        assert channel in CHANNELS, f"Expected channel to be one of {CHANNELS}, found {channel}"
-        assert cluster_size in CLUSTER_SIZES, f"Expected cluster_size to be one of {CLUSTER_SIZES}, found {cluster_size}"
+        values = self.__CREATE_SCHEMA.validate(name=name,
+                                               cluster_size=cluster_size,
+                                               enable_serverless_compute=enable_serverless_compute,
+                                               min_num_clusters=min_num_clusters,
+                                               max_num_clusters=max_num_clusters,
+                                               auto_stop_mins=auto_stop_mins,
+                                               enable_photon=enable_photon,
+                                               spot_instance_policy=spot_instance_policy,
+                                               channel=channel,
+                                               tags=tags)
 
         params = {
-            "name": name,
-            "cluster_size": cluster_size,
-            "min_num_clusters": min_num_clusters,
-            "max_num_clusters": max_num_clusters,
-            "auto_stop_mins": auto_stop_mins,
+            "name": values["name"],
+            "cluster_size": values["cluster_size"],
+            "min_num_clusters": values["min_num_clusters"],
+            "max_num_clusters": values["max_num_clusters"],
+            "auto_stop_mins": values["auto_stop_mins"],
             "tags": {
                 "custom_tags": []
             },
-            "spot_instance_policy": spot_instance_policy,
-            "enable_photon": enable_photon,
+            "spot_instance_policy": values["spot_instance_policy"],
+            "enable_photon": values["enable_photon"],
             "warehouse_type": "Pro",
-            "enable_serverless_compute": enable_serverless_compute,
+            "enable_serverless_compute": values["enable_serverless_compute"],
             "channel": {
-                "name": channel
+                "name": values["channel"]
             },
         }
 
-        for item in tags.items():
+        for item in values["tags"].items():
             custom_tags = params.get("tags").get("custom_tags", [])
             custom_tags.append({
                 "key": item[0],
@@ -254,6 +272,7 @@ class SqlWarehousesApi(ApiContainer):
     @staticmethod
     def to_endpoint_name(user, naming_template: str, naming_params: Dict[str, Any]):
         username = user.get("userName")
+        naming_params = dict(naming_params)  # Don't mutate the caller's params, they are shared across users and threads
 
         if "{da_hash}" in naming_template:
             assert naming_params.get("course", None) is not None, "The template is employing da_hash which requires course to be specified in naming_params"
@@ -264,6 +283,31 @@ class SqlWarehousesApi(ApiContainer):
         naming_params["da_name"] = username.split("@")[0]
         return naming_template.format(**naming_params)
 
+    def index_by_name(self) -> Dict[str, Dict[str, Any]]:
+        """Lists the warehouses once, returning them keyed by name for the per-user operations below."""
+        return {endpoint.get("name"): endpoint for endpoint in self.list()}
+
+    def __for_each_user(self, users: Optional[List[Dict[str, Any]]], max_workers: int, function: Callable[[Dict[str, Any], Dict[str, Dict[str, Any]]], str]) -> Dict[str, str]:
+        from concurrent.futures import ThreadPoolExecutor
+        from dbacademy.common import validate
+        from dbacademy.clients.dbrest.scim_api.users_api import ScimUsersApi
+
+        validate(max_workers=max_workers).required.int(min_value=1)
+
+        # List the users and the warehouses once, not once per user.
+        users = ScimUsersApi(self.__client).to_users_list(users)
+        warehouses = self.index_by_name()
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dbacademy-warehouses") as executor:
+            futures = [executor.submit(function, user, warehouses) for user in users]
+
+        # Every user is processed before the failures, if any, are raised together.
+        failures = {user.get("userName"): future.exception() for user, future in zip(users, futures) if future.exception() is not None}
+        if len(failures) > 0:
+            raise Exception(f"Failed for {len(failures)} of {len(users)} users: {list(failures)}") from list(failures.values())[0]
+
+        return {user.get("userName"): future.result() for user, future in zip(users, futures)}
+
     def create_user_endpoints(self,
                               naming_template: str,
                               naming_params: Dict[str, Any],
@@ -276,7 +320,8 @@ class SqlWarehousesApi(ApiContainer):
                               spot_instance_policy: str = RELIABILITY_OPTIMIZED,
                               channel: str = CHANNEL_NAME_CURRENT,
                               tags: Dict[str, Any] = None,
-                              users: List[Dict[str, Any]] = None):
+                              users: List[Dict[str, Any]] = None,
+                              max_workers: int = 8) -> Dict[str, str]:
         """Creates one SQL endpoint per user in the current workspace. The list of users can be limited to a subset of users with the "users" parameter.
         Parameters:
         naming_template (str): The template used to name each user's endpoint.
@@ -291,25 +336,30 @@ class SqlWarehousesApi(ApiContainer):
         channel (str = CHANNEL_NAME_CURRENT): The endpoint's channel - see CHANNELS for the list of valid values.
         tags (dict = dict()): The list of tags expressed as key-value pairs.
         users (list[str or dict] = None, str): unlike other parameters, this value is eventually converted to a list of user objects but may be specified as a list or single value (which is converted to a list). String values are assumed to be the user's username if it includes the @ symbol and the user's ID otherwise.
+        max_workers (int = 8): The maximum number of users processed concurrently.
+        Returns:
+        dict: The outcome for each user keyed by username, e.g. "created", "exists" or "inactive".
+        Raises:
+        Exception: Naming the users that failed, raised once every user has been processed.
         """
-        from dbacademy.clients.dbrest import from_client
-        da_client = from_client(self.__client)
-
         tags = dict() if tags is None else tags
 
-        for user in da_client.scim.users.to_users_list(users):
-            self.create_user_endpoint(user=user, 
-                                      naming_template=naming_template, 
-                                      naming_params=naming_params,
-                                      cluster_size=cluster_size,
-                                      enable_serverless_compute=enable_serverless_compute,
-                                      min_num_clusters=min_num_clusters,
-                                      max_num_clusters=max_num_clusters,
-                                      auto_stop_mins=auto_stop_mins,
-                                      enable_photon=enable_photon,
-                                      spot_instance_policy=spot_instance_policy,
-                                      channel=channel,
-                                      tags=tags)
+        def create(user: Dict[str, Any], warehouses: Dict[str, Dict[str, Any]]) -> str:
+            return self.create_user_endpoint(user=user,
+                                             naming_template=naming_template,
+                                             naming_params=naming_params,
+                                             cluster_size=cluster_size,
+                                             enable_serverless_compute=enable_serverless_compute,
+                                             min_num_clusters=min_num_clusters,
+                                             max_num_clusters=max_num_clusters,
+                                             auto_stop_mins=auto_stop_mins,
+                                             enable_photon=enable_photon,
+                                             spot_instance_policy=spot_instance_policy,
+                                             channel=channel,
+                                             tags=tags,
+                                             warehouses=warehouses)
+
+        return self.__for_each_user(users, max_workers, create)
 
     def create_user_endpoint(self,
                              user,
@@ -323,24 +373,24 @@ class SqlWarehousesApi(ApiContainer):
                              enable_photon: bool,
                              spot_instance_policy: str,
                              channel: str,
-                             tags: Dict[str, Any]):
+                             tags: Dict[str, Any],
+                             warehouses: Dict[str, Dict[str, Any]] = None) -> str:
 
         from dbacademy.clients.dbrest import from_client
-        da_client = from_client(self.__client)
 
         username = user.get("userName")
         active = user.get("active")
         
         if not active:
             print(f"Skipping creation of endpoint for the user \"{username}\":\n - Inactive user\n")
-            return
+            return "inactive"
         
         endpoint_name = self.to_endpoint_name(user, naming_template, naming_params)
+        warehouses = self.index_by_name() if warehouses is None else warehouses
 
-        for endpoint in da_client.sql.warehouses().list():
-            if endpoint.get("name") == endpoint_name:
-                print(f"Skipping creation of the endpoint \"{endpoint_name}\" for the user \"{username}\":\n - The endpoint already exists\n")
-                return
+        if endpoint_name in warehouses:
+            print(f"Skipping creation of the endpoint \"{endpoint_name}\" for the user \"{username}\":\n - The endpoint already exists\n")
+            return "exists"
 
         print(f"Creating the endpoint \"{endpoint_name}\" for the user \"{username}\"")
 
@@ -357,94 +407,86 @@ class SqlWarehousesApi(ApiContainer):
 
         # Give the user CAN_MANAGE to their new endpoint
         endpoint_id = endpoint.get("id")
+        da_client = from_client(self.__client)
         da_client.permissions.sql.warehouses.update_user(id_value=endpoint_id,
                                                          username=username,
                                                          permission_level="CAN_MANAGE")
+        return "created"
 
     def delete_user_endpoints(self,
                               naming_template: str,
                               naming_params: Dict[str, Any],
-                              users: List[Dict[str, Any]] = None):
-        from dbacademy.clients.dbrest import from_client
-        da_client = from_client(self.__client)
+                              users: List[Dict[str, Any]] = None,
+                              max_workers: int = 8) -> Dict[str, str]:
 
-        for user in da_client.scim.users.to_users_list(users):
-            self.delete_user_endpoint(user=user, naming_template=naming_template, naming_params=naming_params)
+        return self.__for_each_user(users, max_workers, lambda user, warehouses: self.delete_user_endpoint(user=user, naming_template=naming_template, naming_params=naming_params, warehouses=warehouses))
 
     def delete_user_endpoint(self,
                              user: Dict[str, Any],
                              naming_template: str,
-                             naming_params: Dict[str, Any]):
-
-        from dbacademy.clients.dbrest import from_client
-        da_client = from_client(self.__client)
+                             naming_params: Dict[str, Any],
+                             warehouses: Dict[str, Dict[str, Any]] = None) -> str:
 
         username = user.get("userName")
         endpoint_name = self.to_endpoint_name(user, naming_template, naming_params)
+        endpoint = (self.index_by_name() if warehouses is None else warehouses).get(endpoint_name)
 
-        for endpoint in da_client.sql.warehouses().list():
-            if endpoint.get("name") == endpoint_name:
-                print(f"Deleting the endpoint \"{endpoint_name}\" for the user \"{username}\"")
-                self.delete_by_id(endpoint.get("id"))
-                return
+        if endpoint is not None:
+            print(f"Deleting the endpoint \"{endpoint_name}\" for the user \"{username}\"")
+            self.delete_by_id(endpoint.get("id"))
+            return "deleted"
 
         print(f"Skipping deletion of the endpoint \"{endpoint_name}\" for the user \"{username}\": Not found\n")
+        return "not found"
 
     def start_user_endpoints(self,
                              naming_template: str,
                              naming_params: Dict[str, Any],
-                             users: List[Dict[str, Any]] = None):
+                             users: List[Dict[str, Any]] = None,
+                             max_workers: int = 8) -> Dict[str, str]:
 
-        from dbacademy.clients.dbrest import from_client
-        da_client = from_client(self.__client)
-
-        for user in da_client.scim.users.to_users_list(users):
-            self.start_user_endpoint(user=user, naming_template=naming_template, naming_params=naming_params)
+        return self.__for_each_user(users, max_workers, lambda user, warehouses: self.start_user_endpoint(user=user, naming_template=naming_template, naming_params=naming_params, warehouses=warehouses))
 
     def start_user_endpoint(self,
                             user: Dict[str, Any],
                             naming_template: str,
-                            naming_params: Dict[str, Any]):
-
-        from dbacademy.clients.dbrest import from_client
-        da_client = from_client(self.__client)
+                            naming_params: Dict[str, Any],
+                            warehouses: Dict[str, Dict[str, Any]] = None) -> str:
 
         username = user.get("userName")
         endpoint_name = self.to_endpoint_name(user, naming_template, naming_params)
+        endpoint = (self.index_by_name() if warehouses is None else warehouses).get(endpoint_name)
 
-        for endpoint in da_client.sql.warehouses().list():
-            if endpoint.get("name") == endpoint_name:
-                print(f"Starting the endpoint \"{endpoint_name}\" for the user \"{username}\"")
-                self.start(endpoint.get("id"))
-                return
+        if endpoint is not None:
+            print(f"Starting the endpoint \"{endpoint_name}\" for the user \"{username}\"")
+            self.start(endpoint.get("id"))
+            return "started"
 
         print(f"Skipping start of the endpoint \"{endpoint_name}\" for the user \"{username}\": Not found\n")
+        return "not found"
 
     def stop_user_endpoints(self,
                             naming_template: str,
                             naming_params: Dict[str, Any],
-                            users: List[Dict[str, Any]] = None):
-        from dbacademy.clients.dbrest import from_client
-        da_client = from_client(self.__client)
+                            users: List[Dict[str, Any]] = None,
+                            max_workers: int = 8) -> Dict[str, str]:
 
-        for user in da_client.scim.users.to_users_list(users):
-            self.stop_user_endpoint(user=user, naming_template=naming_template, naming_params=naming_params)
+        return self.__for_each_user(users, max_workers, lambda user, warehouses: self.stop_user_endpoint(user=user, naming_template=naming_template, naming_params=naming_params, warehouses=warehouses))
 
     def stop_user_endpoint(self,
                            user: Dict[str, Any],
                            naming_template: str,
-                           naming_params: Dict[str, Any]):
-
-        from dbacademy.clients.dbrest import from_client
-        da_client = from_client(self.__client)
+                           naming_params: Dict[str, Any],
+                           warehouses: Dict[str, Dict[str, Any]] = None) -> str:
 
         username = user.get("userName")
         endpoint_name = self.to_endpoint_name(user, naming_template, naming_params)
+        endpoint = (self.index_by_name() if warehouses is None else warehouses).get(endpoint_name)
 
-        for endpoint in da_client.sql.warehouses().list():
-            if endpoint.get("name") == endpoint_name:
-                print(f"Stopping the endpoint \"{endpoint_name}\" for the user \"{username}\"")
-                self.stop(endpoint.get("id"))
-                return
+        if endpoint is not None:
+            print(f"Stopping the endpoint \"{endpoint_name}\" for the user \"{username}\"")
+            self.stop(endpoint.get("id"))
+            return "stopped"
 
         print(f"Skipping stop of the endpoint \"{endpoint_name}\" for the user \"{username}\": Not found\n")
+        return "not found"
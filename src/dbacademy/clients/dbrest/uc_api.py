@@ -3,7 +3,7 @@ __all__ = ["UcApi"]
 
 from typing import Optional, Dict, Any
 from dbacademy.common import validate
-from dbacademy.clients.rest.common import ApiClient, ApiContainer
+from dbacademy.clients.rest.common import ApiClient, ApiContainer, cached_api
 
 
 class MetastoresApi(ApiContainer):
@@ -66,11 +66,11 @@ class UcApi(ApiContainer):
         self.__client = validate(client=client).required.as_type(ApiClient)
         self.base_url = f"{self.__client.endpoint}/api/2.1/unity-catalog"
 
-    @property
+    @cached_api
     def metastores(self) -> MetastoresApi:
         return MetastoresApi(self.__client)
 
-    @property
+    @cached_api
     def workspace(self) -> WorkspaceApi:
         return WorkspaceApi(client=self.__client)
 
@@ -123,13 +123,31 @@ class WorkspaceApi(ApiContainer):
         with open(local_file_path, mode='rb') as file:
             content = file.read()
 
+        return self.import_dbc_content(path=path,
+                                       content=base64.b64encode(content).decode("utf-8"),
+                                       overwrite=overwrite)
+
+    def import_dbc_content(self, *,
+                           path: str,
+                           content: str,
+                           overwrite: bool) -> Dict[str, Any]:
+        """
+        Imports a DBC that was already downloaded and base64 encoded, e.g. once for many users; see also import_dbc_files()
+        :param path: the workspace path to import the DBC to.
+        :param content: the base64 encoded DBC.
+        :param overwrite: when True, any existing path is deleted first.
+        :return: the API's response
+        """
+        path = validate(path=path).required.str()
+        content = validate(content=content).required.str()
+
         if validate(overwrite=overwrite).required.bool():
             self.delete_path(path, recursive=True)
 
         self.mkdirs("/".join(path.split("/")[:-1]))
 
         payload = {
-            "content": base64.b64encode(content).decode("utf-8"),
+            "content": content,
             "path": path,
             "overwrite": False,
             "format": ImportType.DBC.value,
@@ -3,6 +3,7 @@ __all__ = ["DatabricksApiClient"]
 from typing import List
 
 from dbacademy.clients.rest.common import *
+from dbacademy.clients.rest.transport import Transport
 from dbacademy.clients.dougrest.clusters import Clusters
 from dbacademy.clients.dougrest.groups import Groups
 from dbacademy.clients.dougrest.jobs import Jobs
@@ -23,7 +24,7 @@ class DatabricksApiClient(dict, ApiClient):
         "GCP": "n1-standard-4",
     }
 
-    def __init__(self, hostname=None, *, token=None, username=None, password=None, authorization_header=None, deployment_name=None):
+    def __init__(self, hostname=None, *, token=None, username=None, password=None, authorization_header=None, deployment_name=None, transport: Transport = None):
         from dbacademy import dbgems
 
         if hostname:
@@ -38,7 +39,8 @@ class DatabricksApiClient(dict, ApiClient):
                                    token=token,
                                    username=username,
                                    password=password,
-                                   authorization_header=authorization_header)
+                                   authorization_header=authorization_header,
+                                   transport=transport)
 
         if deployment_name is None:
             deployment_name = hostname[0:hostname.find(".")]
@@ -78,47 +80,47 @@ class DatabricksApiClient(dict, ApiClient):
     def url(self) -> str:
         return self.__url
 
-    @property
+    @cached_api
     def clusters(self) -> Clusters:
         return Clusters(self)
 
-    @property
+    @cached_api
     def groups(self) -> Groups:
         return Groups(self)
 
-    @property
+    @cached_api
     def jobs(self) -> Jobs:
         return Jobs(self)
 
-    @property
+    @cached_api
     def mlflow(self) -> MLFlow:
         return MLFlow(self)
 
-    @property
+    @cached_api
     def pools(self) -> Pools:
         return Pools(self)
 
-    @property
+    @cached_api
     def repos(self) -> Repos:
         return Repos(self)
 
-    @property
+    @cached_api
     def scim(self) -> SCIM:
         return SCIM(self)
 
-    @property
+    @cached_api
     def users(self) -> Users:
         return Users(self)
 
-    @property
+    @cached_api
     def sql(self) -> Sql:
         return Sql(self)
 
-    @property
+    @cached_api
     def workspace(self) -> Workspace:
         return Workspace(self)
 
-    @property
+    @cached_api
     def permissions(self) -> PermissionsApi:
         from dbacademy.clients import dbrest
 
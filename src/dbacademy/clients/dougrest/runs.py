@@ -89,15 +89,17 @@ class Runs(ApiContainer):
         runs = self.list(job_id=job_id)
         if not runs:
             return []
-        from multiprocessing.pool import ThreadPool
-        with ThreadPool(min(len(runs), 500)) as pool:
-            pool.map(lambda run: self.delete(run, if_not_exists="ignore"), runs)
+        from dbacademy.clients.rest.async_client import AsyncApiClient
+        with AsyncApiClient(self.databricks) as client:
+            runs_api = client.wrap(self)
+            client.run(client.map(lambda run: runs_api.delete(run, if_not_exists="ignore"), runs))
 
     def cancel_all(self, job_id: int = None) -> list:
         runs = self.list(job_id=job_id)
         if not runs:
             return []
 
-        from multiprocessing.pool import ThreadPool
-        with ThreadPool(min(len(runs), 500)) as pool:
-            pool.map(lambda run: self.cancel(run, if_not_exists="ignore"), runs)
+        from dbacademy.clients.rest.async_client import AsyncApiClient
+        with AsyncApiClient(self.databricks) as client:
+            runs_api = client.wrap(self)
+            client.run(client.map(lambda run: runs_api.cancel(run, if_not_exists="ignore"), runs))
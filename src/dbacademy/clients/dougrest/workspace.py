@@ -14,120 +14,85 @@ class Workspace(ApiContainer):
         filenames = [f['path'] + ('/' if f['object_type'] == 'DIRECTORY' else '') for f in files]
         return filenames
 
-    def walk(self, workspace_path, sort_key=lambda f: f['path']):
-        """Recursively list files into an iterator.  Sorting within a directory is done by the provided sort_key."""
-        for f in self.list(workspace_path, sort_key=sort_key):
-            yield f
-            if f['object_type'] == 'DIRECTORY':
-                yield from self.walk(f['path'])
+    def walk(self, workspace_path, sort_key=lambda f: f['path'], *, max_workers=8, snapshot=None):
+        """
+        Recursively list files into an iterator.  Sorting within a directory is done by the provided sort_key.
+        Directories are listed concurrently, max_workers at a time, ahead of the iteration; see WorkspaceWalker.
+        The listings are read from, and recorded in, the optional ListingSnapshot.
+        """
+        from dbacademy.clients.dougrest.workspace_walker import WorkspaceWalker
+
+        walker = WorkspaceWalker(self, max_workers=max_workers, snapshot=snapshot)
+        return walker.walk(workspace_path, sort_key=sort_key)
 
     def mkdirs(self, workspace_path):
         self.databricks.api("POST", "/api/2.0/workspace/mkdirs", {"path": workspace_path})
 
-    def copy(self, source_path, target_path, *, target_connection=None, if_exists="overwrite", exclude=None, dry_run=False):
-        exclude = exclude or set()
+    def copy(self, source_path, target_path, *, target_connection=None, if_exists="overwrite", exclude=None, dry_run=False,
+             max_workers=8, buffer_size=8, max_items=100, plan=None):
+        """
+        Copies the file or directory to target_path, possibly in the workspace of target_connection, as DBC archives.
+        The tree is split into subtrees of no more than max_items items, which are copied concurrently while holding no
+        more than buffer_size archives in memory.  Subtrees that exceed the export's size limit regardless are recorded
+        in plan, by default shared by every copy, and split without being exported again.  See WorkspaceCopier.
+        """
+        from dbacademy.clients.dougrest.workspace_copier import WorkspaceCopier
 
-        source_connection = self.databricks
         if target_connection is None:
-            target_connection = source_connection
+            target_connection = self.databricks
         # Strip trailing '/', except for root '/'
-        source_path = source_path.rstrip("/")
-        target_path = target_path.rstrip("/")
-        if not source_path:
-            source_path = "/"
-        if not target_path:
-            target_path = "/"
-        if source_path in exclude:
-            print("skip", source_path, target_path)
-            return
-        print("copy", source_path, target_path)
-        # Try to copy the entire directory at once
-        try:
-            content = source_connection.workspace.export(workspace_path=source_path, format="DBC").get("content", None)
-            if content and not dry_run:
-                target_connection.workspace.import_from_data(workspace_path=target_path, content=content,
-                                                             format="DBC", if_exists=if_exists)
-            return
+        source_path = source_path.rstrip("/") or "/"
+        target_path = target_path.rstrip("/") or "/"
 
-        except DatabricksApiException as e:
-            cause = e
-            if "exceeded the limit" in e.message:
-                pass
-            elif "Subtree size exceeds" in e.message:
-                pass
-            elif source_path.endswith("/Trash") and "RESOURCE_DOES_NOT_EXIST":
-                return  # Skip trash folders
-            elif "BAD_REQUEST: Cannot serialize item" in e.message:
-                return  # Can't copy MLFow experiments this way.  Skip it.
-            elif "BAD_REQUEST: Cannot serialize library" in e.message:
-                return  # Can't copy libraries this way.  Skip it.
-            else:
-                raise e
-        # If the size limit was exceeded for a file (not a directory) raise the error
-        source_files = source_connection.workspace.list_names(workspace_path=source_path)
-        if source_files == [source_path]:
-            raise cause
-        # If the size limit was exceeded for a directory, copy the directory item by item to break
-        # it into smaller chunks
-        prefix_len = len(source_path)
-        if source_path == "/":
-            prefix_len = 0
-        target_connection.workspace.mkdirs(target_path)
-        for s in sorted(source_files):
-            t = target_path + s[prefix_len:]
-            self.copy(source_path=s,
-                      target_path=t,
-                      target_connection=target_connection,
-                      if_exists=if_exists,
-                      exclude=exclude)
+        copier = WorkspaceCopier(self.databricks, target_connection,
+                                 max_workers=max_workers,
+                                 buffer_size=buffer_size,
+                                 max_items=max_items,
+                                 plan=plan)
+        copier.copy(source_path, target_path, if_exists=if_exists, exclude=exclude, dry_run=dry_run)
 
     # TODO Remove unused parameter
     # noinspection PyUnusedLocal
-    def compare(self, source_path, target_path, target_connection=None, compare_contents=False):
+    def compare(self, source_path, target_path, target_connection=None, compare_contents=False, *,
+                max_workers=8, source_snapshot=None, target_snapshot=None):
         """
         Recursively compare the filenames and types, but not contents of the files.
         Returns iterator of files that don't have a match on the other side.
 
         compare_contents is a no-op currently and doesn't change anything.
 
+        Both trees are walked concurrently, each listing up to max_workers directories at a time.  A ListingSnapshot
+        of either side lets repeated comparisons against an unchanged tree skip its listings; see Workspace.walk().
+
         This methods signature and behavior is subject to change.  Maintainers are invited to improve it.
         """
         source_connection = self.databricks
         if target_connection is None:
-            target_connection = self
+            target_connection = self.databricks
         # Strip training '/', except for root '/'
-        source_path = source_path.rstrip("/")
-        target_path = target_path.rstrip("/")
-        if not source_path:
-            source_path = "/"
-        if not target_path:
-            target_path = "/"
+        source_path = source_path.rstrip("/") or "/"
+        target_path = target_path.rstrip("/") or "/"
         # Compare the tree contents
-        source_iter = source_connection.workspace.walk(source_path)
-        target_iter = target_connection.workspace.walk(target_path)
+        source_iter = source_connection.workspace.walk(source_path, max_workers=max_workers, snapshot=source_snapshot)
+        target_iter = target_connection.workspace.walk(target_path, max_workers=max_workers, snapshot=target_snapshot)
         source_prefix_len = len(source_path)
         target_prefix_len = len(target_path)
-        try:
-            s = next(source_iter)
-            t = next(target_iter)
-            while True:
-                s_name = s['path'][source_prefix_len:]
-                t_name = t['path'][target_prefix_len:]
-                if s_name < t_name:
-                    yield s, None
-                    s = next(source_iter)
-                elif s_name > t_name:
-                    yield None, t
-                    t = next(target_iter)
-                else:
-                    if s['object_type'] != t['object_type'] or s.get('language', None) != t.get('language', None):
-                        yield s, t
-                    s = next(source_iter)
-                    t = next(target_iter)
-        except StopIteration:
-            from itertools import zip_longest
-            yield from zip_longest(source_iter, [], fillvalue=None)
-            yield from zip_longest([], target_iter, fillvalue=None)
+        s = next(source_iter, None)
+        t = next(target_iter, None)
+        while s is not None or t is not None:
+            s_name = s['path'][source_prefix_len:] if s is not None else None
+            t_name = t['path'][target_prefix_len:] if t is not None else None
+            if t is None or (s is not None and s_name < t_name):
+                yield s, None
+                s = next(source_iter, None)
+            elif s is None or s_name > t_name:
+                yield None, t
+                t = next(target_iter, None)
+            else:
+                if s['object_type'] != t['object_type'] or s.get('language', None) != t.get('language', None):
+                    yield s, t
+                s = next(source_iter, None)
+                t = next(target_iter, None)
 
     def exists(self, workspace_path):
         try:
@@ -201,12 +166,15 @@ class Workspace(ApiContainer):
 
     # TODO Rename parameter "format"
     # noinspection PyShadowingBuiltins
-    def export(self, workspace_path, format="DBC"):
+    def export(self, workspace_path, format="DBC", *, direct_download=False):
         data = {
             "path": workspace_path,
             "format": format,
         }
-        if format == "DBC":
+        if direct_download:
+            data["direct_download"] = "true"
+            return self.databricks.api("GET", "/api/2.0/workspace/export", data, _result_type=bytes)
+        elif format == "DBC":
             return self.databricks.api("GET", "/api/2.0/workspace/export", data, _result_type=bytes)
         else:
             return self.databricks.api("GET", "/api/2.0/workspace/export", data, _result_type=str)
@@ -0,0 +1,225 @@
+__all__ = ["CopyPlan", "WorkspaceCopier"]
+
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from dbacademy.clients.rest.common import DatabricksApiException
+
+# The nominal size of a notebook, used to weigh files whose listing reports their size in bytes.
+ITEM_BYTES = 64 * 1024
+
+
+class CopyPlan:
+    """
+    The source paths known to be too large to export as a single DBC. Marked paths are split into their children
+    without first attempting the export, so sharing one plan across the copies of the same tree, e.g. to each workspace
+    of a fleet, only pays for each failed attempt once.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__oversized: Set[str] = set()
+
+    def is_oversized(self, source_path: str) -> bool:
+        with self.__lock:
+            return source_path in self.__oversized
+
+    def mark_oversized(self, source_path: str) -> None:
+        with self.__lock:
+            self.__oversized.add(source_path)
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__oversized)
+
+    def __iter__(self) -> Iterator[str]:
+        with self.__lock:
+            return iter(sorted(self.__oversized))
+
+
+class WorkspaceCopier:
+    """
+    Copies a workspace tree from one connection to another as DBC archives. The tree is listed first and split into
+    subtrees of no more than max_items items, which are exported and imported concurrently, each export being retried
+    on its children should it still exceed the size limit. At most buffer_size archives are held in memory at a time,
+    export workers blocking until the import of an earlier archive completes.
+    """
+
+    # The plan shared by copies that do not specify their own.
+    default_plan = CopyPlan()
+
+    def __init__(self, source_connection: Any, target_connection: Any, *, max_workers: int = 8, buffer_size: int = 8, max_items: int = 100, plan: CopyPlan = None):
+        """
+        :param source_connection: the DatabricksApiClient to export from.
+        :param target_connection: the DatabricksApiClient to import into.
+        :param max_workers: the number of concurrent exports, and likewise of concurrent imports.
+        :param buffer_size: the maximum number of exported archives held in memory at a time.
+        :param max_items: the maximum number of items exported as a single archive; see ITEM_BYTES.
+        :param plan: the CopyPlan recording oversized subtrees, by default WorkspaceCopier.default_plan.
+        """
+        from dbacademy.common import validate
+
+        self.__source = source_connection
+        self.__target = target_connection
+        self.__max_workers = validate(max_workers=max_workers).required.int(min_value=1)
+        self.__buffer_size = validate(buffer_size=buffer_size).required.int(min_value=1)
+        self.__max_items = validate(max_items=max_items).required.int(min_value=1)
+        self.__plan = self.default_plan if plan is None else validate(plan=plan).required.as_type(CopyPlan)
+
+    @property
+    def plan(self) -> CopyPlan:
+        return self.__plan
+
+    @staticmethod
+    def is_size_limit(e: DatabricksApiException) -> bool:
+        return "exceeded the limit" in e.message or "Subtree size exceeds" in e.message
+
+    @staticmethod
+    def is_skippable(source_path: str, e: DatabricksApiException) -> bool:
+        if source_path.endswith("/Trash"):
+            return True  # Skip trash folders
+        elif "BAD_REQUEST: Cannot serialize item" in e.message:
+            return True  # Can't copy MLFow experiments this way.  Skip it.
+        elif "BAD_REQUEST: Cannot serialize library" in e.message:
+            return True  # Can't copy libraries this way.  Skip it.
+        else:
+            return False
+
+    def __list_tree(self, source_path: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Lists the tree one level at a time, returning the children of each directory keyed by its path."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        def list_children(path: str) -> Optional[List[Dict[str, Any]]]:
+            try:
+                return self.__source.workspace.list(path)
+            except DatabricksApiException as e:
+                if path.endswith("/Trash") and e.error_code == "RESOURCE_DOES_NOT_EXIST":
+                    return None
+                raise e
+
+        tree: Dict[str, List[Dict[str, Any]]] = dict()
+        level = [source_path]
+
+        with ThreadPoolExecutor(max_workers=self.__max_workers, thread_name_prefix="dbacademy-copy") as executor:
+            while len(level) > 0:
+                next_level = list()
+                for path, children in zip(level, executor.map(list_children, level)):
+                    if children is not None:
+                        tree[path] = children
+                        next_level.extend(c["path"] for c in children if c["object_type"] == "DIRECTORY")
+                level = next_level
+
+        return tree
+
+    @staticmethod
+    def __weigh(tree: Dict[str, List[Dict[str, Any]]], path: str, weights: Dict[str, int]) -> int:
+        weight = 0
+        for child in tree.get(path, list()):
+            if child["object_type"] == "DIRECTORY":
+                weight += WorkspaceCopier.__weigh(tree, child["path"], weights)
+            else:
+                weight += max(1, -(-child.get("size", 0) // ITEM_BYTES))
+        weights[path] = weight
+        return weight
+
+    def copy(self, source_path: str, target_path: str, *, if_exists: str = "overwrite", exclude: Set[str] = None, dry_run: bool = False) -> None:
+        """
+        :param source_path: the file or directory to copy.
+        :param target_path: the path of the copy in the target workspace.
+        :param if_exists: one of "overwrite", "ignore" or "error"; see Workspace.import_from_data().
+        :param exclude: source paths that are not copied.
+        :param dry_run: when True, the tree is exported but nothing is imported or created in the target workspace.
+        """
+        import base64
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+        exclude = exclude or set()
+        tree = self.__list_tree(source_path)
+
+        # The listing of a file is the file itself
+        root = tree.get(source_path, list())
+        is_file = len(root) == 1 and root[0]["path"] == source_path and root[0]["object_type"] != "DIRECTORY"
+        if is_file:
+            del tree[source_path]
+
+        weights: Dict[str, int] = dict()
+        self.__weigh(tree, source_path, weights)
+
+        slots = threading.BoundedSemaphore(self.__buffer_size)
+        aborted = threading.Event()
+
+        def export(source: str) -> bytes:
+            from concurrent.futures import CancelledError
+
+            while not slots.acquire(timeout=0.1):
+                if aborted.is_set():
+                    raise CancelledError()
+            try:
+                return self.__source.workspace.export(source, "DBC", direct_download=True)
+            except BaseException:
+                slots.release()
+                raise
+
+        def import_data(target: str, data: bytes) -> None:
+            try:
+                content = base64.b64encode(data).decode("utf-8")
+                self.__target.workspace.import_from_data(content, target, "DBC", if_exists=if_exists)
+            finally:
+                slots.release()
+
+        with ThreadPoolExecutor(max_workers=self.__max_workers, thread_name_prefix="dbacademy-export") as exporter, \
+             ThreadPoolExecutor(max_workers=self.__max_workers, thread_name_prefix="dbacademy-import") as importer:
+
+            pending: Dict[Any, Any] = dict()
+
+            def split(source: str, target: str) -> None:
+                if not dry_run:
+                    self.__target.workspace.mkdirs(target)
+                prefix_len = 0 if source == "/" else len(source)
+                for child in tree[source]:
+                    schedule(child["path"], target.rstrip("/") + child["path"][prefix_len:])
+
+            def schedule(source: str, target: str) -> None:
+                excluded = any(e == source or e.startswith(source.rstrip("/") + "/") for e in exclude)
+
+                if source in exclude:
+                    print("skip", source, target)
+                elif source in tree and (excluded or weights[source] > self.__max_items or self.__plan.is_oversized(source)):
+                    split(source, target)
+                else:
+                    print("copy", source, target)
+                    pending[exporter.submit(export, source)] = (source, target)
+
+            try:
+                schedule(source_path, target_path)
+
+                while len(pending) > 0:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        source, target = pending.pop(future)
+
+                        if target is None:
+                            future.result()  # Raises the import's exception, if any
+
+                        elif future.exception() is None:
+                            if dry_run:
+                                slots.release()
+                            else:
+                                pending[importer.submit(import_data, target, future.result())] = (source, None)
+
+                        elif not isinstance(future.exception(), DatabricksApiException):
+                            raise future.exception()
+
+                        elif self.is_size_limit(future.exception()) and source in tree:
+                            self.__plan.mark_oversized(source)
+                            split(source, target)
+
+                        elif not self.is_skippable(source, future.exception()):
+                            raise future.exception()
+            except BaseException:
+                # Unblock the exports waiting for a slot, whose archives would never be imported
+                aborted.set()
+                for future in pending:
+                    future.cancel()
+                raise
@@ -0,0 +1,111 @@
+__all__ = ["ListingSnapshot", "WorkspaceWalker"]
+
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+class ListingSnapshot:
+    """
+    The directory listings of a workspace keyed by path. A WorkspaceWalker reads the listings the snapshot holds instead
+    of requesting them and records those it does request, so walking an unchanged tree a second time, e.g. when
+    comparing it to several others, makes no requests at all.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__listings: Dict[str, List[Dict[str, Any]]] = dict()
+
+    def get(self, workspace_path: str) -> Optional[List[Dict[str, Any]]]:
+        with self.__lock:
+            return self.__listings.get(workspace_path)
+
+    def put(self, workspace_path: str, objects: List[Dict[str, Any]]) -> None:
+        with self.__lock:
+            self.__listings[workspace_path] = objects
+
+    def invalidate(self, workspace_path: str = None) -> None:
+        """Discards the listings of the directory and its descendants, or every listing if workspace_path is None."""
+        with self.__lock:
+            if workspace_path is None:
+                self.__listings.clear()
+            else:
+                prefix = workspace_path.rstrip("/") + "/"
+                for path in [p for p in self.__listings if p == workspace_path or p.startswith(prefix)]:
+                    del self.__listings[path]
+
+    def __contains__(self, workspace_path: str) -> bool:
+        with self.__lock:
+            return workspace_path in self.__listings
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__listings)
+
+
+class WorkspaceWalker:
+    """
+    Walks a workspace tree depth-first, in the same order as listing one directory at a time, while prefetching the
+    listings breadth-first with max_workers concurrent requests: as soon as a directory is listed, the listings of its
+    subdirectories are requested, well before the walk reaches them.
+    """
+
+    def __init__(self, workspace: Any, *, max_workers: int = 8, snapshot: ListingSnapshot = None):
+        """
+        :param workspace: the dougrest Workspace to list.
+        :param max_workers: the maximum number of concurrent listings.
+        :param snapshot: the ListingSnapshot to read listings from and record them in, if any.
+        """
+        from dbacademy.common import validate
+
+        self.__workspace = workspace
+        self.__max_workers = validate(max_workers=max_workers).required.int(min_value=1)
+        self.__snapshot = None if snapshot is None else validate(snapshot=snapshot).required.as_type(ListingSnapshot)
+
+    def list(self, workspace_path: str) -> List[Dict[str, Any]]:
+        objects = None if self.__snapshot is None else self.__snapshot.get(workspace_path)
+
+        if objects is None:
+            objects = self.__workspace.list(workspace_path)
+            if self.__snapshot is not None:
+                self.__snapshot.put(workspace_path, objects)
+
+        return objects
+
+    def walk(self, workspace_path: str, sort_key: Callable[[Dict[str, Any]], Any] = lambda f: f['path']) -> Iterator[Dict[str, Any]]:
+        """Recursively list files into an iterator.  Sorting within a directory is done by the provided sort_key."""
+        from concurrent.futures import ThreadPoolExecutor, Future
+
+        lock = threading.Lock()
+        futures: Dict[str, Future] = dict()
+        closed = False
+
+        def list_directory(path: str) -> List[Dict[str, Any]]:
+            objects = sorted(self.list(path), key=sort_key)
+            for f in objects:
+                if f['object_type'] == 'DIRECTORY':
+                    prefetch(f['path'])
+            return objects
+
+        def prefetch(path: str) -> None:
+            with lock:
+                if not closed:
+                    futures[path] = executor.submit(list_directory, path)
+
+        def visit(path: str) -> Iterator[Dict[str, Any]]:
+            with lock:
+                future = futures.pop(path)
+
+            for f in future.result():
+                yield f
+                if f['object_type'] == 'DIRECTORY':
+                    yield from visit(f['path'])
+
+        executor = ThreadPoolExecutor(max_workers=self.__max_workers, thread_name_prefix="dbacademy-walk")
+        try:
+            prefetch(workspace_path)
+            yield from visit(workspace_path)
+        finally:
+            # Stops prefetching should the caller not exhaust the walk
+            with lock:
+                closed = True
+            executor.shutdown(wait=False, cancel_futures=True)
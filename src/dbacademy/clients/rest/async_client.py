@@ -0,0 +1,169 @@
+"""
+An asyncio front-end for the REST clients.
+
+AsyncApiClient mirrors any ApiClient, and in particular every sub-API of DBAcademyRestClient (scim, jobs, runs,
+workspace, clusters, sql.warehouses, etc.), as coroutines:
+
+    async with AsyncApiClient(dbrest.from_token(...)) as client:
+        users = await client.scim.users.list()
+        runs = await asyncio.gather(*[client.runs.get(run_id) for run_id in run_ids])
+
+Thousands of requests can be awaited concurrently from a single event loop while the blocking HTTP I/O is performed by
+a small, bounded pool of worker threads, sized by default to the client's connection pool.  Requests therefore still
+flow through the wrapped client's Transport, RateLimiter and retry handling.  The wrapped, synchronous client remains
+available as AsyncApiClient.sync.
+"""
+from __future__ import annotations
+
+__all__ = ["AsyncApiClient", "AsyncApi"]
+
+import asyncio
+import functools
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Type, TypeVar
+from dbacademy.common import validate
+from dbacademy.clients.rest.common import ApiClient, ApiContainer, HttpMethod, HttpReturnType, HttpStatusCodes
+
+T = TypeVar("T")
+
+
+class AsyncApi:
+    """
+    An asynchronous view of a synchronous ApiContainer.
+
+    Methods become coroutine functions, generator methods become async generators, nested ApiContainers (e.g.
+    scim.users or sql.warehouses) are themselves wrapped, and all other attributes are returned unchanged.
+    """
+
+    def __init__(self, api: ApiContainer, executor: ThreadPoolExecutor):
+        self.__api = validate(api=api).required.as_type(ApiContainer)
+        self.__executor = executor
+
+    @property
+    def sync(self) -> ApiContainer:
+        """The wrapped, synchronous API."""
+        return self.__api
+
+    def __call__(self) -> AsyncApi:
+        """Returns itself.  Provided for symmetry with ApiContainer."""
+        return self
+
+    def __getattr__(self, name: str) -> Any:
+        member = getattr(self.__api, name)
+
+        if isinstance(member, ApiContainer):
+            return AsyncApi(member, self.__executor)
+
+        elif inspect.isgeneratorfunction(getattr(type(self.__api), name, None)):
+            return functools.partial(self.__iterate, member)
+
+        elif callable(member):
+            return functools.partial(self.__invoke, member)
+
+        else:
+            return member
+
+    async def __invoke(self, function: Callable[..., T], *args, **kwargs) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.__executor, functools.partial(function, *args, **kwargs))
+
+    async def __iterate(self, function: Callable[..., Iterable[T]], *args, **kwargs) -> AsyncIterator[T]:
+        loop = asyncio.get_running_loop()
+        iterator = iter(await loop.run_in_executor(self.__executor, functools.partial(function, *args, **kwargs)))
+        sentinel = object()
+
+        while (item := await loop.run_in_executor(self.__executor, next, iterator, sentinel)) is not sentinel:
+            yield item
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.__api!r})"
+
+
+class AsyncApiClient(AsyncApi):
+
+    def __init__(self, client: ApiClient, *, max_concurrency: int = None):
+        """
+        Args:
+            client: The synchronous client to mirror, typically a DBAcademyRestClient.
+            max_concurrency: The maximum number of requests in flight at once, i.e. the number of worker threads.
+                Defaults to the client's Transport.pool_maxsize so that every in-flight request has a pooled connection.
+        """
+        client = validate(client=client).required.as_type(ApiClient)
+        max_concurrency = validate(max_concurrency=max_concurrency).optional.int(min_value=1) or client.transport.pool_maxsize
+
+        self.__client = client
+        self.__max_concurrency = max_concurrency
+        self.__executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="dbacademy-async")
+
+        super().__init__(client, self.__executor)
+
+    @property
+    def sync(self) -> ApiClient:
+        """The wrapped, synchronous client."""
+        return self.__client
+
+    @property
+    def max_concurrency(self) -> int:
+        return self.__max_concurrency
+
+    async def api(self,
+                  _http_method: HttpMethod,
+                  _endpoint_path: str,
+                  _data: Dict[str, Any] = None,
+                  *,
+                  _expected: HttpStatusCodes = None,
+                  _result_type: Type[HttpReturnType] = dict,
+                  _base_url: str = None,
+                  **data: Any) -> HttpReturnType:
+        """The coroutine equivalent of ApiClient.api(); see ApiClient.api() for a description of the parameters."""
+        loop = asyncio.get_running_loop()
+        call = functools.partial(self.__client.api, _http_method, _endpoint_path, _data,
+                                 _expected=_expected, _result_type=_result_type, _base_url=_base_url, **data)
+        return await loop.run_in_executor(self.__executor, call)
+
+    def wrap(self, api: ApiContainer) -> AsyncApi:
+        """Mirrors another ApiContainer, e.g. one not reachable from this client, on this client's worker threads."""
+        return AsyncApi(api, self.__executor)
+
+    @staticmethod
+    async def map(function: Callable[[T], Awaitable[Any]], items: Iterable[T]) -> List[Any]:
+        """
+        Awaits function(item) for every item concurrently, returning the results in the order of items.
+        Concurrency is bounded by the client's max_concurrency, not by the number of items.
+        """
+        return list(await asyncio.gather(*[function(item) for item in items]))
+
+    @staticmethod
+    def run(awaitable: Awaitable[T]) -> T:
+        """
+        Synchronously runs the awaitable to completion and returns its result.
+
+        Unlike asyncio.run(), this also works when called from a thread that is already running an event loop, such
+        as a notebook cell, by running the awaitable on a new loop in a helper thread.
+        """
+        async def main():
+            return await awaitable
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(main())
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, main()).result()
+
+    def close(self) -> None:
+        self.__executor.shutdown(wait=True)
+
+    def __enter__(self) -> AsyncApiClient:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    async def __aenter__(self) -> AsyncApiClient:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        self.close()
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
-__all__ = ["ApiContainer", "ApiClient", "DatabricksApiException",
+__all__ = ["ApiContainer", "ApiClient", "DatabricksApiException", "cached_api",
            "HttpStatusCodes", "HttpMethod", "HttpReturnType", "IfNotExists", "IfExists",
            "Item", "ItemId", "ItemOrId"]
 
 import requests
+import threading
 from pprint import pformat
-from dbacademy.common import validate
+from dbacademy.common import validate, Schema
 from requests.adapters import HTTPAdapter
 from dbacademy.clients import ClientErrorHandler
-from typing import Any, Container, Dict, Type, TypeVar, Union, Literal
+from dbacademy.clients.rest.transport import Transport
+from dbacademy.clients.rest.rate_limiter import RateLimiter, parse_retry_after
+from typing import Any, Callable, Container, Dict, Generic, Optional, Type, TypeVar, Union, Literal
 
 HttpStatusCodes = Union[int, Container[int]]
 HttpMethod = Literal["GET", "PUT", "POST", "DELETE", "PATCH", "HEAD", "OPTIONS"]
@@ -22,11 +25,83 @@ Item = Dict
 ItemId = Union[int, str]
 ItemOrId = Union[int, str, Dict]
 
+ApiType = TypeVar("ApiType")
+
+
+# noinspection PyPep8Naming
+class cached_api(Generic[ApiType]):
+    """
+    A read-only property whose value, typically a sub-API such as client.clusters, is created on first access and then
+    stored on the instance.  Later accesses are plain attribute lookups that bypass the descriptor altogether.  Creation
+    is guarded by a lock so that threads racing on the first access share a single value.
+    """
+
+    def __init__(self, factory: Callable[[Any], ApiType]):
+        self.__factory = factory
+        self.__name = factory.__name__
+        self.__lock = threading.RLock()
+        self.__doc__ = factory.__doc__
+
+    def __set_name__(self, owner, name):
+        self.__name = name
+
+    def __get__(self, instance, owner=None) -> ApiType:
+        if instance is None:
+            return self
+
+        with self.__lock:
+            value = instance.__dict__.get(self.__name, self)
+            if value is self:
+                value = self.__factory(instance)
+                instance.__dict__[self.__name] = value
+
+        return value
+
 
 class ApiContainer(object):
 
     T = TypeVar('T')
 
+    # The classes whose docstrings were formatted by _format_docstrings(), each formatted once.
+    __formatted_classes = set()
+    __formatted_lock = threading.Lock()
+
+    def _format_docstrings(self) -> None:
+        """
+        Replaces the placeholders in the docstrings of this class' methods, e.g. {singular}, with the values of this
+        instance's attributes.  This is done once per class, on construction of its first instance.  Methods inherited
+        from a base class are copied onto this class before being formatted so that sibling classes, formatted with
+        other values, do not overwrite each other's docstrings.
+        """
+        import functools
+        from types import FunctionType
+
+        cls = type(self)
+
+        with ApiContainer.__formatted_lock:
+            if cls in ApiContainer.__formatted_classes:
+                return
+            ApiContainer.__formatted_classes.add(cls)
+
+            seen = set()
+            for klass in cls.__mro__[:cls.__mro__.index(ApiContainer)]:
+                for name, member in list(klass.__dict__.items()):
+                    if name.startswith("__") or name in seen:
+                        continue
+                    seen.add(name)
+
+                    # The unformatted docstring, kept on the copies for the benefit of subclasses.
+                    template = getattr(member, "_doc_template", getattr(member, "__doc__", None))
+                    if not isinstance(member, FunctionType) or not isinstance(template, str) or "{" not in template:
+                        continue
+
+                    method = FunctionType(member.__code__, member.__globals__, member.__name__, member.__defaults__, member.__closure__)
+                    functools.update_wrapper(method, member)
+                    method.__kwdefaults__ = member.__kwdefaults__
+                    method.__doc__ = template.format(**self.__dict__)
+                    method._doc_template = template
+                    setattr(cls, name, method)
+
     def __call__(self: T) -> T:
         """Returns itself.  Provided for backwards compatibility."""
         return self
@@ -53,6 +128,23 @@ class ApiClient(ApiContainer):
     dns_retry: bool = False
     trace: bool = False
 
+    __SCHEMA = Schema(verbose=Schema.required.bool(),
+                      endpoint=Schema.required.str(),
+                      token=Schema.optional.str(),
+                      username=Schema.optional.str(),
+                      password=Schema.optional.str(),
+                      authorization_header=Schema.optional.str(),
+                      throttle_seconds=Schema.required.int(),
+                      error_handler=Schema.required.as_type(ClientErrorHandler),
+                      rate_limiter=Schema.optional.as_type(RateLimiter),
+                      transport=Schema.optional.as_type(Transport))
+
+    # Validated once per request, see ApiClient.api()
+    __API_SCHEMA = Schema(_data=Schema.optional.dict(str, auto_create=True),
+                          _base_url=Schema.optional.str(),
+                          _endpoint_path=Schema.optional.str(),
+                          _http_method=Schema.required.as_one_of(str, HttpMethod))
+
     def __init__(self,
                  endpoint: str,
                  *,
@@ -63,7 +155,9 @@ class ApiClient(ApiContainer):
                  client: ApiClient = None,
                  throttle_seconds: int = 0,
                  verbose: bool = False,
-                 error_handler: ClientErrorHandler = ClientErrorHandler()):
+                 error_handler: ClientErrorHandler = ClientErrorHandler(),
+                 transport: Transport = None,
+                 rate_limiter: RateLimiter = None):
         """
         Create a Databricks REST API client.
 
@@ -75,26 +169,35 @@ class ApiClient(ApiContainer):
             authorization_header: The header to use for authentication.
                 By default, it's generated from the token or password.
             client: A parent ApiClient from which to clone settings.
-            throttle_seconds: Number of seconds to sleep between requests.
+            throttle_seconds: Number of seconds to sleep between requests.  When greater than zero and no rate_limiter
+                is specified, this client gets its own fixed-interval RateLimiter, a single bucket spacing all of the
+                client's requests whatever their host or endpoint family.
+            transport: The connection pools to send requests through.  Defaults to the parent client's transport
+                when a client is specified, otherwise to a new Transport with default pool sizes.
+            rate_limiter: The RateLimiter metering this client's requests, e.g. the process-wide RateLimiter.shared().
+                Defaults to the parent client's limiter when a client is specified, otherwise to None, in which case
+                requests are not metered and only rate-limited responses are retried after a delay.
         """
         super().__init__()
         import requests, base64
 
-        self.__verbose = validate(verbose=verbose).required.bool()
+        check = self.__SCHEMA.check
+
+        self.__verbose = check("verbose", verbose)
 
         # We always have to have an endpoint.
-        self.__endpoint = validate(endpoint=endpoint).required.str().rstrip("/")
+        self.__endpoint = check("endpoint", endpoint).rstrip("/")
         if client is not None and "://" not in endpoint:
             # We have a client, and we don't have an absolute endpoint, combine them.
             self.__endpoint = client.endpoint.lstrip("/") + "/" + self.__endpoint
 
         # The remaining parameters are all conditional depending on what was first provided.
-        self.__token = validate(token=token).optional.str()
-        self.__username = validate(username=username).optional.str()
-        self.__password = validate(password=password).optional.str()
+        self.__token = check("token", token)
+        self.__username = check("username", username)
+        self.__password = check("password", password)
 
         if authorization_header is not None:
-            self.__authorization_header = validate(authorization_header=authorization_header).optional.str()
+            self.__authorization_header = check("authorization_header", authorization_header)
         elif token is not None:
             self.__authorization_header = f"Bearer {token}"
         elif username is not None and password is not None:
@@ -106,13 +209,21 @@ class ApiClient(ApiContainer):
             pass  # This is an unauthenticated clients
             self.__authorization_header = None
 
-        self.__throttle_seconds = validate(throttle_seconds=throttle_seconds).required.int()
-        self.__error_handler = validate(error_handler=error_handler).required.as_type(ClientErrorHandler)
+        self.__throttle_seconds = check("throttle_seconds", throttle_seconds)
+        self.__error_handler = check("error_handler", error_handler)
 
         self.__read_timeout = 300   # seconds
         self.__connect_timeout = 5  # seconds
         self.__max_retries = 25
-        self.__last_request_timestamp = 0  # No property for this one.
+
+        if rate_limiter is not None:
+            self.__rate_limiter = check("rate_limiter", rate_limiter)
+        elif self.throttle_seconds > 0 and (client is None or client.throttle_seconds != self.throttle_seconds):
+            self.__rate_limiter = RateLimiter.fixed_interval(self.throttle_seconds)
+        elif client is not None:
+            self.__rate_limiter = client.rate_limiter  # Share rate limits with our parent
+        else:
+            self.__rate_limiter = None  # Rate limiting is opt-in, see RateLimiter.shared()
 
         # Reference information for this backoff/retry issues
         # https://stackoverflow.com/questions/47675138/how-to-override-backoff-max-while-working-with-requests-retry
@@ -135,15 +246,13 @@ class ApiClient(ApiContainer):
         # retry = Retry(connect=connection_retries,
         #               backoff_factor=backoff_factor)
 
+        if transport is None and client is not None:
+            transport = client.transport  # Share connection pools with our parent
+        self.__transport = check("transport", transport) or Transport()
+
         self.__session = requests.Session()
         self.session.headers = {'Authorization': self.authorization_header, 'Content-Type': 'text/json'}
-        
-        self.__http_adapter = HTTPAdapter()
-        # self.http_adapter = HTTPAdapter(max_retries=retry)
-
-        # noinspection HttpUrlsUsage
-        self.session.mount('http://', self.http_adapter)
-        self.session.mount('https://', self.http_adapter)
+        self.transport.mount(self.session)
 
     def vprint(self, what):
         if self.verbose:
@@ -163,7 +272,11 @@ class ApiClient(ApiContainer):
 
     @property
     def http_adapter(self) -> HTTPAdapter:
-        return self.__http_adapter
+        return self.transport.adapter
+
+    @property
+    def transport(self) -> Transport:
+        return self.__transport
 
     @property
     def verbose(self) -> bool:
@@ -205,6 +318,10 @@ class ApiClient(ApiContainer):
     def error_handler(self) -> ClientErrorHandler:
         return self.__error_handler
 
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        return self.__rate_limiter
+
     def api(self,
             _http_method: HttpMethod,
             _endpoint_path: str,
@@ -242,20 +359,20 @@ class ApiClient(ApiContainer):
         import json, time, math
         from urllib.parse import urljoin
 
-        _data = validate(_data=_data).optional.dict(str, auto_create=True)
+        check = self.__API_SCHEMA.check
+
+        _data = check("_data", _data)
         if data:
             _data = _data.copy()
             _data.update(data)
 
-        _base_url = validate(_base_url=_base_url).optional.str()
+        _base_url = check("_base_url", _base_url)
         _base_url: str = urljoin(self.endpoint, _base_url)
 
         if self.dns_verify:
             self._verify_hostname(_base_url)
 
-        self._throttle_calls()
-
-        validate(_endpoint_path=_endpoint_path).optional.str()
+        check("_endpoint_path", _endpoint_path)
         if _endpoint_path.startswith(_base_url):
             _endpoint_path = _endpoint_path[len(_base_url):]
 
@@ -270,8 +387,9 @@ class ApiClient(ApiContainer):
         response = None  # Precluding warning
         attempts = 0     # Counter for debugging
 
-        validate(_http_method=_http_method).required.as_one_of(str, HttpMethod)
+        check("_http_method", _http_method)
         for attempt in range(self.max_retries):
+            self._throttle_calls(endpoint)
             try:
                 if _http_method in ('GET', 'HEAD', 'OPTIONS'):
                     params = {k: str(v).lower() if isinstance(v, bool) else v for k, v in _data.items()}
@@ -284,14 +402,29 @@ class ApiClient(ApiContainer):
                         print(f"{_http_method} {endpoint}: data={json_data}")
                     response = self.session.request(_http_method, endpoint, data=json_data, timeout=timeout)
 
-                if response.status_code == 500:
-                    if "REQUEST_LIMIT_EXCEEDED" not in response.text:
-                        attempts = attempt
-                        break  # Don't retry, this is a hard fail, not rate-limited
-                elif response.status_code not in [429]:
+                if not self._is_rate_limited(response):
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.on_success(endpoint)
                     attempts = attempt
                     break  # Don't retry, either we passed or it's a hard fail.
 
+                # Attempt 1=1s, 2=1s, 3=5s, 4=16s, 5=13s, etc... unless the server tells us otherwise.
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                duration = math.ceil(attempt * attempt / 2) if retry_after is None else retry_after
+
+                # No retry follows the final attempt, so there is nothing to wait for.
+                if attempt + 1 >= self.max_retries:
+                    duration = None
+
+                if self.rate_limiter is not None:
+                    # Pause the whole bucket so that every thread calling this endpoint family backs off together.
+                    self.rate_limiter.on_throttled(endpoint, duration)
+                elif duration is not None:
+                    time.sleep(duration)
+                if verbose:
+                    print(f"Rate limited, retrying after {duration}s, attempt {attempt+1} of {self.max_retries+1}: {_http_method} {endpoint}")
+                continue
+
             except requests.exceptions.ConnectionError as e:
                 connection_errors += 1
                 if connection_errors >= 2:
@@ -365,16 +498,16 @@ class ApiClient(ApiContainer):
                     time.sleep(i*2)
             raise ConnectionError(f"""DNS lookup for hostname failed for "{test_url.hostname}" after {retries} retries.""") from last_exception
 
-    def _throttle_calls(self):
-        if self.throttle_seconds <= 0:
-            return
-        import time
-        now = time.time()
-        elapsed = now - self.__last_request_timestamp
-        sleep_seconds = self.throttle_seconds - elapsed
-        if sleep_seconds > 0:
-            time.sleep(sleep_seconds)
-        self.__last_request_timestamp = time.time()
+    def _throttle_calls(self, url: str) -> None:
+        """Blocks until the rate limiter, if any, allows another request to the url's host and endpoint family."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(url)
+
+    @staticmethod
+    def _is_rate_limited(response: requests.Response) -> bool:
+        if response.status_code == 429:
+            return True
+        return response.status_code == 500 and "REQUEST_LIMIT_EXCEEDED" in response.text
 
     @staticmethod
     def _raise_for_status(response: requests.Response, expected: Union[int, Container[int]] = None) -> None:
@@ -37,12 +37,7 @@ class CRUD(ApiContainer, metaclass=ABCMeta):
         self.id_key = id_key or noun + "_id"
         self.name_key = name_key or noun + "_name"
         # Update doc strings, replacing placeholders with actual values.
-        cls = type(self)
-        methods = [attr for attr in dir(cls) if not attr.startswith("__") and callable(getattr(cls, attr))]
-        for name in methods:
-            m = getattr(cls, name)
-            if isinstance(m.__doc__, str):
-                m.__doc__ = m.__doc__.format(**self.__dict__)
+        self._format_docstrings()
 
     @abstractmethod
     def _list(self, *, _expected: HttpStatusCodes = None) -> List[Item]:
@@ -0,0 +1,45 @@
+"""
+Streaming support for paginated list endpoints.
+"""
+from __future__ import annotations
+
+__all__ = ["paginate", "PageFetcher"]
+
+from typing import Any, Callable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Given the cursor for a page (None for the first page unless specified otherwise), returns that page's items and the
+# cursor for the next page, or None if this was the last page.
+PageFetcher = Callable[[Optional[Any]], Tuple[List[T], Optional[Any]]]
+
+
+def paginate(fetch_page: PageFetcher, first_cursor: Any = None, *, prefetch: bool = False) -> Iterator[T]:
+    """
+    Yields every item of a paginated listing, one page at a time, without accumulating the pages.
+
+    :param fetch_page: the function that fetches one page, see PageFetcher.
+    :param first_cursor: the cursor passed to fetch_page for the first page, e.g. an offset or start index.
+    :param prefetch: when True, the next page is fetched on a background thread while the caller consumes the current one.
+    :return: an iterator over every item of every page.
+    """
+    if not prefetch:
+        cursor = first_cursor
+        while True:
+            items, cursor = fetch_page(cursor)
+            yield from items
+            if cursor is None:
+                return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="dbacademy-prefetch") as executor:
+        future = executor.submit(fetch_page, first_cursor)
+        try:
+            while future is not None:
+                items, cursor = future.result()
+                future = None if cursor is None else executor.submit(fetch_page, cursor)
+                yield from items
+        finally:
+            if future is not None:
+                future.cancel()  # The caller stopped iterating early
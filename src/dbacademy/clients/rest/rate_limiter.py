@@ -0,0 +1,275 @@
+"""
+Client-side rate limiting for the REST clients.
+
+Requests are metered through one token bucket per host and endpoint family (e.g. scim, jobs, workspace).  Buckets adapt
+to the server: every rate-limited response (HTTP 429 or REQUEST_LIMIT_EXCEEDED) halves the bucket's rate and pauses it
+for the server's Retry-After, while every successful response nudges the rate back up toward its maximum.
+
+Rate limiting is opt-in: clients created without a rate_limiter are not metered.  Passing the process-wide
+RateLimiter.shared() to many clients lets their threads cooperate when calling the same workspace rather than each
+backing off on their own.
+"""
+from __future__ import annotations
+
+__all__ = ["RateLimiter", "TokenBucket", "endpoint_family", "parse_retry_after"]
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from dbacademy.common import validate
+
+
+def endpoint_family(url: str) -> str:
+    """
+    Groups endpoints that share a server-side rate limit, using the first path segment after /api/<version>/ (ignoring
+    "preview").  For example, /api/2.0/preview/scim/v2/Users is "scim" and /api/2.1/jobs/runs/list is "jobs".
+    """
+    from urllib.parse import urlparse
+
+    parts = [p for p in urlparse(url).path.split("/") if p]
+    if len(parts) < 3 or parts[0] != "api":
+        return "default"
+
+    parts = parts[2:]  # Drop "api" and the version
+    if parts[0] == "preview" and len(parts) > 1:
+        parts = parts[1:]
+
+    return parts[0].lower()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Converts a Retry-After header, expressed either in seconds or as an HTTP-date, to a number of seconds."""
+    if value is None or value.strip() == "":
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        from email.utils import parsedate_to_datetime
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """A thread-safe token bucket whose rate adapts (additive-increase, multiplicative-decrease) to rate-limit signals."""
+
+    def __init__(self, *,
+                 rate: float,
+                 capacity: float = None,
+                 min_rate: float = None,
+                 max_rate: float = None,
+                 adaptive: bool = True,
+                 increase_step: float = 0.05,
+                 decrease_factor: float = 0.5):
+        """
+        Args:
+            rate: The initial number of requests per second.
+            capacity: The largest burst allowed after a quiet period.  Defaults to max(1, rate).
+            min_rate: The floor for adaptive decreases.  Defaults to rate / 50.
+            max_rate: The ceiling for adaptive increases.  Defaults to rate * 4.
+            adaptive: When False, the rate never changes.
+            increase_step: The requests-per-second added after each successful request.
+            decrease_factor: The multiplier applied to the rate after each rate-limited request.
+        """
+        self.__rate = validate(rate=rate).required.float(min_value=0.001)
+        self.__capacity = validate(capacity=capacity).optional.float(min_value=1.0) or max(1.0, self.__rate)
+        self.__min_rate = validate(min_rate=min_rate).optional.float(min_value=0.001) or self.__rate / 50
+        self.__max_rate = validate(max_rate=max_rate).optional.float(min_value=self.__rate) or self.__rate * 4
+        self.__adaptive = validate(adaptive=adaptive).required.bool()
+        self.__increase_step = validate(increase_step=increase_step).required.float(min_value=0.0)
+        self.__decrease_factor = validate(decrease_factor=decrease_factor).required.float(min_value=0.0, max_value=1.0)
+
+        self.__condition = threading.Condition()
+        self.__tokens = self.__capacity
+        self.__last_refill = time.monotonic()
+        self.__paused_until = 0.0
+        self.__waiting = 0
+        self.__throttled = 0
+
+    @property
+    def rate(self) -> float:
+        """The current number of requests per second."""
+        return self.__rate
+
+    @property
+    def capacity(self) -> float:
+        return self.__capacity
+
+    @property
+    def min_rate(self) -> float:
+        return self.__min_rate
+
+    @property
+    def max_rate(self) -> float:
+        return self.__max_rate
+
+    @property
+    def adaptive(self) -> bool:
+        return self.__adaptive
+
+    @property
+    def waiting(self) -> int:
+        """The number of threads currently blocked in acquire(), i.e. the queue depth."""
+        return self.__waiting
+
+    @property
+    def throttled(self) -> int:
+        """The number of rate-limited responses reported to this bucket."""
+        return self.__throttled
+
+    def __refill(self, now: float) -> None:
+        self.__tokens = min(self.__capacity, self.__tokens + (now - self.__last_refill) * self.__rate)
+        self.__last_refill = now
+
+    def acquire(self) -> float:
+        """
+        Blocks until a token is available, then consumes it.
+        :return: the number of seconds spent waiting.
+        """
+        start = time.monotonic()
+
+        with self.__condition:
+            self.__waiting += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    self.__refill(now)
+
+                    if now < self.__paused_until:
+                        self.__condition.wait(self.__paused_until - now)
+                    elif self.__tokens >= 1:
+                        self.__tokens -= 1
+                        return time.monotonic() - start
+                    else:
+                        self.__condition.wait((1 - self.__tokens) / self.__rate)
+            finally:
+                self.__waiting -= 1
+
+    def on_success(self) -> None:
+        if self.__adaptive and self.__rate < self.__max_rate:
+            with self.__condition:
+                self.__refill(time.monotonic())
+                self.__rate = min(self.__max_rate, self.__rate + self.__increase_step)
+
+    def on_throttled(self, retry_after: Optional[float] = None) -> None:
+        """
+        Records a rate-limited response: decreases the rate and, if the server specified Retry-After, pauses every
+        caller of this bucket for that long.
+        """
+        with self.__condition:
+            now = time.monotonic()
+            self.__refill(now)
+            self.__throttled += 1
+
+            if self.__adaptive:
+                self.__rate = max(self.__min_rate, self.__rate * self.__decrease_factor)
+
+            if retry_after is not None and retry_after > 0:
+                self.__paused_until = max(self.__paused_until, now + retry_after)
+                self.__tokens = min(self.__tokens, 0.0)
+
+            self.__condition.notify_all()
+
+    def metrics(self) -> Dict[str, float]:
+        with self.__condition:
+            return {
+                "rate": self.__rate,
+                "waiting": self.__waiting,
+                "throttled": self.__throttled,
+                "paused_seconds": max(0.0, self.__paused_until - time.monotonic()),
+            }
+
+
+class RateLimiter:
+    """A thread-safe registry of TokenBuckets, one per (host, endpoint family) or a single one for all requests."""
+
+    DEFAULT_RATE = 25.0
+    DEFAULT_MAX_RATE = 100.0
+
+    __shared: Optional[RateLimiter] = None
+    __shared_lock = threading.Lock()
+
+    def __init__(self, *,
+                 rate: float = DEFAULT_RATE,
+                 max_rate: float = DEFAULT_MAX_RATE,
+                 family_rates: Dict[str, float] = None,
+                 capacity: float = None,
+                 adaptive: bool = True,
+                 per_endpoint: bool = True):
+        """
+        Args:
+            rate: The initial requests per second for each host and endpoint family.
+            max_rate: The ceiling for adaptive increases, at least rate.
+            family_rates: Initial rates for specific endpoint families, e.g. {"scim": 5.0}, overriding rate.
+            capacity: The largest burst allowed per bucket.  Defaults to max(1, rate).
+            adaptive: When False, buckets never change their rate.
+            per_endpoint: When False, every request shares one bucket, keyed as "*/*", whatever its host and family.
+        """
+        self.__rate = validate(rate=rate).required.float(min_value=0.001)
+        self.__max_rate = max(self.__rate, validate(max_rate=max_rate).required.float(min_value=0.001))
+        self.__family_rates = validate(family_rates=family_rates).optional.dict(str, auto_create=True)
+        self.__capacity = validate(capacity=capacity).optional.float(min_value=1.0)
+        self.__adaptive = validate(adaptive=adaptive).required.bool()
+        self.__per_endpoint = validate(per_endpoint=per_endpoint).required.bool()
+
+        self.__lock = threading.Lock()
+        self.__buckets: Dict[Tuple[str, str], TokenBucket] = dict()
+
+    @classmethod
+    def shared(cls) -> RateLimiter:
+        """The process-wide RateLimiter, for clients opting in to rate limiting with rate_limiter=RateLimiter.shared()."""
+        if cls.__shared is None:
+            with cls.__shared_lock:
+                if cls.__shared is None:
+                    cls.__shared = RateLimiter()
+        return cls.__shared
+
+    @classmethod
+    def fixed_interval(cls, seconds: float) -> RateLimiter:
+        """
+        A non-adaptive limiter allowing one request every `seconds` across all hosts and endpoint families; the
+        semantics of the legacy throttle_seconds.
+        """
+        seconds = validate(seconds=seconds).required.float(min_value=0.001)
+        return RateLimiter(rate=1.0 / seconds, max_rate=1.0 / seconds, capacity=1.0, adaptive=False, per_endpoint=False)
+
+    @staticmethod
+    def key(url: str) -> Tuple[str, str]:
+        from urllib.parse import urlparse
+        return (urlparse(url).hostname or "").lower(), endpoint_family(url)
+
+    def bucket(self, url: str) -> TokenBucket:
+        key = self.key(url) if self.__per_endpoint else ("*", "*")
+        bucket = self.__buckets.get(key)
+
+        if bucket is None:
+            with self.__lock:
+                bucket = self.__buckets.get(key)
+                if bucket is None:
+                    rate = self.__family_rates.get(key[1], self.__rate)
+                    bucket = TokenBucket(rate=rate,
+                                         capacity=self.__capacity,
+                                         max_rate=max(rate, self.__max_rate),
+                                         adaptive=self.__adaptive)
+                    self.__buckets[key] = bucket
+
+        return bucket
+
+    def acquire(self, url: str) -> float:
+        """Blocks until the bucket for this URL's host and endpoint family allows another request."""
+        return self.bucket(url).acquire()
+
+    def on_success(self, url: str) -> None:
+        self.bucket(url).on_success()
+
+    def on_throttled(self, url: str, retry_after: Optional[float] = None) -> None:
+        self.bucket(url).on_throttled(retry_after)
+
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        """The current rate, queue depth and throttle count of each bucket keyed as "<host>/<family>"."""
+        with self.__lock:
+            buckets = list(self.__buckets.items())
+
+        return {f"{host}/{family}": bucket.metrics() for (host, family), bucket in buckets}
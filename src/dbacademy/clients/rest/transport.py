@@ -0,0 +1,326 @@
+"""
+Connection management shared by the REST clients.
+
+A Transport owns the HTTP connection pools used by one or more ApiClients.  Clients cloned from another client (e.g.
+ApiClient(..., client=parent) or dbrest.from_client(parent)) share their parent's Transport so that every clone reuses
+the same keep-alive connections instead of each one performing its own TLS handshakes.
+"""
+from __future__ import annotations
+
+__all__ = ["Transport", "TransportStats", "Http2Transport"]
+
+import threading
+from typing import Any, Dict, Optional
+from requests.adapters import HTTPAdapter
+from dbacademy.common import validate
+
+
+class TransportStats:
+    """Thread-safe counters describing how well a Transport is reusing its connections."""
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__requests = 0
+        self.__new_connections = 0
+
+    def record_request(self) -> None:
+        with self.__lock:
+            self.__requests += 1
+
+    def record_new_connection(self) -> None:
+        with self.__lock:
+            self.__new_connections += 1
+
+    @property
+    def requests(self) -> int:
+        """The total number of HTTP requests sent."""
+        return self.__requests
+
+    @property
+    def new_connections(self) -> int:
+        """The number of requests that required a new connection (and with it, a new TCP/TLS handshake)."""
+        return self.__new_connections
+
+    @property
+    def reused_connections(self) -> int:
+        """The number of requests that were sent over an already-established, pooled connection."""
+        with self.__lock:
+            return max(0, self.__requests - self.__new_connections)
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__requests = 0
+            self.__new_connections = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        with self.__lock:
+            return {
+                "requests": self.__requests,
+                "new_connections": self.__new_connections,
+                "reused_connections": max(0, self.__requests - self.__new_connections),
+            }
+
+    def __repr__(self) -> str:
+        return f"TransportStats({self.to_dict()})"
+
+
+class _CountingHTTPAdapter(HTTPAdapter):
+    """An HTTPAdapter that reports every request, and every new connection it opens, to a TransportStats."""
+
+    def __init__(self, stats: TransportStats, socket_options: Optional[list], **kwargs):
+        self.__stats = stats
+        self.__socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self.__socket_options is not None:
+            pool_kwargs.setdefault("socket_options", self.__socket_options)
+
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+
+        stats = self.__stats
+        pool_classes = dict()
+
+        for scheme, pool_class in self.poolmanager.pool_classes_by_scheme.items():
+            # Count at the socket level; urllib3 transparently re-connects pooled connections the server has closed.
+            def connect(connection, _base=pool_class.ConnectionCls):
+                stats.record_new_connection()
+                return _base.connect(connection)
+
+            connection_class = type(f"Counting{pool_class.ConnectionCls.__name__}", (pool_class.ConnectionCls,), {"connect": connect})
+            pool_classes[scheme] = type(f"Counting{pool_class.__name__}", (pool_class,), {"ConnectionCls": connection_class})
+
+        # Per-instance override; urllib3 reads this attribute each time it creates a new host pool.
+        self.poolmanager.pool_classes_by_scheme = pool_classes
+
+    def send(self, request, **kwargs):
+        self.__stats.record_request()
+        return super().send(request, **kwargs)
+
+
+class Transport:
+    """
+    Creates and owns the connection pools used by an ApiClient's requests.Session.
+
+    Subclasses may override create_adapter() to provide an alternative backend, see Http2Transport.
+    """
+
+    DEFAULT_POOL_CONNECTIONS = 10
+    DEFAULT_POOL_MAXSIZE = 32
+
+    def __init__(self, *,
+                 pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 pool_block: bool = False,
+                 keep_alive: bool = True):
+        """
+        Args:
+            pool_connections: The number of per-host connection pools to cache, i.e. the number of distinct hosts.
+            pool_maxsize: The maximum number of connections kept open to any single host.  Size this to the number
+                of threads expected to call the same host concurrently.
+            pool_block: When True, a thread that finds its host's pool exhausted waits for a connection to be
+                returned rather than opening (and later discarding) an extra connection.
+            keep_alive: When True, connections are returned to the pool after each request and TCP keep-alive is
+                enabled on their sockets.  When False, every request sends "Connection: close".
+        """
+        self.__pool_connections = validate(pool_connections=pool_connections).required.int(min_value=1)
+        self.__pool_maxsize = validate(pool_maxsize=pool_maxsize).required.int(min_value=1)
+        self.__pool_block = validate(pool_block=pool_block).required.bool()
+        self.__keep_alive = validate(keep_alive=keep_alive).required.bool()
+        self.__stats = TransportStats()
+        self.__lock = threading.Lock()
+        self.__adapter: Optional[HTTPAdapter] = None
+
+    @property
+    def pool_connections(self) -> int:
+        return self.__pool_connections
+
+    @property
+    def pool_maxsize(self) -> int:
+        return self.__pool_maxsize
+
+    @property
+    def pool_block(self) -> bool:
+        return self.__pool_block
+
+    @property
+    def keep_alive(self) -> bool:
+        return self.__keep_alive
+
+    @property
+    def stats(self) -> TransportStats:
+        return self.__stats
+
+    @property
+    def adapter(self) -> HTTPAdapter:
+        """The one adapter, created on first use, that is mounted into every session using this transport."""
+        if self.__adapter is None:
+            with self.__lock:
+                if self.__adapter is None:
+                    self.__adapter = self.create_adapter()
+        return self.__adapter
+
+    def create_adapter(self) -> HTTPAdapter:
+        socket_options = None
+
+        if self.keep_alive:
+            import socket
+            from urllib3.connection import HTTPConnection
+            socket_options = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+        return _CountingHTTPAdapter(self.stats,
+                                    socket_options,
+                                    pool_connections=self.pool_connections,
+                                    pool_maxsize=self.pool_maxsize,
+                                    pool_block=self.pool_block)
+
+    def mount(self, session: Any) -> None:
+        """Routes all of the session's http:// and https:// traffic through this transport's connection pools."""
+        # noinspection HttpUrlsUsage
+        session.mount("http://", self.adapter)
+        session.mount("https://", self.adapter)
+
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+
+    def close(self) -> None:
+        with self.__lock:
+            if self.__adapter is not None:
+                self.__adapter.close()
+                self.__adapter = None
+
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}(pool_connections={self.pool_connections}, pool_maxsize={self.pool_maxsize}, "
+                f"pool_block={self.pool_block}, keep_alive={self.keep_alive})")
+
+
+class _Http2Adapter(HTTPAdapter):
+    """
+    Sends requests.PreparedRequests over httpx.Clients so that a single connection can multiplex many requests.
+
+    httpx fixes TLS verification, client certificates and proxies per client rather than per request, so one client is
+    created for each combination of them that requests passes to send(), which is typically just one.
+    """
+
+    def __init__(self, transport: Http2Transport):
+        super().__init__()
+
+        # noinspection PyPackageRequirements
+        import httpx
+
+        self.__stats = transport.stats
+        max_connections = transport.pool_connections * transport.pool_maxsize
+        self.__limits = httpx.Limits(max_connections=max_connections,
+                                     max_keepalive_connections=max_connections if transport.keep_alive else 0)
+        self.__lock = threading.Lock()
+        self.__clients: Dict[Any, Any] = dict()
+
+    @property
+    def clients(self) -> Dict[Any, Any]:
+        """The httpx.Clients created so far keyed by their (verify, cert, proxy)."""
+        return self.__clients
+
+    @staticmethod
+    def __ssl_context(verify: Any, cert: Any) -> Any:
+        import os
+        import ssl
+        from requests.utils import DEFAULT_CA_BUNDLE_PATH
+
+        if verify is False:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        elif isinstance(verify, str) and os.path.isdir(verify):
+            context = ssl.create_default_context(capath=verify)
+        else:
+            # As with requests, verify is either a CA bundle or True for certifi's bundle.
+            context = ssl.create_default_context(cafile=verify if isinstance(verify, str) else DEFAULT_CA_BUNDLE_PATH)
+
+        if isinstance(cert, tuple):
+            context.load_cert_chain(*cert)
+        elif cert is not None:
+            context.load_cert_chain(cert)
+
+        return context
+
+    def __client_for(self, verify: Any, cert: Any, proxy: Optional[str]) -> Any:
+        # noinspection PyPackageRequirements
+        import httpx
+
+        # Lists aren't hashable, but requests accepts a certificate and its key as either a list or a tuple.
+        key = (verify, tuple(cert) if isinstance(cert, list) else cert, proxy)
+
+        with self.__lock:
+            if key not in self.__clients:
+                # requests already resolved the proxies from the environment, so httpx must not resolve them again.
+                self.__clients[key] = httpx.Client(http2=True,
+                                                   limits=self.__limits,
+                                                   verify=self.__ssl_context(key[0], key[1]),
+                                                   proxy=proxy,
+                                                   trust_env=False)
+            return self.__clients[key]
+
+    def __trace(self, event_name: str, _info: Dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            self.__stats.record_new_connection()
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        # noinspection PyPackageRequirements
+        import httpx
+        from requests.models import Response
+        from requests.structures import CaseInsensitiveDict
+        from requests.utils import select_proxy
+
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            timeout = httpx.Timeout(None, connect=connect_timeout, read=read_timeout)
+        else:
+            timeout = httpx.Timeout(timeout)
+
+        client = self.__client_for(verify, cert, select_proxy(request.url, proxies or dict()))
+
+        self.__stats.record_request()
+        http_response = client.request(request.method,
+                                       request.url,
+                                       headers=dict(request.headers),
+                                       content=request.body,
+                                       timeout=timeout,
+                                       extensions={"trace": self.__trace})
+
+        response = Response()
+        response.status_code = http_response.status_code
+        response.headers = CaseInsensitiveDict(http_response.headers)
+        response.reason = http_response.reason_phrase
+        response.url = str(http_response.url)
+        response.encoding = http_response.encoding
+        response.request = request
+        response.connection = self
+        response._content = http_response.content
+        return response
+
+    def close(self):
+        with self.__lock:
+            for client in self.__clients.values():
+                client.close()
+            self.__clients.clear()
+
+        super().close()
+
+
+class Http2Transport(Transport):
+    """
+    A Transport that speaks HTTP/2 through the optional httpx package (pip install "httpx[http2]>=0.26").
+
+    With HTTP/2, concurrent requests to the same host are multiplexed over a few connections instead of one connection
+    per in-flight request.  Responses are converted back to requests.Response objects, so callers are unaffected, and
+    the session's TLS verification, client certificate and proxy settings still apply.
+    """
+
+    def create_adapter(self) -> HTTPAdapter:
+        try:
+            # noinspection PyPackageRequirements,PyUnresolvedReferences
+            import httpx, h2
+        except ImportError as e:
+            raise ImportError(f"{self.__class__.__name__} requires the optional httpx[http2] package.") from e
+
+        return _Http2Adapter(self)
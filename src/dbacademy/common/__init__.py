@@ -4,11 +4,12 @@ This was moved out of dbgems because dbgems has a dependency on pyspark.
 """
 from __future__ import annotations
 
-__all__ = ["deprecation_log_level", "deprecated", "overrides", "print_title", "print_warning", "CachedStaticProperty", "clean_string", "load_databricks_cfg", "Cloud", "validate", "assert_true", "ValidationError", "combine_var_args"]
+__all__ = ["deprecation_log_level", "deprecated", "overrides", "print_title", "print_warning", "CachedStaticProperty", "clean_string", "load_databricks_cfg", "Cloud", "validate", "assert_true", "ValidationError", "Schema", "combine_var_args"]
 
 from typing import Callable, Any, TypeVar, List, Iterable, Tuple, Dict, Optional
 from dbacademy.common.cloud import Cloud
 from dbacademy.common.validator import Validator, ValidationError
+from dbacademy.common.schema import Schema
 
 deprecation_log_level = "error"
 ParamType = TypeVar("ParamType")
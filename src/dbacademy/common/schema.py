@@ -0,0 +1,305 @@
+__all__ = ["Schema", "Param", "ParamBuilder"]
+
+import numbers
+import typing
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+from dbacademy.common.validator import Validator, ValidationError, E_INTERNAL
+
+Check = Callable[[Any], Any]
+
+
+class Param:
+    """
+    The specification of a single parameter of a Schema, e.g. a required int with a minimum value of 1, as created by
+    Schema.required or Schema.optional. The specification is compiled into a checker function when the Schema is.
+    """
+
+    def __init__(self, *, required: bool, method: str, args: Tuple, kwargs: Dict[str, Any]):
+        self.__required = required
+        self.__method = method
+        self.__args = args
+        self.__kwargs = kwargs
+
+    @property
+    def required(self) -> bool:
+        return self.__required
+
+    @property
+    def method(self) -> str:
+        """The name of the equivalent TypedValidator method, e.g. "int" for Schema.required.int()"""
+        return self.__method
+
+    def compile(self, parameter_name: str) -> Check:
+        """
+        Compiles this specification into a function that validates, and possibly converts, a value. The function tests
+        the value directly; only when a test fails is the value handed to the equivalent Validator chain, so that the
+        errors, and their messages, are exactly those of validate(...).
+        :param parameter_name: the name of the parameter reported in error messages.
+        :return: the function, which returns the validated value or raises a ValidationError.
+        """
+        required = self.__required
+        args = self.__args
+        kwargs = self.__kwargs
+        method = self.__method
+
+        def fail(value: Any) -> Any:
+            typed_validator = Validator(**{parameter_name: value}).args(required=required)
+            value = getattr(typed_validator, method)(*args, **kwargs)
+
+            # The slow path either raised or converted the value, e.g. a str to its enum.
+            return value
+
+        compiler = getattr(self, f"_compile_{method}", None)
+        if compiler is None:
+            raise ValidationError(f"""{E_INTERNAL} | Schema parameters of the type "{method}" are not supported.""")
+
+        check = compiler(fail, *args, **kwargs)
+
+        if required:
+            def check_required(value: Any) -> Any:
+                return fail(value) if value is None else check(value)
+            return check_required
+
+        return check
+
+    @staticmethod
+    def __resolve(data_type: Any) -> Any:
+        # The class isinstance() checks for typing's aliases, e.g. list for List or List[str]
+        return typing.get_origin(data_type) or data_type
+
+    @classmethod
+    def __compile_range(cls, fail: Check, value_type: Any, min_value: Optional[numbers.Number], max_value: Optional[numbers.Number], convert: Optional[Type] = None) -> Check:
+        def check(value: Any) -> Any:
+            if value is None:
+                return None
+            if convert is not None and isinstance(value, int):
+                value = convert(value)
+            if not isinstance(value, value_type):
+                return fail(value)
+            if min_value is not None and not value >= min_value:
+                return fail(value)
+            if max_value is not None and not value <= max_value:
+                return fail(value)
+            return value
+
+        if min_value is not None and not isinstance(min_value, numbers.Number) or max_value is not None and not isinstance(max_value, numbers.Number):
+            return fail  # Let the validator report its invalid arguments
+
+        return check
+
+    @classmethod
+    def _compile_int(cls, fail: Check, min_value: Optional[int] = None, max_value: Optional[int] = None) -> Check:
+        return cls.__compile_range(fail, int, min_value, max_value)
+
+    @classmethod
+    def _compile_float(cls, fail: Check, min_value: Optional[float] = None, max_value: Optional[float] = None) -> Check:
+        return cls.__compile_range(fail, float, min_value, max_value, convert=float)
+
+    @classmethod
+    def _compile_number(cls, fail: Check, min_value: Optional[numbers.Number] = None, max_value: Optional[numbers.Number] = None) -> Check:
+        return cls.__compile_range(fail, numbers.Number, min_value, max_value)
+
+    @classmethod
+    def _compile_bool(cls, fail: Check) -> Check:
+        return cls.__compile_range(fail, bool, None, None)
+
+    @classmethod
+    def _compile_str(cls, fail: Check, *, min_length: int = 0) -> Check:
+        def check(value: Any) -> Any:
+            if value is None:
+                return None
+            if not isinstance(value, str) or len(value) < min_length:
+                return fail(value)
+            return value
+
+        return check
+
+    @classmethod
+    def __compile_collection(cls, fail: Check, collection_type: Type, factory: Optional[Callable[[], Any]], key_type: Any, element_type: Any, min_length: int) -> Check:
+        key_type = cls.__resolve(key_type)
+        check_elements = element_type is not Any
+        element_type = cls.__resolve(element_type)
+
+        def check(value: Any) -> Any:
+            if factory is not None:
+                value = value or factory()  # As with the validator, empty collections are replaced too.
+            if value is None:
+                return None
+            if not isinstance(value, collection_type) or len(value) < min_length:
+                return fail(value)
+
+            if collection_type is dict:
+                for k, v in value.items():
+                    if not isinstance(k, key_type) or check_elements and not isinstance(v, element_type):
+                        return fail(value)
+
+            elif check_elements:
+                for v in value:
+                    if not isinstance(v, element_type):
+                        return fail(value)
+
+            return value
+
+        if not isinstance(min_length, int):
+            return fail  # Let the validator report its invalid arguments
+
+        return check
+
+    @classmethod
+    def _compile_list(cls, fail: Check, element_type: Any, *, min_length: int = 0, auto_create: bool = False) -> Check:
+        return cls.__compile_collection(fail, list, list if auto_create is True else None, Any, element_type, min_length)
+
+    @classmethod
+    def _compile_set(cls, fail: Check, element_type: Any, *, min_length: int = 0, auto_create: bool = False) -> Check:
+        return cls.__compile_collection(fail, set, set if auto_create is True else None, Any, element_type, min_length)
+
+    @classmethod
+    def _compile_dict(cls, fail: Check, key_type: Any, element_type: Any = Any, *, min_length: int = 0, auto_create: bool = False) -> Check:
+        return cls.__compile_collection(fail, dict, dict if auto_create is True else None, key_type, element_type, min_length)
+
+    @classmethod
+    def _compile_as_type(cls, fail: Check, parameter_type: Any, *or_type: Any) -> Check:
+        parameter_types = tuple(cls.__resolve(t) for t in (parameter_type, *or_type))
+
+        def check(value: Any) -> Any:
+            if value is None or isinstance(value, parameter_types):
+                return value
+            return fail(value)
+
+        return check
+
+    @classmethod
+    def _compile_as_one_of(cls, fail: Check, parameter_type: Any, value: Any, *or_values: Any) -> Check:
+        parameter_type = cls.__resolve(parameter_type)
+        expected_values = list(value) if isinstance(value, (list, tuple)) else list(typing.get_args(value)) or [value]
+        expected_values.extend(or_values)
+
+        def check(v: Any) -> Any:
+            if v is None:
+                return None
+            if not isinstance(v, parameter_type) or v not in expected_values:
+                return fail(v)
+            return v
+
+        return check
+
+    @classmethod
+    def _compile_enum(cls, fail: Check, enum_type: Any, auto_convert: bool = False) -> Check:
+        # Conversions are resolved by the validator once per distinct value, e.g. "aws" to Cloud.AWS, and then reused.
+        conversions: Dict[Any, Any] = dict()
+
+        def check(value: Any) -> Any:
+            if value is None or isinstance(value, enum_type):
+                return value
+
+            try:
+                return conversions[value]
+            except KeyError:
+                converted = conversions[value] = fail(value)
+                return converted
+            except TypeError:
+                return fail(value)  # Unhashable, and so certainly not convertible
+
+        return check
+
+
+class ParamBuilder:
+    """
+    Creates the Param specifications of a Schema, mirroring the TypedValidator methods of validate(...).required and
+    validate(...).optional; see Schema.required and Schema.optional.
+    """
+
+    def __init__(self, *, required: bool):
+        self.__required = required
+
+    def __param(self, method: str, *args: Any, **kwargs: Any) -> Param:
+        return Param(required=self.__required, method=method, args=args, kwargs=kwargs)
+
+    def as_one_of(self, parameter_type: Type, value: Any, *or_values: Any) -> Param:
+        return self.__param("as_one_of", parameter_type, value, *or_values)
+
+    def as_type(self, parameter_type: Type, *or_type: Type) -> Param:
+        return self.__param("as_type", parameter_type, *or_type)
+
+    def enum(self, enum_type: Type, auto_convert: bool = False) -> Param:
+        return self.__param("enum", enum_type, auto_convert=auto_convert)
+
+    def number(self, min_value: Optional[numbers.Number] = None, max_value: Optional[numbers.Number] = None) -> Param:
+        return self.__param("number", min_value=min_value, max_value=max_value)
+
+    def int(self, min_value: Optional[int] = None, max_value: Optional[int] = None) -> Param:
+        return self.__param("int", min_value=min_value, max_value=max_value)
+
+    def float(self, min_value: Optional[float] = None, max_value: Optional[float] = None) -> Param:
+        return self.__param("float", min_value=min_value, max_value=max_value)
+
+    def bool(self) -> Param:
+        return self.__param("bool")
+
+    def str(self, *, min_length: int = 0) -> Param:
+        return self.__param("str", min_length=min_length)
+
+    def list(self, element_type: Type, *, min_length: int = 0, auto_create: bool = False) -> Param:
+        return self.__param("list", element_type, min_length=min_length, auto_create=auto_create)
+
+    def set(self, element_type: Type, *, min_length: int = 0, auto_create: bool = False) -> Param:
+        return self.__param("set", element_type, min_length=min_length, auto_create=auto_create)
+
+    def dict(self, key_type: Type, element_type: Type = Any, *, min_length: int = 0, auto_create: bool = False) -> Param:
+        return self.__param("dict", key_type, element_type, min_length=min_length, auto_create=auto_create)
+
+
+class Schema:
+    """
+    A declarative alternative to a series of validate(...) calls for constructors and payload builders invoked in bulk.
+    Each parameter is specified once, with the same vocabulary as the Validator, and compiled into a checker function
+    when the Schema is created, typically as a class or module constant. Usage:
+
+    class SomeConfig:
+        __SCHEMA = Schema(name=Schema.required.str(),
+                          size=Schema.optional.int(min_value=1),
+                          tags=Schema.optional.dict(str, str, auto_create=True))
+
+        def __init__(self, *, name: str, size: int = None, tags: Dict[str, str] = None):
+            params = self.__SCHEMA.validate(name=name, size=size, tags=tags)
+
+    Errors, including their messages, are identical to those raised by the equivalent validate(...) calls.
+    """
+
+    required = ParamBuilder(required=True)
+    optional = ParamBuilder(required=False)
+
+    def __init__(self, **params: Param):
+        """
+        :param params: the parameter names and their specifications, e.g. name=Schema.required.str()
+        """
+        for name, param in params.items():
+            if not isinstance(param, Param):
+                raise ValidationError(f"""{E_INTERNAL} | Expected the Schema's parameter '{name}' to be of type {Param}, found {type(param)}.""")
+
+        self.__checks: Dict[str, Check] = {name: param.compile(name) for name, param in params.items()}
+
+    @property
+    def parameter_names(self) -> List[str]:
+        return list(self.__checks)
+
+    def check(self, parameter_name: str, value: Any) -> Any:
+        """
+        Validates a single parameter of this schema.
+        :param parameter_name: the name of the parameter.
+        :param value: the value to validate.
+        :return: the validated, and possibly converted, value.
+        """
+        return self.__checks[parameter_name](value)
+
+    def validate(self, **values: Any) -> Dict[str, Any]:
+        """
+        Validates every parameter of this schema, in the order the schema declares them.
+        :param values: the value of each parameter; omitted parameters are validated as None.
+        :return: the validated, and possibly converted or auto-created, values keyed by parameter name.
+        """
+        unexpected = values.keys() - self.__checks.keys()
+        if unexpected:
+            raise ValidationError(f"""{E_INTERNAL} | The parameters {sorted(unexpected)} are not defined by this Schema.""")
+
+        return {name: check(values.get(name)) for name, check in self.__checks.items()}
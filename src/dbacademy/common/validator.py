@@ -1,6 +1,6 @@
 __all__ = ["Validator", "ValidationError"]
 
-import numbers, inspect
+import numbers
 from collections.abc import Collection
 from typing import Type, Any, List, Dict, Set, TypeVar, Sized, Optional, Iterable, Union, Tuple
 import typing
@@ -21,11 +21,6 @@ ElementType = TypeVar("ElementType")
 ParameterType = TypeVar("ParameterType")
 
 
-def do_validate(*, passed: bool, message: str) -> None:
-    if not passed:
-        raise ValidationError(message)
-
-
 class ValidationError(Exception):
 
     def __init__(self, message: str):
@@ -38,6 +33,15 @@ class ValidationError(Exception):
 
 
 class TypedValidator:
+
+    # The class isinstance() checks for each type validated so far, e.g. list for List[str]; resolving typing's
+    # generics goes through str(), and checking against typing's aliases goes through __instancecheck__(), both of
+    # which are far too slow to repeat on every call.
+    __resolved_types: Dict[Any, Any] = dict()
+
+    # The typing constructs, e.g. Any or List[str], already accepted by __validate_data_type().
+    __typing_types: Set[Any] = set()
+
     def __init__(self, *, parameter_name: str, parameter_value: Any):
         self.__parameter_name: str = parameter_name
         self.__parameter_value: Any = parameter_value
@@ -63,6 +67,9 @@ class TypedValidator:
                                    parameter_value=self.parameter_value,
                                    parameter_types=[parameter_type])
 
+        if Validator.fast_mode:
+            return self.parameter_value
+
         expected_values = list()
 
         if isinstance(value, List):
@@ -80,8 +87,8 @@ class TypedValidator:
         # Add all of our "other" values
         expected_values.extend(or_values)
 
-        message = f"""{E_ONE_OF} | The parameter '{self.parameter_name}' must be one of the expected values {expected_values}, found "{self.parameter_value}"."""
-        do_validate(passed=self.parameter_value in expected_values, message=message)
+        if self.parameter_value not in expected_values:
+            raise ValidationError(f"""{E_ONE_OF} | The parameter '{self.parameter_name}' must be one of the expected values {expected_values}, found "{self.parameter_value}".""")
 
         return self.parameter_value
 
@@ -99,8 +106,8 @@ class TypedValidator:
     def enum(self, enum_type: Type[ParameterType], auto_convert: bool = False) -> ParameterType:
         self.__validate_data_type("enum_type", enum_type)
 
-        message = f"""{E_INTERNAL} | Expected {self.__class__.__name__}.{inspect.stack()[0].function}(..)'s parameter 'auto_convert' to be of type bool, found {type(auto_convert)}."""
-        do_validate(passed=isinstance(auto_convert, bool), message=message)
+        if not isinstance(auto_convert, bool):
+            raise ValidationError(f"""{E_INTERNAL} | Expected {self.__class__.__name__}.enum(..)'s parameter 'auto_convert' to be of type bool, found {type(auto_convert)}.""")
 
         if auto_convert and self.parameter_value is not None and not isinstance(self.parameter_value, enum_type):
             for value in enum_type:
@@ -113,8 +120,8 @@ class TypedValidator:
                 elif isinstance(self.parameter_value, str) and self.parameter_value.upper() == value.value:
                     self.parameter_value = value
 
-            message = f"""{E_TYPE} | Cannot convert the value "{self.parameter_value}" of type {type(self.parameter_value)} to {enum_type}."""
-            do_validate(passed=isinstance(self.parameter_value, enum_type), message=message)
+            if not isinstance(self.parameter_value, enum_type):
+                raise ValidationError(f"""{E_TYPE} | Cannot convert the value "{self.parameter_value}" of type {type(self.parameter_value)} to {enum_type}.""")
 
         self.__validate_value_type(parameter_name=self.parameter_name,
                                    parameter_value=self.parameter_value,
@@ -166,6 +173,10 @@ class TypedValidator:
         self.__validate_value_type(parameter_name=self.parameter_name,
                                    parameter_value=self.parameter_value,
                                    parameter_types=[tuple])
+
+        if Validator.fast_mode:
+            return self.parameter_value
+
         from dbacademy.common import combine_var_args
 
         all_element_types = combine_var_args(first=element_types, others=and_types)
@@ -176,8 +187,8 @@ class TypedValidator:
 
         actual_length = len(self.parameter_value)
         expected_length = len(all_element_types)
-        message = f"""{E_ONE_OF} | The parameter '{self.parameter_name}' must have {expected_length} elements, found {actual_length}."""
-        do_validate(passed=actual_length == expected_length, message=message)
+        if actual_length != expected_length:
+            raise ValidationError(f"""{E_ONE_OF} | The parameter '{self.parameter_name}' must have {expected_length} elements, found {actual_length}.""")
 
         for i, element_type in enumerate(all_element_types):
             self.__validate_value_type(parameter_name=f"{self.parameter_name}[{i}]",
@@ -190,96 +201,121 @@ class TypedValidator:
         return self.__validate_collection(parameter_type=Iterable, key_type=Any, element_type=element_type, min_length=0)
 
     def list(self, element_type: Type[ElementType], *, min_length: int = 0, auto_create: bool = False) -> List[ElementType]:
-        message = f"""{E_INTERNAL} | Expected {self.__class__.__name__}.{inspect.stack()[0].function}(..)'s parameter 'auto_create' to be of type bool, found {type(auto_create)}."""
-        do_validate(passed=isinstance(auto_create, bool), message=message)
+        if not isinstance(auto_create, bool):
+            raise ValidationError(f"""{E_INTERNAL} | Expected {self.__class__.__name__}.list(..)'s parameter 'auto_create' to be of type bool, found {type(auto_create)}.""")
 
         self.parameter_value = self.parameter_value or list() if auto_create else self.parameter_value
         return self.__validate_collection(parameter_type=list, key_type=Any, element_type=element_type, min_length=min_length)
 
     def set(self, element_type: Type[ElementType], *, min_length: int = 0, auto_create: bool = False) -> Set[ElementType]:
-        message = f"""{E_INTERNAL} | Expected {self.__class__.__name__}.{inspect.stack()[0].function}(..)'s parameter 'auto_create' to be of type bool, found {type(auto_create)}."""
-        do_validate(passed=isinstance(auto_create, bool), message=message)
+        if not isinstance(auto_create, bool):
+            raise ValidationError(f"""{E_INTERNAL} | Expected {self.__class__.__name__}.set(..)'s parameter 'auto_create' to be of type bool, found {type(auto_create)}.""")
 
         self.parameter_value = self.parameter_value or set() if auto_create else self.parameter_value
         return self.__validate_collection(parameter_type=set, key_type=Any, element_type=element_type, min_length=min_length)
 
     def dict(self, key_type: Type[KeyType], element_type: Type[ParameterType] = Any, *, min_length: int = 0, auto_create: bool = False) -> Dict[KeyType, ParameterType]:
-        message = f"""{E_INTERNAL} | Expected {self.__class__.__name__}.{inspect.stack()[0].function}(..)'s parameter 'auto_create' to be of type bool, found {type(auto_create)}."""
-        do_validate(passed=isinstance(auto_create, bool), message=message)
+        if not isinstance(auto_create, bool):
+            raise ValidationError(f"""{E_INTERNAL} | Expected {self.__class__.__name__}.dict(..)'s parameter 'auto_create' to be of type bool, found {type(auto_create)}.""")
 
         self.parameter_value = self.parameter_value or dict() if auto_create else self.parameter_value
         return self.__validate_collection(parameter_type=dict, key_type=key_type, element_type=element_type, min_length=min_length)
 
+    @classmethod
+    def __resolve_type(cls, data_type: Any) -> Any:
+        """
+        Converts a type to the class isinstance() expects, e.g. List[str] to list, caching the result per type.
+        :param data_type: the type to resolve, which must already have passed __validate_data_type()
+        :return: the resolved type.
+        """
+        try:
+            return cls.__resolved_types[data_type]
+        except KeyError:
+            pass
+
+        # The aliases, e.g. List or Iterable, resolve to their builtin or abstract classes, which isinstance() checks directly.
+        resolved = typing.get_origin(data_type) or data_type
+        ts = str(data_type)
+
+        if ts.startswith("typing.") and ts.endswith("]"):
+            if ts.startswith(f"{List}[") and ts.endswith("]"):
+                resolved = list  # This is a generic list, as in, List[str]; convert to list
+            elif ts.startswith(f"{Set}[") and ts.endswith("]"):
+                resolved = set  # This is a generic set, as in, Set[str]; convert to set
+            elif ts.startswith(f"{Dict}[") and ts.endswith("]"):
+                resolved = dict  # This is a generic dictionary, as in, Dict[str, Any]; convert to dict
+            elif ts.startswith(f"{Tuple}[") and ts.endswith("]"):
+                resolved = tuple  # This is a generic tuple, as in, Tuple[str, int]; convert to tuple
+            else:
+                raise NotImplementedError(f"""Conversion from generic type "{ts}" to a supported type is not implemented.""")
+
+        cls.__resolved_types[data_type] = resolved
+        return resolved
+
     def __validate_data_type(self, name: str, data_type: Type) -> None:
-        message = f"""{E_INTERNAL} | Expected {self.__class__.__name__}.{inspect.stack()[0].function}(..)'s parameter '{name}' to be specified."""
-        do_validate(passed=data_type is not None, message=message)
+        if isinstance(data_type, type) or Validator.fast_mode:
+            return  # The common case, which needs neither str() nor an error message.
+
+        if data_type is None:
+            raise ValidationError(f"""{E_INTERNAL} | Expected {self.__class__.__name__}.__validate_data_type(..)'s parameter '{name}' to be specified.""")
+
+        try:
+            if data_type in self.__typing_types:
+                return
+        except TypeError:
+            pass  # Unhashable, and so certainly not a type.
 
         # noinspection PyUnresolvedReferences,PyProtectedMember
-        message = f"""{E_INTERNAL} | Expected {self.__class__.__name__}.{inspect.stack()[0].function}(..)'s parameter '{name}' to be a python "type", found {type(data_type)}."""
-        do_validate(passed=isinstance(data_type, type) or str(data_type).startswith("typing."), message=message)
+        if not str(data_type).startswith("typing."):
+            raise ValidationError(f"""{E_INTERNAL} | Expected {self.__class__.__name__}.__validate_data_type(..)'s parameter '{name}' to be a python "type", found {type(data_type)}.""")
+
+        self.__typing_types.add(data_type)
 
     def __validate_min_value(self, *, min_value: Optional[numbers.Number]) -> None:
 
-        if self.parameter_value is not None and min_value is not None:
+        if self.parameter_value is not None and min_value is not None and not Validator.fast_mode:
             # We need to verify that min_value is of type numbers.Number
-            message = f"""{E_INTERNAL} | Expected {self.__class__.__name__}.{inspect.stack()[0].function}(..)'s parameter 'min_value' to be of type numbers.Number, found {type(min_value)}."""
-            do_validate(passed=isinstance(min_value, numbers.Number), message=message)
+            if not isinstance(min_value, numbers.Number):
+                raise ValidationError(f"""{E_INTERNAL} | Expected {self.__class__.__name__}.__validate_min_value(..)'s parameter 'min_value' to be of type numbers.Number, found {type(min_value)}.""")
 
             # We cannot test the min value if the value is not of type numbers.Number
-            message = f"""{E_TYPE} | Expected the parameter '{self.parameter_name}' to be of type numbers.Number, found {type(self.parameter_value)}."""
-            do_validate(passed=isinstance(self.parameter_value, numbers.Number), message=message)
+            if not isinstance(self.parameter_value, numbers.Number):
+                raise ValidationError(f"""{E_TYPE} | Expected the parameter '{self.parameter_name}' to be of type numbers.Number, found {type(self.parameter_value)}.""")
 
-            message = f"""{E_MIN_V} | The parameter '{self.parameter_name}' must have a minimum value of '{min_value}', found '{self.parameter_value}'."""
-            do_validate(passed=self.parameter_value >= min_value, message=message)
+            if not self.parameter_value >= min_value:
+                raise ValidationError(f"""{E_MIN_V} | The parameter '{self.parameter_name}' must have a minimum value of '{min_value}', found '{self.parameter_value}'.""")
 
     def __validate_max_value(self, *, max_value: Optional[numbers.Number]) -> None:
 
-        if self.parameter_value is not None and max_value is not None:
+        if self.parameter_value is not None and max_value is not None and not Validator.fast_mode:
             # INTERNAL, We need to verify that max_value is of type numbers.Number
-            message = f"""{E_INTERNAL} | Expected {self.__class__.__name__}.{inspect.stack()[0].function}(..)'s parameter 'max_value' to be of type numbers.Number, found {type(max_value)}."""
-            do_validate(passed=isinstance(max_value, numbers.Number), message=message)
+            if not isinstance(max_value, numbers.Number):
+                raise ValidationError(f"""{E_INTERNAL} | Expected {self.__class__.__name__}.__validate_max_value(..)'s parameter 'max_value' to be of type numbers.Number, found {type(max_value)}.""")
 
             # We cannot test the max value if the value is not of type numbers.Number
-            message = f"""{E_TYPE} | Expected the parameter '{self.parameter_name}' to be of type numbers.Number, found {type(self.parameter_value)}."""
-            do_validate(passed=isinstance(self.parameter_value, numbers.Number), message=message)
+            if not isinstance(self.parameter_value, numbers.Number):
+                raise ValidationError(f"""{E_TYPE} | Expected the parameter '{self.parameter_name}' to be of type numbers.Number, found {type(self.parameter_value)}.""")
 
-            message = f"""{E_MAX_V} | The parameter '{self.parameter_name}' must have a maximum value of '{max_value}', found '{self.parameter_value}'."""
-            do_validate(passed=self.parameter_value <= max_value, message=message)
+            if not self.parameter_value <= max_value:
+                raise ValidationError(f"""{E_MAX_V} | The parameter '{self.parameter_name}' must have a maximum value of '{max_value}', found '{self.parameter_value}'.""")
 
     def __validate_value_type(self, *, parameter_name: str = None, parameter_value: Any = None, parameter_types: List[Type]):
 
         for i, parameter_type in enumerate(parameter_types):
-            name = f"parameter_type" if len(parameter_types) == 1 else f"parameter_type[{i}]"
-            self.__validate_data_type(name, parameter_type)
+            self.__validate_data_type(f"parameter_type" if len(parameter_types) == 1 else f"parameter_type[{i}]", parameter_type)
 
         if parameter_value is not None:
-            passed = False
             for t in parameter_types:
-                ts = str(t)
-                if ts.startswith("typing.") and ts.endswith("]"):
-                    if ts.startswith(f"{List}[") and ts.endswith("]"):
-                        t = List  # This is a generic list, as in, List[str]; convert to List
-                    elif ts.startswith(f"{Set}[") and ts.endswith("]"):
-                        t = Set  # This is a generic set, as in, Set[str]; convert to Set
-                    elif ts.startswith(f"{Dict}[") and ts.endswith("]"):
-                        t = Dict  # This is a generic dictionary, as in, Dict[str, Any]; convert to Dict
-                    elif ts.startswith(f"{Tuple}[") and ts.endswith("]"):
-                        t = Tuple  # This is a generic dictionary, as in, Dict[str, Any]; convert to Dict
-                    else:
-                        raise NotImplementedError(f"""Conversion from generic type "{ts}" to a supported type is not implemented.""")
-
-                is_of_type = isinstance(parameter_value, t)
-                passed = passed or is_of_type
-
-            if not passed:
-                last_type = parameter_types.pop()
-                expected_types = ", ".join([str(t) for t in parameter_types])
-                if len(expected_types) > 0:
-                    expected_types += " or "
-                expected_types += str(last_type)
-
-                message = f"""{E_TYPE} | Expected the parameter '{parameter_name}' to be of type {expected_types}, found {type(parameter_value)}."""
-                do_validate(passed=passed, message=message)
+                if isinstance(parameter_value, self.__resolve_type(t)):
+                    return
+
+            last_type = parameter_types.pop()
+            expected_types = ", ".join([str(t) for t in parameter_types])
+            if len(expected_types) > 0:
+                expected_types += " or "
+            expected_types += str(last_type)
+
+            raise ValidationError(f"""{E_TYPE} | Expected the parameter '{parameter_name}' to be of type {expected_types}, found {type(parameter_value)}.""")
 
     def __validate_collection(self, *, parameter_type: Type[CollectionType], key_type: Type[KeyType], element_type: Type[ElementType], min_length: int = 0) -> CollectionType:
         self.__validate_data_type("parameter_type", parameter_type)
@@ -288,6 +324,9 @@ class TypedValidator:
 
         self.__validate_value_type(parameter_name=self.parameter_name, parameter_value=self.parameter_value, parameter_types=[parameter_type])
 
+        if Validator.fast_mode:
+            return self.parameter_value
+
         self.__validate_collection_of_type(parameter_type=parameter_type,
                                            key_type=key_type,
                                            element_type=element_type)
@@ -297,49 +336,52 @@ class TypedValidator:
         return self.parameter_value
 
     def __validate_collection_of_type(self, *, parameter_type: Type[CollectionType], key_type: Type[KeyType], element_type: Type[ElementType]) -> None:
-        self.__validate_data_type("parameter_type", parameter_type)
-        self.__validate_data_type("element_type", element_type)
+        if isinstance(self.parameter_value, str):
+            pass  # We don't need to test these.
 
-        if isinstance(self.parameter_value, (List, Set)):
+        elif isinstance(self.parameter_value, (list, set)):
             for i, actual_value in enumerate(self.parameter_value):
-                message = f"""{ELEM_TYPE} | Expected element {i} of '{self.parameter_name}' to be of type {element_type}, found "{actual_value}" of type {type(actual_value)}."""
-                do_validate(passed=isinstance(actual_value, element_type), message=message)
+                if not isinstance(actual_value, element_type):
+                    raise ValidationError(f"""{ELEM_TYPE} | Expected element {i} of '{self.parameter_name}' to be of type {element_type}, found "{actual_value}" of type {type(actual_value)}.""")
 
-        elif isinstance(self.parameter_value, Dict):
-            for key, value in self.parameter_value.items():
-                message = f"""{ELEM_TYPE} | Expected the key "{key}" of '{self.parameter_name}' to be of type {key_type}, found the type {type(key)}."""
-                do_validate(passed=isinstance(key, key_type), message=message)
+        elif isinstance(self.parameter_value, dict):
+            check_values = element_type is not Any
 
-                if element_type is not Any:
-                    message = f"""{ELEM_TYPE} | Expected the entry for key "{key}" of '{self.parameter_name}' to be of type {element_type}, found the type {type(value)}."""
-                    do_validate(passed=isinstance(value, element_type), message=message)
+            for key, value in self.parameter_value.items():
+                if not isinstance(key, key_type):
+                    raise ValidationError(f"""{ELEM_TYPE} | Expected the key "{key}" of '{self.parameter_name}' to be of type {key_type}, found the type {type(key)}.""")
 
-        elif isinstance(self.parameter_value, str):
-            pass  # We don't need to test these.
+                if check_values and not isinstance(value, element_type):
+                    raise ValidationError(f"""{ELEM_TYPE} | Expected the entry for key "{key}" of '{self.parameter_name}' to be of type {element_type}, found the type {type(value)}.""")
 
         elif self.parameter_value is not None:
             raise Exception(f"Cannot validate collections of type {parameter_type}.")
 
     def __validate_min_length(self, *, min_length: int = 0) -> None:
         # We need to verify that min_length is of tye int
-        message = f"""{E_INTERNAL} | Expected {self.__class__.__name__}.{inspect.stack()[0].function}(..)'s parameter 'min_length' to be specified."""
-        do_validate(passed=min_length is not None, message=message)
+        if min_length is None:
+            raise ValidationError(f"""{E_INTERNAL} | Expected {self.__class__.__name__}.__validate_min_length(..)'s parameter 'min_length' to be specified.""")
 
-        message = f"""{E_INTERNAL} | Expected {self.__class__.__name__}.{inspect.stack()[0].function}(..)'s parameter 'min_length' to be of type int, found {type(min_length)}."""
-        do_validate(passed=isinstance(min_length, int), message=message)
+        if not isinstance(min_length, int):
+            raise ValidationError(f"""{E_INTERNAL} | Expected {self.__class__.__name__}.__validate_min_length(..)'s parameter 'min_length' to be of type int, found {type(min_length)}.""")
 
         if self.parameter_value is not None and min_length > 0:
             # We cannot test the length if the value is not of type Sized, and we shouldn't test it if it is None.
-            message = f"""{E_TYPE} |  Expected the parameter '{self.parameter_name}' to be of type Sized, found {type(self.parameter_value)}."""
-            do_validate(passed=isinstance(self.parameter_value, Sized), message=message)
+            if not isinstance(self.parameter_value, Sized):
+                raise ValidationError(f"""{E_TYPE} |  Expected the parameter '{self.parameter_name}' to be of type Sized, found {type(self.parameter_value)}.""")
 
             actual_length = len(self.parameter_value)
-            message = f"""{E_MIN_L} | The parameter '{self.parameter_name}' must have a minimum length of {min_length}, found {actual_length}."""
-            do_validate(passed=actual_length >= min_length, message=message)
+            if actual_length < min_length:
+                raise ValidationError(f"""{E_MIN_L} | The parameter '{self.parameter_name}' must have a minimum length of {min_length}, found {actual_length}.""")
 
 
 class Validator:
 
+    # When True, validations are reduced to the required check and the value's own type, skipping element types,
+    # lengths, ranges, expected values and the checks of the validator's own arguments; for hot paths whose arguments
+    # were already validated once, e.g. in production jobs after the same calls passed in development.
+    fast_mode: bool = False
+
     def __init__(self, **kwargs):
         """
         Creates an instance of a validator relying on kwargs to specify both the parameter_name, and it's value.
@@ -361,11 +403,10 @@ class Validator:
         :param kwargs: The one and only one parameter to be validated by this class expressed as a dictionary.
         """
 
-        message = f"{E_INTERNAL} | {self.__class__.__name__}.{inspect.stack()[0].function}(..) expects one and only one parameter, found {len(kwargs)}."
-        do_validate(passed=len(kwargs) == 1, message=message)
+        if len(kwargs) != 1:
+            raise ValidationError(f"{E_INTERNAL} | {self.__class__.__name__}.__init__(..) expects one and only one parameter, found {len(kwargs)}.")
 
-        self.__parameter_name: str = list(kwargs)[0]
-        self.__parameter_value: Any = kwargs.get(self.__parameter_name)
+        (self.__parameter_name, self.__parameter_value), = kwargs.items()
 
     @property
     def parameter_value(self) -> Any:
@@ -401,13 +442,11 @@ class Validator:
 
         if parameter_name is None:
             parameter_name = self.parameter_name
-        else:
-            message = f"""{E_INTERNAL} | Expected {self.__class__.__name__}.{inspect.stack()[0].function}(..)'s parameter 'parameter_name' to be of type str, found {type(parameter_name)}."""
-            do_validate(passed=isinstance(parameter_name, str), message=message)
+        elif not isinstance(parameter_name, str):
+            raise ValidationError(f"""{E_INTERNAL} | Expected {self.__class__.__name__}.args(..)'s parameter 'parameter_name' to be of type str, found {type(parameter_name)}.""")
 
-        if required is True:
-            message = f"""{E_NOT_NONE} | The parameter '{parameter_name}' must be specified."""
-            do_validate(passed=self.parameter_value is not None, message=message)
+        if required is True and self.parameter_value is None:
+            raise ValidationError(f"""{E_NOT_NONE} | The parameter '{parameter_name}' must be specified.""")
 
         return TypedValidator(parameter_name=parameter_name,
                               parameter_value=self.parameter_value)
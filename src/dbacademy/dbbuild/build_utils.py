@@ -1,6 +1,6 @@
 __all__ = ["BuildUtils"]
 
-from typing import Union, List, Dict
+from typing import Union, List, Dict, TextIO
 from dbacademy.clients.dbrest import DBAcademyRestClient
 
 
@@ -15,9 +15,9 @@ class BuildUtils:
         return f"{dbgems.get_workspace_url()}#job/{job_id}/run/{run_id}"
 
     @classmethod
-    def print_if(cls, condition, text) -> None:
+    def print_if(cls, condition, text, file: TextIO = None) -> None:
         if condition:
-            print(text)
+            print(text, file=file)
 
     @classmethod
     def clean_target_dir(cls, client: DBAcademyRestClient, target_dir: str, verbose: bool) -> None:
@@ -62,14 +62,14 @@ class BuildUtils:
             f.write(data)
 
     @classmethod
-    def reset_git_repo(cls, *, client: DBAcademyRestClient, directory: str, repo_url: str, branch: str, which: Union[str, None], prefix="") -> None:
+    def reset_git_repo(cls, *, client: DBAcademyRestClient, directory: str, repo_url: str, branch: str, which: Union[str, None], prefix="", file: TextIO = None) -> None:
 
         which = "" if which is None else f" ({which})"
 
-        print(f"{prefix}Resetting git repo{which}:")
-        print(f"{prefix}| Branch:   \"{branch}\"")
-        print(f"{prefix}| Directory: {directory}")
-        print(f"{prefix}| Repo URL:  {repo_url}")
+        print(f"{prefix}Resetting git repo{which}:", file=file)
+        print(f"{prefix}| Branch:   \"{branch}\"", file=file)
+        print(f"{prefix}| Directory: {directory}", file=file)
+        print(f"{prefix}| Repo URL:  {repo_url}", file=file)
 
         status = client.workspace.get_status(directory)
 
@@ -84,7 +84,7 @@ class BuildUtils:
         actual_branch = response.get("branch")
         if actual_branch != branch:
             if actual_branch != "published":
-                print(f"\n*** Unexpected branch: {actual_branch}, expected {branch} ***\n")
+                print(f"\n*** Unexpected branch: {actual_branch}, expected {branch} ***\n", file=file)
             client.repos.update(repo_id=repo_id, branch=branch)
 
         results = client.repos.get(repo_id)
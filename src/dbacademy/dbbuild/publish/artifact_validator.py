@@ -1,6 +1,6 @@
 __all__ = ["from_publisher", "from_translator"]
 
-from typing import Optional
+from typing import Callable, List, Optional, TextIO
 from dbacademy.common import validate
 from dbacademy.dbbuild.build_config_data import BuildConfigData
 from dbacademy.dbbuild.publish.publisher import Publisher
@@ -51,50 +51,66 @@ class ArtifactValidator:
         return self.__build_config
 
     def validate_publishing_processes(self) -> None:
+        import io
         from dbacademy.dbhelper.validations import ValidationSuite
 
-        suite = ValidationSuite(name="Distribution")
-        suite.test_true(actual_value=lambda: self.__validate_distribution_dbc(), description=f"DBC in Distribution System (v{self.build_config.version}-PENDING)", depends_on=[])
+        # Each check prints to its own buffer, printed once all checks completed, so that concurrent reports don't interleave.
+        outputs: List[io.StringIO] = list()
+
+        def check(validation: Callable[[TextIO], bool]) -> Callable[[], bool]:
+            output = io.StringIO()
+            outputs.append(output)
+            return lambda: validation(output)
+
+        # The checks don't depend on each other (depends_on=[]) and so are evaluated concurrently.
+        suite = ValidationSuite(name="Distribution", max_workers=5)
+        suite.test_true(actual_value=check(lambda output: self.__validate_distribution_dbc(output=output)), description=f"DBC in Distribution System (v{self.build_config.version}-PENDING)", depends_on=[])
 
         if self.target_repo_url is not None:
-            suite.test_true(actual_value=lambda: self.__validate_git_releases_dbc(), description=f"Found \"{self.build_config.version}\" in Version Info in DBC from GitHub", depends_on=[])
-            suite.test_true(actual_value=lambda: self.__validate_git_branch(branch="published", version=None), description=f"Found \"{self.build_config.version}\" in Version Info from GitHub Repo (published)", depends_on=[])
-            suite.test_true(actual_value=lambda: self.__validate_git_branch(branch=f"published-v{self.build_config.version}", version=None), description=f"Found \"{self.build_config.version}\" in Version Info from GitHub Repo (published-v{self.build_config.version})", depends_on=[])
+            suite.test_true(actual_value=check(lambda output: self.__validate_git_releases_dbc(output=output)), description=f"Found \"{self.build_config.version}\" in Version Info in DBC from GitHub", depends_on=[])
+            suite.test_true(actual_value=check(lambda output: self.__validate_git_branch(branch="published", version=None, output=output)), description=f"Found \"{self.build_config.version}\" in Version Info from GitHub Repo (published)", depends_on=[])
+            suite.test_true(actual_value=check(lambda output: self.__validate_git_branch(branch=f"published-v{self.build_config.version}", version=None, output=output)), description=f"Found \"{self.build_config.version}\" in Version Info from GitHub Repo (published-v{self.build_config.version})", depends_on=[])
+
+        suite.test_true(actual_value=check(lambda output: self.__validate_published_docs(version=self.build_config.version, output=output)), description=f"Docs Published as PDF ({self.build_config.version})", depends_on=[])
+
+        # noinspection PyStatementEffect
+        suite.test_results  # Evaluates the checks
 
-        suite.test_true(actual_value=lambda: self.__validate_published_docs(version=self.build_config.version), description=f"Docs Published as PDF ({self.build_config.version})", depends_on=[])
+        for output in outputs:
+            print(output.getvalue(), end="")
 
         suite.display_results()
         assert suite.passed, f"One or more problems were found."
 
-    def __validate_distribution_dbc(self) -> bool:
+    def __validate_distribution_dbc(self, output: TextIO = None) -> bool:
         from dbacademy import dbgems
 
         file_name = f"v{self.build_config.version}-PENDING/{self.build_config.build_name}.dbc"
 
-        print()
-        print(f"Validating the DBC in DBAcademy's distribution system ({self.build_config.version}):")
+        print(file=output)
+        print(f"Validating the DBC in DBAcademy's distribution system ({self.build_config.version}):", file=output)
 
         target_path = f"dbfs:/mnt/resources.training.databricks.com/distributions/{self.build_config.build_name}/{file_name}"
         files = dbgems.dbutils.fs.ls(target_path)  # Generates an un-catchable exception
         assert len(files) == 1, f"The distribution DBC was not found at \"{target_path}\"."
 
-        print(f"| PASSED:  .../{file_name} found in \"s3://resources.training.databricks.com/distributions/{self.build_config.build_name}/\".")
-        print(f"| UNKNOWN: \"v{self.build_config.version}\" found in \"s3://resources.training.databricks.com/distributions/{self.build_config.build_name}/{file_name}\".")
+        print(f"| PASSED:  .../{file_name} found in \"s3://resources.training.databricks.com/distributions/{self.build_config.build_name}/\".", file=output)
+        print(f"| UNKNOWN: \"v{self.build_config.version}\" found in \"s3://resources.training.databricks.com/distributions/{self.build_config.build_name}/{file_name}\".", file=output)
 
         return True
 
-    def __validate_git_releases_dbc(self, version: Optional[str] = None) -> bool:
-        print()
-        print("Validating the DBC in GitHub's Releases page:")
+    def __validate_git_releases_dbc(self, version: Optional[str] = None, output: TextIO = None) -> bool:
+        print(file=output)
+        print("Validating the DBC in GitHub's Releases page:", file=output)
 
         version = version or self.build_config.version
 
         base_url = self.target_repo_url[:-4] if self.target_repo_url.endswith(".git") else self.target_repo_url
         dbc_url = f"{base_url}/releases/download/v{version}/{self.build_config.build_name}-v{self.build_config.version}-notebooks.dbc"
 
-        return self.__validate_dbc(version=version, dbc_url=dbc_url)
+        return self.__validate_dbc(version=version, dbc_url=dbc_url, output=output)
 
-    def __validate_dbc(self, version: Optional[str] = None, dbc_url: str = None) -> bool:
+    def __validate_dbc(self, version: Optional[str] = None, dbc_url: str = None, output: TextIO = None) -> bool:
         from dbacademy import dbgems
 
         version = version or self.build_config.version
@@ -102,34 +118,34 @@ class ArtifactValidator:
         dbc_target_dir = f"{self.temp_work_dir}/{self.build_config.build_name}-v{version}"[10:]
 
         name = dbc_url.split("/")[-1]
-        print(f"| Importing: {name}")
-        print(f"| Source:    {dbc_url}")
-        print(f"| Target:    {dbc_target_dir}")
-        print(f"| Notebooks: {dbgems.get_workspace_url()}#workspace{dbc_target_dir}")
+        print(f"| Importing: {name}", file=output)
+        print(f"| Source:    {dbc_url}", file=output)
+        print(f"| Target:    {dbc_target_dir}", file=output)
+        print(f"| Notebooks: {dbgems.get_workspace_url()}#workspace{dbc_target_dir}", file=output)
 
         self.build_config.client.workspace.delete_path(dbc_target_dir, recursive=True)
         self.build_config.client.workspace.mkdirs(dbc_target_dir)
         self.build_config.client.workspace.import_dbc_files(path=dbc_target_dir, source_url=dbc_url, overwrite=True)
 
-        return self.__validate_version_info(version=version, dbc_dir=dbc_target_dir)
+        return self.__validate_version_info(version=version, dbc_dir=dbc_target_dir, output=output)
 
-    def __validate_version_info(self, *, version: Optional[str], dbc_dir: str) -> bool:
+    def __validate_version_info(self, *, version: Optional[str], dbc_dir: str, output: TextIO = None) -> bool:
         version = version or self.build_config.version
 
         version_info_path = f"{dbc_dir}/Version Info"
         source = self.build_config.client.workspace.export_notebook(version_info_path)
         assert f"**{version}**" in source, f"Expected the notebook \"Version Info\" at \"{version_info_path}\" to contain the version \"{version}\""
-        print(f"|")
-        print(f"| PASSED: v{version} found in \"{version_info_path}\"")
+        print(f"|", file=output)
+        print(f"| PASSED: v{version} found in \"{version_info_path}\"", file=output)
 
         return True
 
-    def __validate_git_branch(self, *, branch: str, version: Optional[str]) -> bool:
+    def __validate_git_branch(self, *, branch: str, version: Optional[str], output: TextIO = None) -> bool:
         from dbacademy import common
         from dbacademy.dbbuild.build_utils import BuildUtils
 
-        print()
-        print(f"Validating the \"{branch}\" branch in the public, student-facing repo:")
+        print(file=output)
+        print(f"Validating the \"{branch}\" branch in the public, student-facing repo:", file=output)
 
         if not self.build_config.i18n:
             repo_url = f"https://github.com/databricks-academy/{self.build_config.build_name}.git"
@@ -143,21 +159,22 @@ class ArtifactValidator:
                                   repo_url=repo_url,
                                   branch=branch,
                                   which=None,
-                                  prefix="| ")
+                                  prefix="| ",
+                                  file=output)
 
-        return self.__validate_version_info(version=version, dbc_dir=target_dir)
+        return self.__validate_version_info(version=version, dbc_dir=target_dir, output=output)
 
-    def __validate_published_docs(self, version: str) -> bool:
+    def __validate_published_docs(self, version: str, output: TextIO = None) -> bool:
         import os
         from dbacademy.dbbuild.publish.docs_publisher import DocsPublisher
         from dbacademy.clients import google
 
         if self.translation is None:
-            print(f"| PASSED: No documents to validate.")
+            print(f"| PASSED: No documents to validate.", file=output)
             return True
 
-        print()
-        print(f"Validating export of Google docs ({version})")
+        print(file=output)
+        print(f"Validating export of Google docs ({version})", file=output)
 
         google_client = google.from_workspace()
         docs_publisher = DocsPublisher(build_name=self.build_config.build_name, version=self.build_config.version, translation=self.translation)
@@ -168,14 +185,14 @@ class ArtifactValidator:
             file = google_client.drive.file_get(file_id)
             name = file.get("name")
             folder_id = file.get("id")
-            print(f"| {i+1} of {total}: {name} (https://drive.google.com/drive/folders/{folder_id})")
+            print(f"| {i+1} of {total}: {name} (https://drive.google.com/drive/folders/{folder_id})", file=output)
 
             distribution_path = docs_publisher.get_distribution_path(version=version, file=file)
-            print(f"|                   {distribution_path}")
+            print(f"|                   {distribution_path}", file=output)
 
             assert os.path.exists(distribution_path), f"The document {name} was not found at \"{distribution_path}\""
 
-        print(f"| PASSED: All documents exported to the distribution system")
+        print(f"| PASSED: All documents exported to the distribution system", file=output)
 
         return True
 
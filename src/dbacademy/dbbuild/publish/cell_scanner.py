@@ -0,0 +1,92 @@
+__all__ = ["CellScanner", "CellFindings"]
+
+import re
+from typing import List, Optional
+
+
+class CellFindings:
+    """The prohibited content found in one cell, or one notebook, by CellScanner.scan()"""
+
+    def __init__(self, *, tokens: List[str], copyrights: List[str], icons: List[str], mustache: Optional[str]):
+        self.__tokens = tokens
+        self.__copyrights = copyrights
+        self.__icons = icons
+        self.__mustache = mustache
+
+    @property
+    def tokens(self) -> List[str]:
+        """The BDC tokens found, in the order of CellScanner.BDC_TOKENS"""
+        return self.__tokens
+
+    @property
+    def copyrights(self) -> List[str]:
+        """The copyright tags found, e.g. "2023 Databricks, Inc", in chronological order"""
+        return self.__copyrights
+
+    @property
+    def icons(self) -> List[str]:
+        """The deprecated icons found, in the order of CellScanner.DEPRECATED_ICONS"""
+        return self.__icons
+
+    @property
+    def mustache(self) -> Optional[str]:
+        """The first unreplaced mustache pattern, e.g. "{{version}}", if any"""
+        return self.__mustache
+
+
+class CellScanner:
+    """
+    Finds every BDC token, copyright tag, deprecated icon and unreplaced mustache pattern in a single regular
+    expression pass, as opposed to one substring search per token, per copyright year and per icon.
+    """
+
+    # "R_ONLY" "VIDEO" concatenate to a single token, as they always have in NotebookDef.update_command().
+    BDC_TOKENS = ["IPYTHON_ONLY", "DATABRICKS_ONLY",
+                  "AMAZON_ONLY", "AZURE_ONLY", "TEST", "PRIVATE_TEST", "INSTRUCTOR_NOTE", "INSTRUCTOR_ONLY",
+                  "SCALA_ONLY", "PYTHON_ONLY", "SQL_ONLY", "R_ONLY" "VIDEO", "ILT_ONLY", "SELF_PACED_ONLY", "INLINE",
+                  "NEW_PART", "{dbr}"]
+
+    COPYRIGHT_YEARS = range(2017, 2999)
+
+    DEPRECATED_ICONS = [":HINT:", ":CAUTION:", ":BESTPRACTICE:", ":SIDENOTE:", ":NOTE:"]
+
+    # noinspection RegExpDuplicateCharacterInClass
+    MUSTACHE_PATTERN = re.compile(r"{{[a-zA-Z\-\\_\\#\\/]*}}")
+
+    # The leading lookahead rejects, with a single character-set test, every position that cannot start a finding;
+    # without it, each alternative would be attempted at every position of the text.
+    __PATTERN = re.compile("(?=[0-9{first}])(?:(?P<token>{tokens})|(?P<year>[0-9]{{4}}) Databricks, Inc|(?P<icon>{icons})|(?P<mustache>{mustache}))".format(
+        first="".join(sorted({re.escape(value[0]) for value in BDC_TOKENS + DEPRECATED_ICONS + ["{"]})),
+        tokens="|".join(re.escape(t) for t in BDC_TOKENS),
+        icons="|".join(re.escape(i) for i in DEPRECATED_ICONS),
+        mustache=MUSTACHE_PATTERN.pattern))
+
+    @classmethod
+    def scan(cls, text: str) -> CellFindings:
+        """
+        Scans the text, a single command or an entire notebook, for prohibited content.
+        :param text: the text to scan.
+        :return: the findings; each distinct token, copyright or icon is reported once.
+        """
+        found_token = False
+        found_icon = False
+        years = set()
+        mustache = None
+
+        for match in cls.__PATTERN.finditer(text):
+            if match.group("year") is not None:
+                years.add(int(match.group("year")))
+            elif match.group("token") is not None:
+                found_token = True
+            elif match.group("icon") is not None:
+                found_icon = True
+            elif mustache is None:
+                mustache = match.group("mustache")
+                found_token = True  # A mustache may hide a token, e.g. {dbr} in {{dbr}}
+
+        # Matches don't overlap, so one match may hide another, e.g. TEST in PRIVATE_TEST; the rare cells with any
+        # finding are re-checked token by token, every other cell is settled by the one pass above.
+        return CellFindings(tokens=[t for t in cls.BDC_TOKENS if t in text] if found_token else list(),
+                            copyrights=[f"{y} Databricks, Inc" for y in sorted(years) if y in cls.COPYRIGHT_YEARS],
+                            icons=[i for i in cls.DEPRECATED_ICONS if i in text] if found_icon else list(),
+                            mustache=mustache)
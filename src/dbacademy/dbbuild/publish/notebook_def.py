@@ -1,10 +1,12 @@
 __all__ = ["NotebookDef"]
 
-from typing import Union, List, Dict, Any
+from typing import Union, List, Dict, Any, Callable, Optional, TextIO
 from dbacademy.common import validate
 from dbacademy.clients.dbrest import DBAcademyRestClient
 from dbacademy.dbbuild.publish.notebook_def_data import NotebookDefData
 from dbacademy.dbbuild.publish.state_variables import StateVariables
+from dbacademy.dbbuild.publish.publishing_manifest import PublishingManifest
+from dbacademy.dbbuild.publish.cell_scanner import CellScanner
 
 
 class NotebookDef(NotebookDefData):
@@ -49,6 +51,9 @@ class NotebookDef(NotebookDefData):
                          i18n=i18n,
                          i18n_language=i18n_language)
 
+        # Where publish() prints to, see NotebookDef.publish()
+        self.__output: Optional[TextIO] = None
+
     def __str__(self):
         result = self.path
         result += f"\n - include_solution = {self.include_solution}"
@@ -58,21 +63,21 @@ class NotebookDef(NotebookDefData):
     def assert_no_warnings(self) -> None:
         if len(self.logger.warnings) > 0:
             what = "warning was" if len(self.logger.warnings) == 1 else "warnings were"
-            print(f"CAUTION: {len(self.logger.warnings)} {what} found while publishing")
+            print(f"CAUTION: {len(self.logger.warnings)} {what} found while publishing", file=self.__output)
             for warning in self.logger.warnings:
-                print("-" * 80)
-                print(warning.message)
-            print()
+                print("-" * 80, file=self.__output)
+                print(warning.message, file=self.__output)
+            print(file=self.__output)
 
     def assert_no_errors(self, print_warnings: bool) -> None:
         validate(print_warnings=print_warnings).required.bool()
 
         if len(self.logger.errors) > 0:
             what = "error was" if len(self.logger.errors) == 1 else "errors were"
-            print(f"ABORTING: {len(self.logger.errors)} {what} found while publishing")
+            print(f"ABORTING: {len(self.logger.errors)} {what} found while publishing", file=self.__output)
             for error in self.logger.errors:
-                print("-" * 80)
-                print(error.message)
+                print("-" * 80, file=self.__output)
+                print(error.message, file=self.__output)
             raise Exception("Publish aborted - see previous errors for more information")
 
         if print_warnings:
@@ -586,10 +591,35 @@ For more current information, please see <a href="https://files.training.databri
                 i18n_resources_dir: str,
                 verbose: bool,
                 debugging: bool,
-                other_notebooks: List[NotebookDefData]) -> None:
+                other_notebooks: List[NotebookDefData],
+                mkdirs: Callable[[str], None] = None,
+                manifest: PublishingManifest = None,
+                output: Optional[TextIO] = None) -> None:
+        """
+        Publishes the student's and, if included, the solution's notebook.
+        :param output: The stream this notebook's progress is printed to, None for sys.stdout.
+        """
+        self.__output = output
+        try:
+            self.__publish(source_dir, target_dir, i18n_resources_dir, verbose, debugging, other_notebooks, mkdirs, manifest)
+        finally:
+            self.__output = None
+
+    def __publish(self,
+                  source_dir: str,
+                  target_dir: str,
+                  i18n_resources_dir: str,
+                  verbose: bool,
+                  debugging: bool,
+                  other_notebooks: List[NotebookDefData],
+                  mkdirs: Optional[Callable[[str], None]],
+                  manifest: Optional[PublishingManifest]) -> None:
 
+        from datetime import date
         from dbacademy.common import validate
         from dbacademy.dbbuild.build_utils import BuildUtils
+        from dbacademy.dbbuild.publish import pub_utils
+        from dbacademy.dbbuild.publish.notebook_logger import NotebookError
 
         validate(source_dir=source_dir).required.str()
         validate(target_dir=target_dir).required.str()
@@ -601,9 +631,9 @@ For more current information, please see <a href="https://files.training.databri
 
         self.logger.reset()      # Remove all errors from previous invocations of publish
         self.i18n_guids.clear()  # Remove all GUIDs from previous invocations of publish
-        print()
-        print("=" * 80)
-        print(f".../{self.path}")
+        print(file=self.__output)
+        print("=" * 80, file=self.__output)
+        print(f".../{self.path}", file=self.__output)
 
         source_notebook_path = f"{source_dir}/{self.path}"
         source_info = self.client.workspace.get_status(source_notebook_path)
@@ -615,17 +645,30 @@ For more current information, please see <a href="https://files.training.databri
         i18n_source = self.load_i18n_source(i18n_resources_dir)
         state.i18n_guid_map = self.load_i18n_guid_map(i18n_source)
 
+        fingerprint = None
+        if manifest is not None:
+            # Everything the published notebooks depend on, including the year printed in the footer.
+            fingerprint = manifest.fingerprint(language, raw_source, state.i18n_guid_map, self.replacements, self.include_solution,
+                                               self.test_round, self.version, self.i18n, self.i18n_language, self.ignored_errors,
+                                               [n.path for n in other_notebooks], date.today().year)
+
+            if manifest.is_current(self.path, fingerprint):
+                self.logger.reset()
+                for warning in manifest.warnings(self.path):
+                    self.logger.warnings.append(NotebookError(warning))
+                print("Unchanged, skipping", file=self.__output)
+                return
+
         cmd_delim = self.get_cmd_delim(language)
-        commands = raw_source.split(cmd_delim)
 
-        for i in range(len(commands)):
+        for i, command in enumerate(pub_utils.iter_commands(raw_source, cmd_delim)):
             if debugging:
-                print("\n" + ("=" * 80))
-                print(f"Debug Command {i + 1}")
+                print("\n" + ("=" * 80), file=self.__output)
+                print(f"Debug Command {i + 1}", file=self.__output)
 
             self.update_command(state=state,
                                 language=language,
-                                command=commands[i].lstrip(),
+                                command=command.lstrip(),
                                 i=i,
                                 other_notebooks=other_notebooks,
                                 debugging=debugging)
@@ -648,16 +691,20 @@ For more current information, please see <a href="https://files.training.databri
 
         # Create the student's notebooks
         students_notebook_path = f"{target_dir}/{self.path}"
-        BuildUtils.print_if(verbose, students_notebook_path)
-        BuildUtils.print_if(verbose, f"...publishing {len(state.students_commands)} commands")
-        self.publish_notebook(language, state.students_commands, students_notebook_path, print_warnings=True)
+        BuildUtils.print_if(verbose, students_notebook_path, file=self.__output)
+        BuildUtils.print_if(verbose, f"...publishing {len(state.students_commands)} commands", file=self.__output)
+        self.publish_notebook(language, state.students_commands, students_notebook_path, print_warnings=True, mkdirs=mkdirs)
 
         # Create the solutions notebooks
         if self.include_solution:
             solutions_notebook_path = f"{target_dir}/Solutions/{self.path}"
-            BuildUtils.print_if(verbose, solutions_notebook_path)
-            BuildUtils.print_if(verbose, f"...publishing {len(state.solutions_commands)} commands")
-            self.publish_notebook(language, state.solutions_commands, solutions_notebook_path, print_warnings=False)
+            BuildUtils.print_if(verbose, solutions_notebook_path, file=self.__output)
+            BuildUtils.print_if(verbose, f"...publishing {len(state.solutions_commands)} commands", file=self.__output)
+            self.publish_notebook(language, state.solutions_commands, solutions_notebook_path, print_warnings=False, mkdirs=mkdirs)
+
+        if manifest is not None:
+            targets = [students_notebook_path, solutions_notebook_path] if self.include_solution else [students_notebook_path]
+            manifest.record(self.path, fingerprint, targets, [w.message for w in self.logger.warnings])
 
     def update_command(self, *,
                        state: StateVariables,
@@ -706,18 +753,18 @@ For more current information, please see <a href="https://files.training.databri
 
         if debugging:
             if len(leading_comments) > 0:
-                print("   |-LEADING COMMENTS --" + ("-" * 57))
+                print("   |-LEADING COMMENTS --" + ("-" * 57), file=self.__output)
                 for comment in leading_comments:
-                    print("   |" + comment)
+                    print("   |" + comment, file=self.__output)
             else:
-                print("   |-NO LEADING COMMENTS --" + ("-" * 54))
+                print("   |-NO LEADING COMMENTS --" + ("-" * 54), file=self.__output)
 
             if len(directives) > 0:
-                print("   |-DIRECTIVES --" + ("-" * 62))
+                print("   |-DIRECTIVES --" + ("-" * 62), file=self.__output)
                 for directive in directives:
-                    print("   |" + directive)
+                    print("   |" + directive, file=self.__output)
             else:
-                print("   |-NO DIRECTIVES --" + ("-" * 59))
+                print("   |-NO DIRECTIVES --" + ("-" * 59), file=self.__output)
 
         # Update flags to indicate if we found the required header and footer directives
         state.include_header = True if NotebookDef.D_INCLUDE_HEADER_TRUE in directives else state.include_header
@@ -735,7 +782,7 @@ For more current information, please see <a href="https://files.training.databri
 
         # Process the various directives
         if command.strip() == "":
-            state.skipped += self.skipping(i, "Empty Cell")
+            state.skipped += self.skipping(i, "Empty Cell", file=self.__output)
         elif NotebookDef.D_SOURCE_ONLY in directives:
             state.skipped += self.skipping(i, None)
         elif NotebookDef.D_INCLUDE_HEADER_TRUE in directives:
@@ -774,15 +821,11 @@ For more current information, please see <a href="https://files.training.databri
             # Not a TO-DO or ANSWER, just append to both
             self.append_both(state.students_commands, state.solutions_commands, command)
 
-        # Check the command for BDC markers
-        bdc_tokens = ["IPYTHON_ONLY", "DATABRICKS_ONLY",
-                      "AMAZON_ONLY", "AZURE_ONLY", "TEST", "PRIVATE_TEST", "INSTRUCTOR_NOTE", "INSTRUCTOR_ONLY",
-                      "SCALA_ONLY", "PYTHON_ONLY", "SQL_ONLY", "R_ONLY"
-                                                               "VIDEO", "ILT_ONLY", "SELF_PACED_ONLY", "INLINE",
-                      "NEW_PART", "{dbr}"]
+        # Check the command for BDC markers and copyrights, in one pass
+        findings = CellScanner.scan(command)
 
-        for token in bdc_tokens:
-            self.logger.test(lambda: token not in command, f"""Cmd #{i + 1} | Found the token "{token}" """)
+        for token in findings.tokens:
+            self.logger.test(lambda: False, f"""Cmd #{i + 1} | Found the token "{token}" """)
 
         if not pub_utils.is_markdown(cm=cm, command=command):
             if language.lower() == "python":
@@ -802,9 +845,8 @@ For more current information, please see <a href="https://files.training.databri
             else:
                 raise Exception(f"The language {language} is not supported")
 
-        for year in range(2017, 2999):
-            tag = f"{year} Databricks, Inc"
-            self.logger.test(lambda: tag not in command, f"""Cmd #{i + 1} | Found copyright ({tag}) """)
+        for tag in findings.copyrights:
+            self.logger.test(lambda: False, f"""Cmd #{i + 1} | Found copyright ({tag}) """)
 
         return command
 
@@ -818,17 +860,17 @@ For more current information, please see <a href="https://files.training.databri
         m = self.get_comment_marker(language)
         target_path = f"{target_dir}/{natural_language}/{self.path}"
 
-        final_source = f"# /{self.path}\n"
+        parts = [f"# /{self.path}\n"]
 
         # Processes all commands except the last
         for md_command in md_commands:
             md_command = md_command.replace(f"{m} MAGIC ", "")
             md_command = md_command.replace(f"%md-sandbox --i18n-", f"<hr sandbox>--i18n-")
             md_command = md_command.replace(f"%md --i18n-", f"<hr>--i18n-")
-            final_source += md_command
-            final_source += "\n"
+            parts.append(md_command)
+            parts.append("\n")
 
-        final_source = self.replace_contents(final_source)
+        final_source = self.replace_contents("".join(parts))
 
         target_file = "/Workspace"+target_path+".md"
         target_dir = "/".join(target_file.split("/")[:-1])
@@ -845,36 +887,32 @@ For more current information, please see <a href="https://files.training.databri
                          language: str,
                          commands: List[str],
                          target_path: str,
-                         print_warnings: bool) -> None:
+                         print_warnings: bool,
+                         mkdirs: Callable[[str], None] = None) -> None:
 
         from dbacademy.dbbuild import dbb_constants
 
         m = self.get_comment_marker(language)
-        final_source = f"{m} {dbb_constants.NOTEBOOKS.DATABRICKS_NOTEBOOK_SOURCE}\n"
+        header = f"{m} {dbb_constants.NOTEBOOKS.DATABRICKS_NOTEBOOK_SOURCE}\n"
 
-        # Processes all commands except the last
-        for command in commands[:-1]:
-            final_source += command
-            final_source += self.get_cmd_delim(language)
-
-        # Process the last command
-        m = self.get_comment_marker(language)
-        final_source += commands[-1]
-        final_source += "" if commands[-1].startswith(f"{m} MAGIC") else "\n\n"
+        # Joins all commands, the last of which is terminated with blank lines unless it's a magic command
+        trailer = "" if commands[-1].startswith(f"{m} MAGIC") else "\n\n"
+        final_source = header + self.get_cmd_delim(language).join(commands) + trailer
 
         final_source = self.replace_contents(final_source)
 
         self.assert_no_errors(print_warnings)
 
         parent_dir = "/".join(target_path.split("/")[0:-1])
-        self.client.workspace.mkdirs(parent_dir)
+        mkdirs = mkdirs or self.client.workspace.mkdirs
+        mkdirs(parent_dir)
         self.client.workspace.import_notebook(language=language.upper(),
                                               path=target_path,
                                               content=final_source,
                                               overwrite=True)
 
     def clean_todo_cell(self, source_language, command, i):
-        new_command = ""
+        new_lines = list()
         lines = command.split("\n")
         source_m = self.get_comment_marker(source_language)
 
@@ -893,55 +931,49 @@ For more current information, please see <a href="https://files.training.databri
 
             if index == 0 and first == 1:
                 # This is the first line, but the first is a magic command
-                new_command += line
+                new_lines.append(line)
 
             elif (index == first) and line.strip() not in [f"{prefix} {NotebookDef.D_TODO}"]:
                 self.logger.test(lambda: False, f"""Cmd #{i + 1} | Expected line #{index + 1} to be the "{NotebookDef.D_TODO}" directive: "{line}" """)
+                new_lines.append("")  # The offending line is dropped, leaving it blank
 
             elif not line.startswith(prefix) and line.strip() != "" and line.strip() != f"{source_m} MAGIC":
                 self.logger.test(lambda: False, f"""Cmd #{i + 1} | Expected line #{index + 1} to be commented out: "{line}" with prefix "{prefix}" """)
+                new_lines.append("")  # The offending line is dropped, leaving it blank
 
             elif line.strip().startswith(f"{prefix} {NotebookDef.D_TODO}"):
                 # Add as-is
-                new_command += line
+                new_lines.append(line)
 
             elif line.strip() == "" or line.strip() == f"{source_m} MAGIC":
                 # No comment, do not process
-                new_command += line
+                new_lines.append(line)
 
             elif line.strip().startswith(f"{prefix} "):
                 # Remove comment and space
                 length = len(prefix) + 1
-                new_command += line[length:]
+                new_lines.append(line[length:])
 
             else:
                 # Remove just the comment
                 length = len(prefix)
-                new_command += line[length:]
+                new_lines.append(line[length:])
 
-            # Add new line for all but the last line
-            if index < len(lines) - 1:
-                new_command += "\n"
-
-        return new_command
+        return "\n".join(new_lines)
 
     def replace_contents(self, contents: str):
-        import re
-
         for key, new_value in self.replacements.items():
             old_value = "{{" + key + "}}"
             contents = contents.replace(old_value, str(new_value))
 
-        # TODO Fix this error after a proper unit tests is created.
-        # noinspection RegExpDuplicateCharacterInClass
-        mustache_pattern = re.compile(r"{{[a-zA-Z\-\\_\\#\\/]*}}")
-        result = mustache_pattern.search(contents)
-        if result is not None:
+        findings = CellScanner.scan(contents)
+
+        if findings.mustache is not None:
+            result = CellScanner.MUSTACHE_PATTERN.search(contents)
             self.logger.test(lambda: False, f"A mustache pattern was detected after all replacements were processed: {result}")
 
-        for icon in [":HINT:", ":CAUTION:", ":BESTPRACTICE:", ":SIDENOTE:", ":NOTE:"]:
-            if icon in contents:
-                self.logger.test(lambda: False, f"The deprecated {icon} pattern was found after all replacements were processed.")
+        for icon in findings.icons:
+            self.logger.test(lambda: False, f"The deprecated {icon} pattern was found after all replacements were processed.")
 
         # No longer supported
         # replacements[":HINT:"] =         """<img src="https://files.training.databricks.com/images/icon_hint_24.png"/>&nbsp;**Hint:**"""
@@ -1076,9 +1108,9 @@ For more current information, please see <a href="https://files.training.databri
         return directives
 
     @staticmethod
-    def skipping(i, label):
+    def skipping(i, label, file: TextIO = None):
         if label:
-            print(f"Cmd #{i+1} | Skipping: {label}")
+            print(f"Cmd #{i+1} | Skipping: {label}", file=file)
         return 1
 
     def get_header_cell(self, language):
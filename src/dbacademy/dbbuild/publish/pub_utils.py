@@ -1,6 +1,6 @@
-__all__ = ["is_markdown", "is_not_markdown", "is_titled", "is_not_titled"]
+__all__ = ["is_markdown", "is_not_markdown", "is_titled", "is_not_titled", "iter_commands"]
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from dbacademy.dbbuild import dbb_constants
 
 
@@ -32,6 +32,24 @@ def is_not_titled(*, cm: str, command: str) -> bool:
     return not is_titled(cm=cm, command=command)
 
 
+def iter_commands(source: str, cmd_delim: str) -> Iterator[str]:
+    """
+    Yields the same commands as source.split(cmd_delim), one at a time, without first materializing the list of every command.
+    :param source: the notebook's source.
+    :param cmd_delim: the delimiter between commands, see NotebookDef.get_cmd_delim()
+    :return: an iterator over the notebook's commands.
+    """
+    start = 0
+    while True:
+        end = source.find(cmd_delim, start)
+        if end == -1:
+            yield source[start:]
+            return
+
+        yield source[start:end]
+        start = end + len(cmd_delim)
+
+
 def parse_html_links(command: str) -> List[str]:
     import re
     return re.findall(r"<a .*?</a>", command)
@@ -73,6 +73,13 @@ class Publisher:
     def target_repo_url(self, target_repo_url: str) -> None:
         self.__target_repo_url = validate(target_repo_url=target_repo_url).required.str()
 
+    @property
+    def manifest_path(self) -> str:
+        """
+        The manifest of incremental builds, kept alongside, not within, the target directory so that it is never published.
+        """
+        return f"/Workspace{self.target_dir}.manifest.json"
+
     @property
     def temp_repo_dir(self) -> str:
         return self.__temp_repo_dir
@@ -184,18 +191,22 @@ class Publisher:
         """
         assert self.__generated_notebooks, "The notebooks have not yet been generated. See Publisher.generate_notebooks()"
 
-    def generate_notebooks(self, *, skip_generation: bool = False, verbose=False, debugging=False) -> Optional[str]:
+    def generate_notebooks(self, *, skip_generation: bool = False, verbose=False, debugging=False, max_workers: int = 1, incremental: bool = False) -> Optional[str]:
         """
         Generates the publishable notebooks from the source notebooks
         :param skip_generation: Overrides the default behavior and skips generation of the notebook
         :param verbose: True of verbose logging
         :param debugging: True for debug logging
+        :param max_workers: The number of notebooks published concurrently, by default 1 to publish them serially
+        :param incremental: True to only republish notebooks whose inputs changed since the last build, see Publisher.manifest_path
         :return: The HTML results that should be rendered with displayHTML() from the calling notebook
         """
         from dbacademy import common, dbgems
         from dbacademy.dbbuild.publish.notebook_def import NotebookDef
         from dbacademy.dbbuild.build_utils import BuildUtils
         from dbacademy.dbbuild.build_config import BuildConfig
+        from dbacademy.dbbuild.publish.publishing_pool import PublishingPool
+        from dbacademy.dbbuild.publish.publishing_manifest import PublishingManifest
 
         if self.build_config.version in BuildConfig.VERSIONS_LIST:
             self.assert_validated_config()
@@ -244,22 +255,55 @@ class Publisher:
             for path in self.build_config.white_list[1:]:
                 print(f"              {path}")
 
-        # Now that we backed up the version-info, we can delete everything.
+        # Now that we backed up the version-info, we can delete everything, unless the manifest accounts for it.
         target_status = self.build_config.client.workspace.get_status(self.target_dir)
-        if target_status is not None:
+
+        manifest = None
+        if incremental:
+            manifest = PublishingManifest(self.manifest_path, build_inputs=[self.build_config.name,
+                                                                            self.build_config.version,
+                                                                            self.build_config.core_version,
+                                                                            self.build_config.source_dir,
+                                                                            self.target_dir,
+                                                                            self.i18n_resources_dir,
+                                                                            self.publishing_mode.value,
+                                                                            self.build_config.include_solutions,
+                                                                            self.build_config.ignored_errors,
+                                                                            self.build_config.white_list,
+                                                                            self.build_config.black_list])
+            if target_status is None:
+                # The manifest is kept outside the target directory and so outlives its deletion.
+                manifest.discard()
+            elif not manifest.is_empty:
+                # Notebooks deleted since the last build are published again.
+                existing = self.build_config.client.workspace.ls(self.target_dir, recursive=True) or list()
+                manifest.retain_existing([e.get("path") for e in existing])
+
+        if target_status is not None and (manifest is None or manifest.is_empty):
             BuildUtils.print_if(verbose, "-" * 80)
             BuildUtils.clean_target_dir(self.build_config.client, self.target_dir, verbose)
 
         errors = 0
         warnings = 0
 
+        pool = PublishingPool(self.build_config.client, max_workers)
+        pool.map(lambda notebook, output: notebook.publish(source_dir=self.build_config.source_dir,
+                                                           target_dir=self.target_dir,
+                                                           i18n_resources_dir=self.i18n_resources_dir,
+                                                           verbose=verbose,
+                                                           debugging=debugging,
+                                                           other_notebooks=self.notebooks,
+                                                           mkdirs=pool.mkdirs,
+                                                           manifest=manifest,
+                                                           output=output), main_notebooks)
+
+        if manifest is not None:
+            for path in manifest.orphaned_targets():
+                BuildUtils.print_if(verbose, f"Deleting orphaned notebook {path}")
+                self.build_config.client.workspace.delete_path(path, recursive=False)
+            manifest.save()
+
         for notebook in main_notebooks:
-            notebook.publish(source_dir=self.build_config.source_dir,
-                             target_dir=self.target_dir,
-                             i18n_resources_dir=self.i18n_resources_dir,
-                             verbose=verbose, 
-                             debugging=debugging,
-                             other_notebooks=self.notebooks)
             errors += len(notebook.logger.errors)
             warnings += len(notebook.logger.warnings)
 
@@ -0,0 +1,183 @@
+__all__ = ["PublishingManifest"]
+
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+from dbacademy.common import validate
+
+
+class PublishingManifest:
+    """
+    Records, per published notebook, a hash of everything that went into generating it along with the notebooks it
+    produced so that subsequent builds can skip the notebooks whose inputs did not change and delete only the targets
+    that are no longer produced.
+    """
+
+    def __init__(self, manifest_path: str, build_inputs: Any = None):
+        """
+        :param manifest_path: the local path (e.g. /Workspace/...) of the JSON file the manifest is loaded from and saved to.
+        :param build_inputs: the build-wide inputs common to every notebook, e.g. the transformation settings; the previous
+        manifest is discarded when they, or the version of this library, change.
+        """
+        self.__manifest_path = validate(manifest_path=manifest_path).required.str()
+        self.__build_fingerprint = self.fingerprint(self.library_version(), build_inputs)
+        self.__lock = threading.Lock()
+        self.__previous: Dict[str, Dict[str, Any]] = self.__load()
+        self.__current: Dict[str, Dict[str, Any]] = dict()
+
+    @property
+    def manifest_path(self) -> str:
+        return self.__manifest_path
+
+    @property
+    def is_empty(self) -> bool:
+        """
+        :return: True if no manifest was previously saved, in which case the target directory's contents are unaccounted for.
+        """
+        return len(self.__previous) == 0
+
+    def discard(self) -> None:
+        """
+        Forgets the previous build, e.g. because its target directory no longer exists, so that every notebook is published.
+        :return: None
+        """
+        with self.__lock:
+            self.__previous = dict()
+
+    def retain_existing(self, existing_targets: Iterable[str]) -> None:
+        """
+        Forgets the notebooks of the previous build whose targets no longer all exist, e.g. because they were deleted by
+        hand, so that they are published again.
+        :param existing_targets: the workspace paths of the notebooks currently found in the target directory.
+        :return: None
+        """
+        existing_targets = set(existing_targets)
+
+        with self.__lock:
+            self.__previous = {path: entry for path, entry in self.__previous.items()
+                               if all(t in existing_targets for t in entry.get("targets", list()))}
+
+    @staticmethod
+    def library_version() -> str:
+        """
+        :return: the installed version, or commit, of dbacademy or, should it not be installed as a distribution, a hash of
+        the publishing modules' sources, so that a manifest never outlives a change to the transformation itself.
+        """
+        import os
+        import hashlib
+        from dbacademy import dbgems
+
+        try:
+            return dbgems.lookup_current_module_version("dbacademy")
+        except Exception:
+            pass
+
+        digest = hashlib.sha256()
+        package_dir = os.path.dirname(__file__)
+        for file_name in sorted(os.listdir(package_dir)):
+            if file_name.endswith(".py"):
+                with open(os.path.join(package_dir, file_name), "rb") as f:
+                    digest.update(f.read())
+
+        return digest.hexdigest()
+
+    def __load(self) -> Dict[str, Dict[str, Any]]:
+        import os
+        import json
+
+        if not os.path.exists(self.manifest_path):
+            return dict()
+
+        try:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+        except ValueError:
+            return dict()  # A corrupt manifest only costs a full build
+
+        if manifest.get("build_fingerprint") != self.__build_fingerprint:
+            return dict()
+
+        return manifest.get("notebooks", dict())
+
+    @staticmethod
+    def fingerprint(*inputs: Any) -> str:
+        """
+        Hashes the inputs of a notebook's transformation.
+        :param inputs: any JSON serializable values; dictionaries are hashed independently of their key order.
+        :return: the hex digest of the inputs.
+        """
+        import json
+        import hashlib
+
+        text = json.dumps(inputs, sort_keys=True, default=str)
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def is_current(self, notebook_path: str, fingerprint: str) -> bool:
+        """
+        Tests whether the notebook was previously published from identical inputs, carrying its entry over to this build if so.
+        :param notebook_path: the notebook's path relative to the source directory.
+        :param fingerprint: the hash of the notebook's current inputs, see PublishingManifest.fingerprint()
+        :return: True if the notebook's targets are up-to-date and need not be published again.
+        """
+        entry = self.__previous.get(notebook_path)
+        if entry is None or entry.get("fingerprint") != fingerprint:
+            return False
+
+        with self.__lock:
+            self.__current[notebook_path] = entry
+
+        return True
+
+    def warnings(self, notebook_path: str) -> List[str]:
+        """
+        :param notebook_path: the notebook's path relative to the source directory.
+        :return: the warnings reported when the notebook was last published.
+        """
+        entry = self.__current.get(notebook_path) or self.__previous.get(notebook_path) or dict()
+        return list(entry.get("warnings", list()))
+
+    def record(self, notebook_path: str, fingerprint: str, targets: List[str], warnings: List[str]) -> None:
+        """
+        Records that the notebook was published.
+        :param notebook_path: the notebook's path relative to the source directory.
+        :param fingerprint: the hash of the notebook's inputs, see PublishingManifest.fingerprint()
+        :param targets: the workspace paths of the notebooks produced.
+        :param warnings: the warnings reported while publishing, to be reported again when the notebook is skipped.
+        :return: None
+        """
+        with self.__lock:
+            self.__current[notebook_path] = {
+                "fingerprint": fingerprint,
+                "targets": list(targets),
+                "warnings": list(warnings),
+            }
+
+    def orphaned_targets(self) -> List[str]:
+        """
+        :return: the targets of the previous build that were not produced by this build, e.g. of deleted or excluded notebooks.
+        """
+        with self.__lock:
+            current = {t for entry in self.__current.values() for t in entry.get("targets", list())}
+            previous = {t for entry in self.__previous.values() for t in entry.get("targets", list())}
+
+        return sorted(previous - current)
+
+    def save(self, manifest_path: Optional[str] = None) -> None:
+        """
+        Writes the entries of this build, replacing those of the previous build.
+        :param manifest_path: where to write the manifest, defaults to the path it was loaded from.
+        :return: None
+        """
+        import os
+        import json
+
+        manifest_path = manifest_path or self.manifest_path
+        os.makedirs(os.path.dirname(manifest_path) or ".", exist_ok=True)
+
+        with self.__lock:
+            manifest = {
+                "build_fingerprint": self.__build_fingerprint,
+                "notebooks": dict(self.__current),
+            }
+
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
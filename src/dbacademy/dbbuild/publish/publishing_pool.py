@@ -0,0 +1,110 @@
+__all__ = ["PublishingPool"]
+
+import sys
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Set, Tuple, TypeVar, Optional, TextIO
+from dbacademy.common import validate
+from dbacademy.clients.dbrest import DBAcademyRestClient
+
+T = TypeVar("T")
+
+
+class PublishingPool:
+    """
+    Publishes notebooks on a bounded pool of threads while keeping the output of each notebook together and in the
+    original order, and creating each workspace directory only once.
+    """
+
+    def __init__(self, client: DBAcademyRestClient, max_workers: int):
+        self.__client = validate(client=client).required.as_type(DBAcademyRestClient)
+        self.__max_workers = validate(max_workers=max_workers).required.int(min_value=1)
+        self.__created_dirs: Set[str] = set()
+        self.__pending_dirs: Dict[str, Future] = dict()
+        self.__lock = threading.Lock()
+
+    @property
+    def max_workers(self) -> int:
+        return self.__max_workers
+
+    def mkdirs(self, path: str) -> None:
+        """
+        Creates the workspace directory unless it, or one of its subdirectories, was already created through this pool.
+        Concurrent requests for the same directory wait on the first instead of creating it again.
+        :param path: the workspace directory to create.
+        :return: None
+        """
+        with self.__lock:
+            if path in self.__created_dirs:
+                return
+
+            pending = self.__pending_dirs.get(path)
+            if pending is None:
+                self.__pending_dirs[path] = Future()
+
+        if pending is not None:
+            pending.result()  # Raises should the first request have failed
+            return
+
+        try:
+            self.__client.workspace.mkdirs(path)
+        except BaseException as e:
+            with self.__lock:
+                self.__pending_dirs.pop(path).set_exception(e)
+            raise
+
+        with self.__lock:
+            # mkdirs is recursive, so every ancestor now exists too.
+            parts = path.rstrip("/").split("/")
+            for i in range(1, len(parts) + 1):
+                self.__created_dirs.add("/".join(parts[:i]))
+
+            self.__pending_dirs.pop(path).set_result(None)
+
+    def map(self, function: Callable[[T, Optional[TextIO]], None], items: List[T]) -> None:
+        """
+        Invokes the function once per item, concurrently, printing everything each invocation wrote to the output it was
+        given as one block, in the order of the items. Once an invocation fails, the items not yet started are skipped
+        and the first exception, in the order of the items, is re-raised once the pool is drained.
+        :param function: the function to invoke with an item and the output to print to, None when publishing serially.
+        :param items: the items to invoke the function with.
+        :return: None
+        """
+        import io
+        from concurrent.futures import ThreadPoolExecutor
+
+        if self.max_workers == 1 or len(items) <= 1:
+            for item in items:
+                function(item, None)
+            return
+
+        failed = threading.Event()
+
+        def publish(item: T) -> Tuple[str, Optional[BaseException]]:
+            if failed.is_set():
+                return "", None  # Skip the items not yet started once any of them failed
+
+            output = io.StringIO()
+            try:
+                function(item, output)
+            except BaseException as e:
+                failed.set()
+                return output.getvalue(), e
+            else:
+                return output.getvalue(), None
+
+        error: Optional[BaseException] = None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="dbacademy-publish") as executor:
+            futures = [executor.submit(publish, item) for item in items]
+
+            # Waiting on each future in turn prints every block as soon as all the blocks before it are printed.
+            for future in futures:
+                output, e = future.result()
+                sys.stdout.write(output)
+
+                if e is not None and error is None:
+                    error = e
+
+        if error is not None:
+            raise error
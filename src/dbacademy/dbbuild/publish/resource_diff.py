@@ -125,10 +125,17 @@ class Change:
 class Segment:
     def __init__(self, guid):
         self.guid = guid
-        self.contents = ""
+        self.__lines = list()
+
+    @property
+    def contents(self) -> str:
+        if len(self.__lines) > 1:
+            self.__lines = ["".join(self.__lines)]  # Join once, no matter how often contents is read
+
+        return self.__lines[0] if self.__lines else ""
 
     def add_line(self, line):
-        self.contents += line
+        self.__lines.append(line)
 
 
 class SegmentDiff:
@@ -245,11 +245,13 @@ class TestSuite:
         passed = True
         print(f"""\nWaiting for all test to complete:""")
 
-        # Block until all tests completed
-        for test in tests:
-            self.send_status_update("info", f"Waiting for */{test.notebook.path}*")
+        # Block until all tests completed, concluding each as soon as it finishes
+        tests_by_run_id = {int(test.run_id): test for test in tests}
+
+        for response in self.client.runs.wait_for_all(tests_by_run_id.keys()):
+            test = tests_by_run_id[int(response["run_id"])]  # wait_for_all yields only the runs it was given
+            self.send_status_update("info", f"Completed */{test.notebook.path}*")
 
-            response = self.client.runs.wait_for(test.run_id)
             passed = False if not self.conclude_test(test, response) else passed
 
         return passed
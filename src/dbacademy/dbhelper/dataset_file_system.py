@@ -0,0 +1,142 @@
+__all__ = ["DatasetFile", "DatasetFileSystem", "DbutilsFileSystem", "LocalFileSystem"]
+
+from typing import Any, List
+
+
+class DatasetFile:
+    """
+    Describes one entry of a directory listing with the same members as the FileInfo returned by dbutils.fs.ls(),
+    notably that the path and name of directories end with a slash.
+    """
+
+    def __init__(self, *, path: str, name: str, size: int):
+        self.path = path
+        self.name = name
+        self.size = size
+
+    # noinspection PyPep8Naming
+    def isDir(self) -> bool:
+        return self.name.endswith("/")
+
+    def __repr__(self) -> str:
+        return f"DatasetFile(path={self.path!r}, name={self.name!r}, size={self.size})"
+
+
+class DatasetFileSystem:
+    """
+    The file operations DatasetManager depends on. DbutilsFileSystem, the default, delegates to dbutils.fs while
+    LocalFileSystem stands in for it outside a Databricks workspace, e.g. in unit tests.
+    """
+
+    def ls(self, path: str) -> List[Any]:
+        """
+        :param path: the directory to list.
+        :return: the directory's entries, each having the members path, name and size and the method isDir()
+        """
+        raise NotImplementedError()
+
+    def cp(self, source: str, target: str, recurse: bool = False) -> None:
+        raise NotImplementedError()
+
+    def rm(self, path: str, recurse: bool = False) -> None:
+        raise NotImplementedError()
+
+    def head(self, path: str) -> str:
+        """
+        :param path: the file to read, e.g. a checksum published next to an archive.
+        :return: the beginning of the file, at least the first 64 KB, decoded as UTF-8.
+        """
+        raise NotImplementedError()
+
+    def to_local_path(self, path: str) -> str:
+        """
+        :param path: a path of this file system, e.g. dbfs:/mnt/some-file
+        :return: the same path as seen by the driver's local file system, e.g. /dbfs/mnt/some-file, for use with open()
+        """
+        raise NotImplementedError()
+
+    def exists(self, path: str) -> bool:
+        try:
+            self.ls(path)
+            return True
+        except Exception:
+            return False
+
+
+class DbutilsFileSystem(DatasetFileSystem):
+
+    def ls(self, path: str) -> List[Any]:
+        from dbacademy import dbgems
+        return dbgems.dbutils.fs.ls(path)
+
+    def cp(self, source: str, target: str, recurse: bool = False) -> None:
+        from dbacademy import dbgems
+        dbgems.dbutils.fs.cp(source, target, recurse)
+
+    def rm(self, path: str, recurse: bool = False) -> None:
+        from dbacademy import dbgems
+        dbgems.dbutils.fs.rm(path, recurse)
+
+    def head(self, path: str) -> str:
+        from dbacademy import dbgems
+        return dbgems.dbutils.fs.head(path)
+
+    def to_local_path(self, path: str) -> str:
+        return path.replace("dbfs:/", "/dbfs/")
+
+
+class LocalFileSystem(DatasetFileSystem):
+    """Implements DatasetFileSystem over the local file system with dbutils.fs semantics."""
+
+    def ls(self, path: str) -> List[Any]:
+        import os
+
+        path = path.rstrip("/")
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No such file or directory: {path}")
+
+        if os.path.isfile(path):
+            return [DatasetFile(path=path, name=os.path.basename(path), size=os.path.getsize(path))]
+
+        files = list()
+        for entry in sorted(os.scandir(path), key=lambda e: e.name):
+            if entry.is_dir():
+                files.append(DatasetFile(path=f"{path}/{entry.name}/", name=f"{entry.name}/", size=0))
+            else:
+                files.append(DatasetFile(path=f"{path}/{entry.name}", name=entry.name, size=entry.stat().st_size))
+        return files
+
+    def cp(self, source: str, target: str, recurse: bool = False) -> None:
+        import os
+        import shutil
+
+        source = source.rstrip("/")
+        target = target.rstrip("/")
+
+        if os.path.isdir(source):
+            if not recurse:
+                raise IsADirectoryError(f"Cannot copy the directory {source} without recurse=True")
+            shutil.copytree(source, target, dirs_exist_ok=True)
+        else:
+            os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+            shutil.copyfile(source, target)
+
+    def rm(self, path: str, recurse: bool = False) -> None:
+        import os
+        import shutil
+
+        path = path.rstrip("/")
+        if os.path.isdir(path):
+            if recurse:
+                shutil.rmtree(path)
+            else:
+                os.rmdir(path)
+        elif os.path.exists(path):
+            os.remove(path)
+
+    def head(self, path: str) -> str:
+        with open(path, "rb") as f:
+            return f.read(65536).decode("utf-8")
+
+    def to_local_path(self, path: str) -> str:
+        return path
@@ -1,11 +1,27 @@
 __all__ = ["DatasetManager"]
 
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, Tuple, Iterable, Iterator
 from dbacademy.dbhelper.dbacademy_helper import DBAcademyHelper
+from dbacademy.dbhelper.dataset_file_system import DatasetFileSystem, DbutilsFileSystem
 
 
 class DatasetManager:
 
+    ARCHIVE_FILE = "archive.zip"
+
+    # Archives too large to download with a single copy are published in parts, e.g. archive.zip.part-00000,
+    # archive.zip.part-00001 and so on, which are downloaded concurrently and concatenated in name order.
+    ARCHIVE_PART_PREFIX = f"{ARCHIVE_FILE}.part-"
+
+    # Published next to the archive, if at all, with the archive's hex SHA-256 digest.
+    ARCHIVE_CHECKSUM_FILE = f"{ARCHIVE_FILE}.sha256"
+
+    # Written next to the downloaded archive, recording the archive's size and hash, the installed directory's
+    # listing and the size and CRC-32 of every extracted file.
+    MANIFEST_FILE = "archive.manifest.json"
+
+    __BUFFER_SIZE = 1024 * 1024
+
     @staticmethod
     def from_dbacademy_helper(da: DBAcademyHelper):
 
@@ -32,7 +48,9 @@ class DatasetManager:
                  _archives_path: Optional[str],
                  _install_path: str,
                  _install_min_time: Optional[str],
-                 _install_max_time: Optional[str]):
+                 _install_max_time: Optional[str],
+                 _fs: Optional[DatasetFileSystem] = None,
+                 _max_workers: int = 8):
         """
         Creates an instance of DatasetManager
         :param _data_source_uri: See DBAcademy.data_source_uri
@@ -40,11 +58,18 @@ class DatasetManager:
         :param _install_path: See DBAcademy.paths.archives and DBAcademy.paths.datasets, Paths
         :param _install_min_time: See CourseConfig.install_min_time, str
         :param _install_max_time: See CourseConfig.install_max_time, str
+        :param _fs: The file system to copy, list and remove files with, defaults to DbutilsFileSystem
+        :param _max_workers: The number of archive parts downloaded, and of files extracted, concurrently
         """
+        from dbacademy.common import validate
+
         self.__fixes = 0
         self.__repaired_paths = list()
 
-        self.__remote_files = ["/archive.zip"]
+        self.__fs = validate(_fs=_fs).optional.as_type(DatasetFileSystem) or DbutilsFileSystem()
+        self.__max_workers = validate(_max_workers=_max_workers).required.int(min_value=1)
+
+        self.__remote_files = [f"/{self.ARCHIVE_FILE}"]
         self.__data_source_uri = _data_source_uri
         self.__staging_source_uri = _staging_source_uri
 
@@ -83,6 +108,14 @@ class DatasetManager:
     def staging_source_uri(self):
         return self.__staging_source_uri
 
+    @property
+    def fs(self) -> DatasetFileSystem:
+        return self.__fs
+
+    @property
+    def max_workers(self) -> int:
+        return self.__max_workers
+
     @property
     def fixes(self) -> int:
         return self.__fixes
@@ -99,29 +132,28 @@ class DatasetManager:
         when the storage and compute are, for example, on opposite sides of the world.
         """
         from dbacademy import dbgems
-        from dbacademy.dbhelper.paths import Paths
 
         action = "Install" if self.archives_path is None else "Download"
         what = "datasets" if self.archives_path is None else "archive"
         install_start = dbgems.clock_start()
 
-        if Paths.exists(self.install_path):
+        if self.fs.exists(self.install_path):
             # It's already installed...
             if reinstall_datasets:
                 if self.archives_path is None:
                     # This is a classic installation with shared datasets
                     print(f"\nRemoving previously installed shared datasets")
-                    dbgems.dbutils.fs.rm(self.install_path, True)
+                    self.fs.rm(self.install_path, True)
                 else:
                     # This is an installation from an archive with per-user datasets
                     print(f"\nRemoving previously installed private datasets")
-                    dbgems.dbutils.fs.rm(self.archives_path, True)
+                    self.fs.rm(self.archives_path, True)
 
             else:  # not reinstall_datasets:
                 print(f"""\nSkipping {action.lower()} of existing {what} to "{self.install_path}" """)
                 return self.install_dataset_done(install_start)
 
-        file = "archive.zip"
+        file = self.ARCHIVE_FILE
         print(f"""\nInstalling datasets:""")
         print(f"""| from "{self.data_source_uri}/{file}" """)
         print(f"""| temp "{self.install_path}/{file}" """)
@@ -142,14 +174,100 @@ class DatasetManager:
         print(f"""|""")
         print(f"""| Downloading "{file}"...""", end="")
 
-        dbgems.dbutils.fs.cp(f"{self.data_source_uri}/{file}",
-                             f"{self.install_path}/{file}", True)
+        self.__download_archive()
 
         print(dbgems.clock_stopped(download_start))
         print("| ")
 
         return self.install_dataset_done(install_start)
 
+    def __download_archive(self) -> None:
+        """
+        Downloads the archive, concurrently if it was published in parts, verifies it against its published checksum,
+        if any, and records it in a new manifest.
+        :return: None
+        """
+        import shutil
+        from concurrent.futures import ThreadPoolExecutor
+
+        try:
+            remote_names = [f.name for f in self.fs.ls(self.data_source_uri)]
+        except Exception:
+            remote_names = list()  # The remote repository cannot always be listed, in which case there is only the archive.
+
+        parts = sorted(n for n in remote_names if n.startswith(self.ARCHIVE_PART_PREFIX))
+        archive_file = f"{self.install_path}/{self.ARCHIVE_FILE}"
+
+        if len(parts) == 0:
+            self.fs.cp(f"{self.data_source_uri}/{self.ARCHIVE_FILE}", archive_file, True)
+        else:
+            parts_path = f"{self.install_path}/{self.ARCHIVE_FILE}.parts"
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                # Consuming the results re-raises the first failure, if any.
+                list(executor.map(lambda part: self.fs.cp(f"{self.data_source_uri}/{part}", f"{parts_path}/{part}", True), parts))
+
+            with open(self.fs.to_local_path(archive_file), "wb") as archive:
+                for part in parts:
+                    with open(self.fs.to_local_path(f"{parts_path}/{part}"), "rb") as f:
+                        shutil.copyfileobj(f, archive, self.__BUFFER_SIZE)
+
+            self.fs.rm(parts_path, True)
+
+        size, sha256 = self.__hash_file(archive_file)
+
+        if self.ARCHIVE_CHECKSUM_FILE in remote_names:
+            expected = self.fs.head(f"{self.data_source_uri}/{self.ARCHIVE_CHECKSUM_FILE}").split()[0].lower()
+            if sha256 != expected:
+                self.fs.rm(archive_file)
+                raise AssertionError(f"""The checksum of the downloaded "{self.ARCHIVE_FILE}", {sha256}, does not match the published checksum, {expected}.""")
+
+        self.__save_manifest({
+            "archive": {"size": size, "sha256": sha256},
+            "install_listing": self.__list_install_path(),
+        })
+
+    def __hash_file(self, path: str) -> Tuple[int, str]:
+        import hashlib
+
+        size = 0
+        digest = hashlib.sha256()
+
+        with open(self.fs.to_local_path(path), "rb") as f:
+            while chunk := f.read(self.__BUFFER_SIZE):
+                size += len(chunk)
+                digest.update(chunk)
+
+        return size, digest.hexdigest()
+
+    @property
+    def manifest_path(self) -> str:
+        return f"{self.install_path}/{self.MANIFEST_FILE}"
+
+    def load_manifest(self) -> Optional[Dict[str, Any]]:
+        """
+        :return: the manifest written when the datasets were installed, or None if there is none.
+        """
+        import json
+
+        try:
+            with open(self.fs.to_local_path(self.manifest_path)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def __save_manifest(self, manifest: Dict[str, Any]) -> None:
+        import json
+
+        with open(self.fs.to_local_path(self.manifest_path), "w") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+
+    def __list_install_path(self) -> Dict[str, int]:
+        """
+        :return: the size of each entry of the install path, but not of its subdirectories, excluding the manifest.
+        """
+        return {f.name: f.size for f in self.fs.ls(self.install_path) if f.name != self.MANIFEST_FILE}
+
     def install_dataset_done(self, install_start: int) -> None:
         from dbacademy import dbgems
 
@@ -160,9 +278,7 @@ class DatasetManager:
         print(f"""| Dataset installation completed {dbgems.clock_stopped(install_start)}\n""")
 
     def unpack_archive(self) -> None:
-        import shutil
         from dbacademy import dbgems
-        from dbacademy.dbhelper.paths import Paths
 
         unpack_start = dbgems.clock_start()
         if self.archives_path is None:
@@ -170,7 +286,7 @@ class DatasetManager:
             return  # This is a classic install, nothing to unpack
 
         try:
-            files = list() if not Paths.exists(self.datasets_path) else dbgems.dbutils.fs.ls(self.datasets_path)
+            files = list() if not self.fs.exists(self.datasets_path) else self.fs.ls(self.datasets_path)
         except:
             files = list()
 
@@ -180,11 +296,70 @@ class DatasetManager:
         else:
             print(f"""|""")
             print(f"""| Unpacking datasets to "{self.datasets_path}"...""", end="")
-            archive_path = f"{self.archives_path}/archive.zip".replace("dbfs:/", '/dbfs/')
-            dataset_path = self.datasets_path.replace("dbfs:/", '/dbfs/')
-            shutil.unpack_archive(archive_path, dataset_path)
+            archive_path = self.fs.to_local_path(f"{self.archives_path}/{self.ARCHIVE_FILE}")
+            dataset_path = self.fs.to_local_path(self.datasets_path)
+            extracted_files = self.__extract_archive(archive_path, dataset_path)
             print(dbgems.clock_stopped(unpack_start))
 
+            manifest = self.load_manifest() or dict()
+            manifest["files"] = extracted_files
+            self.__save_manifest(manifest)
+
+    def __extract_archive(self, archive_path: str, dataset_path: str) -> Dict[str, Dict[str, int]]:
+        """
+        Extracts the archive's members concurrently, each thread streaming members from its own handle on the archive.
+        Reading a member to its end verifies its CRC-32, raising zipfile.BadZipFile if the member is corrupt.
+        :param archive_path: the local path of the zip file.
+        :param dataset_path: the local path to extract to.
+        :return: the size and CRC-32 of each extracted file, keyed by its path relative to dataset_path, e.g. /some-dir/some-file
+        """
+        import os
+        import shutil
+        import zipfile
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        root = os.path.realpath(dataset_path)
+
+        with zipfile.ZipFile(archive_path) as archive:
+            members = archive.infolist()
+
+        directories = {root}
+        for member in members:
+            target = os.path.realpath(os.path.join(root, member.filename))
+            if target != root and not target.startswith(root + os.sep):
+                raise ValueError(f"""The archive's member "{member.filename}" would be extracted outside of "{dataset_path}".""")
+            directories.add(target if member.is_dir() else os.path.dirname(target))
+
+        for directory in sorted(directories):
+            os.makedirs(directory, exist_ok=True)
+
+        local = threading.local()
+        handles: List[zipfile.ZipFile] = list()
+        lock = threading.Lock()
+
+        def extract(zip_info: zipfile.ZipInfo) -> None:
+            handle = getattr(local, "archive", None)
+            if handle is None:
+                handle = local.archive = zipfile.ZipFile(archive_path)
+                with lock:
+                    handles.append(handle)
+
+            with handle.open(zip_info) as source, open(os.path.join(root, zip_info.filename), "wb") as target_file:
+                shutil.copyfileobj(source, target_file, self.__BUFFER_SIZE)
+
+        # The largest first, so that one large member doesn't start last and finish long after the others.
+        files = sorted((m for m in members if not m.is_dir()), key=lambda m: m.file_size, reverse=True)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                list(executor.map(extract, files))
+        finally:
+            for handle in handles:
+                handle.close()
+
+        return {f"/{m.filename}": {"size": m.file_size, "crc32": m.CRC} for m in files}
+
     def validate_datasets(self, fail_fast: bool) -> None:
         """
         Validates the "install" of the datasets by recursively listing all files in the remote data repository as well as the local data repository, validating that each file exists but DOES NOT validate file size or checksum.
@@ -215,111 +390,143 @@ class DatasetManager:
         print("| | Listing local files", end="...")
         start = dbgems.clock_start()
 
-        local_files = DatasetManager.list_r(self.install_path)
+        manifest = self.load_manifest()
+        if manifest is not None and manifest.get("install_listing") == self.__list_install_path():
+            # Nothing was added, removed or resized since the datasets were installed.
+            print(f"unchanged since installed {dbgems.clock_stopped(start)}")
+            return
+
+        local_files = DatasetManager.list_r(self.install_path, fs=self.fs, max_workers=self.max_workers)
+        local_files = [f for f in local_files if f != f"/{self.MANIFEST_FILE}"]
         print(dbgems.clock_stopped(start))
 
-        # Process directories first
-        self.__del_extra_paths(local_files)
-        self.__add_extra_paths(local_files)
+        plan = self.plan_repairs(local_files, self.__remote_files)
+        self.__apply_repairs(plan)
+
+    @classmethod
+    def plan_repairs(cls, local_files: Iterable[str], remote_files: Iterable[str]) -> List[Tuple[str, str]]:
+        """
+        Compares the local and remote inventories, as returned by list_r(), to determine the repairs required for the
+        local copy to match the remote one. Directories are processed first, removing or restoring the entire
+        directory, followed by individual files not already covered by a directory's repair.
+        :param local_files: the relative paths of the local files and directories, the latter ending in a slash.
+        :param remote_files: the relative paths of the remote files and directories, the latter ending in a slash.
+        :return: the repairs as tuples of the action, one of "rm" or "cp", and the relative path to repair, in order.
+        """
+        local_files = set(local_files)
+        remote_files = set(remote_files)
+        repaired_paths = set()
+
+        def not_repaired(file: str) -> bool:
+            # Tests the file and each of its parent directories, e.g. /a/, /a/b/ and /a/b/c.csv for /a/b/c.csv
+            end = file.find("/", 1)
+            while end != -1:
+                if file[:end + 1] in repaired_paths:
+                    return False
+                end = file.find("/", end + 1)
+            return file not in repaired_paths
+
+        plan = list()
+
+        # Process directories first, each in sorted order so that a parent's repair always precedes its children's.
+        for action, files in [("rm", sorted(local_files - remote_files)), ("cp", sorted(remote_files - local_files))]:
+            for file in files:
+                if file.endswith("/") and not_repaired(file):
+                    repaired_paths.add(file)
+                    plan.append((action, file))
 
         # Then process individual files
-        self.__del_extra_files(local_files)
-        self.__add_extra_files(local_files)
+        for action, files in [("rm", sorted(local_files - remote_files)), ("cp", sorted(remote_files - local_files))]:
+            for file in files:
+                if not file.endswith("/") and not_repaired(file):
+                    plan.append((action, file))
 
-    def __dataset_not_fixed(self, test_file: str) -> bool:
-        for repaired_path in self.repaired_paths:
-            if test_file.startswith(repaired_path):
-                return False
-        return True
+        return plan
 
-    def __del_extra_paths(self, local_files: List[str]) -> None:
+    def __apply_repairs(self, plan: List[Tuple[str, str]]) -> None:
         """
-        Removes extra directories (cascade effect vs one file at a time)
+        Applies the repairs, concurrently, reporting each in the order planned.
+        :param plan: the repairs, see DatasetManager.plan_repairs()
         :return: None
         """
         from dbacademy import dbgems
+        from concurrent.futures import ThreadPoolExecutor
 
-        for file in local_files:
-            if file not in self.__remote_files and file.endswith("/") and self.__dataset_not_fixed(test_file=file):
-                self.__fixes += 1
-                start = dbgems.clock_start()
-                self.repaired_paths.append(file)
-                print(f"| | removing extra path: {file}", end="...")
-                dbgems.dbutils.fs.rm(f"{self.install_path}/{file[1:]}", True)
-                print(dbgems.clock_stopped(start))
+        def repair(action: str, file: str) -> str:
+            start = dbgems.clock_start()
+            if action == "rm":
+                self.fs.rm(f"{self.install_path}/{file[1:]}", True)
+            else:
+                self.fs.cp(f"{self.data_source_uri}/{file[1:]}", f"{self.install_path}/{file[1:]}", True)
+            return dbgems.clock_stopped(start)
 
-    def __add_extra_paths(self, local_files: List[str]) -> None:
-        """
-        Adds extra directories (cascade effect vs one file at a time)
-        :return: None
-        """
-        from dbacademy import dbgems
+        self.__fixes += len(plan)
+        self.repaired_paths.extend(file for action, file in plan if file.endswith("/"))
 
-        for file in self.__remote_files:
-            if file not in local_files and file.endswith("/") and self.__dataset_not_fixed(test_file=file):
-                self.__fixes += 1
-                start = dbgems.clock_start()
-                self.repaired_paths.append(file)
-                print(f"| | restoring missing path: {file}", end="...")
-                source_file = f"{self.data_source_uri}/{file[1:]}"
-                target_file = f"{self.install_path}/{file[1:]}"
-                dbgems.dbutils.fs.cp(source_file, target_file, True)
-                print(dbgems.clock_stopped(start))
-
-    def __del_extra_files(self, local_files: List[str]) -> None:
-        """
-        Remove one file at a time (picking up what was not covered by processing directories)
-        :return: None
-        """
-        from dbacademy import dbgems
+        if len(plan) == 0:
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(repair, action, file) for action, file in plan]
 
-        for file in local_files:
-            if file not in self.__remote_files and not file.endswith("/") and self.__dataset_not_fixed(test_file=file):
-                self.__fixes += 1
-                start = dbgems.clock_start()
-                print(f"| | removing extra file: {file}", end="...")
-                dbgems.dbutils.fs.rm(f"{self.install_path}/{file[1:]}", True)
-                print(dbgems.clock_stopped(start))
+            for (action, file), future in zip(plan, futures):
+                what = "path" if file.endswith("/") else "file"
+                description = f"removing extra {what}" if action == "rm" else f"restoring missing {what}"
+                print(f"| | {description}: {file}...{future.result()}")
 
-    def __add_extra_files(self, local_files: List[str]) -> None:
+    @classmethod
+    def iter_r(cls, path: str, fs: Optional[DatasetFileSystem] = None, max_workers: int = 1) -> Iterator[str]:
         """
-        Add one file at a time (picking up what was not covered by processing directories)
-        :return: None
+        Recursively lists the specified path in a single pass, listing up to max_workers directories concurrently.
+        :param path: the directory to list.
+        :param fs: the file system to list, defaults to DbutilsFileSystem
+        :param max_workers: the number of directories listed concurrently.
+        :return: the paths relative to the specified path, directories ending with a slash, in no particular order.
         """
-        from dbacademy import dbgems
-
-        for file in self.__remote_files:
-            if file not in local_files and not file.endswith("/") and self.__dataset_not_fixed(test_file=file):
-                self.__fixes += 1
-                start = dbgems.clock_start()
-                print(f"| | restoring missing file: {file}", end="...")
-                source_file = f"{self.data_source_uri}/{file[1:]}"
-                target_file = f"{self.install_path}/{file[1:]}"
-                dbgems.dbutils.fs.cp(source_file, target_file, True)
-                print(dbgems.clock_stopped(start))
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+        fs = fs or DbutilsFileSystem()
+        prefix_length = len(path)
+
+        def ls(directory: str) -> List[Any]:
+            try:
+                return fs.ls(directory)
+            except:
+                return list()
+
+        if max_workers <= 1:
+            pending = [path]
+            while pending:
+                for file in ls(pending.pop()):
+                    yield file.path[prefix_length:]
+                    if file.isDir():
+                        pending.append(file.path)
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(ls, path)}
+            while futures:
+                done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for file in future.result():
+                        yield file.path[prefix_length:]
+                        if file.isDir():
+                            futures.add(executor.submit(ls, file.path))
 
     @classmethod
-    def list_r(cls, path: str, prefix: Optional[str] = None, results: Optional[List[str]] = None) -> List[str]:
+    def list_r(cls, path: str, prefix: Optional[str] = None, results: Optional[List[str]] = None, fs: Optional[DatasetFileSystem] = None, max_workers: int = 1) -> List[str]:
         """
         Utility method used by the dataset validation, this method performs a recursive list of the specified path and returns the sorted list of paths.
         """
-        from dbacademy import dbgems
-
-        if prefix is None:
-            prefix = path
         if results is None:
             results = list()
 
-        try:
-            files = dbgems.dbutils.fs.ls(path)
-        except:
-            files = []
+        files = DatasetManager.iter_r(path, fs, max_workers)
 
-        for file in files:
-            data = file.path[len(prefix):]
-            results.append(data)
-            if file.isDir():
-                DatasetManager.list_r(file.path, prefix, results)
+        if prefix is not None and prefix != path:
+            # Relative to the prefix instead of the path
+            files = (f"{path[len(prefix):]}{f}" for f in files)
 
+        results.extend(files)
         results.sort()
         return results
@@ -0,0 +1,201 @@
+__all__ = ["ClusterResources"]
+
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from dbacademy.clients.dbrest import DBAcademyRestClient
+
+# The attributes of an instance pool that can be changed with an edit, all others requiring the pool to be recreated.
+POOL_EDITABLE_ATTRIBUTES = ["instance_pool_name", "min_idle_instances", "max_capacity", "idle_instance_autotermination_minutes"]
+
+
+class ClusterResources:
+    """
+    The instance pools and cluster policies of one workspace, each listed once and kept current as they are ensured or
+    deleted. Ensuring a pool or policy compares the canonical hash of its desired definition to that of the existing
+    one, issuing a create or edit only when they differ, so that repeating the setup of an unchanged workspace costs
+    two listings plus re-granting the users group's permission to each pool and policy.
+    """
+
+    def __init__(self, client: DBAcademyRestClient, *, max_workers: int = 4):
+        from dbacademy.common import validate
+
+        self.__client = validate(client=client).required.as_type(DBAcademyRestClient)
+        self.__max_workers = validate(max_workers=max_workers).required.int(min_value=1)
+        self.__lock = threading.RLock()
+        self.__pools: Optional[Dict[str, Dict[str, Any]]] = None
+        self.__policies: Optional[Dict[str, Dict[str, Any]]] = None
+
+    @staticmethod
+    def canonical_hash(value: Any) -> str:
+        """The SHA-256 of the value's JSON representation, independent of the order of dictionary keys."""
+        import json
+        import hashlib
+
+        return hashlib.sha256(json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+    @property
+    def pools(self) -> Dict[str, Dict[str, Any]]:
+        """The workspace's instance pools keyed by name, listed on first use."""
+        with self.__lock:
+            if self.__pools is None:
+                self.__pools = {p.get("instance_pool_name"): p for p in self.__client.instance_pools.list()}
+            return self.__pools
+
+    @property
+    def policies(self) -> Dict[str, Dict[str, Any]]:
+        """The workspace's cluster policies keyed by name, listed on first use."""
+        with self.__lock:
+            if self.__policies is None:
+                self.__policies = {p.get("name"): p for p in self.__client.cluster_policies.list()}
+            return self.__policies
+
+    def refresh(self) -> None:
+        """Discards the listings, which are listed again on next use."""
+        with self.__lock:
+            self.__pools = None
+            self.__policies = None
+
+    def map(self, f: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+        """Applies f to each item concurrently, returning the results in the order of items."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=self.__max_workers, thread_name_prefix="dbacademy-clusters") as executor:
+            return list(executor.map(f, items))
+
+    @staticmethod
+    def __pool_attributes(pool: Dict[str, Any], names: Iterable[str]) -> Dict[str, Any]:
+        attributes = {name: pool.get(name) for name in names}
+
+        if "custom_tags" in attributes:
+            tags = attributes.get("custom_tags") or dict()
+            # The pool's tags are returned as a dictionary but may be specified as a list of key/value pairs
+            attributes["custom_tags"] = tags if isinstance(tags, dict) else {t.get("key"): t.get("value") for t in tags}
+
+        return attributes
+
+    def ensure_pool(self, *,
+                    name: str,
+                    min_idle_instances: int = 0,
+                    max_capacity: int = None,
+                    idle_instance_autotermination_minutes: int,
+                    node_type_id: str = None,
+                    preloaded_spark_version: str = None,
+                    tags: List[Tuple[str, Any]] = None) -> Tuple[str, bool]:
+        """
+        Creates the instance pool, or edits or recreates the existing one should it differ. Attributes specified as None
+        are left to their defaults and are not compared.
+        :return: the pool's id and whether it was created or changed.
+        """
+        desired = {
+            "instance_pool_name": name,
+            "min_idle_instances": min_idle_instances,
+            "max_capacity": max_capacity,
+            "idle_instance_autotermination_minutes": idle_instance_autotermination_minutes,
+            "node_type_id": node_type_id,
+            "preloaded_spark_versions": [preloaded_spark_version] if preloaded_spark_version and preloaded_spark_version.strip() else None,
+            "custom_tags": None if tags is None else {k: v for k, v in tags},
+        }
+        desired = {k: v for k, v in desired.items() if v is not None}
+
+        existing = self.pools.get(name)
+        if existing is not None:
+            actual = self.__pool_attributes(existing, desired)
+            if self.canonical_hash(actual) == self.canonical_hash(desired):
+                self.__grant_pool(existing.get("instance_pool_id"))
+                return existing.get("instance_pool_id"), False
+
+            changed = {k for k in desired if actual.get(k) != desired.get(k)}
+            if changed.issubset(POOL_EDITABLE_ATTRIBUTES):
+                # The edit requires the node type even though it cannot be changed.
+                pool = self.__client.instance_pools.update_by_id(instance_pool_id=existing.get("instance_pool_id"),
+                                                                 instance_pool_name=name,
+                                                                 min_idle_instances=min_idle_instances,
+                                                                 max_capacity=max_capacity,
+                                                                 idle_instance_autotermination_minutes=idle_instance_autotermination_minutes,
+                                                                 node_type_id=existing.get("node_type_id"))
+                self.__grant_pool(pool.get("instance_pool_id"))
+                with self.__lock:
+                    self.pools[name] = pool
+                return pool.get("instance_pool_id"), True
+
+            # We cannot update some pool attributes once they are created.
+            # To address this, we need to delete it then create it.
+            self.__client.instance_pools.delete_by_id(existing.get("instance_pool_id"))
+
+        definition = {k: v for k, v in desired.items() if k not in ["instance_pool_name", "custom_tags"]}
+        pool = self.__client.instance_pools.create(name, definition, tags)
+        instance_pool_id = pool.get("instance_pool_id")
+
+        self.__grant_pool(instance_pool_id)
+        with self.__lock:
+            self.pools[name] = pool
+
+        return instance_pool_id, True
+
+    def __grant_pool(self, instance_pool_id: str) -> None:
+        # Make sure that all users can attach to the pool, be it new or existing.
+        self.__client.permissions.pools.update_group(id_value=instance_pool_id,
+                                                     group_name="users",
+                                                     permission_level="CAN_ATTACH_TO")
+
+    def __grant_policy(self, policy_id: str) -> None:
+        # Make sure that all users can use the policy, be it new or existing.
+        self.__client.permissions.cluster_policies.update_group(id_value=policy_id,
+                                                                group_name="users",
+                                                                permission_level="CAN_USE")
+
+    def ensure_policy(self, *, name: str, definition: Dict[str, Any]) -> Tuple[str, bool]:
+        """
+        Creates the cluster policy, or edits the existing one should its definition differ.
+        :return: the policy's id and whether it was created or changed.
+        """
+        import json
+
+        existing = self.policies.get(name)
+
+        if existing is None:
+            policy = self.__client.cluster_policies.create(name, definition)
+
+        elif self.canonical_hash(json.loads(existing.get("definition") or "{}")) == self.canonical_hash(definition):
+            self.__grant_policy(existing.get("policy_id"))
+            return existing.get("policy_id"), False
+
+        else:
+            policy = self.__client.cluster_policies.update_by_id(existing.get("policy_id"), name, definition)
+
+        self.__grant_policy(policy.get("policy_id"))
+        with self.__lock:
+            self.policies[name] = policy
+
+        return policy.get("policy_id"), True
+
+    def ensure_policies(self, definitions: Dict[str, Dict[str, Any]]) -> Dict[str, Tuple[str, bool]]:
+        """
+        Ensures each cluster policy concurrently.
+        :param definitions: the definition of each policy keyed by its name.
+        :return: the id of each policy, and whether it was created or changed, keyed by its name.
+        """
+        results = self.map(lambda name: self.ensure_policy(name=name, definition=definitions[name]), definitions)
+        return dict(zip(definitions, results))
+
+    def delete_pools(self, names: Iterable[str]) -> List[str]:
+        """Deletes the instance pools that exist among names, concurrently, returning the names of those deleted."""
+        names = [n for n in names if n in self.pools]
+        self.map(lambda name: self.__client.instance_pools.delete_by_id(self.pools[name].get("instance_pool_id")), names)
+
+        with self.__lock:
+            for name in names:
+                del self.pools[name]
+
+        return names
+
+    def delete_policies(self, names: Iterable[str]) -> List[str]:
+        """Deletes the cluster policies that exist among names, concurrently, returning the names of those deleted."""
+        names = [n for n in names if n in self.policies]
+        self.map(lambda name: self.__client.cluster_policies.delete_by_id(self.policies[name].get("policy_id")), names)
+
+        with self.__lock:
+            for name in names:
+                del self.policies[name]
+
+        return names
@@ -10,9 +10,16 @@ class ClustersHelper:
     def __init__(self, db_academy_rest_client: DBAcademyRestClient):
         from dbacademy.common import validate
         from dbacademy.dbhelper.supporting.workspace_helper import WorkspaceHelper
+        from dbacademy.dbhelper.supporting.cluster_resources import ClusterResources
 
         self.__client = validate(db_academy_rest_client=db_academy_rest_client).required.as_type(DBAcademyRestClient)
         self.__workspace = WorkspaceHelper(self.__client)
+        self.__resources = ClusterResources(self.__client)
+
+    @property
+    def resources(self):
+        """The workspace's instance pools and cluster policies, listed once per ClustersHelper."""
+        return self.__resources
 
     def create_instance_pool(self, *,
                              preloaded_spark_version: str,
@@ -63,22 +70,13 @@ class ClustersHelper:
             (f"dbacademy.pool.{dbh_constants.WORKSPACE_HELPER.PARAM_SOURCE}", common.clean_string("Smoke-Test" if DBAcademyHelper.is_smoke_test() else lab_id))
         ]
 
-        # We cannot update some pool attributes once they are created.
-        # To address this, we need to delete it then create it.
-        self.__client.instance_pools.delete_by_name(name)
-
-        pool = self.__client.instance_pools.create_or_update(instance_pool_name=name,
-                                                             idle_instance_autotermination_minutes=idle_instance_autotermination_minutes,
-                                                             min_idle_instances=min_idle_instances,
-                                                             node_type_id=node_type_id,
-                                                             preloaded_spark_version=preloaded_spark_version,
-                                                             tags=tags)
-        instance_pool_id = pool.get("instance_pool_id")
-
-        # With the pool created, make sure that all users can attach to it.
-        self.__client.permissions.pools.update_group(id_value=instance_pool_id,
-                                                     group_name="users",
-                                                     permission_level="CAN_ATTACH_TO")
+        # The pool is only edited, or recreated, if it differs from the existing one.
+        instance_pool_id, _ = self.__resources.ensure_pool(name=name,
+                                                           idle_instance_autotermination_minutes=idle_instance_autotermination_minutes,
+                                                           min_idle_instances=min_idle_instances,
+                                                           node_type_id=node_type_id,
+                                                           preloaded_spark_version=preloaded_spark_version,
+                                                           tags=tags)
 
         dbgems.display_html(f"""
         <html style="margin:0"><body style="margin:0"><div style="margin:0">
@@ -88,12 +86,8 @@ class ClustersHelper:
 
         return instance_pool_id
 
-    def __create_cluster_policy(self, *,
-                                instance_pool_id: Union[None, str],
-                                name: str,
-                                definition: Dict[str, Any]) -> str:
-
-        from dbacademy import dbgems
+    @staticmethod
+    def __to_policy_definition(instance_pool_id: Union[None, str], definition: Dict[str, Any]) -> Dict[str, Any]:
         if instance_pool_id is not None:
             definition["instance_pool_id"] = {
                 "type": "fixed",
@@ -108,20 +102,11 @@ class ClustersHelper:
                 "hidden": False
             }
 
-        # Some attributes of a policy cannot be updated once created.
-        # To get around this, we first delete the policy.
-        policy = self.__client.cluster_policies.get_by_name(name)
-        if policy:
-            self.__client.cluster_policies.delete_by_id(policy["policy_id"])
-
-        policy = self.__client.cluster_policies.create_or_update(name, definition)
-
-        policy_id = policy.get("policy_id")
+        return definition
 
-        # With the pool created, make sure that all users can attach to it.
-        self.__client.permissions.cluster_policies.update_group(id_value=policy_id,
-                                                                group_name="users",
-                                                                permission_level="CAN_USE")
+    @staticmethod
+    def __display_policy(name: str, policy_id: str) -> None:
+        from dbacademy import dbgems
 
         dbgems.display_html(f"""
         <html style="margin:0"><body style="margin:0"><div style="margin:0">
@@ -129,14 +114,69 @@ class ClustersHelper:
         </div></body></html>
         """)
 
+    def __create_cluster_policy(self, *,
+                                instance_pool_id: Union[None, str],
+                                name: str,
+                                definition: Dict[str, Any]) -> str:
+
+        # The policy is only edited if its definition differs from the existing one.
+        policy_id, _ = self.__resources.ensure_policy(name=name, definition=self.__to_policy_definition(instance_pool_id, definition))
+        self.__display_policy(name, policy_id)
+
         return policy_id
 
+    def create_policies(self, *,
+                        instance_pool_id: str,
+                        spark_version: str,
+                        autotermination_minutes_max: int,
+                        autotermination_minutes_default: int,
+                        lab_id: str,
+                        workspace_description: str,
+                        workspace_name: str,
+                        org_id: str) -> Dict[str, str]:
+        """
+        Creates, or updates, the all-purpose, jobs and DLT policies concurrently; see create_all_purpose_policy(),
+        create_jobs_policy() and create_dlt_policy().
+        :return: the id of each policy keyed by its name.
+        """
+        definitions = {
+            dbh_constants.CLUSTERS_HELPER.POLICY_ALL_PURPOSE: self.__to_policy_definition(instance_pool_id, self.__all_purpose_definition(spark_version=spark_version,
+                                                                                                                                           autotermination_minutes_max=autotermination_minutes_max,
+                                                                                                                                           autotermination_minutes_default=autotermination_minutes_default)),
+            dbh_constants.CLUSTERS_HELPER.POLICY_JOBS_ONLY: self.__to_policy_definition(instance_pool_id, self.__jobs_definition(spark_version=spark_version)),
+            dbh_constants.CLUSTERS_HELPER.POLICY_DLT_ONLY: self.__to_policy_definition(None, self.__dlt_definition(lab_id=lab_id,
+                                                                                                                   workspace_description=workspace_description,
+                                                                                                                   workspace_name=workspace_name,
+                                                                                                                   org_id=org_id)),
+        }
+
+        policy_ids = dict()
+        for name, (policy_id, _) in self.__resources.ensure_policies(definitions).items():
+            self.__display_policy(name, policy_id)
+            policy_ids[name] = policy_id
+
+        return policy_ids
+
     def create_all_purpose_policy(self, *,
                                   instance_pool_id: str,
                                   spark_version: str,
                                   autotermination_minutes_max: int,
                                   autotermination_minutes_default: int) -> str:
 
+        definition = self.__all_purpose_definition(spark_version=spark_version,
+                                                   autotermination_minutes_max=autotermination_minutes_max,
+                                                   autotermination_minutes_default=autotermination_minutes_default)
+
+        return self.__create_cluster_policy(instance_pool_id=instance_pool_id,
+                                            name=dbh_constants.CLUSTERS_HELPER.POLICY_ALL_PURPOSE,
+                                            definition=definition)
+
+    @classmethod
+    def __all_purpose_definition(cls, *,
+                                 spark_version: str,
+                                 autotermination_minutes_max: int,
+                                 autotermination_minutes_default: int) -> Dict[str, Any]:
+
         if type(autotermination_minutes_max) != int or autotermination_minutes_max == 0:
             autotermination_minutes_max = 180
 
@@ -174,16 +214,21 @@ class ClustersHelper:
                 "defaultValue": "STANDARD"
             },
         }
-        self.add_default_policy(definition, "spark_version", spark_version)
+        cls.add_default_policy(definition, "spark_version", spark_version)
 
-        return self.__create_cluster_policy(instance_pool_id=instance_pool_id,
-                                            name=dbh_constants.CLUSTERS_HELPER.POLICY_ALL_PURPOSE,
-                                            definition=definition)
+        return definition
 
     def create_jobs_policy(self, *,
                            instance_pool_id: str,
                            spark_version: str) -> str:
 
+        return self.__create_cluster_policy(instance_pool_id=instance_pool_id,
+                                            name=dbh_constants.CLUSTERS_HELPER.POLICY_JOBS_ONLY,
+                                            definition=self.__jobs_definition(spark_version=spark_version))
+
+    @staticmethod
+    def __jobs_definition(*, spark_version: str) -> Dict[str, Any]:
+
         definition = {
             "cluster_type": {
                 "type": "fixed",
@@ -210,9 +255,7 @@ class ClustersHelper:
         }
         ClustersHelper.add_default_policy(definition, "spark_version", spark_version)
 
-        return self.__create_cluster_policy(instance_pool_id=instance_pool_id,
-                                            name=dbh_constants.CLUSTERS_HELPER.POLICY_JOBS_ONLY,
-                                            definition=definition)
+        return definition
 
     def create_dlt_policy(self, *,
                           lab_id: str,
@@ -220,6 +263,20 @@ class ClustersHelper:
                           workspace_name: str,
                           org_id: str) -> str:
 
+        definition = self.__dlt_definition(lab_id=lab_id,
+                                           workspace_description=workspace_description,
+                                           workspace_name=workspace_name,
+                                           org_id=org_id)
+
+        return self.__create_cluster_policy(instance_pool_id=None, name=dbh_constants.CLUSTERS_HELPER.POLICY_DLT_ONLY, definition=definition)
+
+    @classmethod
+    def __dlt_definition(cls, *,
+                         lab_id: str,
+                         workspace_description: str,
+                         workspace_name: str,
+                         org_id: str) -> Dict[str, Any]:
+
         from dbacademy import common, dbgems
         from dbacademy.dbhelper.supporting.workspace_helper import WorkspaceHelper
         from dbacademy.dbhelper.dbacademy_helper import DBAcademyHelper
@@ -246,13 +303,13 @@ class ClustersHelper:
             },
         }
 
-        self.add_custom_tag(definition, dbh_constants.WORKSPACE_HELPER.PARAM_EVENT_ID, lab_id)
-        self.add_custom_tag(definition, dbh_constants.WORKSPACE_HELPER.PARAM_EVENT_DESCRIPTION, workspace_description)
-        self.add_custom_tag(definition, dbh_constants.WORKSPACE_HELPER.PARAM_SOURCE, "Smoke-Test" if DBAcademyHelper.is_smoke_test() else common.clean_string(lab_id))
-        self.add_custom_tag(definition, dbh_constants.WORKSPACE_HELPER.PARAM_ORG_ID, org_id)
-        self.add_custom_tag(definition, dbh_constants.WORKSPACE_HELPER.PARAM_WORKSPACE_NAME, workspace_name)
+        cls.add_custom_tag(definition, dbh_constants.WORKSPACE_HELPER.PARAM_EVENT_ID, lab_id)
+        cls.add_custom_tag(definition, dbh_constants.WORKSPACE_HELPER.PARAM_EVENT_DESCRIPTION, workspace_description)
+        cls.add_custom_tag(definition, dbh_constants.WORKSPACE_HELPER.PARAM_SOURCE, "Smoke-Test" if DBAcademyHelper.is_smoke_test() else common.clean_string(lab_id))
+        cls.add_custom_tag(definition, dbh_constants.WORKSPACE_HELPER.PARAM_ORG_ID, org_id)
+        cls.add_custom_tag(definition, dbh_constants.WORKSPACE_HELPER.PARAM_WORKSPACE_NAME, workspace_name)
 
-        return self.__create_cluster_policy(instance_pool_id=None, name=dbh_constants.CLUSTERS_HELPER.POLICY_DLT_ONLY, definition=definition)
+        return definition
 
     @staticmethod
     def add_default_policy(definition: Dict[str, Any], name: str, value: str) -> None:
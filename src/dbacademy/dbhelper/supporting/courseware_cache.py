@@ -0,0 +1,75 @@
+__all__ = ["CoursewareCache"]
+
+import threading
+from typing import Callable, Dict, Optional
+
+
+class CoursewareCache:
+    """
+    Downloads and base64 encodes each courseware artifact, e.g. a DBC, once so that it can then be imported into any
+    number of user folders. Artifacts are kept in memory under the SHA-256 of their content, which shares one encoding
+    between URLs that serve identical content.
+    """
+
+    def __init__(self, download: Optional[Callable[[str], bytes]] = None):
+        """
+        :param download: the function returning the content of a URL, by default an HTTP GET.
+        """
+        self.__download = download or CoursewareCache.download_url
+
+        self.__lock = threading.Lock()
+        self.__url_locks: Dict[str, threading.Lock] = dict()
+        self.__digests: Dict[str, str] = dict()    # download URL -> SHA-256
+        self.__encoded: Dict[str, str] = dict()    # SHA-256 -> base64 encoded content
+
+    @staticmethod
+    def download_url(url: str) -> bytes:
+        from urllib import request
+
+        with request.urlopen(url) as response:
+            return response.read()
+
+    def digest_of(self, url: str) -> Optional[str]:
+        """
+        :param url: the download URL of a previously fetched artifact.
+        :return: the SHA-256 of the artifact's content or None if it was not yet fetched.
+        """
+        return self.__digests.get(url)
+
+    def get(self, url: str) -> str:
+        """
+        Returns the base64 encoded content of the specified URL, downloading it only on first use. Concurrent requests
+        for the same URL wait on the one download while requests for other URLs proceed in parallel.
+        :param url: the artifact's download URL.
+        :return: the base64 encoded content.
+        """
+        with self.__lock:
+            url_lock = self.__url_locks.setdefault(url, threading.Lock())
+
+        with url_lock:
+            digest = self.__digests.get(url)
+            if digest is None:
+                digest = self.__fetch(url)
+
+            return self.__encoded[digest]
+
+    def __fetch(self, url: str) -> str:
+        import base64
+        import hashlib
+
+        content = self.__download(url)
+        digest = hashlib.sha256(content).hexdigest()
+
+        with self.__lock:
+            known = digest in self.__encoded
+
+        if not known:
+            encoded = base64.b64encode(content).decode("utf-8")
+
+            with self.__lock:
+                self.__encoded.setdefault(digest, encoded)
+
+        with self.__lock:
+            self.__digests[url] = digest
+
+        return digest
@@ -1,12 +1,14 @@
 # __all__ = ["DatabasesHelper"]
 __all__ = []
 
-from typing import Callable, List, Dict
+from typing import Callable, List, Dict, Optional
 from dbacademy.dbhelper import dbh_constants
 from dbacademy.common import validate
 from dbacademy.clients.dbrest import DBAcademyRestClient
 from dbacademy.dbhelper.lesson_config import LessonConfig
 from dbacademy.dbhelper.supporting.workspace_helper import WorkspaceHelper
+from dbacademy.dbhelper.supporting.prefix_index import PrefixIndex
+from dbacademy.dbhelper.supporting.ddl_executor import DdlExecutor, SparkDdlExecutor, StatementResult
 
 
 class DatabasesHelper:
@@ -24,7 +26,8 @@ class DatabasesHelper:
 
         for i, group in enumerate(groups):
             print(f"| Processing group {i+1} of {len(groups)} ({len(group)} users)")
-            self.__workspace_helper.do_for_all_users(group, lambda username: self.__drop_databases_for(index=group.index(username),
+            indexes = {username: index for index, username in enumerate(group)}
+            self.__workspace_helper.do_for_all_users(group, lambda username: self.__drop_databases_for(index=indexes[username],
                                                                                                        count=len(group),
                                                                                                        username=username,
                                                                                                        course_code=lesson_config.course_config.course_code))
@@ -32,9 +35,8 @@ class DatabasesHelper:
             print("-" * 80)
             print()
 
-        # Clear the list of databases (and derived users) to force a refresh
+        # Clear the list of derived users to force a refresh, the existing databases were updated as they were dropped.
         self.__workspace_helper._usernames = None
-        self.__workspace_helper.clear_existing_databases()
 
     def __drop_databases_for(self, *,
                              index: int,
@@ -48,14 +50,16 @@ class DatabasesHelper:
         dropped = False
         prefix = DBAcademyHelper.to_schema_name_prefix(username=username, course_code=course_code)
 
-        for schema_name in self.__workspace_helper.existing_databases:
-            if schema_name.startswith(prefix):
-                print(f"| ({index+1}/{count}) Dropping the database \"{schema_name}\" for {username}")
-                try:
-                    dbgems.spark.sql(f"DROP DATABASE {schema_name} CASCADE;")
-                    dropped = True
-                except:
-                    pass  # I don't care if it didn't exist.
+        existing_databases = self.__workspace_helper.existing_databases
+
+        for schema_name in existing_databases.starting_with(prefix):
+            print(f"| ({index+1}/{count}) Dropping the database \"{schema_name}\" for {username}")
+            try:
+                dbgems.spark.sql(f"DROP DATABASE {schema_name} CASCADE;")
+                existing_databases.discard(schema_name)
+                dropped = True
+            except:
+                pass  # I don't care if it didn't exist.
         if not dropped:
             print(f"| ({index+1}/{count}) Database not dropped for {username}")
 
@@ -67,10 +71,10 @@ class DatabasesHelper:
                                                  lambda username: self.__drop_catalogs_for(username=username,
                                                                                            lesson_config=lesson_config))
 
-        # Clear the list of catalogs (and derived users) to force a refresh
+        # Clear the list of derived users to force a refresh, the existing catalogs were updated as they were dropped.
+        # The current catalog's databases are reloaded as it may have been one of those dropped.
         self.__workspace_helper._usernames = None
         self.__workspace_helper.clear_existing_databases()
-        self.__workspace_helper.clear_existing_catalogs()
 
     def __drop_catalogs_for(self, username: str, lesson_config: LessonConfig) -> None:
 
@@ -84,11 +88,13 @@ class DatabasesHelper:
         prefix = DBAcademyHelper.to_schema_name_prefix(username=username,
                                                        course_code=lesson_config.course_config.course_code)
 
-        for catalog_name in self.__workspace_helper.existing_catalogs:
-            if catalog_name.startswith(prefix):
-                print(f"Dropping the catalog \"{catalog_name}\" for {username}")
-                dropped = True
-                dbgems.spark.sql(f"DROP CATALOG {catalog_name} CASCADE;")
+        existing_catalogs = self.__workspace_helper.existing_catalogs
+
+        for catalog_name in existing_catalogs.starting_with(prefix):
+            print(f"Dropping the catalog \"{catalog_name}\" for {username}")
+            dropped = True
+            dbgems.spark.sql(f"DROP CATALOG {catalog_name} CASCADE;")
+            existing_catalogs.discard(catalog_name)
 
         if not dropped:
             print(f"Catalog not drop for {username}")
@@ -115,129 +121,140 @@ class DatabasesHelper:
     def create_databases(self, *,
                          drop_existing: bool,
                          lesson_config: LessonConfig,
-                         post_create: Callable[[str, str], None] = None) -> None:
+                         post_create: Callable[[str, str], None] = None,
+                         executor: DdlExecutor = None) -> None:
+
+        from dbacademy.dbhelper.dbacademy_helper import DBAcademyHelper
 
         drop_existing = validate(drop_existing=drop_existing).required.bool()
         lesson_config = validate(lesson_config=lesson_config).required.as_type(LessonConfig)
         post_create = validate(post_create=post_create).optional.as_type(Callable)
+        executor = validate(executor=executor).optional.as_type(DdlExecutor) or SparkDdlExecutor()
 
         print(f"| Creating user-specific databases.")
 
         usernames = self.__workspace_helper.get_usernames(lesson_config=lesson_config)
+        existing_databases = self.__workspace_helper.existing_databases
 
-        groups = self.__to_group_of(usernames=usernames, max_group_size=50)
-
-        # Refactored to process only 50 at a time.
-        print(f"| Processing {len(usernames)} users as {len(groups)} groups.")
+        names: Dict[str, str] = dict()
+        groups: Dict[str, List[str]] = dict()
 
-        for i, group in enumerate(groups):
-            print(f"| Processing group {i+1} of {len(groups)} ({len(group)} users)")
-            self.__workspace_helper.do_for_all_users(group, lambda user: self.__create_database_for(username=user,
-                                                                                                    drop_existing=drop_existing,
-                                                                                                    lesson_config=lesson_config,
-                                                                                                    post_create=post_create))
-            print("-" * 80)
-            print()
-        # Clear the list of databases (and derived users) to force a refresh
+        for username in usernames:
+            db_name = DBAcademyHelper.to_schema_name_prefix(username=username,
+                                                            course_code=lesson_config.course_config.course_code)
+            db_path = f"{DBAcademyHelper.get_dbacademy_users_path()}/{username}/{lesson_config.course_config.course_name}/database.db"
+
+            statements = list()
+            if db_name in existing_databases:
+                # The database already exists.
+                if not drop_existing:
+                    print(f"| Skipping existing schema \"{db_name}\" for {username}")
+                    continue
+                statements.append(f"DROP DATABASE IF EXISTS {db_name} CASCADE;")
+
+            statements.append(f"CREATE DATABASE IF NOT EXISTS {db_name} LOCATION '{db_path}';")
+
+            names[username] = db_name
+            groups[username] = statements
+
+        print(f"| Processing {len(groups)} users in chunks of {executor.chunk_size}.")
+        results = executor.execute(groups)
+
+        self.__after_create(kind="schema",
+                            names=names,
+                            results=results,
+                            existing=existing_databases,
+                            drop_existing=drop_existing,
+                            post_create=post_create)
+
+        # Clear the list of derived users to force a refresh, the existing databases were updated as they were created.
         self.__workspace_helper._usernames = None
 
-    def __create_database_for(self, *, 
-                              username: str, 
-                              drop_existing: bool, 
-                              lesson_config: LessonConfig,
-                              post_create: Callable[[str, str], None] = None) -> None:
-        
-        from dbacademy import dbgems
-        from dbacademy.dbhelper.dbacademy_helper import DBAcademyHelper
-
-        username = validate(username=username).required.str()
-        drop_existing = validate(drop_existing=drop_existing).required.bool()
-        lesson_config = validate(lesson_config=lesson_config).required.as_type(LessonConfig)
-        post_create = validate(post_create=post_create).optional.as_type(Callable)
+    def __after_create(self, *,
+                       kind: str,
+                       names: Dict[str, str],
+                       results: Dict[str, List[StatementResult]],
+                       existing: PrefixIndex,
+                       drop_existing: bool,
+                       post_create: Optional[Callable[[str, str], None]]) -> None:
 
-        db_name = DBAcademyHelper.to_schema_name_prefix(username=username,
-                                                        course_code=lesson_config.course_config.course_code)
-        db_path = f"{DBAcademyHelper.get_dbacademy_users_path()}/{username}/{lesson_config.course_config.course_name}/database.db"
+        DdlExecutor.print_results(results)
 
-        if db_name in self.__workspace_helper.existing_databases:
-            # The database already exists.
+        created = list()
+        for username, statement_results in results.items():
+            name = names[username]
+            if statement_results[-1].succeeded:
+                existing.add(name)
+                created.append(username)
+            elif statement_results[0].succeeded:
+                existing.discard(name)  # Dropped but not re-created
 
-            if drop_existing:
-                dbgems.spark.sql(f"DROP DATABASE IF EXISTS {db_name} CASCADE;")
-            else:
-                return print(f"| Skipping existing schema \"{db_name}\" for {username}")
+        def post_create_for(username: str) -> None:
+            name = names[username]
+            msg = f"|\n| Created {kind} \"{name}\" for \"{username}\", dropped existing: {drop_existing}"
 
-        dbgems.sql(f"CREATE DATABASE IF NOT EXISTS {db_name} LOCATION '{db_path}';")
+            if post_create:
+                # Call the post-create init function if defined
+                response = post_create(username, name)
+                if response is not None:
+                    msg += "\n"
+                    msg += str(response)
 
-        msg = f"|\n| Created schema \"{db_name}\" for \"{username}\", dropped existing: {drop_existing}"
+            print(msg)
 
-        if post_create:
-            # Call the post-create init function if defined
-            response = post_create(username, db_name)
-            if response is not None:
-                msg += "\n"
-                msg += str(response)
+        self.__workspace_helper.do_for_all_users(created, post_create_for)
 
-        return print(msg)
+        failed = [username for username, statement_results in results.items() if not statement_results[-1].succeeded]
+        if len(failed) > 0:
+            raise Exception(f"Failed to create the {kind} for {len(failed)} of {len(results)} users: {failed}")
 
     def create_catalog(self, *, 
                        drop_existing: bool,
                        lesson_config: LessonConfig,
-                       post_create: Callable[[str, str], None] = None) -> None:
+                       post_create: Callable[[str, str], None] = None,
+                       executor: DdlExecutor = None) -> None:
 
-        drop_existing = validate(drop_existing=drop_existing).required.bool()
-        lesson_config = validate(lesson_config=lesson_config).required.as_type(LessonConfig)
-        post_create = validate(post_create=post_create).optional.as_type(Callable)
-        
-        usernames = self.__workspace_helper.get_usernames(lesson_config=lesson_config)
-        
-        self.__workspace_helper.do_for_all_users(usernames, lambda username: self.__create_catalog_for(username=username,
-                                                                                                       drop_existing=drop_existing,
-                                                                                                       lesson_config=lesson_config,
-                                                                                                       post_create=post_create))
-        # Clear the list of catalogs (and derived users) to force a refresh
-        self.__workspace_helper._usernames = None
-        self.__workspace_helper.clear_existing_databases()
-        self.__workspace_helper.clear_existing_catalogs()
-
-    def __create_catalog_for(self, *,
-                             username: str, 
-                             drop_existing: bool, 
-                             lesson_config: LessonConfig,
-                             post_create: Callable[[str, str], None] = None) -> None:
-        
-        from dbacademy import dbgems
         from dbacademy.dbhelper.dbacademy_helper import DBAcademyHelper
 
-        username = validate(username=username).required.str()
         drop_existing = validate(drop_existing=drop_existing).required.bool()
         lesson_config = validate(lesson_config=lesson_config).required.as_type(LessonConfig)
         post_create = validate(post_create=post_create).optional.as_type(Callable)
+        executor = validate(executor=executor).optional.as_type(DdlExecutor) or SparkDdlExecutor()
+
+        usernames = self.__workspace_helper.get_usernames(lesson_config=lesson_config)
+        existing_catalogs = self.__workspace_helper.existing_catalogs
+
+        names: Dict[str, str] = dict()
+        groups: Dict[str, List[str]] = dict()
 
-        cat_name = DBAcademyHelper.to_schema_name_prefix(username=username,
-                                                         course_code=lesson_config.course_config.course_code)
-        # db_path = f"{DBAcademyHelper.get_dbacademy_users_path()}/{username}/{self.__da.course_config.course_name}/database.db"
+        for username in usernames:
+            cat_name = DBAcademyHelper.to_schema_name_prefix(username=username,
+                                                             course_code=lesson_config.course_config.course_code)
 
-        if cat_name in self.__workspace_helper.existing_catalogs:
-            # The catalog already exists.
+            statements = list()
+            if cat_name in existing_catalogs:
+                # The catalog already exists.
+                if not drop_existing:
+                    print(f"Skipping existing catalog \"{cat_name}\" for {username}")
+                    continue
+                statements.append(f"DROP CATALOG IF EXISTS {cat_name} CASCADE;")
 
-            if drop_existing:
-                dbgems.spark.sql(f"DROP CATALOG IF EXISTS {cat_name} CASCADE;")
-            else:
-                return print(f"Skipping existing catalog \"{cat_name}\" for {username}")
+            statements.append(f"CREATE CATALOG IF NOT EXISTS {cat_name};")
 
-        dbgems.sql(f"CREATE CATALOG IF NOT EXISTS {cat_name};")
+            names[username] = cat_name
+            groups[username] = statements
 
-        msg = f"Created schema \"{cat_name}\" for \"{username}\", dropped existing: {drop_existing}"
+        results = executor.execute(groups)
 
-        if post_create:
-            # Call the post-create init function if defined
-            response = post_create(username, cat_name)
-            if response is not None:
-                msg += "\n"
-                msg += str(response)
+        self.__after_create(kind="catalog",
+                            names=names,
+                            results=results,
+                            existing=existing_catalogs,
+                            drop_existing=drop_existing,
+                            post_create=post_create)
 
-        return print(msg)
+        # Clear the list of derived users to force a refresh, the existing catalogs were updated as they were created.
+        self.__workspace_helper._usernames = None
 
     def configure_permissions(self, notebook_name: str, spark_version: str):
         from dbacademy import dbgems
@@ -0,0 +1,218 @@
+__all__ = ["StatementResult", "DdlExecutor", "SparkDdlExecutor", "StatementsApiDdlExecutor"]
+
+from typing import Any, Dict, List, Optional
+from dbacademy.common import validate
+
+SUCCEEDED = "SUCCEEDED"
+FAILED = "FAILED"
+SKIPPED = "SKIPPED"
+
+
+class StatementResult:
+    """The outcome of one statement executed by a DdlExecutor."""
+
+    def __init__(self, *, statement: str, state: str, error: Optional[str] = None):
+        self.statement = statement
+        self.state = state
+        self.error = error
+
+    @property
+    def succeeded(self) -> bool:
+        return self.state == SUCCEEDED
+
+    def __repr__(self) -> str:
+        return f"StatementResult(state={self.state!r}, statement={self.statement!r}, error={self.error!r})"
+
+
+class DdlExecutor:
+    """
+    Executes groups of DDL statements, typically one group per user, e.g. ["DROP DATABASE ...", "CREATE DATABASE ..."].
+    The statements of a group are executed in order, stopping at the first failure, while the groups themselves are
+    executed in chunks of chunk_size; see SparkDdlExecutor and StatementsApiDdlExecutor.
+    """
+
+    def __init__(self, chunk_size: int):
+        self.__chunk_size = validate(chunk_size=chunk_size).required.int(min_value=1)
+
+    @property
+    def chunk_size(self) -> int:
+        return self.__chunk_size
+
+    def execute(self, groups: Dict[str, List[str]]) -> Dict[str, List[StatementResult]]:
+        """
+        :param groups: the statements to execute keyed by an identifier of the group, e.g. the username.
+        :return: the result of every statement keyed by the same identifier. Statements following a failed one are
+                 reported as SKIPPED.
+        """
+        groups = validate(groups=groups).required.dict(str)
+
+        keys = list(groups)
+        chunks = [keys[i:i + self.chunk_size] for i in range(0, len(keys), self.chunk_size)]
+
+        results: Dict[str, List[StatementResult]] = dict()
+        for chunk in self._map_chunks(chunks, groups):
+            results.update(chunk)
+
+        for key, statements in groups.items():
+            executed = results.get(key, list())
+            results[key] = executed + [StatementResult(statement=s, state=SKIPPED) for s in statements[len(executed):]]
+
+        return {key: results[key] for key in keys}
+
+    def _map_chunks(self, chunks: List[List[str]], groups: Dict[str, List[str]]) -> List[Dict[str, List[StatementResult]]]:
+        raise NotImplementedError()
+
+    @staticmethod
+    def print_results(results: Dict[str, List[StatementResult]]) -> None:
+        """Prints one line per statement that did not succeed, and a summary."""
+        count = 0
+        failed = 0
+
+        for key, statement_results in results.items():
+            for result in statement_results:
+                count += 1
+                if not result.succeeded:
+                    failed += 1
+                    print(f"| {result.state} for {key}: {result.statement}")
+                    if result.error is not None:
+                        print(f"|   {result.error}")
+
+        print(f"| Executed {count - failed} of {count} statements successfully.")
+
+
+class SparkDdlExecutor(DdlExecutor):
+    """
+    Executes statements with spark.sql(), one group per task and max_workers tasks at a time. Spark executes one
+    statement per call, so each chunk's groups are fanned out across the pool and the chunks only bound how many groups
+    are submitted at once.
+    """
+
+    def __init__(self, chunk_size: int = 50, max_workers: int = 50, spark: Any = None):
+        """
+        :param chunk_size: the number of groups submitted to the pool at once.
+        :param max_workers: the number of groups executed concurrently.
+        :param spark: the SparkSession executing the statements, by default dbgems.spark.
+        """
+        super().__init__(chunk_size)
+        self.__max_workers = validate(max_workers=max_workers).required.int(min_value=1)
+        self.__spark = spark
+
+    def _map_chunks(self, chunks: List[List[str]], groups: Dict[str, List[str]]) -> List[Dict[str, List[StatementResult]]]:
+        from concurrent.futures import ThreadPoolExecutor
+        from dbacademy import dbgems
+
+        spark = self.__spark or dbgems.spark
+
+        def execute_group(key: str) -> List[StatementResult]:
+            group_results = list()
+
+            for statement in groups[key]:
+                try:
+                    spark.sql(statement)
+                    group_results.append(StatementResult(statement=statement, state=SUCCEEDED))
+                except Exception as e:
+                    group_results.append(StatementResult(statement=statement, state=FAILED, error=str(e)))
+                    break
+
+            return group_results
+
+        with ThreadPoolExecutor(max_workers=self.__max_workers, thread_name_prefix="dbacademy-ddl") as executor:
+            return [dict(zip(chunk, executor.map(execute_group, chunk))) for chunk in chunks]
+
+
+class StatementsApiDdlExecutor(DdlExecutor):
+    """
+    Executes statements with the SQL Statements API. Every group of a chunk has its next statement submitted without
+    waiting, i.e. with on_wait_timeout=CONTINUE, after which the whole chunk is polled until each statement completes.
+    A chunk of any size therefore takes about as many polling rounds as its longest group has statements.
+    """
+
+    TERMINAL_STATES = ["SUCCEEDED", "FAILED", "CANCELED", "CLOSED"]
+
+    def __init__(self, *,
+                 client: Any,
+                 warehouse_id: str,
+                 catalog: str = "main",
+                 schema: str = "default",
+                 chunk_size: int = 500,
+                 poll_seconds: float = 1,
+                 timeout_seconds: float = 15 * 60):
+        """
+        :param client: the DBAcademyRestClient whose sql.statements API is used.
+        :param warehouse_id: the SQL warehouse executing the statements.
+        :param catalog: the default catalog of each statement.
+        :param schema: the default schema of each statement.
+        :param chunk_size: the number of groups whose statements are in flight at once.
+        :param poll_seconds: the delay between two polls of the chunk's outstanding statements.
+        :param timeout_seconds: the time after which outstanding statements are cancelled and reported as FAILED.
+        """
+        from dbacademy.clients.dbrest import DBAcademyRestClient
+
+        super().__init__(chunk_size)
+
+        self.__client = validate(client=client).required.as_type(DBAcademyRestClient)
+        self.__warehouse_id = validate(warehouse_id=warehouse_id).required.str()
+        self.__catalog = validate(catalog=catalog).optional.str()
+        self.__schema = validate(schema=schema).optional.str()
+        self.__poll_seconds = validate(poll_seconds=poll_seconds).required.number(min_value=0)
+        self.__timeout_seconds = validate(timeout_seconds=timeout_seconds).required.number(min_value=0)
+
+    def __submit(self, statement: str) -> Dict[str, Any]:
+        return self.__client.sql.statements.execute(warehouse_id=self.__warehouse_id,
+                                                    catalog=self.__catalog,
+                                                    schema=self.__schema,
+                                                    statement=statement,
+                                                    on_wait_timeout="CONTINUE",
+                                                    wait_timeout="0s")
+
+    @staticmethod
+    def __to_result(statement: str, response: Dict[str, Any]) -> StatementResult:
+        status = response.get("status", dict())
+        state = status.get("state")
+        error = status.get("error", dict()).get("message") if state != SUCCEEDED else None
+        return StatementResult(statement=statement, state=state, error=error)
+
+    def _map_chunks(self, chunks: List[List[str]], groups: Dict[str, List[str]]) -> List[Dict[str, List[StatementResult]]]:
+        return [self.__execute_chunk(chunk, groups) for chunk in chunks]
+
+    def __execute_chunk(self, chunk: List[str], groups: Dict[str, List[str]]) -> Dict[str, List[StatementResult]]:
+        import time
+
+        statements_api = self.__client.sql.statements
+        chunk_results: Dict[str, List[StatementResult]] = {key: list() for key in chunk}
+        remaining = [key for key in chunk if len(groups[key]) > 0]
+
+        while len(remaining) > 0:
+            # Submit the next statement of every remaining group
+            pending: Dict[str, Dict[str, Any]] = dict()
+            for key in remaining:
+                statement = groups[key][len(chunk_results[key])]
+                try:
+                    pending[key] = self.__submit(statement)
+                except Exception as e:
+                    chunk_results[key].append(StatementResult(statement=statement, state=FAILED, error=str(e)))
+
+            # Poll the chunk's outstanding statements until each completes
+            deadline = time.time() + self.__timeout_seconds
+            while True:
+                for key, response in list(pending.items()):
+                    statement = groups[key][len(chunk_results[key])]
+                    if response.get("status", dict()).get("state") in self.TERMINAL_STATES:
+                        chunk_results[key].append(self.__to_result(statement, response))
+                        del pending[key]
+
+                    elif time.time() > deadline:
+                        statements_api.cancel_statement(response.get("statement_id"))
+                        chunk_results[key].append(StatementResult(statement=statement, state=FAILED, error=f"Timed out after {self.__timeout_seconds} seconds."))
+                        del pending[key]
+
+                if len(pending) == 0:
+                    break
+
+                time.sleep(self.__poll_seconds)
+                pending = {key: statements_api.get_statement(response.get("statement_id")) for key, response in pending.items()}
+
+            remaining = [key for key in remaining
+                         if chunk_results[key][-1].succeeded and len(chunk_results[key]) < len(groups[key])]
+
+        return chunk_results
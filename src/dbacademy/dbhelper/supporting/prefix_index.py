@@ -0,0 +1,65 @@
+__all__ = ["PrefixIndex"]
+
+import bisect
+import threading
+from typing import Iterable, Iterator, List, Optional
+
+
+class PrefixIndex:
+    """
+    A sorted, thread-safe set of names, e.g. of the workspace's catalogs or schemas, answering "which names start with
+    this prefix" with a binary search instead of a scan of every name. Names are added and discarded as they are created
+    and dropped so that the index, once loaded, stays current without being reloaded.
+    """
+
+    def __init__(self, names: Optional[Iterable[str]] = None):
+        self.__lock = threading.Lock()
+        self.__names: List[str] = sorted(set(names or list()))
+
+    def __len__(self) -> int:
+        return len(self.__names)
+
+    def __iter__(self) -> Iterator[str]:
+        with self.__lock:
+            return iter(list(self.__names))
+
+    def __contains__(self, name: str) -> bool:
+        with self.__lock:
+            names = self.__names
+            i = bisect.bisect_left(names, name)
+            return i < len(names) and names[i] == name
+
+    def add(self, name: str) -> None:
+        with self.__lock:
+            i = bisect.bisect_left(self.__names, name)
+            if i == len(self.__names) or self.__names[i] != name:
+                self.__names.insert(i, name)
+
+    def discard(self, name: str) -> None:
+        with self.__lock:
+            i = bisect.bisect_left(self.__names, name)
+            if i < len(self.__names) and self.__names[i] == name:
+                del self.__names[i]
+
+    def has_prefix(self, prefix: str) -> bool:
+        """
+        :param prefix: the prefix to test for, e.g. a user's schema name prefix.
+        :return: True if at least one name starts with the prefix.
+        """
+        with self.__lock:
+            names = self.__names
+            i = bisect.bisect_left(names, prefix)
+            return i < len(names) and names[i].startswith(prefix)
+
+    def starting_with(self, prefix: str) -> List[str]:
+        """
+        :param prefix: the prefix to search for, e.g. a user's schema name prefix.
+        :return: the names starting with the prefix, in sorted order.
+        """
+        with self.__lock:
+            names = self.__names
+            start = bisect.bisect_left(names, prefix)
+            end = start
+            while end < len(names) and names[end].startswith(prefix):
+                end += 1
+            return names[start:end]
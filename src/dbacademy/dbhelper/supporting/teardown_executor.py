@@ -0,0 +1,78 @@
+__all__ = ["TeardownExecutor"]
+
+from typing import Any, Callable, Iterable, List, Optional, TypeVar
+from dbacademy.common import validate
+
+T = TypeVar("T")
+
+
+class TeardownExecutor:
+    """
+    Executes the independent steps of a teardown, e.g. dropping each of many schemas, max_workers at a time. Every step
+    runs to completion even if another fails, after which the first failure is raised.
+    """
+
+    def __init__(self, max_workers: int = 8):
+        self.__max_workers = validate(max_workers=max_workers).required.int(min_value=1)
+
+    @property
+    def max_workers(self) -> int:
+        return self.__max_workers
+
+    def map(self, f: Callable[[T], Any], items: Iterable[T]) -> List[Any]:
+        """
+        Applies f to every item concurrently, returning once all of them have completed.
+        :param f: the step to execute for each item.
+        :param items: the items to tear down.
+        :return: the value returned by f for each item, in the order of items.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        items = list(items)
+        if len(items) <= 1:
+            return [f(item) for item in items]  # Not worth a thread
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="dbacademy-teardown") as executor:
+            futures = [executor.submit(f, item) for item in items]
+
+        return [future.result() for future in futures]
+
+    def run(self, *steps: Callable[[], Any]) -> List[Any]:
+        """Executes the steps concurrently, returning the value of each once all of them have completed."""
+        return self.map(lambda step: step(), steps)
+
+    @staticmethod
+    def wait_until(condition: Callable[[], bool], *,
+                   timeout: Optional[float] = 5 * 60,
+                   min_interval: float = 0.25,
+                   max_interval: float = 5,
+                   backoff: float = 2) -> None:
+        """
+        Waits until condition() returns True, checking it immediately and then at intervals that start at min_interval
+        and grow by backoff up to max_interval, so short waits complete promptly without polling long ones too often.
+        :param condition: the check, e.g. that no version of a model remains in an active stage.
+        :param timeout: the number of seconds after which TimeoutError is raised; None to wait indefinitely.
+        :param min_interval: the initial number of seconds between two checks.
+        :param max_interval: the maximum number of seconds between two checks.
+        :param backoff: the factor by which the interval grows after each check.
+        :return: None
+        """
+        import time
+
+        timeout = validate(timeout=timeout).optional.float(min_value=0)
+        min_interval = validate(min_interval=min_interval).required.float(min_value=0)
+        max_interval = validate(max_interval=max_interval).required.float(min_value=min_interval)
+        backoff = validate(backoff=backoff).required.float(min_value=1)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = min_interval
+
+        while not condition():
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"The condition was not met within {timeout} seconds.")
+                interval = min(interval, remaining)
+
+            time.sleep(interval)
+            interval = min(interval * backoff, max_interval)
@@ -1,11 +1,12 @@
 __all__ = ["WarehousesHelper"]
 
-from typing import Union, List, Optional
+from typing import Union, List, Optional, Dict
 
 from dbacademy.common import validate
 from dbacademy.dbhelper.lesson_config import LessonConfig
 from dbacademy.clients.dbrest import DBAcademyRestClient
 from dbacademy.dbhelper.supporting.workspace_helper import WorkspaceHelper
+from dbacademy.dbhelper.supporting.ddl_executor import DdlExecutor, StatementsApiDdlExecutor, StatementResult
 
 
 class WarehousesHelper:
@@ -44,20 +45,27 @@ class WarehousesHelper:
 
         WorkspaceHelper.do_for_all_users(usernames, lambda username: self.delete_sql_warehouses_for(lesson_config=lesson_config))
 
-    def execute_statements(self, warehouse_id: str, statements: List[str]) -> None:
-        import json
-
-        for statement in statements:
-            results = self.__client.sql.statements.execute(warehouse_id=warehouse_id,
-                                                           catalog="main",
-                                                           schema="default",
-                                                           statement=statement)
+    def execute_statements(self, warehouse_id: str, statements: List[str], *, stop_on_failure: bool = False) -> Dict[str, List[StatementResult]]:
+        """
+        Executes the statements one after the other with the SQL Statements API, polling for their completion instead of
+        cancelling those that run longer than a single request's wait timeout.
+        :param warehouse_id: the SQL warehouse executing the statements.
+        :param statements: the statements to execute.
+        :param stop_on_failure: when True, the statements following a failed one are skipped, otherwise every statement is executed.
+        :return: the result of each statement, keyed by "statements" when stopping on failure and by each statement's index otherwise.
+        """
+        if stop_on_failure:
+            executor = StatementsApiDdlExecutor(client=self.__client, warehouse_id=warehouse_id)
+            groups = {"statements": statements}
+        else:
+            # One statement per chunk, so that each completes before the next is submitted
+            executor = StatementsApiDdlExecutor(client=self.__client, warehouse_id=warehouse_id, chunk_size=1)
+            groups = {str(i): [statement] for i, statement in enumerate(statements)}
 
-            state = results.get("status", dict()).get("state")
+        results = executor.execute(groups)
+        DdlExecutor.print_results(results)
 
-            if state != "SUCCEEDED":
-                print(f"""Expected state to be "SUCCEEDED", found "{state}".""")
-                print(json.dumps(results, indent=4))
+        return results
 
     def create_sql_warehouses(self, *,
                               auto_stop_mins: Optional[int] = None,
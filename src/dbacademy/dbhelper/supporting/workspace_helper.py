@@ -1,9 +1,12 @@
 __all__ = ["WorkspaceHelper"]
 
-from typing import Callable, List, TypeVar, Optional, Union, Dict, Any
+from typing import Callable, List, TypeVar, Optional, Union, Dict, Any, Tuple
+from dbacademy.common import validate
 from dbacademy.dbhelper import dbh_constants
 from dbacademy.dbhelper.lesson_config import LessonConfig
 from dbacademy.clients.dbrest import DBAcademyRestClient
+from dbacademy.dbhelper.supporting.courseware_cache import CoursewareCache
+from dbacademy.dbhelper.supporting.prefix_index import PrefixIndex
 
 T = TypeVar("T")
 
@@ -150,61 +153,102 @@ class WorkspaceHelper:
 
         return usernames, course_defs
 
-    def uninstall_courseware(self, courses_arg: str, subdirectory: str, usernames: List[str] = None) -> None:
-
-        usernames, course_defs = self.__parse_args(courses_arg, usernames)
-
-        for username in usernames:
-            print(f"Uninstalling courses for {username}")
+    @staticmethod
+    def __install_dir(username: str, subdirectory: Optional[str], course: str) -> str:
+        if subdirectory is None:
+            return f"/Users/{username}/{course}"
+        else:
+            return f"/Users/{username}/{subdirectory}/{course}"
 
-            for course_def in course_defs:
-                url, course, version, artifact, token = WorkspaceHelper.parse_course_args(course_def)
+    @staticmethod
+    def __for_each_user(usernames: List[str], f: Callable[[str, List[str]], None], max_workers: int, retries: int, retry_delay_seconds: float) -> None:
+        """
+        Applies f to every user with at most max_workers users in flight, retrying a failed user up to "retries" times
+        with exponential backoff. Each user's messages are collected by f and printed together, in the order of usernames,
+        once every user is done; failures are then raised together.
+        """
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        validate(max_workers=max_workers).required.int(min_value=1)
+        validate(retries=retries).required.int(min_value=0)
+        validate(retry_delay_seconds=retry_delay_seconds).required.number(min_value=0)
+
+        def apply(username: str) -> Tuple[List[str], Optional[Exception]]:
+            messages = list()
+            for attempt in range(retries + 1):
+                try:
+                    f(username, messages)
+                    return messages, None
+                except Exception as e:
+                    messages.append(f" - Attempt #{attempt + 1} failed: {e}")
+                    if attempt == retries:
+                        return messages, e
+                    time.sleep(retry_delay_seconds * 2 ** attempt)
 
-                if subdirectory is None:
-                    install_dir = f"/Users/{username}/{course}"
-                else:
-                    install_dir = f"/Users/{username}/{subdirectory}/{course}"
+        if len(usernames) == 0:
+            return
 
-                print(install_dir)
-                self.__client.workspace.delete_path(install_dir, recursive=True)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dbacademy-courseware") as executor:
+            results = list(executor.map(apply, usernames))
 
+        failures = dict()
+        for username, (messages, error) in zip(usernames, results):
+            print("\n".join(messages))
             print("-" * 80)
+            if error is not None:
+                failures[username] = error
 
-    def install_courseware(self, courses_arg: str, subdirectory: str, usernames: List[str] = None) -> None:
+        if len(failures) > 0:
+            raise Exception(f"Failed for {len(failures)} of {len(usernames)} users: {list(failures)}") from list(failures.values())[0]
+
+    def uninstall_courseware(self, courses_arg: str, subdirectory: str, usernames: List[str] = None, *, max_workers: int = 8, retries: int = 2, retry_delay_seconds: float = 5) -> None:
 
         usernames, course_defs = self.__parse_args(courses_arg, usernames)
+        courses = [WorkspaceHelper.parse_course_args(course_def)[1] for course_def in course_defs or list()]
 
-        for username in usernames:
+        def uninstall(username: str, messages: List[str]) -> None:
+            messages.append(f"Uninstalling courses for {username}")
 
-            print(f"Installing courses for {username}")
+            for course in courses:
+                install_dir = self.__install_dir(username, subdirectory, course)
+                messages.append(install_dir)
+                self.__client.workspace.delete_path(install_dir, recursive=True)
 
-            for course_def in course_defs:
-                print()
+        self.__for_each_user(usernames, uninstall, max_workers, retries, retry_delay_seconds)
 
-                url, course, version, artifact, token = WorkspaceHelper.parse_course_args(course_def)
-                download_url = WorkspaceHelper.compose_courseware_url(url, course, version, artifact, token)
+    def install_courseware(self, courses_arg: str, subdirectory: str, usernames: List[str] = None, *, max_workers: int = 8, retries: int = 2, retry_delay_seconds: float = 5, cache: CoursewareCache = None) -> None:
+        """
+        Installs each course into every user's folder. Each DBC is downloaded and encoded once, into the cache, and then
+        imported for max_workers users at a time; a user whose install fails is retried up to "retries" times.
+        """
+        usernames, course_defs = self.__parse_args(courses_arg, usernames)
+        cache = validate(cache=cache).optional.as_type(CoursewareCache) or CoursewareCache()
 
-                if subdirectory is None:
-                    install_dir = f"/Users/{username}/{course}"
-                else:
-                    install_dir = f"/Users/{username}/{subdirectory}/{course}"
+        courses = list()
+        for course_def in course_defs or list():
+            url, course, version, artifact, token = WorkspaceHelper.parse_course_args(course_def)
+            download_url = WorkspaceHelper.compose_courseware_url(url, course, version, artifact, token)
+            courses.append((course, download_url))
+
+        def install(username: str, messages: List[str]) -> None:
+            messages.append(f"Installing courses for {username}")
 
-                print(f" - {install_dir}")
+            for course, download_url in courses:
+                install_dir = self.__install_dir(username, subdirectory, course)
+                messages.append(f"\n - {install_dir}")
 
                 files = self.__client.workspace.ls(install_dir)
                 count = 0 if files is None else len(files)
                 if count > 0:
-                    print(f" - Skipping, course already exists.")
-                    # for file in files or list():
-                    #     path = file.get("path")
-                    #     print(f" - {path}")
+                    messages.append(f" - Skipping, course already exists.")
                 else:
-                    self.__client.workspace.import_dbc_files(path=install_dir,
-                                                             source_url=download_url,
-                                                             overwrite=True)
-                    print(f" - Installed.")
+                    self.__client.workspace.import_dbc_content(path=install_dir,
+                                                               content=cache.get(download_url),
+                                                               overwrite=True)
+                    messages.append(f" - Installed.")
 
-            print("-" * 80)
+        self.__for_each_user(usernames, install, max_workers, retries, retry_delay_seconds)
 
     @staticmethod
     def compose_courseware_url(url: str, course: str, version: Optional[str], artifact: Optional[str], token: str) -> str:
@@ -318,21 +362,16 @@ class WorkspaceHelper:
         missing_users = set()
 
         if lesson_config.requires_uc:
+            existing_catalogs = self.existing_catalogs
             for username in self._usernames:
                 prefix = DBAcademyHelper.to_catalog_name_prefix(username=username)
-                for catalog_name in self.existing_catalogs:
-                    if catalog_name.startswith(prefix):
-                        break
-                else:
+                if not existing_catalogs.has_prefix(prefix):
                     missing_users.add(username)
         else:
+            existing_databases = self.existing_databases
             for username in self._usernames:
                 prefix = DBAcademyHelper.to_schema_name_prefix(username=username, course_code=lesson_config.course_config.course_code)
-
-                for schema_name in self.existing_databases:
-                    if schema_name.startswith(prefix):
-                        break
-                else:
+                if not existing_databases.has_prefix(prefix):
                     missing_users.add(username)
 
             missing_users = list(missing_users)
@@ -342,12 +381,16 @@ class WorkspaceHelper:
         return self._usernames
 
     @property
-    def existing_databases(self):
+    def existing_databases(self) -> PrefixIndex:
+        """
+        The schemas of the current catalog, loaded with SHOW DATABASES on first use and then kept current by the create
+        and drop operations of DatabasesHelper; see also clear_existing_databases()
+        """
         from dbacademy import dbgems
 
         if self.__existing_databases is None:
             existing = dbgems.spark.sql("SHOW DATABASES").collect()
-            self.__existing_databases = {d[0] for d in existing}
+            self.__existing_databases = PrefixIndex(d[0] for d in existing)
 
         return self.__existing_databases
 
@@ -355,12 +398,16 @@ class WorkspaceHelper:
         self.__existing_databases = None
 
     @property
-    def existing_catalogs(self):
+    def existing_catalogs(self) -> PrefixIndex:
+        """
+        The workspace's catalogs, loaded with SHOW CATALOGS on first use and then kept current by the create and drop
+        operations of DatabasesHelper; see also clear_existing_catalogs()
+        """
         from dbacademy import dbgems
 
         if self.__existing_catalogs is None:
             existing = dbgems.spark.sql("SHOW CATALOGS").collect()
-            self.__existing_catalogs = {d[0] for d in existing}
+            self.__existing_catalogs = PrefixIndex(d[0] for d in existing)
 
         return self.__existing_catalogs
 
@@ -1,9 +1,10 @@
 __all__ = ["lazy_property", "TEST_RESULTS_STYLE", "ValidationSuite", "ValidationHelper"]
 
-from typing import List, Callable, Iterable, Any, Sized
+from typing import List, Callable, Iterable, Any, Sized, Optional
 from dbacademy.clients.dbrest import DBAcademyRestClient
 from dbacademy.dbhelper.validations.validation_class import Validation
 from dbacademy.dbhelper.validations.validation_result_class import ValidationResult
+from dbacademy.dbhelper.validations.data_frame_comparison_class import DataFrameComparison
 
 
 # Decorator to lazy evaluate - used by TestSuite
@@ -47,36 +48,82 @@ TEST_RESULTS_STYLE = """
 class ValidationSuite(object):
     import pyspark
 
-    def __init__(self, name: str) -> None:
+    def __init__(self, name: str, *, max_workers: int = 8, timeout_seconds: Optional[float] = None) -> None:
+        """
+        :param name: the suite's name, prefixed to the id of each of its tests.
+        :param max_workers: the maximum number of tests evaluated concurrently, 1 evaluating the tests one after the other.
+        :param timeout_seconds: the time after which each test fails, if it has not completed, or None to wait indefinitely.
+        """
+        from dbacademy.common import validate
         from dbacademy.dbhelper.validations.validation_class import Validation
 
         self.name = name
         self.ids = set()
         self.test_cases: List[Validation] = list()
+        self.max_workers = validate(max_workers=max_workers).required.int(min_value=1)
+        self.timeout_seconds = validate(timeout_seconds=timeout_seconds).optional.number(min_value=0)
 
     @lazy_property
     def test_results(self) -> List[ValidationResult]:
         return self.run_tests()
 
     def run_tests(self) -> List[ValidationResult]:
+        """
+        Evaluates the tests, up to max_workers at a time. A test is started once every test it depends on, among the
+        tests added before it, completed; it is skipped as soon as one of them failed or was skipped itself.
+        :return: the result of each test, in the order the tests were added.
+        """
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
         from dbacademy.dbhelper.validations.validation_results_aggregator_class import ValidationResultsAggregator
         from dbacademy.dbhelper.validations.validation_result_class import ValidationResult
 
-        failed_tests = set()
-        test_results = list()
-
-        for test in self.test_cases:
-            skip = any(test_id in failed_tests for test_id in test.depends_on)
-            test.update_hint()
-            result = ValidationResult(test, skip)
-
-            if not result.passed and test.test_case_id is not None:
-                failed_tests.add(test.test_case_id)
-
-            test_results.append(result)
+        tests = self.test_cases
+        positions = {test.test_case_id: i for i, test in enumerate(tests)}
+
+        # The dependency DAG, limited to earlier tests as with a serial evaluation.
+        dependencies = [{positions[d] for d in test.depends_on if positions.get(d, i) < i} for i, test in enumerate(tests)]
+        dependents = [list() for _ in tests]
+        for i, test_dependencies in enumerate(dependencies):
+            for d in test_dependencies:
+                dependents[d].append(i)
+
+        results: List[Optional[ValidationResult]] = [None] * len(tests)
+        waiting = [len(d) for d in dependencies]
+
+        def evaluate(i: int) -> ValidationResult:
+            tests[i].update_hint()
+            return ValidationResult(tests[i], False, self.timeout_seconds)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="dbacademy-validations") as executor:
+            running = dict()
+
+            def resolve(i: int, result: ValidationResult) -> None:
+                # An explicit stack, as a failure can skip a chain of dependents longer than the recursion limit.
+                results[i] = result
+                resolved = [i]
+                while len(resolved) > 0:
+                    j = resolved.pop()
+                    for dependent in dependents[j]:
+                        waiting[dependent] -= 1
+                        if not results[j].passed and results[dependent] is None:
+                            results[dependent] = ValidationResult(tests[dependent], True)
+                            resolved.append(dependent)
+                        elif waiting[dependent] == 0 and results[dependent] is None:
+                            running[executor.submit(evaluate, dependent)] = dependent
+
+            for i in range(len(tests)):
+                if waiting[i] == 0:
+                    running[executor.submit(evaluate, i)] = i
+
+            while len(running) > 0:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    resolve(running.pop(future), future.result())
+
+        for result in results:
             ValidationResultsAggregator.update(result)
 
-        return test_results
+        return results
 
     def _display(self, css_class: str = "results") -> None:
         from html import escape
@@ -285,7 +332,7 @@ class ValidationSuite(object):
                                         hint=hint,
                                         test_function=lambda: self.compare_rows(actual_value(), expected_value)))
 
-    def test_data_frames(self, actual_value: Callable[[], pyspark.sql.DataFrame], expected_value: pyspark.sql.DataFrame, description: str, *, test_case_id: str = None, points: int = 1, depends_on: Iterable[str] = None, escape_html: bool = False, hint=None):
+    def test_data_frames(self, actual_value: Callable[[], pyspark.sql.DataFrame], expected_value: pyspark.sql.DataFrame, description: str, *, test_case_id: str = None, points: int = 1, depends_on: Iterable[str] = None, escape_html: bool = False, hint=None, test_row_order: bool = True):
         from dbacademy.dbhelper.validations.validation_class import Validation
 
         return self.add_test(Validation(suite=self,
@@ -296,7 +343,7 @@ class ValidationSuite(object):
                                         escape_html=escape_html,
                                         points=points,
                                         hint=hint,
-                                        test_function=lambda: self.compare_data_frames(actual_value(), expected_value)))
+                                        test_function=lambda: self.compare_data_frames(actual_value(), expected_value, test_row_order=test_row_order)))
 
     def test_contains(self, actual_value: Callable[[], Any], expected_values: Iterable[Any], description: str, *, test_case_id: str = None, points: int = 1, depends_on: Iterable[str] = None, escape_html: bool = False, hint=None):
         from dbacademy.dbhelper.validations.validation_class import Validation
@@ -399,15 +446,20 @@ class ValidationSuite(object):
         if test_column_order:
             return value_a == value_b
 
-        for column in value_a:
-            if column not in value_b:
-                return False
-
-        for column in value_b:
-            if column not in value_a:
-                return False
-
-        return True
+        # Compared as multisets, i.e. each value must appear the same number of times in both lists.
+        try:
+            from collections import Counter
+            return Counter(value_a) == Counter(value_b)
+
+        except TypeError:
+            # Unhashable values, e.g. dicts, are matched one by one.
+            remaining = list(value_b)
+            for value in value_a:
+                try:
+                    remaining.remove(value)
+                except ValueError:
+                    return False
+            return True
 
     @staticmethod
     def compare_floats(value_a: float, value_b: float, tolerance: float = 0.01):
@@ -447,27 +499,26 @@ class ValidationSuite(object):
             return set(sch_a) == set(sch_b)
 
     @staticmethod
-    def compare_data_frames(df_a: pyspark.sql.DataFrame, df_b: pyspark.sql.DataFrame):
-        from functools import reduce
-
-        if df_a is None and df_b is None:
-            return True
-        else:
-            n = df_a.count()
-
-            if n != df_b.count():
-                return False
+    def compare_data_frames(df_a: pyspark.sql.DataFrame, df_b: pyspark.sql.DataFrame, test_row_order: bool = True) -> bool:
+        """See ValidationSuite.diff_data_frames()"""
+        return ValidationSuite.diff_data_frames(df_a, df_b, test_row_order=test_row_order).equal
 
-            kv1 = df_a.rdd.zipWithIndex().map(lambda t: (t[1], t[0])).collectAsMap()
-            kv2 = df_b.rdd.zipWithIndex().map(lambda t: (t[1], t[0])).collectAsMap()
-
-            kv12 = [kv1, kv2]
-            d = {}
+    @staticmethod
+    def diff_data_frames(df_a: pyspark.sql.DataFrame, df_b: pyspark.sql.DataFrame, *, test_row_order: bool = True, sample_size: int = 10) -> DataFrameComparison:
+        """
+        Compares two DataFrames within Spark, short-circuiting on schema and count mismatches; see also DataFrameComparison
+        :param df_a: the first DataFrame, e.g. the actual value.
+        :param df_b: the second DataFrame, e.g. the expected value.
+        :param test_row_order: when True, the n-th row of each DataFrame must be equal, otherwise only the rows' counts.
+        :param sample_size: the maximum number of differing rows collected from each DataFrame.
+        :return: the comparison, truthy if the DataFrames are equal and otherwise including a sample of the differing rows.
+        """
+        from dbacademy.common import validate
 
-            for k in kv1.keys():
-                d[k] = tuple(d[k] for d in kv12)
+        validate(test_row_order=test_row_order).required.bool()
+        validate(sample_size=sample_size).required.int(min_value=0)
 
-            return reduce(lambda a, b: a and b, [ValidationSuite.compare_rows(rowTuple[0], rowTuple[1]) for rowTuple in d.values()])
+        return DataFrameComparison.compare(df_a, df_b, test_row_order=test_row_order, sample_size=sample_size)
 
     @staticmethod
     def compare_row(row_a: pyspark.sql.Row, row_b: pyspark.sql.Row):
@@ -0,0 +1,111 @@
+__all__ = ["DataFrameComparison"]
+
+from typing import Any, List, Optional
+
+# The name of the column holding each row's position when the row order is compared.
+ROW_INDEX_COLUMN = "__dbacademy_row_index"
+
+
+class DataFrameComparison:
+    """
+    The result of comparing two DataFrames, which is truthy only if they are equal. The comparison is executed by Spark:
+    it short-circuits on a schema mismatch, then on a count mismatch, and otherwise subtracts each DataFrame from the
+    other with exceptAll(), collecting no more than sample_size of the differing rows to the driver.
+    """
+
+    def __init__(self, *, equal: bool, reason: Optional[str] = None, count_a: Optional[int] = None, count_b: Optional[int] = None, only_in_a: List[Any] = None, only_in_b: List[Any] = None):
+        self.__equal = equal
+        self.__reason = reason
+        self.__count_a = count_a
+        self.__count_b = count_b
+        self.__only_in_a = only_in_a or list()
+        self.__only_in_b = only_in_b or list()
+
+    def __bool__(self) -> bool:
+        return self.__equal
+
+    def __repr__(self) -> str:
+        return f"DataFrameComparison(equal={self.__equal}, reason={self.__reason!r}, count_a={self.__count_a}, count_b={self.__count_b}, only_in_a={self.__only_in_a}, only_in_b={self.__only_in_b})"
+
+    @property
+    def equal(self) -> bool:
+        return self.__equal
+
+    @property
+    def reason(self) -> Optional[str]:
+        """Why the DataFrames differ, one of "missing", "schema", "count" or "rows", or None if they are equal."""
+        return self.__reason
+
+    @property
+    def count_a(self) -> Optional[int]:
+        return self.__count_a
+
+    @property
+    def count_b(self) -> Optional[int]:
+        return self.__count_b
+
+    @property
+    def only_in_a(self) -> List[Any]:
+        """A sample of the rows of the first DataFrame that are not in the second."""
+        return self.__only_in_a
+
+    @property
+    def only_in_b(self) -> List[Any]:
+        """A sample of the rows of the second DataFrame that are not in the first."""
+        return self.__only_in_b
+
+    @staticmethod
+    def __with_row_index(df: Any) -> Any:
+        from pyspark.sql.types import StructType, StructField, LongType
+
+        # zipWithIndex() numbers the rows in partition order without moving them to the driver.
+        schema = StructType(df.schema.fields + [StructField(ROW_INDEX_COLUMN, LongType(), nullable=False)])
+        rows = df.rdd.zipWithIndex().map(lambda t: tuple(t[0]) + (t[1],))
+        return df.sparkSession.createDataFrame(rows, schema)
+
+    @classmethod
+    def compare(cls, df_a: Any, df_b: Any, *, test_row_order: bool = True, sample_size: int = 10) -> "DataFrameComparison":
+        """
+        Compares two DataFrames by their rows, as a multiset, ignoring the order of the columns and their nullability.
+        Note that exceptAll() does not support columns of the type map.
+        :param df_a: the first DataFrame, e.g. the actual value.
+        :param df_b: the second DataFrame, e.g. the expected value.
+        :param test_row_order: when True, the n-th row of each DataFrame must be equal, otherwise only the rows' counts.
+        :param sample_size: the maximum number of differing rows collected from each DataFrame.
+        :return: the comparison's result.
+        """
+        from dbacademy.dbhelper.validations import ValidationSuite
+
+        if df_a is None and df_b is None:
+            return DataFrameComparison(equal=True)
+
+        if df_a is None or df_b is None:
+            return DataFrameComparison(equal=False, reason="missing")
+
+        if not ValidationSuite.compare_schemas(df_a.schema, df_b.schema, test_column_order=False):
+            return DataFrameComparison(equal=False, reason="schema")
+
+        count_a = df_a.count()
+        count_b = df_b.count()
+
+        if count_a != count_b:
+            return DataFrameComparison(equal=False, reason="count", count_a=count_a, count_b=count_b)
+
+        # exceptAll() matches columns by position, so both must list them in the same order.
+        df_b = df_b.select(*df_a.columns)
+
+        if test_row_order:
+            df_a = cls.__with_row_index(df_a)
+            df_b = cls.__with_row_index(df_b)
+
+        # At least one row is collected to decide equality, even when no sample is requested.
+        only_in_a = df_a.exceptAll(df_b).limit(max(sample_size, 1)).collect()
+        equal = len(only_in_a) == 0
+        only_in_b = list() if equal else df_b.exceptAll(df_a).limit(sample_size).collect()
+
+        return DataFrameComparison(equal=equal,
+                                   reason=None if equal else "rows",
+                                   count_a=count_a,
+                                   count_b=count_b,
+                                   only_in_a=only_in_a[:sample_size],
+                                   only_in_b=only_in_b)
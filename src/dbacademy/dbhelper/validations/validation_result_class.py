@@ -1,13 +1,25 @@
 __all__ = ["ValidationResult"]
 
+from typing import Any, Optional
 from dbacademy.dbhelper.validations.validation_class import Validation
 
 
 class ValidationResult(object):
 
-    __slots__ = ('test', 'skipped', 'passed', 'status', 'points', 'exception', 'message')
+    __slots__ = ('test', 'skipped', 'passed', 'status', 'points', 'exception', 'message', 'seconds')
+
+    def __init__(self, test: Validation, skipped: bool = False, timeout_seconds: Optional[float] = None):
+        """
+        Evaluates the test, unless skipped, recording its outcome and wall time in seconds.
+        :param test: the test to evaluate.
+        :param skipped: when True, the test is not evaluated, e.g. because a test it depends on failed.
+        :param timeout_seconds: the time after which the test fails, if it has not completed, or None to wait indefinitely.
+        """
+        import time
+
+        start = time.perf_counter()
+        self.seconds = 0.0
 
-    def __init__(self, test: Validation, skipped: bool = False):
         try:
             self.test = test
             self.skipped = skipped
@@ -16,7 +28,7 @@ class ValidationResult(object):
                 self.passed = False
                 self.points = 0
             else:
-                assert test.test_function(), "Test returned false"
+                assert self.__evaluate(test, timeout_seconds), "Test returned false"
                 self.status = "passed"
                 self.passed = True
                 self.points = self.test.points
@@ -36,3 +48,33 @@ class ValidationResult(object):
             self.points = 0
             self.exception = e
             self.message = str(e)
+
+        finally:
+            self.seconds = 0.0 if skipped else time.perf_counter() - start
+
+    @staticmethod
+    def __evaluate(test: Validation, timeout_seconds: Optional[float]) -> Any:
+        import threading
+
+        if timeout_seconds is None:
+            return test.test_function()
+
+        outcome = dict()
+
+        def evaluate():
+            try:
+                outcome["value"] = test.test_function()
+            except BaseException as e:
+                outcome["error"] = e
+
+        # A daemon thread, as a test that never completes cannot be stopped, only abandoned.
+        thread = threading.Thread(target=evaluate, name=f"dbacademy-validation-{test.test_case_id}", daemon=True)
+        thread.start()
+        thread.join(timeout_seconds)
+
+        if thread.is_alive():
+            raise TimeoutError(f"The test did not complete within {timeout_seconds} seconds.")
+        elif "error" in outcome:
+            raise outcome["error"]
+        else:
+            return outcome.get("value")
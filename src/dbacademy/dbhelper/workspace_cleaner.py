@@ -6,11 +6,19 @@ from dbacademy.dbhelper import dbh_constants
 
 class WorkspaceCleaner:
 
-    def __init__(self, db_academy_helper):
+    def __init__(self, db_academy_helper, *, max_workers: int = 8):
+        """
+        :param db_academy_helper: the DBAcademyHelper whose environment is reset.
+        :param max_workers: the maximum number of catalogs, schemas, models, etc. torn down concurrently.
+        """
         from dbacademy.common import validate
         from dbacademy.dbhelper.dbacademy_helper import DBAcademyHelper
+        from dbacademy.dbhelper.supporting.teardown_executor import TeardownExecutor
+        from dbacademy.dbhelper.supporting.cluster_resources import ClusterResources
 
         self.__da = validate(db_academy_helper=db_academy_helper).required.as_type(DBAcademyHelper)
+        self.__teardown = TeardownExecutor(max_workers=max_workers)
+        self.__cluster_resources = ClusterResources(self.__da.client)
         self.__unique_name: Optional[str] = None
 
     def reset_lesson(self) -> None:
@@ -27,9 +35,9 @@ class WorkspaceCleaner:
 
         if self.__da.lesson_config.enable_ml_support:
             status = self._drop_feature_store_tables(lesson_only=True) or status
-            status = self._cleanup_mlflow_endpoints(lesson_only=True) or status
-            status = self._cleanup_mlflow_models(lesson_only=True) or status
-            status = self._cleanup_experiments(lesson_only=True) or status
+            status = any(self.__teardown.run(lambda: self._cleanup_mlflow_endpoints(lesson_only=True),
+                                             lambda: self._cleanup_mlflow_models(lesson_only=True),
+                                             lambda: self._cleanup_experiments(lesson_only=True))) or status
 
         status = self._drop_catalog() or status
         status = self._drop_schema() or status
@@ -52,36 +60,30 @@ class WorkspaceCleaner:
 
         if self.__da.lesson_config.enable_ml_support:
             self._drop_feature_store_tables(lesson_only=False)
-            self._cleanup_mlflow_endpoints(lesson_only=False)
-            self._cleanup_mlflow_models(lesson_only=False)
-            self._cleanup_experiments(lesson_only=False)
+            self.__teardown.run(lambda: self._cleanup_mlflow_endpoints(lesson_only=False),
+                                lambda: self._cleanup_mlflow_models(lesson_only=False),
+                                lambda: self._cleanup_experiments(lesson_only=False))
 
-        self.__reset_databases()
+        self.__teardown.run(self.__reset_databases,
+                            self.__reset_datasets,
+                            self.__reset_archives,
+                            self.__drop_instance_pool,
+                            self.__drop_cluster_policies)
 
-        self.__reset_datasets()
-        self.__reset_archives()
+        # Always after the databases, removing the files that are not removed by sql-drop operations.
         self.__reset_working_dir()
 
-        self.__drop_instance_pool()
-        self.__drop_cluster_policies()
-
         print(f"| The learning environment was successfully reset {dbgems.clock_stopped(start)}.")
 
     def __drop_instance_pool(self):
 
-        for pool_name in dbh_constants.CLUSTERS_HELPER.POOLS:
-            pool = self.__da.client.instance_pools.get_by_name(pool_name)
-            if pool is not None:
-                print(f"| Dropping the instance pool \"{pool_name}\".")
-                self.__da.client.instance_pools.delete_by_name(pool_name)
+        for pool_name in self.__cluster_resources.delete_pools(dbh_constants.CLUSTERS_HELPER.POOLS):
+            print(f"| Dropped the instance pool \"{pool_name}\".")
 
     def __drop_cluster_policies(self):
 
-        for policy_name in dbh_constants.CLUSTERS_HELPER.POLICIES:
-            policy = self.__da.client.cluster_policies.get_by_name(policy_name)
-            if policy is not None:
-                print(f"| Dropping the cluster policy \"{policy_name}\".")
-                self.__da.client.cluster_policies.delete_by_name(policy_name)
+        for policy_name in self.__cluster_resources.delete_policies(dbh_constants.CLUSTERS_HELPER.POLICIES):
+            print(f"| Dropped the cluster policy \"{policy_name}\".")
 
     def __reset_working_dir(self) -> None:
         from dbacademy import dbgems
@@ -117,27 +119,33 @@ class WorkspaceCleaner:
         from dbacademy import dbgems
         from pyspark.sql.utils import AnalysisException
 
+        def drop_catalog(catalog_name: str) -> None:
+            print(f"Dropping the catalog \"{catalog_name}\"")
+            try:
+                dbgems.spark.sql(f"DROP CATALOG IF EXISTS {catalog_name} CASCADE")
+            except AnalysisException:
+                pass  # Ignore this concurrency error
+
+        def drop_schema(schema_name: str) -> None:
+            print(f"| Dropping the schema \"{schema_name}\"")
+            self._drop_database(schema_name)
+
         # Drop all user-specific catalogs
         catalog_names = self.__list_catalogs()
-        for catalog_name in catalog_names:
-            if catalog_name.startswith(self.__da.catalog_name_prefix):
-                print(f"Dropping the catalog \"{catalog_name}\"")
-                try:
-                    dbgems.spark.sql(f"DROP CATALOG IF EXISTS {catalog_name} CASCADE")
-                except AnalysisException:
-                    pass  # Ignore this concurrency error
+        self.__teardown.map(drop_catalog, [c for c in catalog_names if c.startswith(self.__da.catalog_name_prefix)])
 
         # Refresh the list of catalogs
         catalog_names = self.__list_catalogs()
+        schema_names = list()
         for catalog_name in catalog_names:
             # There are potentially two "default" catalogs from which we need to remove user-specific schemas
             if catalog_name in [dbh_constants.DBACADEMY_HELPER.CATALOG_SPARK_DEFAULT,
                                 dbh_constants.DBACADEMY_HELPER.CATALOG_UC_DEFAULT]:
-                schema_names = [d.databaseName for d in dbgems.spark.sql(f"SHOW DATABASES IN {catalog_name}").collect()]
-                for schema_name in schema_names:
-                    if schema_name.startswith(self.__da.schema_name_prefix) and schema_name != dbh_constants.DBACADEMY_HELPER.SCHEMA_DEFAULT:
-                        print(f"| Dropping the schema \"{catalog_name}.{schema_name}\"")
-                        self._drop_database(f"{catalog_name}.{schema_name}")
+                for d in dbgems.spark.sql(f"SHOW DATABASES IN {catalog_name}").collect():
+                    if d.databaseName.startswith(self.__da.schema_name_prefix) and d.databaseName != dbh_constants.DBACADEMY_HELPER.SCHEMA_DEFAULT:
+                        schema_names.append(f"{catalog_name}.{d.databaseName}")
+
+        self.__teardown.map(drop_schema, schema_names)
 
     @staticmethod
     def _drop_database(schema_name) -> None:
@@ -288,10 +296,9 @@ class WorkspaceCleaner:
         return True
 
     def _cleanup_mlflow_models(self, lesson_only: bool) -> bool:
-        import time
         from dbacademy import dbgems
 
-        models = []
+        models = dict()
         start = dbgems.clock_start()
 
         # Filter out the models that pertain to this course and user
@@ -300,10 +307,10 @@ class WorkspaceCleaner:
             name = model.get("name")
             for part in name.split("_"):
                 if lesson_only and unique_name == part:
-                    models.append(model)
+                    models[name] = model
                     # print(f"| Matched model \"{name}\" against \"{unique_name}\" ({lesson_only})")
                 elif part.startswith(unique_name):
-                    models.append(model)
+                    models[name] = model
                     # print(f"| Matched model \"{name}\" against \"{unique_name}\" ({lesson_only})")
 
         if len(models) == 0:
@@ -312,31 +319,28 @@ class WorkspaceCleaner:
         # Not our normal pattern, but the goal here is to report on ourselves only if models were found.
         print(f"| Enumerating MLflow models...{dbgems.clock_stopped(start)}")
         active_stages = ["production", "staging"]
+        versions_api = self.__da.client.ml.mlflow_model_versions
 
-        for model in models:
-            start = dbgems.clock_start()
-            name = model.get("name")
-            print(f"| Deleting model {name}", end="...")
-
-            for version in self.__da.client.ml.mlflow_model_versions.list(name):
-                v = version.get("version")
-                stage = version.get("current_stage").lower()
-                if stage in active_stages:
-                    print(f" archiving model v{v}", end="...")
-                    self.__da.client.ml.mlflow_model_versions.transition_stage(name, v, "archived")
-
-            all_archived = False
-            while not all_archived:
-                all_archived = True  # Assume True at start
-                for version in self.__da.client.ml.mlflow_model_versions.list(name):
-                    if version.get("current_stage").lower() in active_stages:
-                        all_archived = False
-                        v = version.get("version")
-                        print(f" waiting for v{v}", end="...")
-                        time.sleep(5)
+        def is_archived(name: str) -> bool:
+            return all(v.get("current_stage").lower() not in active_stages for v in versions_api.list(name))
+
+        def delete_model(name: str) -> None:
+            model_start = dbgems.clock_start()
+            archived = list()
+
+            for version in versions_api.list(name):
+                if version.get("current_stage").lower() in active_stages:
+                    archived.append(f"v{version.get('version')}")
+                    versions_api.transition_stage(name, version.get("version"), "archived")
+
+            if len(archived) > 0:
+                self.__teardown.wait_until(lambda: is_archived(name))
 
             self.__da.client.ml.mlflow_models.delete_by_name(name)
-            print(dbgems.clock_stopped(start))
+            archived_message = f" after archiving {', '.join(archived)}" if len(archived) > 0 else ""
+            print(f"| Deleted model {name}{archived_message}...{dbgems.clock_stopped(model_start)}")
+
+        self.__teardown.map(delete_model, models)
 
         return True
 
@@ -378,9 +382,11 @@ class WorkspaceCleaner:
         if len(endpoints) == 0:
             return False
 
-        for endpoint in endpoints:
-            name: str = endpoint.get("name")
+        def delete_endpoint(name: str) -> None:
             print(f"| Disabling serving endpoint \"{name}\"")
             self.__da.client.serving_endpoints.delete_by_name(name)
 
+        # An endpoint may match more than one of its name's parts
+        self.__teardown.map(delete_endpoint, dict.fromkeys(e.get("name") for e in endpoints))
+
         return True
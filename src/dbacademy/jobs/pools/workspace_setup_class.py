@@ -770,35 +770,24 @@ class WorkspaceSetup:
         job_id = trio.client.jobs.create_from_dict(config)
         return job_id
 
-    def __wait_for_job_run(self, trio: WorkspaceTrio, job_id: str, run_id: str):
-        import time
-
-        wait = 15
-        new_run = trio.client.runs.get(run_id)
+    @staticmethod
+    def __wait_for_job_run(trio: WorkspaceTrio, job_id: str, run_id: str):
+        while True:
+            new_run = next(trio.client.runs.wait_for_all([run_id]))
+            life_cycle_state = new_run.get("state", dict()).get("life_cycle_state")
 
-        life_cycle_state = new_run.get("state", dict()).get("life_cycle_state")
+            if life_cycle_state != "SKIPPED":
+                return new_run
 
-        if life_cycle_state == "SKIPPED":
             # For some reason, the job was aborted and then restarted.
             # Rather than simply reporting skipped, we want to get the
             # current run_id and resume monitoring from there.
-            runs = trio.client.runs.list_by_job_id(job_id)
-            for past_runs in runs:
-                life_cycle_state = past_runs.get("state", dict()).get("life_cycle_state")
-                if life_cycle_state == "RUNNING":
-                    return self.__wait_for_job_run(trio, job_id, past_runs.get("run_id"))
-
-            return new_run
-
-        elif life_cycle_state != "TERMINATED" and life_cycle_state != "INTERNAL_ERROR":
-            if life_cycle_state == "PENDING" or life_cycle_state == "RUNNING":
-                time.sleep(wait)
-            else:
-                time.sleep(5)
-
-            return self.__wait_for_job_run(trio, job_id, run_id)
+            running = [r for r in trio.client.runs.iter_runs(job_id=job_id, active_only=True)
+                       if r.get("state", dict()).get("life_cycle_state") == "RUNNING"]
+            if not running:
+                return new_run
 
-        return new_run
+            run_id = running[0].get("run_id")
 
     def __create_metastore(self, trio: WorkspaceTrio):
 
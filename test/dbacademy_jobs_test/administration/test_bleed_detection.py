@@ -0,0 +1,143 @@
+__all__ = ["WatchdogTests"]
+
+import io
+import sys
+import threading
+import unittest
+from typing import Any, Dict, List, Optional
+from dbacademy.clients import dbrest, ClientErrorHandler
+from dbacademy.clients.dbrest.accounts_client import AccountsClient
+from dbacademy_jobs.administration.bleed_detection import Watchdog, WorkspaceSnapshot
+
+WORKSPACE_ADMIN = "jacob.parr@databricks.com"
+
+
+class FakeAccountsClient(AccountsClient):
+    """Lists the specified workspaces."""
+
+    def __init__(self, workspace_names: List[str]):
+        super().__init__(endpoint="https://accounts.cloud.databricks.com",
+                         account_id="1234",
+                         username="unused",
+                         password="unused",
+                         verbose=False,
+                         throttle_seconds=0,
+                         error_handler=ClientErrorHandler())
+
+        self.workspace_names = workspace_names
+
+    def api(self, _http_method: str, _endpoint_path: str, _data: Optional[Dict[str, Any]] = None, **data: Any) -> Optional[Dict[str, Any]]:
+        if _endpoint_path.endswith("/workspaces"):
+            return [{"workspace_name": name} for name in self.workspace_names]
+
+        raise ValueError(f"Unexpected request: {_http_method} {_endpoint_path}")
+
+
+class FakeWorkspaceClient(dbrest.DBAcademyRestClient):
+    """Lists the specified users and nothing else, failing every request when the workspace is unreachable."""
+
+    def __init__(self, usernames: List[str], unreachable: bool = False):
+        super().__init__(token="unused",
+                         endpoint="https://example.cloud.databricks.com",
+                         username=None,
+                         password=None,
+                         authorization_header=None,
+                         client=None,
+                         verbose=False,
+                         throttle_seconds=0,
+                         error_handler=ClientErrorHandler())
+
+        self.lock = threading.Lock()
+        self.usernames = usernames
+        self.unreachable = unreachable
+        self.requests: List[str] = list()
+
+    def api(self, _http_method: str, _endpoint_path: str, _data: Optional[Dict[str, Any]] = None, **data: Any) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            self.requests.append(_endpoint_path)
+
+        if self.unreachable:
+            raise ConnectionError(f"Failed to connect to {_endpoint_path}")
+
+        elif _endpoint_path.endswith("/scim/v2/Users"):
+            return {"Resources": [{"userName": u} for u in self.usernames], "totalResults": len(self.usernames)}
+
+        return dict()
+
+
+class FakeWatchdog(Watchdog):
+
+    def __init__(self, clients: Dict[str, FakeWorkspaceClient]):
+        super().__init__(max_workers=2, accounts_client=FakeAccountsClient(list(clients)))
+        self.clients = clients
+
+    def create_client(self, workspace_name: str) -> dbrest.DBAcademyRestClient:
+        return self.clients[workspace_name]
+
+
+class WatchdogTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.watchdog = FakeWatchdog({
+            "clean": FakeWorkspaceClient([WORKSPACE_ADMIN]),
+            "rogue": FakeWorkspaceClient([WORKSPACE_ADMIN, "someone@example.com"]),
+            "broken": FakeWorkspaceClient([], unreachable=True),
+        })
+
+    def test_snapshot(self):
+        client = FakeWorkspaceClient([WORKSPACE_ADMIN])
+        snapshot = WorkspaceSnapshot(_workspace={"workspace_name": "trainers"}, _client=client)
+
+        self.assertEqual("training", snapshot.workspace_domain)
+        self.assertEqual("https://training.cloud.databricks.com", snapshot.workspace_endpoint)
+
+        # Each analyzer shares the workspace's users, fetched once
+        self.assertEqual([WORKSPACE_ADMIN], [u.get("userName") for u in snapshot.users])
+        self.assertEqual([WORKSPACE_ADMIN], [u.get("userName") for u in snapshot.users])
+        self.assertEqual(1, len(client.requests))
+
+        snapshot.log_error("Some error", ["LONG-RUNNING", "NODE-TYPE"], _scope="CLUSTERS")
+        snapshot.log_warning("Some warning")
+
+        self.assertEqual(["ERROR", "WARNING"], [r.result_type for r in snapshot.results])
+        self.assertEqual(["CLUSTERS-LONG-RUNNING", "CLUSTERS-NODE-TYPE"], snapshot.results[0].failures)
+        self.assertEqual("trainers", snapshot.results[0].workspace_name)
+
+    def test_scan(self):
+        snapshots = {s.workspace_name: s for s in self.watchdog.scan()}
+
+        # Every workspace is reported, including those without results
+        self.assertEqual(["broken", "clean", "rogue"], sorted(snapshots))
+        self.assertEqual([], snapshots.get("clean").results)
+        self.assertEqual([["USERS-NOT-DB"]], [r.failures for r in snapshots.get("rogue").results])
+
+        # The unreachable workspace is reported as failed without ending the scan
+        self.assertEqual([["WORKSPACE-FAILED"]], [r.failures for r in snapshots.get("broken").results])
+        self.assertIn("ConnectionError", snapshots.get("broken").results[0].message)
+
+        self.assertEqual(2, len(self.watchdog.results))
+
+    def test_scan_filter(self):
+        snapshots = list(self.watchdog.scan(workspace_filter=["clean"]))
+
+        self.assertEqual(["clean"], [s.workspace_name for s in snapshots])
+        self.assertEqual(0, len(self.watchdog.clients.get("rogue").requests))
+
+    def test_analyse(self):
+        stdout = sys.stdout
+        sys.stdout = io.StringIO()
+        try:
+            self.watchdog.analyse()
+            output = sys.stdout.getvalue()
+        finally:
+            sys.stdout = stdout
+
+        for workspace_name in ["broken", "clean", "rogue"]:
+            self.assertIn(f"* Processed workspace {workspace_name}\n", output)
+
+        self.assertIn("Unauthorized user: someone@example.com", output)
+        self.assertTrue(output.endswith("Processed 3 workspaces\n"), output)
+
+
+if __name__ == '__main__':
+    unittest.main()
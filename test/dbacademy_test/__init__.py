@@ -1,3 +1,5 @@
+import os
+import unittest
 from dbacademy import dbgems
 
 from dbacademy.dbgems.mock_dbutils_class import MockDBUtils
@@ -5,3 +7,7 @@ from dbacademy.dbgems.mock_spark_context_class import MockSparkContext
 
 dbgems.dbutils = MockDBUtils()
 dbgems.sc = MockSparkContext()
+
+# Set to run the benchmarks, which print their timings rather than asserting on them.
+DBACADEMY_BENCHMARKS = "DBACADEMY_BENCHMARKS"
+benchmark = unittest.skipUnless(os.environ.get(DBACADEMY_BENCHMARKS), f"Set {DBACADEMY_BENCHMARKS}=1 to run the benchmarks")
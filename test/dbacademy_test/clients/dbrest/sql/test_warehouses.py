@@ -0,0 +1,98 @@
+__all__ = ["UserWarehousesTests"]
+
+import threading
+import unittest
+from urllib.parse import urlparse
+from typing import Any, Dict, List
+
+from dbacademy.clients import dbrest, ClientErrorHandler
+
+
+class FakeWarehousesClient(dbrest.DBAcademyRestClient):
+    """Serves SCIM users and SQL warehouses from memory, recording every request."""
+
+    def __init__(self, users: int, warehouses: int):
+        super().__init__(token="unused", endpoint="https://example.cloud.databricks.com",
+                         username=None, password=None, authorization_header=None, client=None,
+                         verbose=False, throttle_seconds=0, error_handler=ClientErrorHandler())
+        self.all_users = [{"id": str(i), "userName": f"user-{i}@example.com", "active": True} for i in range(users)]
+        self.all_warehouses = [{"id": f"wh-{i}", "name": f"user-{i}'s warehouse"} for i in range(warehouses)]
+        self.requests: List[str] = list()
+        self.lock = threading.Lock()
+
+    def api(self, _http_method, _endpoint_path, _data=None, **data) -> Dict[str, Any]:
+        path = urlparse(_endpoint_path).path
+        with self.lock:
+            self.requests.append(f"{_http_method} {path}")
+
+        if path.endswith("/scim/v2/Users"):
+            start, count = int(data["startIndex"]), int(data["count"])
+            return {"totalResults": len(self.all_users), "Resources": self.all_users[start-1:start-1+count]}
+
+        elif _http_method == "GET" and path.endswith("/sql/warehouses"):
+            return {"warehouses": self.all_warehouses}
+
+        elif _http_method == "DELETE" or path.endswith("/start") or path.endswith("/stop"):
+            return dict()
+
+        raise ValueError(f"Unexpected request: {_http_method} {_endpoint_path}")
+
+
+class UserWarehousesTests(unittest.TestCase):
+
+    naming_template = "{da_name}'s warehouse"
+
+    def test_start_user_endpoints(self):
+        client = FakeWarehousesClient(users=50, warehouses=40)
+
+        report = client.sql.warehouses.start_user_endpoints(self.naming_template, dict(), max_workers=4)
+
+        self.assertEqual(50, len(report))
+        self.assertEqual("started", report.get("user-0@example.com"))
+        self.assertEqual("not found", report.get("user-49@example.com"))
+        self.assertEqual(40, list(report.values()).count("started"))
+
+        # Users and warehouses are each listed once, not once per user.
+        self.assertEqual(1, client.requests.count("GET /api/2.0/sql/warehouses"))
+        self.assertEqual(1, client.requests.count("GET /api/2.0/preview/scim/v2/Users"))
+        self.assertEqual(40, len([r for r in client.requests if r.endswith("/start")]))
+
+    def test_stop_and_delete_user_endpoints(self):
+        client = FakeWarehousesClient(users=5, warehouses=5)
+
+        report = client.sql.warehouses.stop_user_endpoints(self.naming_template, dict(), users=["user-1@example.com", "3"])
+        self.assertEqual({"user-1@example.com": "stopped", "user-3@example.com": "stopped"}, report)
+
+        report = client.sql.warehouses.delete_user_endpoints(self.naming_template, dict(), users=client.all_users[:2])
+        self.assertEqual({"user-0@example.com": "deleted", "user-1@example.com": "deleted"}, report)
+
+    def test_create_user_endpoints(self):
+        client = FakeWarehousesClient(users=3, warehouses=2)
+        client.all_users[2]["active"] = False
+
+        report = client.sql.warehouses.create_user_endpoints(self.naming_template, dict(), cluster_size="2X-Small", enable_serverless_compute=True)
+        self.assertEqual({"user-0@example.com": "exists", "user-1@example.com": "exists", "user-2@example.com": "inactive"}, report)
+
+    def test_failures_are_raised(self):
+        client = FakeWarehousesClient(users=3, warehouses=3)
+        template = "{da_name}'s warehouse{suffix}"
+
+        # Only user-1's name cannot be formatted, the other users are processed regardless
+        def to_endpoint_name(user, naming_template, naming_params):
+            if user.get("userName") == "user-1@example.com":
+                raise ValueError("Cannot name the warehouse")
+            return naming_template.format(da_name=user.get("userName").split("@")[0], **naming_params)
+
+        warehouses = client.sql.warehouses
+        warehouses.to_endpoint_name = to_endpoint_name
+
+        with self.assertRaises(Exception) as e:
+            warehouses.start_user_endpoints(template, dict(suffix=""))
+
+        self.assertIn("Failed for 1 of 3 users: ['user-1@example.com']", str(e.exception))
+        self.assertIsInstance(e.exception.__cause__, ValueError)
+        self.assertEqual(2, len([r for r in client.requests if r.endswith("/start")]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+__all__ = ["TestWaitForAll"]
+
+import time
+import unittest
+from unittest import mock
+from urllib.parse import urlparse, parse_qs
+from typing import Any, Dict, List
+
+from dbacademy.clients import dbrest, ClientErrorHandler
+
+
+class FakeRunsClient(dbrest.DBAcademyRestClient):
+    """Serves runs/get and runs/list from memory, each run terminating at its own point in time.monotonic()."""
+
+    def __init__(self, durations: Dict[int, float]):
+        super().__init__(token="unused", endpoint="https://example.cloud.databricks.com",
+                         username=None, password=None, authorization_header=None, client=None,
+                         verbose=False, throttle_seconds=0, error_handler=ClientErrorHandler())
+        self.finish_times = {run_id: time.monotonic() + duration for run_id, duration in durations.items()}
+        self.paths: List[str] = list()
+
+    def to_run(self, run_id: int) -> Dict[str, Any]:
+        done = time.monotonic() >= self.finish_times[run_id]
+        state = {"life_cycle_state": "TERMINATED", "result_state": "SUCCESS"} if done else {"life_cycle_state": "RUNNING"}
+        return {"run_id": run_id, "job_id": 1, "state": state}
+
+    def api(self, _http_method, _endpoint_path, _data=None, **data):
+        params = {k: v[0] for k, v in parse_qs(urlparse(_endpoint_path).query).items()}
+        path = urlparse(_endpoint_path).path
+        self.paths.append(path)
+
+        if path.endswith("/jobs/runs/get"):
+            return self.to_run(int(params["run_id"]))
+
+        elif path.endswith("/jobs/runs/list"):
+            runs = [self.to_run(r) for r in self.finish_times]
+            if params.get("active_only") == "true":
+                runs = [r for r in runs if r["state"]["life_cycle_state"] != "TERMINATED"]
+            offset, limit = int(params["offset"]), int(params["limit"])
+            return {"runs": runs[offset:offset+limit], "has_more": offset + limit < len(runs)}
+
+        raise ValueError(f"Unexpected request: {_endpoint_path}")
+
+
+class TestWaitForAll(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # A fake clock that only advances when sleeping, so that the polling rounds are exact
+        self.clock = 0.0
+        self.sleeps: List[float] = list()
+
+        def sleep(seconds: float) -> None:
+            self.sleeps.append(seconds)
+            self.clock += seconds
+
+        patchers = [mock.patch("time.monotonic", lambda: self.clock), mock.patch("time.sleep", sleep)]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_wait_for_all(self):
+        durations = {run_id: float(run_id % 4) for run_id in range(200)}
+        client = FakeRunsClient(durations)
+
+        responses = list(client.runs.wait_for_all(durations.keys(), min_interval=0.125, max_interval=0.5, backoff=2, jitter=0))
+
+        self.assertEqual(set(durations.keys()), {r["run_id"] for r in responses})
+        self.assertTrue(all(r["state"]["life_cycle_state"] == "TERMINATED" for r in responses))
+
+        # Completions are yielded in the order in which they happen
+        order = [durations[r["run_id"]] for r in responses]
+        self.assertEqual(sorted(order), order)
+
+        # The interval backs off up to max_interval and is reset by each round with completions, at 0, 1, 2 and 3 seconds
+        self.assertEqual([0.125, 0.25, 0.5, 0.5, 0.125, 0.25, 0.5, 0.125, 0.25, 0.5], self.sleeps)
+
+        # Each run is fetched once, when it completes, plus one listing of the active runs per polling round
+        self.assertEqual(200, client.paths.count("/api/2.0/jobs/runs/get"))
+        self.assertEqual(11, client.paths.count("/api/2.0/jobs/runs/list"))
+
+    def test_wait_for_few(self):
+        client = FakeRunsClient({1: 0, 2: 0.25})
+
+        responses = list(client.runs.wait_for_all(["2", 1], min_interval=0.125, jitter=0))
+        self.assertEqual([1, 2], [r["run_id"] for r in responses])
+        self.assertNotIn("/api/2.0/jobs/runs/list", client.paths)
+        self.assertEqual([0.125, 0.1875], self.sleeps)
+
+    def test_timeout(self):
+        client = FakeRunsClient({1: 0, 2: 60})
+
+        iterator = client.runs.wait_for_all([1, 2], timeout=1, min_interval=0.25, jitter=0)
+        self.assertEqual(1, next(iterator)["run_id"])
+        self.assertRaises(TimeoutError, next, iterator)
+
+        # The last interval is shortened so that the timeout is not overshot
+        self.assertEqual([0.25, 0.375, 0.375], self.sleeps)
+        self.assertEqual(1.0, self.clock)
+
+    def test_wait_for(self):
+        client = FakeRunsClient({7: 0})
+        self.assertEqual("TERMINATED", client.runs.wait_for(7)["state"]["life_cycle_state"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+__all__ = ["WorkspaceCopierTests"]
+
+import base64
+import json
+import threading
+import time
+import unittest
+from typing import Any, Dict, List
+from dbacademy.clients.rest.common import DatabricksApiException
+from dbacademy.clients.dougrest.workspace import Workspace
+from dbacademy.clients.dougrest.workspace_copier import CopyPlan
+
+
+class FakeConnection:
+    """
+    A workspace holding the given notebooks, whose export fails for trees of more than export_limit notebooks. Archives
+    are counted as buffered from their export from a source connection to their import into its target.
+    """
+
+    lock = threading.Lock()
+    buffered = 0
+    max_buffered = 0
+
+    def __init__(self, notebooks: List[str] = None, export_limit: int = 1000):
+        self.notebooks = set(notebooks or list())
+        self.directories = {"/"}
+        self.export_limit = export_limit
+        self.exports: List[str] = list()
+        self.workspace = Workspace(self)
+
+        for notebook in self.notebooks:
+            parts = notebook.split("/")
+            self.directories.update("/".join(parts[:i]) for i in range(2, len(parts)))
+
+    def under(self, path: str) -> List[str]:
+        return sorted(n for n in self.notebooks if n == path or n.startswith(path.rstrip("/") + "/"))
+
+    def api(self, _http_method: str, _endpoint_path: str, _data: Dict[str, Any] = None, **data: Any) -> Any:
+        path = _data.get("path")
+
+        if _endpoint_path.endswith("/list"):
+            if path in self.notebooks:
+                return {"objects": [{"path": path, "object_type": "NOTEBOOK"}]}
+            children = {c for c in self.notebooks | self.directories if c != "/" and c.rsplit("/", 1)[0] == path.rstrip("/")}
+            return {"objects": [{"path": c, "object_type": "DIRECTORY" if c in self.directories else "NOTEBOOK"} for c in children]}
+
+        elif _endpoint_path.endswith("/export"):
+            with self.lock:
+                self.exports.append(path)
+                FakeConnection.buffered += 1
+                FakeConnection.max_buffered = max(FakeConnection.max_buffered, FakeConnection.buffered)
+
+            notebooks = self.under(path)
+            if len(notebooks) > self.export_limit:
+                raise DatabricksApiException("BAD_REQUEST: Subtree size exceeds the limit", 400)
+
+            time.sleep(0.01)
+            prefix_len = len(path.rstrip("/"))
+            return json.dumps([n[prefix_len:] for n in notebooks]).encode("utf-8")
+
+        elif _endpoint_path.endswith("/import"):
+            time.sleep(0.01)
+            relative_paths = json.loads(base64.b64decode(_data.get("content")))
+            with self.lock:
+                self.notebooks.update(path + p for p in relative_paths)
+                FakeConnection.buffered -= 1
+
+        elif _endpoint_path.endswith("/mkdirs"):
+            with self.lock:
+                self.directories.add(path)
+
+
+class WorkspaceCopierTests(unittest.TestCase):
+
+    NOTEBOOKS = [f"/Course/Lesson-{i}/Notebook-{j}" for i in range(6) for j in range(5)] + ["/Course/Readme", "/Other/Notebook"]
+
+    def test_copy(self):
+        FakeConnection.max_buffered = 0
+        source = FakeConnection(self.NOTEBOOKS, export_limit=12)
+        target = FakeConnection()
+        plan = CopyPlan()
+
+        source.workspace.copy("/Course", "/Copy", target_connection=target, max_workers=4, buffer_size=2, max_items=20, plan=plan)
+
+        self.assertEqual([n.replace("/Course", "/Copy") for n in source.under("/Course")], target.under("/Copy"))
+        self.assertLessEqual(FakeConnection.max_buffered, 2)
+
+        # The course's 31 notebooks are split by the listing, its lessons exported whole
+        self.assertEqual(0, len(plan))
+        self.assertEqual(7, len(source.exports))
+
+    def test_copy_oversized(self):
+        source = FakeConnection(self.NOTEBOOKS, export_limit=3)
+        plan = CopyPlan()
+
+        for target in [FakeConnection(), FakeConnection()]:
+            source.exports.clear()
+            source.workspace.copy("/Course/", "/Copy/", target_connection=target, exclude={"/Course/Readme"}, max_items=20, plan=plan)
+            self.assertEqual([n.replace("/Course", "/Copy") for n in source.under("/Course") if n != "/Course/Readme"], target.under("/Copy"))
+
+        # The failed exports of the lessons are not attempted for the second workspace
+        self.assertEqual([f"/Course/Lesson-{i}" for i in range(6)], list(plan))
+        self.assertEqual(30, len(source.exports))
+
+    def test_copy_file(self):
+        source = FakeConnection(self.NOTEBOOKS, export_limit=0)
+        target = FakeConnection()
+
+        with self.assertRaises(DatabricksApiException):
+            source.workspace.copy("/Other/Notebook", "/Copy", target_connection=target, plan=CopyPlan())
+
+        source.export_limit = 1
+        source.workspace.copy("/Other/Notebook", "/Copy", target_connection=target, plan=CopyPlan())
+        self.assertEqual(["/Copy"], target.under("/Copy"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+__all__ = ["WorkspaceWalkerTests"]
+
+import threading
+import time
+import unittest
+from typing import Any, Dict, List
+from dbacademy.clients.dougrest.workspace import Workspace
+from dbacademy.clients.dougrest.workspace_walker import ListingSnapshot
+
+
+class FakeConnection:
+    """A workspace holding the given notebooks, each listing taking delay_seconds."""
+
+    def __init__(self, notebooks: List[str], delay_seconds: float = 0.0):
+        self.lock = threading.Lock()
+        self.delay_seconds = delay_seconds
+        self.listings = 0
+        self.active = 0
+        self.max_active = 0
+        self.objects: Dict[str, Dict[str, Any]] = dict()
+        self.workspace = Workspace(self)
+
+        for notebook in notebooks:
+            parts = notebook.split("/")
+            for i in range(2, len(parts)):
+                self.objects["/".join(parts[:i])] = {"path": "/".join(parts[:i]), "object_type": "DIRECTORY"}
+            self.objects[notebook] = {"path": notebook, "object_type": "NOTEBOOK", "language": "PYTHON"}
+
+    def api(self, _http_method: str, _endpoint_path: str, _data: Dict[str, Any] = None, **data: Any) -> Any:
+        with self.lock:
+            self.listings += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+        time.sleep(self.delay_seconds)
+
+        with self.lock:
+            self.active -= 1
+
+        path = _data.get("path").rstrip("/")
+        children = [o for p, o in self.objects.items() if p.rsplit("/", 1)[0] == path]
+        return {"objects": list(reversed(children))}
+
+
+class WorkspaceWalkerTests(unittest.TestCase):
+
+    NOTEBOOKS = [f"/Course/Lesson-{i}/Part-{j}/Notebook-{k}" for i in range(4) for j in range(3) for k in range(2)]
+
+    @staticmethod
+    def sequential_walk(workspace: Workspace, path: str) -> List[str]:
+        paths = list()
+        for f in workspace.list(path):
+            paths.append(f["path"])
+            if f["object_type"] == "DIRECTORY":
+                paths.extend(WorkspaceWalkerTests.sequential_walk(workspace, f["path"]))
+        return paths
+
+    def test_walk(self):
+        connection = FakeConnection(self.NOTEBOOKS, delay_seconds=0.02)
+
+        expected = self.sequential_walk(connection.workspace, "/Course")
+        connection.listings = 0
+
+        actual = [f["path"] for f in connection.workspace.walk("/Course", max_workers=4)]
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(1 + 4 + 12, connection.listings)
+        self.assertGreater(connection.max_active, 1)
+        self.assertLessEqual(connection.max_active, 4)
+
+        # Sorting applies to every directory
+        descending = [f["path"] for f in connection.workspace.walk("/Course", sort_key=lambda f: -int(f["path"][-1]))]
+        self.assertEqual("/Course/Lesson-3", descending[0])
+        self.assertEqual("/Course/Lesson-3/Part-2", descending[1])
+
+    def test_walk_closed(self):
+        connection = FakeConnection(self.NOTEBOOKS, delay_seconds=0.02)
+
+        walk = connection.workspace.walk("/Course", max_workers=2)
+        self.assertEqual("/Course/Lesson-0", next(walk)["path"])
+        walk.close()
+
+        time.sleep(0.1)
+        self.assertLess(connection.listings, 1 + 4 + 12)
+
+    def test_compare(self):
+        source = FakeConnection(self.NOTEBOOKS)
+        target = FakeConnection([n.replace("/Course", "/Copy") for n in self.NOTEBOOKS if "Lesson-3" not in n] + ["/Copy/Extra/Notebook"])
+        target.objects["/Copy/Lesson-0/Part-0/Notebook-0"]["language"] = "SQL"
+
+        snapshot = ListingSnapshot()
+        for _ in range(2):
+            differences = list(source.workspace.compare("/Course", "/Copy", target, source_snapshot=snapshot))
+
+            only_in_source = [s["path"] for s, t in differences if t is None]
+            only_in_target = [t["path"] for s, t in differences if s is None]
+            mismatched = [s["path"] for s, t in differences if s is not None and t is not None]
+
+            self.assertEqual(1 + 3 + 6, len(only_in_source))
+            self.assertEqual(["/Copy/Extra", "/Copy/Extra/Notebook"], only_in_target)
+            self.assertEqual(["/Course/Lesson-0/Part-0/Notebook-0"], mismatched)
+
+        # The second comparison read the source's listings from the snapshot
+        self.assertEqual(1 + 4 + 12, source.listings)
+        self.assertEqual(1 + 4 + 12, len(snapshot))
+
+        snapshot.invalidate("/Course/Lesson-1")
+        self.assertEqual(1 + 3 + 9, len(snapshot))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import time
+import asyncio
+import unittest
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from dbacademy.clients import dbrest
+from dbacademy.clients.rest.common import ApiContainer
+from dbacademy.clients.rest.async_client import AsyncApiClient, AsyncApi
+
+
+class CountingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+
+    def do_GET(self):
+        with CountingHandler.lock:
+            CountingHandler.in_flight += 1
+            CountingHandler.max_in_flight = max(CountingHandler.max_in_flight, CountingHandler.in_flight)
+
+        time.sleep(0.01)
+        body = b'{"objects": [{"path": "/Users", "object_type": "DIRECTORY"}]}'
+
+        with CountingHandler.lock:
+            CountingHandler.in_flight -= 1
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    # noinspection PyShadowingBuiltins
+    def log_message(self, format, *args):
+        pass
+
+
+class TestAsyncApiClient(unittest.TestCase):
+
+    def setUp(self) -> None:
+        CountingHandler.max_in_flight = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), CountingHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.client = dbrest.from_args(endpoint=f"http://127.0.0.1:{self.server.server_port}", token="unused")
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_defaults(self):
+        with AsyncApiClient(self.client) as client:
+            self.assertIs(self.client, client.sync)
+            self.assertEqual(self.client.transport.pool_maxsize, client.max_concurrency)
+            self.assertEqual(self.client.endpoint, client.endpoint)
+            self.assertIs(client, client())
+
+    def test_sub_apis(self):
+        with AsyncApiClient(self.client) as client:
+            self.assertIsInstance(client.workspace, AsyncApi)
+            self.assertIsInstance(client.sql.warehouses, AsyncApi)
+            self.assertIsInstance(client.scim.users, AsyncApi)
+
+            results = client.run(client.workspace.ls("/"))
+            self.assertEqual([{"path": "/Users", "object_type": "DIRECTORY"}], results)
+
+    def test_api(self):
+        with AsyncApiClient(self.client) as client:
+            result = client.run(client.api("GET", "/api/2.0/workspace/list", path="/"))
+            self.assertEqual("/Users", result["objects"][0]["path"])
+
+    def test_bounded_concurrency(self):
+        async def list_all(client: AsyncApiClient):
+            return await client.map(lambda path: client.workspace.ls(path), [f"/Users/{i}" for i in range(100)])
+
+        with AsyncApiClient(self.client, max_concurrency=4) as client:
+            results = client.run(list_all(client))
+
+        self.assertEqual(100, len(results))
+        self.assertLessEqual(CountingHandler.max_in_flight, 4)
+
+    def test_generators(self):
+        class Numbers(ApiContainer):
+            # noinspection PyMethodMayBeStatic
+            def count(self, limit: int):
+                yield from range(limit)
+
+        async def collect(numbers: AsyncApi):
+            return [n async for n in numbers.count(5)]
+
+        with AsyncApiClient(self.client) as client:
+            self.assertEqual([0, 1, 2, 3, 4], client.run(collect(client.wrap(Numbers()))))
+
+    def test_run_inside_running_loop(self):
+        with AsyncApiClient(self.client) as client:
+            async def outer():
+                # Simulates a notebook cell, which already has a running event loop.
+                return client.run(client.api("GET", "/api/2.0/workspace/list", path="/"))
+
+            self.assertIn("objects", asyncio.run(outer()))
+
+
+if __name__ == '__main__':
+    unittest.main()
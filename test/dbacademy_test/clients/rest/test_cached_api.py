@@ -0,0 +1,139 @@
+__all__ = ["CachedApiTests"]
+
+import threading
+import timeit
+import unittest
+from typing import List
+from dbacademy.clients import dbrest, ClientErrorHandler
+from dbacademy.clients.rest.common import ApiContainer, cached_api
+from dbacademy.clients.rest.crud import CRUD
+from dbacademy_test import benchmark
+
+
+def create_client() -> dbrest.DBAcademyRestClient:
+    return dbrest.DBAcademyRestClient(token="unused",
+                                      endpoint="https://example.cloud.databricks.com",
+                                      username=None,
+                                      password=None,
+                                      authorization_header=None,
+                                      client=None,
+                                      verbose=False,
+                                      throttle_seconds=0,
+                                      error_handler=ClientErrorHandler())
+
+
+class SlowContainer(ApiContainer):
+    """Counts the sub-APIs it creates, taking long enough to create each that racing threads overlap."""
+
+    def __init__(self):
+        self.created = 0
+
+    @cached_api
+    def child(self) -> List[int]:
+        """The child sub-API."""
+        import time
+
+        time.sleep(0.05)
+        self.created += 1
+        return [self.created]
+
+
+class WidgetsCRUD(CRUD):
+
+    def __init__(self, client):
+        super().__init__(client, "/api/2.0/widgets", "widget")
+
+    def _list(self, *, _expected=None):
+        return []
+
+    def _get(self, item_id, *, _expected=None):
+        return {self.id_key: item_id}
+
+    def _create(self, item, *, _expected=None):
+        return item
+
+    def _update(self, item, *, _expected=None):
+        return item
+
+    def _delete(self, item_id, *, _expected=None):
+        pass
+
+
+class GadgetsCRUD(WidgetsCRUD):
+
+    def __init__(self, client):
+        CRUD.__init__(self, client, "/api/2.0/gadgets", "gadget", plural="gadgetry")
+
+
+class CachedApiTests(unittest.TestCase):
+
+    def test_identity(self):
+        client = create_client()
+
+        self.assertIs(client.clusters, client.clusters)
+        self.assertIs(client.scim.users, client.scim.users)
+        self.assertIs(client.permissions.clusters, client.permissions.clusters)
+
+        # Each client holds its own sub-APIs
+        self.assertIsNot(client.clusters, create_client().clusters)
+
+        # The descriptor itself is returned when accessed on the class
+        self.assertIsInstance(dbrest.DBAcademyRestClient.clusters, cached_api)
+
+    def test_concurrent_first_access(self):
+        container = SlowContainer()
+        barrier = threading.Barrier(8)
+        results = []
+
+        def access():
+            barrier.wait()
+            results.append(container.child)
+
+        threads = [threading.Thread(target=access) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(1, container.created)
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual("The child sub-API.", SlowContainer.child.__doc__)
+
+    def test_attribute_chain(self):
+        client = create_client()
+        users = client.scim.users
+
+        # Once created, the sub-APIs are plain instance attributes, bypassing the descriptor on later accesses
+        self.assertIs(client.scim, client.__dict__.get("scim"))
+        self.assertIs(users, client.scim.__dict__.get("users"))
+
+    @benchmark
+    def test_benchmark(self):
+        client = create_client()
+        client.scim.users
+
+        cached = min(timeit.repeat(lambda: client.scim.users, number=1000, repeat=5))
+        uncached = min(timeit.repeat(lambda: dbrest.scim_api.ScimApi(client).users, number=1000, repeat=5))
+
+        # Creating the chain on each access validates and constructs two objects, the cache costs two lookups
+        print(f"\nclient.scim.users: {cached * 1000:.3f} µs cached, {uncached * 1000:.3f} µs constructed")
+
+    def test_crud_docstrings(self):
+        client = create_client()
+
+        widgets = WidgetsCRUD(client)
+        gadgets = GadgetsCRUD(client)
+        WidgetsCRUD(client)
+
+        self.assertIn("Fetch the widget with `widget_id`=`item_id`", WidgetsCRUD.get_by_id.__doc__)
+        self.assertIn("Fetch the gadget with `gadget_id`=`item_id`", GadgetsCRUD.get_by_id.__doc__)
+        self.assertIn("Returns a list of all gadgetry.", GadgetsCRUD.list.__doc__)
+
+        # The base class keeps its templates, and the copies behave like the originals
+        self.assertIn("{singular}", CRUD.get_by_id.__doc__)
+        self.assertEqual([], widgets.list())
+        self.assertEqual({"gadget_id": 1}, gadgets.get_by_id(1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import unittest
+from urllib.parse import urlparse, parse_qs
+from typing import Any, Dict, List
+
+from dbacademy.clients import dbrest, ClientErrorHandler
+from dbacademy.clients.rest.pagination import paginate
+
+
+class FakeClient(dbrest.DBAcademyRestClient):
+    """Serves SCIM users, runs and jobs from memory, recording every request."""
+
+    def __init__(self, *, users: int = 0, runs: int = 0, jobs: int = 0):
+        super().__init__(token="unused", endpoint="https://example.cloud.databricks.com",
+                         username=None, password=None, authorization_header=None, client=None,
+                         verbose=False, throttle_seconds=0, error_handler=ClientErrorHandler())
+        self.all_users = [{"id": str(i), "userName": f"user-{i}@example.com"} for i in range(users)]
+        self.all_runs = [{"run_id": i, "job_id": i % 2} for i in range(runs)]
+        self.all_jobs = [{"job_id": i} for i in range(jobs)]
+        self.requests: List[Dict[str, Any]] = list()
+
+    def api(self, _http_method, _endpoint_path, _data=None, **data):
+        params = {k: v[0] for k, v in parse_qs(urlparse(_endpoint_path).query).items()}
+        params.update(data)
+        self.requests.append(params)
+        path = urlparse(_endpoint_path).path
+
+        if path.endswith("/scim/v2/Users"):
+            start, count = int(params["startIndex"]), int(params["count"])
+            return {"totalResults": len(self.all_users), "Resources": self.all_users[start-1:start-1+count]}
+
+        elif path.endswith("/jobs/runs/list"):
+            runs = [r for r in self.all_runs if "job_id" not in params or r["job_id"] == int(params["job_id"])]
+            offset, limit = int(params["offset"]), int(params["limit"])
+            return {"runs": runs[offset:offset+limit], "has_more": offset + limit < len(runs)}
+
+        elif path.endswith("/jobs/list"):
+            offset, limit = int(params.get("page_token", 0)), int(params["limit"])
+            has_more = offset + limit < len(self.all_jobs)
+            response = {"jobs": self.all_jobs[offset:offset+limit], "has_more": has_more}
+            if has_more:
+                response["next_page_token"] = str(offset + limit)
+            return response
+
+        raise ValueError(f"Unexpected request: {_endpoint_path}")
+
+
+class TestPaginate(unittest.TestCase):
+
+    @staticmethod
+    def fetch_page(offset: int):
+        items = list(range(offset, min(offset + 3, 10)))
+        return items, (offset + 3 if offset + 3 < 10 else None)
+
+    def test_paginate(self):
+        self.assertEqual(list(range(10)), list(paginate(self.fetch_page, 0)))
+
+    def test_prefetch(self):
+        self.assertEqual(list(range(10)), list(paginate(self.fetch_page, 0, prefetch=True)))
+
+    def test_early_exit(self):
+        pages = list()
+
+        def fetch_page(offset: int):
+            pages.append(offset)
+            return self.fetch_page(offset)
+
+        for item in paginate(fetch_page, 0):
+            if item == 1:
+                break
+
+        self.assertEqual([0], pages)
+
+        iterator = paginate(fetch_page, 0, prefetch=True)
+        self.assertEqual(0, next(iterator))
+        iterator.close()
+
+
+class TestPaginatedApis(unittest.TestCase):
+
+    def test_scim_users(self):
+        client = FakeClient(users=25)
+
+        users = client.scim.users.list(users_per_request=10)
+        self.assertEqual(25, len(users))
+        self.assertEqual("user-24@example.com", users[-1]["userName"])
+        self.assertEqual([1, 11, 21], [r["startIndex"] for r in client.requests])  # No trailing, empty request
+
+        self.assertEqual(25, len(list(client.scim.users.iter_users(page_size=7, prefetch=True))))
+        self.assertEqual(5, len(list(client.scim.users.iter_users(start_index=21))))
+
+    def test_scim_no_users(self):
+        client = FakeClient(users=0)
+        self.assertEqual([], client.scim.users.list())
+        self.assertEqual(1, len(client.requests))
+
+    def test_runs(self):
+        client = FakeClient(runs=2500)
+
+        self.assertEqual(2500, len(client.runs.list()))
+        self.assertEqual(3, len(client.requests))
+
+        runs = list(client.runs.iter_runs(job_id=1, page_size=100, prefetch=True))
+        self.assertEqual(1250, len(runs))
+        self.assertTrue(all(r["job_id"] == 1 for r in runs))
+
+        self.assertEqual(1250, len(client.runs.list_by_job_id(0)))
+
+    def test_jobs(self):
+        client = FakeClient(jobs=250)
+
+        self.assertEqual(250, len(client.jobs.list()))
+        self.assertEqual(3, len(client.requests))
+
+        self.assertEqual(list(range(250)), [j["job_id"] for j in client.jobs.iter_jobs(limit=30, prefetch=True)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,204 @@
+import time
+import unittest
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from dbacademy.clients.rest.common import ApiClient, DatabricksApiException
+from dbacademy.clients.rest.rate_limiter import RateLimiter, TokenBucket, endpoint_family, parse_retry_after
+
+
+class RateLimitedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    rejections = 0
+
+    def do_GET(self):
+        if RateLimitedHandler.rejections > 0:
+            RateLimitedHandler.rejections -= 1
+            self.send_reply(429, b'{"error_code": "REQUEST_LIMIT_EXCEEDED"}', {"Retry-After": "0.2"})
+        else:
+            self.send_reply(200, b'{"status": "ok"}', {})
+
+    def send_reply(self, status_code, body, headers):
+        self.send_response(status_code)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    # noinspection PyShadowingBuiltins
+    def log_message(self, format, *args):
+        pass
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_endpoint_family(self):
+        self.assertEqual("scim", endpoint_family("https://example.com/api/2.0/preview/scim/v2/Users"))
+        self.assertEqual("jobs", endpoint_family("https://example.com/api/2.1/jobs/runs/list"))
+        self.assertEqual("workspace", endpoint_family("https://example.com/api/2.0/workspace/list"))
+        self.assertEqual("sql", endpoint_family("https://example.com/api/2.0/sql/warehouses"))
+        self.assertEqual("default", endpoint_family("https://example.com/v0/some-table"))
+
+    def test_parse_retry_after(self):
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after(""))
+        self.assertIsNone(parse_retry_after("not-a-date"))
+        self.assertEqual(3.0, parse_retry_after("3"))
+        self.assertEqual(0.5, parse_retry_after("0.5"))
+        self.assertEqual(0.0, parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"))
+
+    def test_bucket_rate(self):
+        bucket = TokenBucket(rate=20, capacity=1)
+
+        start = time.monotonic()
+        for _ in range(5):
+            bucket.acquire()
+        elapsed = time.monotonic() - start
+
+        # The first token is free, the next four cost 1/20th of a second each.
+        self.assertGreaterEqual(elapsed, 0.15)
+
+    def test_bucket_adapts(self):
+        bucket = TokenBucket(rate=10, min_rate=2, max_rate=12, increase_step=1)
+
+        bucket.on_throttled()
+        self.assertEqual(5, bucket.rate)
+        self.assertEqual(1, bucket.throttled)
+
+        bucket.on_throttled()
+        bucket.on_throttled()
+        self.assertEqual(2, bucket.rate)
+
+        for _ in range(20):
+            bucket.on_success()
+        self.assertEqual(12, bucket.rate)
+
+    def test_bucket_not_adaptive(self):
+        bucket = TokenBucket(rate=10, adaptive=False)
+        bucket.on_throttled()
+        bucket.on_success()
+        self.assertEqual(10, bucket.rate)
+
+    def test_bucket_retry_after(self):
+        bucket = TokenBucket(rate=100)
+        bucket.on_throttled(retry_after=0.3)
+
+        self.assertGreater(bucket.metrics()["paused_seconds"], 0)
+        self.assertGreaterEqual(bucket.acquire(), 0.25)
+
+    def test_queue_depth(self):
+        bucket = TokenBucket(rate=1, capacity=1)
+        bucket.acquire()
+
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+
+        self.assertEqual(3, bucket.waiting)
+        self.assertEqual(3, bucket.metrics()["waiting"])
+
+        bucket.on_throttled()  # Wakes everyone; they go back to waiting at the lower rate
+        for thread in threads:
+            thread.join()
+        self.assertEqual(0, bucket.waiting)
+
+    def test_buckets_per_host_and_family(self):
+        limiter = RateLimiter(rate=10, family_rates={"scim": 2})
+
+        scim = limiter.bucket("https://a.example.com/api/2.0/preview/scim/v2/Users")
+        self.assertIs(scim, limiter.bucket("https://a.example.com/api/2.0/preview/scim/v2/Groups"))
+        self.assertIsNot(scim, limiter.bucket("https://b.example.com/api/2.0/preview/scim/v2/Users"))
+        self.assertEqual(2, scim.rate)
+
+        jobs = limiter.bucket("https://a.example.com/api/2.1/jobs/list")
+        self.assertEqual(10, jobs.rate)
+
+        metrics = limiter.metrics()
+        self.assertEqual({"a.example.com/scim", "b.example.com/scim", "a.example.com/jobs"}, set(metrics))
+        self.assertEqual(2, metrics["a.example.com/scim"]["rate"])
+
+    def test_client_limiters(self):
+        self.assertIsNone(ApiClient("https://example.com").rate_limiter)
+        self.assertIs(RateLimiter.shared(), ApiClient("https://example.com", rate_limiter=RateLimiter.shared()).rate_limiter)
+
+        limiter = RateLimiter()
+        parent = ApiClient("https://example.com", rate_limiter=limiter)
+        self.assertIs(limiter, ApiClient("api/2.0", client=parent).rate_limiter)
+
+        throttled = ApiClient("https://example.com", throttle_seconds=2)
+        self.assertIsNot(RateLimiter.shared(), throttled.rate_limiter)
+        self.assertEqual(0.5, throttled.rate_limiter.bucket("https://example.com/api/2.0/jobs").rate)
+
+        # As with the sleep it replaced, throttle_seconds spaces all the client's requests, whatever their endpoint
+        self.assertIs(throttled.rate_limiter.bucket("https://example.com/api/2.0/jobs"), throttled.rate_limiter.bucket("https://other.example.com/api/2.0/preview/scim/v2/Users"))
+        self.assertEqual(["*/*"], list(throttled.rate_limiter.metrics()))
+
+    def test_rest_client_limiters(self):
+        from dbacademy.clients import dbrest
+
+        limiter = RateLimiter()
+        client = dbrest.from_args(endpoint="https://example.cloud.databricks.com", token="unused", rate_limiter=limiter)
+
+        self.assertIs(limiter, client.rate_limiter)
+        self.assertIs(limiter, dbrest.from_client(client).rate_limiter)
+        self.assertIsNone(dbrest.from_args(endpoint="https://example.cloud.databricks.com", token="unused").rate_limiter)
+
+
+class TestRateLimitedClient(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), RateLimitedHandler)
+        self.endpoint = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_retry_after(self):
+        RateLimitedHandler.rejections = 2
+        limiter = RateLimiter(rate=10)
+        client = ApiClient(self.endpoint, token="unused", rate_limiter=limiter)
+
+        start = time.monotonic()
+        self.assertEqual({"status": "ok"}, client.api("GET", "/api/2.0/jobs/list"))
+        elapsed = time.monotonic() - start
+
+        bucket = limiter.bucket(self.endpoint + "/api/2.0/jobs/list")
+        self.assertGreaterEqual(elapsed, 0.4)
+        self.assertEqual(2, bucket.throttled)
+        self.assertLess(bucket.rate, 10)
+
+    def test_final_attempt(self):
+        class TwoAttemptsClient(ApiClient):
+            max_retries = property(lambda self: 2)
+
+        RateLimitedHandler.rejections = 5
+        limiter = RateLimiter(rate=10)
+        client = TwoAttemptsClient(self.endpoint, token="unused", rate_limiter=limiter)
+
+        with self.assertRaises(DatabricksApiException) as e:
+            client.api("GET", "/api/2.0/jobs/list")
+        self.assertEqual(429, e.exception.http_code)
+
+        # Both responses are recorded but, with no retry following the second, only the first pauses the bucket.
+        metrics = limiter.bucket(self.endpoint + "/api/2.0/jobs/list").metrics()
+        self.assertEqual(2, metrics["throttled"])
+        self.assertEqual(0, metrics["paused_seconds"])
+        RateLimitedHandler.rejections = 0
+
+    def test_unmetered_retry(self):
+        RateLimitedHandler.rejections = 1
+        client = ApiClient(self.endpoint, token="unused")
+
+        start = time.monotonic()
+        self.assertEqual({"status": "ok"}, client.api("GET", "/api/2.0/jobs/list"))
+        self.assertIsNone(client.rate_limiter)
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import unittest
+import threading
+import importlib.util
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from dbacademy.clients.rest.common import ApiClient
+from dbacademy.clients.rest.transport import Transport, Http2Transport
+
+HTTPX_MISSING = importlib.util.find_spec("httpx") is None or importlib.util.find_spec("h2") is None
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    paths = list()
+
+    def do_GET(self):
+        KeepAliveHandler.paths.append(self.path)
+        body = b'{"status": "ok"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    # noinspection PyShadowingBuiltins
+    def log_message(self, format, *args):
+        pass
+
+
+class TestTransport(unittest.TestCase):
+
+    def setUp(self) -> None:
+        KeepAliveHandler.paths.clear()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        self.endpoint = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_defaults(self):
+        transport = Transport()
+        self.assertEqual(Transport.DEFAULT_POOL_CONNECTIONS, transport.pool_connections)
+        self.assertEqual(Transport.DEFAULT_POOL_MAXSIZE, transport.pool_maxsize)
+        self.assertFalse(transport.pool_block)
+        self.assertTrue(transport.keep_alive)
+        self.assertIs(transport.adapter, transport.adapter)
+
+    def test_connection_reuse(self):
+        client = ApiClient(self.endpoint, token="unused")
+
+        for _ in range(5):
+            self.assertEqual({"status": "ok"}, client.api("GET", "/api/2.0/whatever"))
+
+        stats = client.transport.stats
+        self.assertEqual(5, stats.requests)
+        self.assertEqual(1, stats.new_connections)
+        self.assertEqual(4, stats.reused_connections)
+
+    def test_clone_shares_transport(self):
+        parent = ApiClient(self.endpoint, token="unused", transport=Transport(pool_maxsize=4))
+        child = ApiClient("api/2.0", client=parent)
+
+        self.assertIs(parent.transport, child.transport)
+        self.assertIs(parent.http_adapter, child.http_adapter)
+        self.assertIsNot(parent.session, child.session)
+
+        parent.api("GET", "/api/2.0/whatever")
+        child.api("GET", "whatever")
+
+        self.assertEqual({"requests": 2, "new_connections": 1, "reused_connections": 1}, parent.transport.stats.to_dict())
+
+    def test_no_keep_alive(self):
+        client = ApiClient(self.endpoint, token="unused", transport=Transport(keep_alive=False))
+        self.assertEqual("close", client.session.headers.get("Connection"))
+
+        client.api("GET", "/api/2.0/whatever")
+        client.api("GET", "/api/2.0/whatever")
+
+        self.assertEqual(2, client.transport.stats.new_connections)
+        self.assertEqual(0, client.transport.stats.reused_connections)
+
+    def test_concurrent_requests(self):
+        from multiprocessing.pool import ThreadPool
+
+        client = ApiClient(self.endpoint, token="unused", transport=Transport(pool_maxsize=4, pool_block=True))
+
+        with ThreadPool(8) as pool:
+            results = pool.map(lambda _: client.api("GET", "/api/2.0/whatever"), range(40))
+
+        self.assertEqual(40, len(results))
+        self.assertEqual(40, client.transport.stats.requests)
+        self.assertLessEqual(client.transport.stats.new_connections, 4)
+
+    @unittest.skipUnless(HTTPX_MISSING, "httpx[http2] is installed")
+    def test_http2_requires_httpx(self):
+        self.assertRaises(ImportError, lambda: Http2Transport().adapter)
+
+    @unittest.skipIf(HTTPX_MISSING, "Requires httpx[http2]")
+    def test_http2(self):
+        client = ApiClient(self.endpoint, token="unused", transport=Http2Transport())
+
+        for _ in range(3):
+            self.assertEqual({"status": "ok"}, client.api("GET", "/api/2.0/whatever"))
+
+        # Without TLS there is no HTTP/2 negotiation, but the one connection is still reused
+        self.assertEqual({"requests": 3, "new_connections": 1, "reused_connections": 2}, client.transport.stats.to_dict())
+        self.assertEqual(["/api/2.0/whatever"] * 3, KeepAliveHandler.paths)
+
+    @unittest.skipIf(HTTPX_MISSING, "Requires httpx[http2]")
+    def test_http2_session_settings(self):
+        # The endpoint doesn't exist, the test server acting as its proxy
+        client = ApiClient("http://dbacademy.invalid", token="unused", transport=Http2Transport())
+        client.dns_verify = False
+        client.session.trust_env = False  # Else the environment's CA bundle, if any, overrides verify
+        client.session.proxies = {"http": self.endpoint}
+        client.session.verify = False
+
+        self.assertEqual({"status": "ok"}, client.api("GET", "/api/2.0/whatever"))
+        self.assertEqual(["http://dbacademy.invalid/api/2.0/whatever"], KeepAliveHandler.paths)
+        self.assertEqual([(False, None, self.endpoint)], list(client.transport.adapter.clients))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+__all__ = ["SchemaTests"]
+
+import unittest
+from typing import Any, Callable, Dict, List
+from dbacademy.common import validate, Schema, ValidationError, Cloud
+
+EXPECTED_ASSERTION_ERROR = "Expected AssertionError"
+
+
+class SchemaTests(unittest.TestCase):
+
+    def assert_same_error(self, schema: Schema, name: str, value: Any, validation: Callable[[Any], Any]):
+        try:
+            validation(value)
+            self.fail(EXPECTED_ASSERTION_ERROR)
+        except ValidationError as e:
+            expected = e.message
+
+        try:
+            schema.check(name, value)
+            self.fail(EXPECTED_ASSERTION_ERROR)
+        except ValidationError as e:
+            self.assertEqual(expected, e.message)
+
+    def test_validate(self):
+        schema = Schema(name=Schema.required.str(),
+                        size=Schema.optional.int(min_value=1, max_value=10),
+                        ratio=Schema.optional.float(),
+                        tags=Schema.optional.dict(str, str, auto_create=True),
+                        keys=Schema.required.list(str, min_length=1))
+
+        values = schema.validate(name="Some Name", size=5, ratio=1, keys=["a"])
+
+        self.assertEqual({"name": "Some Name", "size": 5, "ratio": 1.0, "tags": dict(), "keys": ["a"]}, values)
+        self.assertIsInstance(values["ratio"], float)
+        self.assertEqual(["name", "size", "ratio", "tags", "keys"], schema.parameter_names)
+
+        try:
+            schema.validate(name="Some Name", keys=["a"], color="red")
+            self.fail(EXPECTED_ASSERTION_ERROR)
+        except ValidationError as e:
+            self.assertEqual("""Error-Internal | The parameters ['color'] are not defined by this Schema.""", e.message)
+
+    def test_same_errors(self):
+        schema = Schema(name=Schema.required.str(min_length=3),
+                        size=Schema.optional.int(min_value=1, max_value=10),
+                        flag=Schema.required.bool(),
+                        tags=Schema.optional.dict(str, str, auto_create=True),
+                        keys=Schema.required.list(str, min_length=1),
+                        method=Schema.required.as_one_of(str, "GET", "POST"),
+                        handler=Schema.optional.as_type(Dict, List))
+
+        self.assert_same_error(schema, "name", None, lambda v: validate(name=v).required.str(min_length=3))
+        self.assert_same_error(schema, "name", 7, lambda v: validate(name=v).required.str(min_length=3))
+        self.assert_same_error(schema, "name", "ab", lambda v: validate(name=v).required.str(min_length=3))
+        self.assert_same_error(schema, "size", 0, lambda v: validate(size=v).optional.int(min_value=1, max_value=10))
+        self.assert_same_error(schema, "size", 11, lambda v: validate(size=v).optional.int(min_value=1, max_value=10))
+        self.assert_same_error(schema, "flag", "true", lambda v: validate(flag=v).required.bool())
+        self.assert_same_error(schema, "tags", {"a": 1}, lambda v: validate(tags=v).optional.dict(str, str, auto_create=True))
+        self.assert_same_error(schema, "tags", {1: "a"}, lambda v: validate(tags=v).optional.dict(str, str, auto_create=True))
+        self.assert_same_error(schema, "keys", [], lambda v: validate(keys=v).required.list(str, min_length=1))
+        self.assert_same_error(schema, "keys", ["a", 2], lambda v: validate(keys=v).required.list(str, min_length=1))
+        self.assert_same_error(schema, "method", "PATCH", lambda v: validate(method=v).required.as_one_of(str, "GET", "POST"))
+        self.assert_same_error(schema, "handler", "nope", lambda v: validate(handler=v).optional.as_type(Dict, List))
+
+    def test_enum(self):
+        schema = Schema(cloud=Schema.required.enum(Cloud, auto_convert=True),
+                        strict=Schema.optional.enum(Cloud))
+
+        self.assertEqual(Cloud.AWS, schema.check("cloud", Cloud.AWS))
+        self.assertEqual(Cloud.AWS, schema.check("cloud", "AWS"))
+        self.assertEqual(Cloud.AWS, schema.check("cloud", "aws"))  # Converted by the validator, then reused
+        self.assertEqual(Cloud.AWS, schema.check("cloud", "aws"))
+        self.assertIsNone(schema.check("strict", None))
+
+        self.assert_same_error(schema, "cloud", "Mars", lambda v: validate(cloud=v).required.enum(Cloud, auto_convert=True))
+        self.assert_same_error(schema, "strict", "AWS", lambda v: validate(strict=v).optional.enum(Cloud))
+
+    def test_invalid_schema(self):
+        try:
+            Schema(name=str)
+            self.fail(EXPECTED_ASSERTION_ERROR)
+        except ValidationError as e:
+            self.assertEqual("""Error-Internal | Expected the Schema's parameter 'name' to be of type <class 'dbacademy.common.schema.Param'>, found <class 'type'>.""", e.message)
+
+        # Invalid arguments are reported by the validator, exactly as they would be by validate(...)
+        schema = Schema(size=Schema.required.int(min_value="1"))
+        self.assert_same_error(schema, "size", 1, lambda v: validate(size=v).required.int(min_value="1"))
+
+    def test_config_builders(self):
+        from dbacademy.clients.dbrest.jobs_api.job_config import JobConfig
+        from dbacademy.clients.dbrest.clusters_api.cluster_config import JobClusterConfig
+
+        job_config = JobConfig(job_name="Job #1", timeout_seconds=600, tags={"index": "1"})
+        task_config = job_config.add_task(task_key="Run-Tests", depends_on=None)
+        task_config.as_notebook(notebook_path="/Repos/Some/Notebook", source="WORKSPACE")
+        task_config.cluster_new(JobClusterConfig(cloud="AWS",
+                                                 spark_version="13.3.x-scala2.12",
+                                                 node_type_id="i3.xlarge",
+                                                 num_workers=0,
+                                                 spark_conf={"spark.some.conf": "true"}))
+
+        params = job_config.params
+        self.assertEqual("Job #1", params.get("name"))
+        self.assertEqual(600, params.get("timeout_seconds"))
+
+        task = params.get("tasks")[0]
+        self.assertEqual("Run-Tests", task.get("task_key"))
+        self.assertEqual({"notebook_path": "/Repos/Some/Notebook", "source": "WORKSPACE", "base_parameters": {}}, task.get("notebook_task"))
+        self.assertEqual("i3.xlarge", task.get("new_cluster").get("node_type_id"))
+        self.assertEqual("true", task.get("new_cluster").get("spark_conf").get("spark.some.conf"))
+
+        # The schemas report invalid values exactly as validate(...) did
+        with self.assertRaises(ValidationError):
+            JobConfig(job_name="Job #2", timeout_seconds="600")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,7 @@ import numbers
 import unittest
 from typing import Dict, List, Set, Any, Tuple
 from dbacademy.common import validate, ValidationError
+from dbacademy_test import benchmark
 
 EXPECTED_ASSERTION_ERROR = "Expected AssertionError"
 
@@ -697,6 +698,74 @@ class ValidateTests(unittest.TestCase):
         except TypeError as e:
             self.assertEqual("Subscripted generics cannot be used with class and instance checks", e.args[0])
 
+    def test_fast_mode(self):
+        from dbacademy.common.validator import Validator
+
+        Validator.fast_mode = True
+        try:
+            # Element types, lengths and ranges are no longer checked...
+            self.assertEqual({"a": 1}, validate(value={"a": 1}).required.dict(str, str))
+            self.assertEqual([1, "b"], validate(value=[1, "b"]).required.list(int, min_length=3))
+            self.assertEqual(100, validate(value=100).required.int(min_value=0, max_value=10))
+            self.assertEqual("red", validate(value="red").required.as_one_of(str, "blue", "green"))
+
+            # ...but values still have to be specified and of the expected type.
+            try:
+                validate(value=None).required.dict(str)
+                self.fail(EXPECTED_ASSERTION_ERROR)
+            except ValidationError as e:
+                self.assertEqual("""Error-Not-None | The parameter 'value' must be specified.""", e.message)
+
+            try:
+                validate(value="1").required.int()
+                self.fail(EXPECTED_ASSERTION_ERROR)
+            except ValidationError as e:
+                self.assertEqual("""Error-Type | Expected the parameter 'value' to be of type <class 'int'>, found <class 'str'>.""", e.message)
+
+            self.assertEqual(1.0, validate(value=1).required.float())
+        finally:
+            Validator.fast_mode = False
+
+    def test_passing_validations_do_not_walk_the_stack(self):
+        from unittest import mock
+        from dbacademy.common.validator import Validator
+
+        value = {f"key_{i}": i for i in range(10)}
+
+        # Formatting the messages eagerly walked the stack on every call, passing or not.
+        with mock.patch("inspect.stack", side_effect=AssertionError("The stack was walked")):
+            self.assertIs(value, validate(value=value).required.dict(str))
+            self.assertEqual([1, 2], validate(value=[1, 2]).required.list(int, min_length=1, auto_create=True))
+            self.assertEqual(5, validate(value=5).required.int(min_value=1, max_value=10))
+
+            Validator.fast_mode = True
+            try:
+                self.assertIs(value, validate(value=value).required.dict(str))
+            finally:
+                Validator.fast_mode = False
+
+    @benchmark
+    def test_benchmark(self):
+        import inspect
+        import timeit
+        from dbacademy.common.validator import Validator
+
+        value = {f"key_{i}": i for i in range(10)}
+        count = 10000
+
+        # Formatting the messages eagerly walked the stack once per internal check, four times for dict(str).
+        stack_seconds = timeit.timeit(lambda: inspect.stack()[0].function, number=100) / 100 * 4
+
+        default_seconds = timeit.timeit(lambda: validate(value=value).required.dict(str), number=count) / count
+
+        Validator.fast_mode = True
+        try:
+            fast_seconds = timeit.timeit(lambda: validate(value=value).required.dict(str), number=count) / count
+        finally:
+            Validator.fast_mode = False
+
+        print(f"\nvalidate(value=...).required.dict(str): {stack_seconds * 1e6:,.1f} µs walking the stack before, {default_seconds * 1e6:,.1f} µs now, {fast_seconds * 1e6:,.1f} µs in fast mode")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,83 @@
+import time
+import unittest
+
+from dbacademy.dbbuild.publish.cell_scanner import CellScanner
+from dbacademy_test import benchmark
+
+
+class CellScannerTests(unittest.TestCase):
+
+    @staticmethod
+    def scan_naively(command: str):
+        """The per-token, per-year substring searches CellScanner replaces."""
+        tokens = [t for t in CellScanner.BDC_TOKENS if t in command]
+        copyrights = [f"{y} Databricks, Inc" for y in range(2017, 2999) if f"{y} Databricks, Inc" in command]
+        icons = [i for i in CellScanner.DEPRECATED_ICONS if i in command]
+        return tokens, copyrights, icons
+
+    def assert_same_as_naive(self, command: str):
+        findings = CellScanner.scan(command)
+        self.assertEqual(self.scan_naively(command), (findings.tokens, findings.copyrights, findings.icons))
+
+    def test_clean_cell(self):
+        findings = CellScanner.scan("# MAGIC %md\n# MAGIC Nothing to see here, {version}")
+        self.assertEqual([], findings.tokens)
+        self.assertEqual([], findings.copyrights)
+        self.assertEqual([], findings.icons)
+        self.assertIsNone(findings.mustache)
+
+    def test_tokens(self):
+        self.assert_same_as_naive("# PRIVATE_TEST\n# IPYTHON_ONLY\nprint('{{dbr}}')")
+        self.assertEqual(["TEST", "PRIVATE_TEST", "PYTHON_ONLY", "{dbr}"], CellScanner.scan("PRIVATE_TEST IPYTHON_ONLY {dbr}").tokens[1:])
+        self.assertEqual(["R_ONLYVIDEO"], CellScanner.scan("R_ONLYVIDEO").tokens)
+
+    def test_copyrights(self):
+        command = "(c) 2999 Databricks, Inc\n(c) 2022 Databricks, Inc\n(c) 2016 Databricks, Inc\n(c) 2017 Databricks, Inc\n(c) 2022 Databricks, Inc"
+        self.assertEqual(["2017 Databricks, Inc", "2022 Databricks, Inc"], CellScanner.scan(command).copyrights)
+        self.assert_same_as_naive(command)
+        self.assert_same_as_naive("12017 Databricks, Inc")
+
+    def test_icons_and_mustache(self):
+        findings = CellScanner.scan(":NOTE: {{missing}} :HINT: {{other}}")
+        self.assertEqual([":HINT:", ":NOTE:"], findings.icons)
+        self.assertEqual("{{missing}}", findings.mustache)
+        self.assertIsNone(CellScanner.scan("{{ not a match }}").mustache)
+
+    @staticmethod
+    def create_notebook():
+        cell = "\n".join([
+            "# MAGIC %md",
+            "# MAGIC ## Some Lesson",
+            "# MAGIC Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore.",
+            "# MAGIC <a href=\"https://example.com\" target=\"_blank\">A link</a> and some `code` to look at.",
+        ] * 5)
+        return [cell] * 499 + ["# TEST\n# MAGIC &copy; 2023 Databricks, Inc"]
+
+    def test_notebook(self):
+        notebook = self.create_notebook()
+
+        naive = [self.scan_naively(command) for command in notebook]
+        findings = [CellScanner.scan(command) for command in notebook]
+
+        self.assertEqual(naive, [(f.tokens, f.copyrights, f.icons) for f in findings])
+        self.assertEqual((["TEST"], ["2023 Databricks, Inc"], []), naive[-1])
+
+    @benchmark
+    def test_benchmark(self):
+        notebook = self.create_notebook()
+
+        start = time.perf_counter()
+        for command in notebook:
+            self.scan_naively(command)
+        naive_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for command in notebook:
+            CellScanner.scan(command)
+        scanner_seconds = time.perf_counter() - start
+
+        print(f"\n500 cells: {naive_seconds * 1000:.1f} ms with substring searches, {scanner_seconds * 1000:.1f} ms with CellScanner")
+
+
+if __name__ == '__main__':
+    unittest.main()
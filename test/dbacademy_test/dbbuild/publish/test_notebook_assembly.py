@@ -0,0 +1,117 @@
+import time
+import base64
+import unittest
+from typing import Any, Dict, List
+
+from dbacademy.clients import dbrest, ClientErrorHandler
+from dbacademy.dbbuild.publish import pub_utils
+from dbacademy.dbbuild.publish.notebook_def import NotebookDef
+from dbacademy.dbbuild.publish.resource_diff import Segment
+from dbacademy_test import benchmark
+
+
+class FakeWorkspaceClient(dbrest.DBAcademyRestClient):
+    """Records every imported notebook instead of calling the REST API."""
+
+    def __init__(self):
+        super().__init__(token="unused", endpoint="https://example.cloud.databricks.com",
+                         username=None, password=None, authorization_header=None, client=None,
+                         verbose=False, throttle_seconds=0, error_handler=ClientErrorHandler())
+        self.imported: Dict[str, str] = dict()
+
+    def api(self, _http_method, _endpoint_path, _data=None, **data) -> Dict[str, Any]:
+        if _endpoint_path.endswith("/workspace/mkdirs"):
+            return dict()
+
+        elif _endpoint_path.endswith("/workspace/import"):
+            self.imported[_data.get("path")] = base64.b64decode(_data.get("content")).decode("utf-8")
+            return dict()
+
+        raise ValueError(f"Unexpected request: {_http_method} {_endpoint_path}")
+
+
+class NotebookAssemblyTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.client = FakeWorkspaceClient()
+        self.notebook = NotebookDef(client=self.client,
+                                    path="Some Lesson",
+                                    replacements={"version": "1.2.3"},
+                                    include_solution=True,
+                                    test_round=2,
+                                    ignored=False,
+                                    order=0,
+                                    i18n=False,
+                                    i18n_language=None,
+                                    ignored_errors=[],
+                                    version="1.2.3")
+
+    def publish_notebook(self, commands: List[str]) -> str:
+        self.notebook.publish_notebook("python", commands, "/Target/Some Lesson", print_warnings=False)
+        return self.client.imported.get("/Target/Some Lesson")
+
+    def test_iter_commands(self):
+        delim = NotebookDef.get_cmd_delim("python")
+
+        for source in ["", "one", f"one{delim}two", f"{delim}one{delim}{delim}two{delim}"]:
+            self.assertEqual(source.split(delim), list(pub_utils.iter_commands(source, delim)))
+
+    def test_publish_notebook(self):
+        delim = NotebookDef.get_cmd_delim("python")
+
+        source = self.publish_notebook(["print('{{version}}')", "x = 1"])
+        self.assertEqual(f"# Databricks notebook source\nprint('1.2.3'){delim}x = 1\n\n", source)
+
+        source = self.publish_notebook(["x = 1", "# MAGIC %md\n# MAGIC The end"])
+        self.assertEqual(f"# Databricks notebook source\nx = 1{delim}# MAGIC %md\n# MAGIC The end", source)
+
+    def test_clean_todo_cell(self):
+        command = "# TODO\n# x = FILL_IN\n#y = 2\n\nz = 3\n# MAGIC"
+        self.assertEqual("# TODO\nx = FILL_IN\ny = 2\n\n\n# MAGIC", self.notebook.clean_todo_cell("python", command, 0))
+        self.assertEqual(1, len(self.notebook.logger.errors))  # z = 3 isn't commented out
+
+        command = "# MAGIC %sql\n# MAGIC -- TODO\n# MAGIC -- SELECT FILL_IN"
+        self.assertEqual("# MAGIC %sql\n# MAGIC -- TODO\nSELECT FILL_IN", self.notebook.clean_todo_cell("python", command, 0))
+
+    def test_segment(self):
+        segment = Segment("--i18n-123")
+        self.assertEqual("", segment.contents)
+
+        segment.add_line("one\n")
+        segment.add_line("two\n")
+        self.assertEqual("one\ntwo\n", segment.contents)
+
+        segment.add_line("three\n")
+        self.assertEqual("one\ntwo\nthree\n", segment.contents)
+
+    def test_large_notebook(self):
+        count = 4000
+        commands = [f"# MAGIC %md\n# MAGIC Cell #{i} of {{{{version}}}}\n# MAGIC " + ("lorem ipsum " * 20) for i in range(count)]
+        todo_cell = "# TODO\n" + "\n".join(f"# line_{i} = FILL_IN" for i in range(count * 10))
+
+        source = self.publish_notebook(commands)
+        cells = source.split(NotebookDef.get_cmd_delim("python"))
+        self.assertEqual(count, len(cells))
+        self.assertIn("Cell #3999 of 1.2.3", cells[-1])
+
+        cleaned = self.notebook.clean_todo_cell("python", todo_cell, 0)
+        self.assertEqual(count * 10 + 1, len(cleaned.split("\n")))
+
+    @benchmark
+    def test_benchmark(self):
+        timings = dict()
+
+        for count in [1000, 4000]:
+            commands = [f"# MAGIC %md\n# MAGIC Cell #{i} of {{{{version}}}}\n# MAGIC " + ("lorem ipsum " * 20) for i in range(count)]
+            todo_cell = "# TODO\n" + "\n".join(f"# line_{i} = FILL_IN" for i in range(count * 10))
+
+            start = time.perf_counter()
+            self.publish_notebook(commands)
+            self.notebook.clean_todo_cell("python", todo_cell, 0)
+            timings[count] = time.perf_counter() - start
+
+        print(f"\nAssembled 1,000 cells in {timings[1000] * 1000:.1f} ms and 4,000 cells in {timings[4000] * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    unittest.main()
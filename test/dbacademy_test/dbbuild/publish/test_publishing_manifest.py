@@ -0,0 +1,114 @@
+import os
+import tempfile
+import unittest
+
+from dbacademy.dbbuild.publish.publishing_manifest import PublishingManifest
+
+
+class PublishingManifestTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manifest_path = os.path.join(self.temp_dir.name, "Published", "Course - v1.0.0.manifest.json")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_fingerprint(self):
+        self.assertEqual(PublishingManifest.fingerprint("source", {"a": 1, "b": 2}),
+                         PublishingManifest.fingerprint("source", {"b": 2, "a": 1}))
+
+        self.assertNotEqual(PublishingManifest.fingerprint("source", {"a": 1}),
+                            PublishingManifest.fingerprint("source", {"a": 2}))
+
+    def test_incremental_builds(self):
+        manifest = PublishingManifest(self.manifest_path, build_inputs=["Course", "1.0.0"])
+        self.assertTrue(manifest.is_empty)
+        self.assertFalse(manifest.is_current("Intro", "abc"))
+
+        manifest.record("Intro", "abc", ["/Target/Intro", "/Target/Solutions/Intro"], ["Some warning"])
+        manifest.record("Lab", "def", ["/Target/Lab"], [])
+        self.assertEqual([], manifest.orphaned_targets())
+        manifest.save()
+
+        # The second build leaves Lab unchanged and changes Intro, which no longer includes solutions
+        manifest = PublishingManifest(self.manifest_path, build_inputs=["Course", "1.0.0"])
+        self.assertFalse(manifest.is_empty)
+        self.assertTrue(manifest.is_current("Lab", "def"))
+        self.assertFalse(manifest.is_current("Intro", "xyz"))
+        self.assertFalse(manifest.is_current("Other", "def"))
+
+        manifest.record("Intro", "xyz", ["/Target/Intro"], [])
+        self.assertEqual(["/Target/Solutions/Intro"], manifest.orphaned_targets())
+        manifest.save()
+
+        # The third build drops Lab
+        manifest = PublishingManifest(self.manifest_path, build_inputs=["Course", "1.0.0"])
+        self.assertTrue(manifest.is_current("Intro", "xyz"))
+        self.assertEqual(["/Target/Lab"], manifest.orphaned_targets())
+
+    def test_warnings_are_kept(self):
+        manifest = PublishingManifest(self.manifest_path)
+        manifest.record("Intro", "abc", ["/Target/Intro"], ["Some warning"])
+        manifest.save()
+
+        manifest = PublishingManifest(self.manifest_path)
+        self.assertTrue(manifest.is_current("Intro", "abc"))
+        self.assertEqual(["Some warning"], manifest.warnings("Intro"))
+
+    def test_build_inputs_changed(self):
+        manifest = PublishingManifest(self.manifest_path, build_inputs=["Course", "1.0.0"])
+        manifest.record("Intro", "abc", ["/Target/Intro"], [])
+        manifest.save()
+
+        manifest = PublishingManifest(self.manifest_path, build_inputs=["Course", "1.0.1"])
+        self.assertTrue(manifest.is_empty)
+        self.assertFalse(manifest.is_current("Intro", "abc"))
+
+    def test_library_version_changed(self):
+        from unittest import mock
+
+        manifest = PublishingManifest(self.manifest_path, build_inputs=["Course", "1.0.0"])
+        manifest.record("Intro", "abc", ["/Target/Intro"], [])
+        manifest.save()
+
+        self.assertFalse(PublishingManifest(self.manifest_path, build_inputs=["Course", "1.0.0"]).is_empty)
+
+        with mock.patch.object(PublishingManifest, "library_version", return_value="v0.0.0-other"):
+            self.assertTrue(PublishingManifest(self.manifest_path, build_inputs=["Course", "1.0.0"]).is_empty)
+
+    def test_discard(self):
+        manifest = PublishingManifest(self.manifest_path)
+        manifest.record("Intro", "abc", ["/Target/Intro"], [])
+        manifest.save()
+
+        # e.g. the target directory was deleted since the last build
+        manifest = PublishingManifest(self.manifest_path)
+        manifest.discard()
+        self.assertTrue(manifest.is_empty)
+        self.assertFalse(manifest.is_current("Intro", "abc"))
+        self.assertEqual([], manifest.orphaned_targets())
+
+    def test_retain_existing(self):
+        manifest = PublishingManifest(self.manifest_path)
+        manifest.record("Intro", "abc", ["/Target/Intro", "/Target/Solutions/Intro"], [])
+        manifest.record("Lab", "def", ["/Target/Lab"], [])
+        manifest.save()
+
+        # The solution of Intro was deleted by hand
+        manifest = PublishingManifest(self.manifest_path)
+        manifest.retain_existing(["/Target/Intro", "/Target/Lab"])
+        self.assertFalse(manifest.is_empty)
+        self.assertFalse(manifest.is_current("Intro", "abc"))
+        self.assertTrue(manifest.is_current("Lab", "def"))
+
+    def test_corrupt_manifest(self):
+        os.makedirs(os.path.dirname(self.manifest_path))
+        with open(self.manifest_path, "w") as f:
+            f.write("{ not json")
+
+        self.assertTrue(PublishingManifest(self.manifest_path).is_empty)
+
+
+if __name__ == '__main__':
+    unittest.main()
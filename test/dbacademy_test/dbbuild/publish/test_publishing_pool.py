@@ -0,0 +1,115 @@
+import io
+import sys
+import time
+import threading
+import unittest
+from typing import List, Optional, TextIO
+
+from dbacademy.clients import dbrest, ClientErrorHandler
+from dbacademy.dbbuild.publish.publishing_pool import PublishingPool
+
+
+class FakeWorkspaceClient(dbrest.DBAcademyRestClient):
+    """Records every workspace directory created instead of calling the REST API."""
+
+    def __init__(self):
+        super().__init__(token="unused", endpoint="https://example.cloud.databricks.com",
+                         username=None, password=None, authorization_header=None, client=None,
+                         verbose=False, throttle_seconds=0, error_handler=ClientErrorHandler())
+        self.created_dirs: List[str] = list()
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def api(self, _http_method, _endpoint_path, _data=None, **data):
+        if _endpoint_path.endswith("/api/2.0/workspace/mkdirs"):
+            with self.lock:
+                self.created_dirs.append(data.get("path") or _data.get("path"))
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+            time.sleep(0.05)
+            with self.lock:
+                self.active -= 1
+            return dict()
+
+        raise ValueError(f"Unexpected request: {_http_method} {_endpoint_path}")
+
+
+class PublishingPoolTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.stdout = sys.stdout
+        sys.stdout = io.StringIO()
+
+    def tearDown(self) -> None:
+        sys.stdout = self.stdout
+
+    @staticmethod
+    def publish(number: int, output: Optional[TextIO]) -> None:
+        print(f"start {number}", file=output)
+        time.sleep((10 - number) * 0.01)  # The first notebooks finish last
+        print(f"end {number}", file=output)
+
+    def test_output_is_ordered(self):
+        pool = PublishingPool(FakeWorkspaceClient(), max_workers=5)
+        pool.map(self.publish, list(range(10)))
+
+        expected = "".join(f"start {i}\nend {i}\n" for i in range(10))
+        self.assertEqual(expected, sys.stdout.getvalue())
+
+    def test_stdout_is_not_replaced(self):
+        stdout = sys.stdout
+        seen = list()
+
+        def publish(number: int, output: Optional[TextIO]) -> None:
+            seen.append(sys.stdout)
+            print(f"publishing {number}", file=output)
+
+        PublishingPool(FakeWorkspaceClient(), max_workers=4).map(publish, list(range(8)))
+
+        # Other threads printing meanwhile are unaffected
+        self.assertTrue(all(s is stdout for s in seen))
+        self.assertEqual("".join(f"publishing {i}\n" for i in range(8)), sys.stdout.getvalue())
+
+    def test_serial(self):
+        pool = PublishingPool(FakeWorkspaceClient(), max_workers=1)
+        pool.map(self.publish, [1, 2])
+
+        self.assertEqual("start 1\nend 1\nstart 2\nend 2\n", sys.stdout.getvalue())
+
+    def test_first_error_is_raised(self):
+        def publish(number: int, output: Optional[TextIO]) -> None:
+            print(f"publishing {number}", file=output)
+            time.sleep(0.01)
+            if number in (3, 5):
+                raise AssertionError(f"Failed {number}")
+
+        pool = PublishingPool(FakeWorkspaceClient(), max_workers=2)
+
+        with self.assertRaises(AssertionError) as context:
+            pool.map(publish, list(range(50)))
+
+        self.assertEqual("Failed 3", str(context.exception))
+
+        # The output of notebooks that ran is still printed, and in order
+        lines = sys.stdout.getvalue().splitlines()
+        self.assertEqual(["publishing 0", "publishing 1", "publishing 2", "publishing 3"], lines[:4])
+        self.assertLess(len(lines), 50)
+
+    def test_mkdirs(self):
+        client = FakeWorkspaceClient()
+        pool = PublishingPool(client, max_workers=4)
+
+        paths = ["/Target/Module 1", "/Target/Module 2", "/Target/Module 3", "/Target/Module 4"] * 10
+        pool.map(lambda path, output: pool.mkdirs(path), paths)
+
+        # Each directory is created once, and distinct directories concurrently
+        self.assertEqual(sorted(set(paths)), sorted(client.created_dirs))
+        self.assertGreater(client.max_active, 1)
+
+        pool.map(lambda path, output: pool.mkdirs(path), ["/Target", "/Target/Module 1"])
+        self.assertEqual(4, len(client.created_dirs))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+__all__ = ["ClusterResourcesTests"]
+
+import json
+import threading
+import unittest
+from typing import Any, Dict, List, Optional
+from dbacademy.clients import dbrest, ClientErrorHandler
+from dbacademy.dbhelper.supporting.cluster_resources import ClusterResources
+
+
+class FakeClustersClient(dbrest.DBAcademyRestClient):
+    """Holds instance pools and cluster policies in memory, recording the permission updates apart from every other request."""
+
+    def __init__(self):
+        super().__init__(token="unused",
+                         endpoint="https://example.cloud.databricks.com",
+                         username=None,
+                         password=None,
+                         authorization_header=None,
+                         client=None,
+                         verbose=False,
+                         throttle_seconds=0,
+                         error_handler=ClientErrorHandler())
+
+        self.lock = threading.Lock()
+        self.requests: List[str] = list()
+        self.grants: List[str] = list()
+        self.pools = {"pool-1": {"instance_pool_id": "pool-1", "instance_pool_name": "DBAcademy", "min_idle_instances": 0,
+                                 "idle_instance_autotermination_minutes": 15, "node_type_id": "i3.xlarge",
+                                 "preloaded_spark_versions": ["13.3.x-scala2.12"], "custom_tags": {"dbacademy.pool.source": "abc"}}}
+        self.policies = {"policy-1": {"policy_id": "policy-1", "name": "DBAcademy", "definition": json.dumps({"num_workers": {"type": "fixed", "value": 0}, "cluster_type": {"type": "fixed", "value": "all-purpose"}})},
+                         "policy-2": {"policy_id": "policy-2", "name": "DBAcademy Jobs", "definition": json.dumps({"cluster_type": {"type": "fixed", "value": "job"}})}}
+
+    def api(self, _http_method: str, _endpoint_path: str, _data: Optional[Dict[str, Any]] = None, **data: Any) -> Optional[Dict[str, Any]]:
+        data = {**(_data or dict()), **data}
+        action = _endpoint_path.split("?")[0].split("/api/2.0/")[-1]
+
+        with self.lock:
+            if "permissions/" in action:
+                self.grants.append(action)
+                return dict()
+
+            self.requests.append(action)
+
+            if action == "instance-pools/list":
+                return {"instance_pools": list(self.pools.values())}
+            elif action == "instance-pools/get":
+                return dict(self.pools[_endpoint_path.split("=")[-1]])
+            elif action == "instance-pools/edit":
+                assert "node_type_id" in data, "The node_type_id is required."
+                self.pools[data["instance_pool_id"]].update(data)
+            elif action == "instance-pools/delete":
+                del self.pools[data["instance_pool_id"]]
+
+            elif action == "policies/clusters/list":
+                return {"policies": list(self.policies.values())}
+            elif action == "policies/clusters/get":
+                return dict(self.policies[_endpoint_path.split("=")[-1]])
+            elif action == "policies/clusters/create":
+                policy_id = f"policy-{len(self.policies) + 1}"
+                self.policies[policy_id] = {"policy_id": policy_id, "name": data["name"], "definition": data["definition"]}
+                return {"policy_id": policy_id}
+            elif action == "policies/clusters/edit":
+                self.policies[data["policy_id"]].update(data)
+            elif action == "policies/clusters/delete":
+                del self.policies[data["policy_id"]]
+
+            return dict()
+
+
+class ClusterResourcesTests(unittest.TestCase):
+
+    DEFINITIONS = {
+        "DBAcademy": {"cluster_type": {"type": "fixed", "value": "all-purpose"}, "num_workers": {"type": "fixed", "value": 0}},
+        "DBAcademy Jobs": {"cluster_type": {"type": "fixed", "value": "job"}, "num_workers": {"type": "fixed", "value": 0}},
+        "DBAcademy DLT": {"cluster_type": {"type": "fixed", "value": "dlt"}},
+    }
+
+    def test_ensure_policies(self):
+        client = FakeClustersClient()
+        resources = ClusterResources(client)
+
+        results = resources.ensure_policies(self.DEFINITIONS)
+
+        self.assertEqual({"DBAcademy": ("policy-1", False), "DBAcademy Jobs": ("policy-2", True), "DBAcademy DLT": ("policy-3", True)}, results)
+        self.assertEqual(["policies/clusters/create", "policies/clusters/edit", "policies/clusters/get", "policies/clusters/get", "policies/clusters/list"], sorted(client.requests))
+        self.assertEqual(["preview/permissions/cluster-policies/policy-1", "preview/permissions/cluster-policies/policy-2", "preview/permissions/cluster-policies/policy-3"], sorted(client.grants))
+
+        # Repeating the setup of an unchanged workspace costs a single listing, the permissions being re-granted
+        client.requests.clear()
+        client.grants.clear()
+        resources = ClusterResources(client)
+
+        self.assertTrue(all(not changed for _, changed in resources.ensure_policies(self.DEFINITIONS).values()))
+        self.assertEqual(["policies/clusters/list"], client.requests)
+        self.assertEqual(3, len(client.grants))
+
+        self.assertEqual(["DBAcademy", "DBAcademy DLT"], resources.delete_policies(["DBAcademy", "Unknown", "DBAcademy DLT"]))
+        self.assertEqual(["DBAcademy Jobs"], [p.get("name") for p in client.policies.values()])
+        self.assertEqual(["DBAcademy Jobs"], list(resources.policies))
+
+    def test_ensure_pool(self):
+        client = FakeClustersClient()
+        resources = ClusterResources(client)
+
+        pool = dict(name="DBAcademy",
+                    idle_instance_autotermination_minutes=15,
+                    preloaded_spark_version="13.3.x-scala2.12",
+                    tags=[("dbacademy.pool.source", "abc")])
+
+        self.assertEqual(("pool-1", False), resources.ensure_pool(**pool))
+        self.assertEqual(["instance-pools/list"], client.requests)
+        self.assertEqual(["permissions/instance-pools/pool-1"], client.grants)
+
+        # Editable attributes are changed in place
+        self.assertEqual(("pool-1", True), resources.ensure_pool(**pool, min_idle_instances=2))
+        self.assertEqual(2, client.pools["pool-1"]["min_idle_instances"])
+        self.assertEqual("i3.xlarge", client.pools["pool-1"]["node_type_id"])
+        self.assertEqual(("pool-1", False), resources.ensure_pool(**pool, min_idle_instances=2))
+        self.assertEqual(1, client.requests.count("instance-pools/list"))
+        self.assertEqual(1, client.requests.count("instance-pools/edit"))
+        self.assertEqual(3, len(client.grants))
+
+        self.assertEqual(["DBAcademy"], resources.delete_pools(["DBAcademy"]))
+        self.assertEqual([], resources.delete_pools(["DBAcademy"]))
+        self.assertEqual(dict(), client.pools)
+
+    def test_canonical_hash(self):
+        self.assertEqual(ClusterResources.canonical_hash({"a": 1, "b": {"c": [1, 2]}}), ClusterResources.canonical_hash({"b": {"c": [1, 2]}, "a": 1}))
+        self.assertNotEqual(ClusterResources.canonical_hash({"a": 1}), ClusterResources.canonical_hash({"a": "1"}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,212 @@
+__all__ = ["DatasetManagerTests"]
+
+import os
+import hashlib
+import zipfile
+import tempfile
+import unittest
+from typing import Dict, List, Tuple
+from dbacademy.dbhelper.dataset_manager import DatasetManager
+from dbacademy.dbhelper.dataset_file_system import LocalFileSystem
+
+
+class DatasetManagerTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_source_uri = os.path.join(self.temp_dir.name, "remote", "v01")
+        self.archives_path = os.path.join(self.temp_dir.name, "archives", "v01")
+        self.datasets_path = os.path.join(self.temp_dir.name, "datasets", "v01")
+
+        os.makedirs(self.data_source_uri)
+
+        self.files: Dict[str, bytes] = {
+            "flights/departures.csv": b"origin,destination\n" + b"SFO,JFK\n" * 10000,
+            "flights/README.md": b"# Flights",
+            "retail/2023/sales.json": b'{"amount": 42}\n' * 5000,
+        }
+
+        self.archive_file = os.path.join(self.temp_dir.name, DatasetManager.ARCHIVE_FILE)
+        with zipfile.ZipFile(self.archive_file, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("flights/", "")
+            for name, data in self.files.items():
+                archive.writestr(name, data)
+
+        with open(self.archive_file, "rb") as f:
+            self.archive_bytes = f.read()
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def publish(self, parts: int = 0, checksum: str = None) -> None:
+        if parts == 0:
+            with open(os.path.join(self.data_source_uri, DatasetManager.ARCHIVE_FILE), "wb") as f:
+                f.write(self.archive_bytes)
+        else:
+            size = len(self.archive_bytes) // parts + 1
+            for i in range(parts):
+                with open(os.path.join(self.data_source_uri, f"{DatasetManager.ARCHIVE_PART_PREFIX}{i:05d}"), "wb") as f:
+                    f.write(self.archive_bytes[i * size:(i + 1) * size])
+
+        if checksum is not None:
+            with open(os.path.join(self.data_source_uri, DatasetManager.ARCHIVE_CHECKSUM_FILE), "w") as f:
+                f.write(f"{checksum}  {DatasetManager.ARCHIVE_FILE}\n")
+
+    def create_manager(self) -> DatasetManager:
+        return DatasetManager(_data_source_uri=self.data_source_uri,
+                              _staging_source_uri=None,
+                              _datasets_path=self.datasets_path,
+                              _archives_path=self.archives_path,
+                              _install_path=self.archives_path,
+                              _install_min_time=None,
+                              _install_max_time=None,
+                              _fs=LocalFileSystem(),
+                              _max_workers=4)
+
+    def assert_installed(self, manager: DatasetManager) -> None:
+        with open(os.path.join(self.archives_path, DatasetManager.ARCHIVE_FILE), "rb") as f:
+            self.assertEqual(self.archive_bytes, f.read())
+
+        for name, data in self.files.items():
+            with open(os.path.join(self.datasets_path, name), "rb") as f:
+                self.assertEqual(data, f.read())
+
+        manifest = manager.load_manifest()
+        self.assertEqual(len(self.archive_bytes), manifest["archive"]["size"])
+        self.assertEqual(hashlib.sha256(self.archive_bytes).hexdigest(), manifest["archive"]["sha256"])
+        self.assertEqual({DatasetManager.ARCHIVE_FILE: len(self.archive_bytes)}, manifest["install_listing"])
+        self.assertEqual({f"/{n}": len(d) for n, d in self.files.items()}, {n: e["size"] for n, e in manifest["files"].items()})
+
+    def test_install(self):
+        self.publish(checksum=hashlib.sha256(self.archive_bytes).hexdigest())
+
+        manager = self.create_manager()
+        manager.install_dataset(reinstall_datasets=False)
+
+        self.assert_installed(manager)
+        self.assertEqual(0, manager.fixes)
+
+    def test_install_parts(self):
+        self.publish(parts=3)
+
+        manager = self.create_manager()
+        manager.install_dataset(reinstall_datasets=False)
+
+        self.assert_installed(manager)
+        self.assertEqual(sorted([DatasetManager.ARCHIVE_FILE, DatasetManager.MANIFEST_FILE]), sorted(os.listdir(self.archives_path)))
+
+    def test_checksum_mismatch(self):
+        self.publish(checksum="0" * 64)
+
+        manager = self.create_manager()
+        self.assertRaises(AssertionError, lambda: manager.install_dataset(reinstall_datasets=False))
+        self.assertFalse(os.path.exists(os.path.join(self.archives_path, DatasetManager.ARCHIVE_FILE)))
+
+    def test_validate_and_repair(self):
+        self.publish()
+        self.create_manager().install_dataset(reinstall_datasets=False)
+
+        # Unchanged, the listing is skipped
+        manager = self.create_manager()
+        manager.validate_datasets(fail_fast=True)
+        self.assertEqual(0, manager.fixes)
+
+        # An extra file is removed
+        with open(os.path.join(self.archives_path, "extra.txt"), "w") as f:
+            f.write("extra")
+
+        manager = self.create_manager()
+        manager.validate_datasets(fail_fast=False)
+        self.assertEqual(1, manager.fixes)
+        self.assertFalse(os.path.exists(os.path.join(self.archives_path, "extra.txt")))
+        self.assertTrue(os.path.exists(manager.manifest_path))
+
+        # A missing archive is restored
+        os.remove(os.path.join(self.archives_path, DatasetManager.ARCHIVE_FILE))
+
+        manager = self.create_manager()
+        manager.validate_datasets(fail_fast=False)
+        self.assertEqual(1, manager.fixes)
+        self.assertTrue(os.path.exists(os.path.join(self.archives_path, DatasetManager.ARCHIVE_FILE)))
+
+    def test_unsafe_archive(self):
+        with zipfile.ZipFile(self.archive_file, "w") as archive:
+            archive.writestr("../escaped.txt", "nope")
+
+        with open(self.archive_file, "rb") as f:
+            self.archive_bytes = f.read()
+
+        self.publish()
+        manager = self.create_manager()
+        self.assertRaises(ValueError, lambda: manager.install_dataset(reinstall_datasets=False))
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir.name, "datasets", "escaped.txt")))
+
+    def test_list_r(self):
+        for name, data in self.files.items():
+            os.makedirs(os.path.dirname(os.path.join(self.datasets_path, name)), exist_ok=True)
+            with open(os.path.join(self.datasets_path, name), "wb") as f:
+                f.write(data)
+
+        expected = ["/flights/", "/flights/README.md", "/flights/departures.csv", "/retail/", "/retail/2023/", "/retail/2023/sales.json"]
+
+        self.assertEqual(expected, DatasetManager.list_r(self.datasets_path, fs=LocalFileSystem()))
+        self.assertEqual(expected, DatasetManager.list_r(self.datasets_path, fs=LocalFileSystem(), max_workers=4))
+        self.assertEqual(["/retail/2023/", "/retail/2023/sales.json"], DatasetManager.list_r(os.path.join(self.datasets_path, "retail"), prefix=self.datasets_path, fs=LocalFileSystem()))
+
+    @staticmethod
+    def plan_repairs_naively(local_files: List[str], remote_files: List[str]) -> List[Tuple[str, str]]:
+        """The list-membership and prefix-scanning algorithm DatasetManager.plan_repairs() replaces"""
+        plan = list()
+        repaired_paths = list()
+
+        def not_repaired(test_file: str) -> bool:
+            return not any(test_file.startswith(p) for p in repaired_paths)
+
+        for action, files, others in [("rm", local_files, remote_files), ("cp", remote_files, local_files)]:
+            for file in files:
+                if file not in others and file.endswith("/") and not_repaired(file):
+                    repaired_paths.append(file)
+                    plan.append((action, file))
+
+        for action, files, others in [("rm", local_files, remote_files), ("cp", remote_files, local_files)]:
+            for file in files:
+                if file not in others and not file.endswith("/") and not_repaired(file):
+                    plan.append((action, file))
+
+        return plan
+
+    def test_plan_repairs(self):
+        remote_files = sorted([f"/d{d:02d}/" for d in range(20)] +
+                              [f"/d{d:02d}/s{s}/" for d in range(20) for s in range(5)] +
+                              [f"/d{d:02d}/s{s}/part-{p:04d}.parquet" for d in range(20) for s in range(5) for p in range(50)])
+
+        local_files = set(remote_files)
+        local_files -= {f for f in remote_files if f.startswith("/d03/")}     # A missing directory
+        local_files -= {"/d07/s2/part-0042.parquet", "/d09/s0/"}              # A missing file and an empty directory
+        local_files |= {"/extra/", "/extra/file.csv", "/d11/s1/extra.csv"}  # Extra directories and files
+        local_files = sorted(local_files)
+
+        expected = self.plan_repairs_naively(local_files, remote_files)
+        actual = DatasetManager.plan_repairs(local_files, remote_files)
+
+        self.assertEqual(expected, actual)
+        self.assertEqual([("rm", "/extra/"), ("cp", "/d03/"), ("cp", "/d09/s0/"), ("rm", "/d11/s1/extra.csv"), ("cp", "/d07/s2/part-0042.parquet")], actual)
+
+    def test_repairs_applied(self):
+        self.publish()
+        self.create_manager().install_dataset(reinstall_datasets=False)
+
+        os.makedirs(os.path.join(self.archives_path, "unexpected", "nested"))
+        for path in [("unexpected", "nested", "a.txt"), ("old.txt",)]:
+            with open(os.path.join(self.archives_path, *path), "w") as f:
+                f.write("extra")
+
+        manager = self.create_manager()
+        manager.validate_datasets(fail_fast=False)
+
+        self.assertEqual(2, manager.fixes)
+        self.assertEqual(["/unexpected/"], manager.repaired_paths)
+        self.assertEqual(sorted([DatasetManager.ARCHIVE_FILE, DatasetManager.MANIFEST_FILE]), sorted(os.listdir(self.archives_path)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,219 @@
+__all__ = ["DdlExecutorTests"]
+
+import io
+import sys
+import threading
+import unittest
+from unittest import mock
+from typing import Any, Dict, List, Optional
+from dbacademy import dbgems
+from dbacademy.clients import dbrest, ClientErrorHandler
+from dbacademy.dbhelper.course_config import CourseConfig
+from dbacademy.dbhelper.lesson_config import LessonConfig
+from dbacademy.dbhelper.supporting.databases_helper import DatabasesHelper
+from dbacademy.dbhelper.supporting.ddl_executor import SparkDdlExecutor, StatementsApiDdlExecutor
+from dbacademy.dbhelper.supporting.prefix_index import PrefixIndex
+from dbacademy.dbhelper.supporting.warehouses_helper import WarehousesHelper
+from dbacademy.dbhelper.supporting.workspace_helper import WorkspaceHelper
+
+
+class FakeStatementsClient(dbrest.DBAcademyRestClient):
+    """Completes each statement on its second poll, failing those that mention FAIL and never completing those that mention SLOW."""
+
+    def __init__(self):
+        super().__init__(token="unused",
+                         endpoint="https://example.cloud.databricks.com",
+                         username=None,
+                         password=None,
+                         authorization_header=None,
+                         client=None,
+                         verbose=False,
+                         throttle_seconds=0,
+                         error_handler=ClientErrorHandler())
+
+        self.lock = threading.Lock()
+        self.statements: Dict[str, Dict[str, Any]] = dict()
+        self.executed: List[str] = list()
+        self.cancelled: List[str] = list()
+        self.requests = 0
+
+    def api(self, _http_method: str, _endpoint_path: str, _data: Optional[Dict[str, Any]] = None, **data: Any) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            self.requests += 1
+
+            if _endpoint_path.endswith("/cancel"):
+                self.cancelled.append(_endpoint_path.split("/")[-2])
+                return dict()
+
+            if _http_method == "POST":
+                self.assertions(_data)
+                statement_id = f"stmt-{len(self.statements)}"
+                self.statements[statement_id] = {"statement": _data.get("statement"), "polls": 0}
+                self.executed.append(_data.get("statement"))
+                return {"statement_id": statement_id, "status": {"state": "PENDING"}}
+
+            statement_id = _endpoint_path.split("/")[-1]
+            entry = self.statements[statement_id]
+            entry["polls"] += 1
+
+            if entry["polls"] < 2 or "SLOW" in entry["statement"]:
+                return {"statement_id": statement_id, "status": {"state": "RUNNING"}}
+            elif "FAIL" in entry["statement"]:
+                return {"statement_id": statement_id, "status": {"state": "FAILED", "error": {"message": "Some failure"}}}
+            else:
+                return {"statement_id": statement_id, "status": {"state": "SUCCEEDED"}}
+
+    @staticmethod
+    def assertions(data: Dict[str, Any]) -> None:
+        assert data.get("on_wait_timeout") == "CONTINUE", data
+        assert data.get("wait_timeout") == "0s", data
+
+
+class FakeSpark:
+    """Records each statement, failing those that mention FAIL, and waits on a barrier for those that mention WAIT."""
+
+    def __init__(self, parties: int = 1):
+        self.lock = threading.Lock()
+        self.barrier = threading.Barrier(parties, timeout=5)
+        self.executed: List[str] = list()
+
+    def sql(self, statement: str) -> None:
+        with self.lock:
+            self.executed.append(statement)
+
+        if "WAIT" in statement:
+            self.barrier.wait()
+        if "FAIL" in statement:
+            raise ValueError(f"Failed {statement}")
+
+
+class DdlExecutorTests(unittest.TestCase):
+
+    def test_spark(self):
+        spark = FakeSpark()
+        executor = SparkDdlExecutor(chunk_size=2, spark=spark)
+
+        groups = {f"user-{i}": [f"DROP DATABASE db_{i} CASCADE;", f"CREATE DATABASE db_{i};"] for i in range(5)}
+        groups["user-3"] = ["DROP DATABASE FAIL;", "CREATE DATABASE db_3;"]
+
+        results = executor.execute(groups)
+
+        self.assertEqual(list(groups), list(results))
+        self.assertEqual(["SUCCEEDED", "SUCCEEDED"], [r.state for r in results["user-0"]])
+        self.assertEqual(["FAILED", "SKIPPED"], [r.state for r in results["user-3"]])
+        self.assertEqual("Failed DROP DATABASE FAIL;", results["user-3"][0].error)
+
+        self.assertEqual(9, len(spark.executed))
+        self.assertNotIn("CREATE DATABASE db_3;", spark.executed)
+        self.assertLess(spark.executed.index("DROP DATABASE db_4 CASCADE;"), spark.executed.index("CREATE DATABASE db_4;"))
+
+    def test_spark_groups_are_concurrent(self):
+        # Every group of the chunk must be in flight at once for the barrier to release
+        spark = FakeSpark(parties=50)
+        executor = SparkDdlExecutor(spark=spark)
+
+        results = executor.execute({f"user-{i}": ["SELECT WAIT;", f"SELECT {i};"] for i in range(50)})
+
+        self.assertTrue(all(r.succeeded for group_results in results.values() for r in group_results))
+        self.assertEqual(100, len(spark.executed))
+
+    def test_create_databases_raises(self):
+        lesson_config = LessonConfig(name=None,
+                                     create_schema=True,
+                                     create_catalog=False,
+                                     requires_uc=False,
+                                     install_datasets=False,
+                                     enable_streaming_support=False,
+                                     enable_ml_support=False,
+                                     mocks=None)
+        lesson_config.lock_mutations(CourseConfig(course_code="test",
+                                                  course_name="Some Unit Test",
+                                                  data_source_version="v03",
+                                                  install_min_time="5 min",
+                                                  install_max_time="25 min",
+                                                  supported_dbrs=["version-1"],
+                                                  expected_dbrs="version-1"))
+
+        client = FakeStatementsClient()
+        workspace_helper = WorkspaceHelper(client)
+        workspace_helper._usernames = ["a@example.com", "FAIL@example.com", "b@example.com"]
+        existing_databases = PrefixIndex([])
+        created: List[str] = list()
+
+        stdout = sys.stdout
+        sys.stdout = io.StringIO()
+        try:
+            with mock.patch.dict(dbgems.MOCK_VALUES, {"workspace_id": "9876543210"}), \
+                    mock.patch.object(WorkspaceHelper, "existing_databases", new_callable=mock.PropertyMock, return_value=existing_databases):
+                with self.assertRaises(Exception) as context:
+                    # The failing user's LOCATION mentions FAIL
+                    DatabasesHelper(client, workspace_helper).create_databases(drop_existing=False,
+                                                                               lesson_config=lesson_config,
+                                                                               post_create=lambda username, _: created.append(username),
+                                                                               executor=SparkDdlExecutor(spark=FakeSpark()))
+        finally:
+            sys.stdout = stdout
+
+        self.assertEqual("Failed to create the schema for 1 of 3 users: ['FAIL@example.com']", str(context.exception))
+
+        # The other users' schemas were still created
+        self.assertEqual(["a@example.com", "b@example.com"], sorted(created))
+        self.assertEqual(2, len(existing_databases))
+
+    @mock.patch("time.sleep")
+    def test_execute_statements(self, _sleep):
+        stdout = sys.stdout
+        sys.stdout = io.StringIO()
+        try:
+            client = FakeStatementsClient()
+            helper = WarehousesHelper(client, WorkspaceHelper(client))
+
+            # Like the loop it replaced, every statement is executed, one after the other
+            results = helper.execute_statements("1234", ["SELECT 1;", "SELECT FAIL;", "SELECT 2;"])
+            self.assertEqual(["SUCCEEDED", "FAILED", "SUCCEEDED"], [r[0].state for r in results.values()])
+            self.assertEqual(["SELECT 1;", "SELECT FAIL;", "SELECT 2;"], client.executed)
+
+            results = helper.execute_statements("1234", ["SELECT FAIL;", "SELECT 3;"], stop_on_failure=True)
+            self.assertEqual(["FAILED", "SKIPPED"], [r.state for r in results["statements"]])
+            self.assertNotIn("SELECT 3;", client.executed)
+        finally:
+            sys.stdout = stdout
+
+    def test_statements_api(self):
+        client = FakeStatementsClient()
+        executor = StatementsApiDdlExecutor(client=client, warehouse_id="1234", chunk_size=200, poll_seconds=0)
+
+        groups = {f"user-{i:03d}": [f"DROP DATABASE db_{i:03d} CASCADE;", f"CREATE DATABASE db_{i:03d};"] for i in range(500)}
+        groups["user-007"] = ["DROP DATABASE FAIL;", "CREATE DATABASE db_007;"]
+        groups["user-008"] = ["CREATE DATABASE db_008;"]
+
+        results = executor.execute(groups)
+
+        self.assertEqual(list(groups), list(results))
+        self.assertEqual(["SUCCEEDED", "SUCCEEDED"], [r.state for r in results["user-000"]])
+        self.assertEqual(["FAILED", "SKIPPED"], [r.state for r in results["user-007"]])
+        self.assertEqual("Some failure", results["user-007"][0].error)
+        self.assertEqual(["SUCCEEDED"], [r.state for r in results["user-008"]])
+
+        self.assertEqual(998, len(client.executed))
+        self.assertNotIn("CREATE DATABASE db_007;", client.executed)
+
+        # Each group's statements are executed in order
+        self.assertLess(client.executed.index("DROP DATABASE db_042 CASCADE;"), client.executed.index("CREATE DATABASE db_042;"))
+
+        # Each statement took one submission and two polls, all statements of a chunk being polled together
+        self.assertEqual(998 * 3, client.requests)
+
+    def test_timeout(self):
+        client = FakeStatementsClient()
+        executor = StatementsApiDdlExecutor(client=client, warehouse_id="1234", poll_seconds=0.01, timeout_seconds=0.05)
+
+        results = executor.execute({"a": ["SELECT SLOW;", "SELECT 1;"], "b": ["SELECT 2;"]})
+
+        self.assertEqual(["FAILED", "SKIPPED"], [r.state for r in results["a"]])
+        self.assertEqual(["SUCCEEDED"], [r.state for r in results["b"]])
+        self.assertEqual(["stmt-0"], client.cancelled)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+__all__ = ["PrefixIndexTests"]
+
+import unittest
+from dbacademy.dbhelper.supporting.prefix_index import PrefixIndex
+
+
+class PrefixIndexTests(unittest.TestCase):
+
+    def test_prefixes(self):
+        index = PrefixIndex(["jdoe_abc_ex", "jdoe_abc_ex_lesson_1", "jdoe_xyz_ex", "default", "jdoe_abc_ex"])
+
+        self.assertEqual(4, len(index))
+        self.assertEqual(["default", "jdoe_abc_ex", "jdoe_abc_ex_lesson_1", "jdoe_xyz_ex"], list(index))
+
+        self.assertTrue(index.has_prefix("jdoe_abc"))
+        self.assertTrue(index.has_prefix("jdoe_xyz_ex"))
+        self.assertFalse(index.has_prefix("jdoe_abc_ex_lesson_2"))
+        self.assertFalse(index.has_prefix("zed"))
+
+        self.assertEqual(["jdoe_abc_ex", "jdoe_abc_ex_lesson_1"], index.starting_with("jdoe_abc_ex"))
+        self.assertEqual([], index.starting_with("mary"))
+
+    def test_updates(self):
+        index = PrefixIndex()
+        self.assertFalse(index.has_prefix(""))
+
+        index.add("mary_abc_ex")
+        index.add("jdoe_abc_ex")
+        index.add("mary_abc_ex")
+
+        self.assertIn("mary_abc_ex", index)
+        self.assertEqual(["jdoe_abc_ex", "mary_abc_ex"], list(index))
+
+        index.discard("mary_abc_ex")
+        index.discard("unknown")
+
+        self.assertNotIn("mary_abc_ex", index)
+        self.assertFalse(index.has_prefix("mary"))
+        self.assertEqual(["jdoe_abc_ex"], list(index))
+
+    def test_same_as_scanning(self):
+        prefixes = [f"user_{i:04d}_abc_ex" for i in range(2000)]
+        schemas = [f"{p}_lesson_{j}" for p in prefixes[::2] for j in range(3)]
+
+        expected = [p for p in prefixes if not any(s.startswith(p) for s in schemas)]
+
+        index = PrefixIndex(schemas)
+        actual = [p for p in prefixes if not index.has_prefix(p)]
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(1000, len(actual))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+__all__ = ["TeardownExecutorTests"]
+
+import threading
+import unittest
+from dbacademy.dbhelper.supporting.teardown_executor import TeardownExecutor
+
+
+class TeardownExecutorTests(unittest.TestCase):
+
+    def test_map(self):
+        started = threading.Barrier(4, timeout=5)
+        completed = list()
+
+        def drop(name: str) -> str:
+            started.wait()  # Fails unless the four steps are executed at the same time
+            if name == "b":
+                raise ValueError("Cannot drop b")
+            completed.append(name)
+            return name.upper()
+
+        executor = TeardownExecutor(max_workers=4)
+        with self.assertRaises(ValueError):
+            executor.map(drop, ["a", "b", "c", "d"])
+
+        # Every other step completed regardless of the failure
+        self.assertEqual(["a", "c", "d"], sorted(completed))
+
+        self.assertEqual(["A"], TeardownExecutor(max_workers=1).map(str.upper, ["a"]))
+        self.assertEqual([1, 2], TeardownExecutor().run(lambda: 1, lambda: 2))
+        self.assertEqual([], TeardownExecutor().map(str.upper, []))
+
+    def test_wait_until(self):
+        from unittest import mock
+
+        checks = list()
+
+        def condition() -> bool:
+            checks.append(len(checks))
+            return len(checks) == 4
+
+        with mock.patch("time.sleep") as sleep:
+            TeardownExecutor.wait_until(condition, min_interval=0.01, max_interval=0.03, backoff=2)
+
+        # Checked immediately, then after 0.01, 0.02 and 0.03 seconds
+        self.assertEqual(4, len(checks))
+        self.assertEqual([0.01, 0.02, 0.03], [c.args[0] for c in sleep.call_args_list])
+
+    def test_wait_until_timeout(self):
+        from unittest import mock
+
+        clock = [0.0]
+
+        def sleep(seconds: float) -> None:
+            clock[0] += seconds
+
+        with mock.patch("time.monotonic", lambda: clock[0]), mock.patch("time.sleep", sleep):
+            with self.assertRaises(TimeoutError):
+                TeardownExecutor.wait_until(lambda: False, timeout=0.1, min_interval=0.01)
+
+        # The last interval is shortened so that the timeout is not overshot
+        self.assertAlmostEqual(0.1, clock[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
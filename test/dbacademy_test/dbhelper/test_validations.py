@@ -0,0 +1,174 @@
+__all__ = ["ValidationSuiteTests"]
+
+import shutil
+import time
+import threading
+import unittest
+from typing import Any, List, Tuple
+from dbacademy.dbhelper.validations import ValidationSuite
+
+
+class FakeDataFrame:
+    """The subset of a DataFrame's API DataFrameComparison uses when the row order is not compared, over a list of tuples."""
+
+    def __init__(self, columns: List[Tuple[str, Any]], rows: List[tuple]):
+        self.__columns = columns
+        self.rows = rows
+        self.collected = 0
+
+    @property
+    def schema(self):
+        from pyspark.sql.types import StructType, StructField
+
+        return StructType([StructField(name, data_type) for name, data_type in self.__columns])
+
+    @property
+    def columns(self) -> List[str]:
+        return [name for name, _ in self.__columns]
+
+    def count(self) -> int:
+        return len(self.rows)
+
+    def select(self, *columns: str) -> "FakeDataFrame":
+        positions = [self.columns.index(c) for c in columns]
+        return FakeDataFrame([self.__columns[i] for i in positions], [tuple(r[i] for i in positions) for r in self.rows])
+
+    def exceptAll(self, other: "FakeDataFrame") -> "FakeDataFrame":
+        remaining = list(other.rows)
+        rows = list()
+        for row in self.rows:
+            if row in remaining:
+                remaining.remove(row)
+            else:
+                rows.append(row)
+        return FakeDataFrame(self.__columns, rows)
+
+    def limit(self, num: int) -> "FakeDataFrame":
+        return FakeDataFrame(self.__columns, self.rows[:num])
+
+    def collect(self) -> List[tuple]:
+        return list(self.rows)
+
+
+class ValidationSuiteTests(unittest.TestCase):
+
+    def test_compare_lists(self):
+        self.assertTrue(ValidationSuite.compare_lists(None, None, test_column_order=False))
+        self.assertFalse(ValidationSuite.compare_lists(["a"], None, test_column_order=False))
+
+        self.assertTrue(ValidationSuite.compare_lists(["a", "b"], ["a", "b"], test_column_order=True))
+        self.assertFalse(ValidationSuite.compare_lists(["a", "b"], ["b", "a"], test_column_order=True))
+        self.assertTrue(ValidationSuite.compare_lists(["a", "b"], ["b", "a"], test_column_order=False))
+
+        # Duplicates must be matched the same number of times
+        self.assertFalse(ValidationSuite.compare_lists(["a", "a", "b"], ["a", "b", "b"], test_column_order=False))
+        self.assertTrue(ValidationSuite.compare_lists(["a", "b", "a"], ["a", "a", "b"], test_column_order=False))
+
+        # Unhashable values
+        self.assertTrue(ValidationSuite.compare_lists([{"a": 1}, {"b": 2}], [{"b": 2}, {"a": 1}], test_column_order=False))
+        self.assertFalse(ValidationSuite.compare_lists([{"a": 1}, {"a": 1}], [{"a": 1}, {"b": 2}], test_column_order=False))
+
+    def test_compare_long_lists(self):
+        value_a = [f"column_{i}" for i in range(50000)]
+        value_b = list(reversed(value_a))
+
+        self.assertTrue(ValidationSuite.compare_lists(value_a, value_b, test_column_order=False))
+        self.assertFalse(ValidationSuite.compare_lists(value_a, value_b, test_column_order=True))
+        self.assertFalse(ValidationSuite.compare_lists(value_a, value_b[:-1] + ["column_x"], test_column_order=False))
+
+    def test_run_tests(self):
+        started = threading.Barrier(3, timeout=5)
+
+        def concurrent_check(value: bool):
+            started.wait()  # Fails unless the three independent tests are evaluated at the same time
+            return value
+
+        suite = ValidationSuite("Suite", max_workers=4)
+        suite.test_true(lambda: concurrent_check(True), "A", test_case_id="a", depends_on=[])
+        suite.test_true(lambda: concurrent_check(False), "B", test_case_id="b", depends_on=[])
+        suite.test_true(lambda: concurrent_check(True), "C", test_case_id="c", depends_on=[])
+        suite.test_true(lambda: True, "D", test_case_id="d", depends_on=["Suite-a", "Suite-c"])
+        suite.test_true(lambda: True, "E", test_case_id="e", depends_on=["Suite-b"])
+        suite.test_true(lambda: True, "F", test_case_id="f")  # Depends on "e", the last test
+        suite.test_true(lambda: True, "G", test_case_id="g", depends_on=["Suite-h", "unknown"])  # Only earlier tests are depended on
+        suite.test_true(lambda: True, "H", test_case_id="h", depends_on=[])
+
+        results = suite.run_tests()
+
+        self.assertEqual(["A", "B", "C", "D", "E", "F", "G", "H"], [r.test.description for r in results])
+        self.assertEqual(["passed", "failed", "passed", "passed", "skipped", "skipped", "passed", "passed"], [r.status for r in results])
+        self.assertEqual(0, results[4].seconds)
+        self.assertGreater(results[0].seconds, 0)
+
+    def test_run_tests_timeout(self):
+        suite = ValidationSuite("Timeouts", timeout_seconds=0.1)
+        suite.test_true(lambda: time.sleep(2) or True, "Slow", test_case_id="slow", depends_on=[])
+        suite.test_true(lambda: True, "Fast", test_case_id="fast", depends_on=[])
+        suite.test_true(lambda: True, "Dependent", test_case_id="dependent", depends_on=["Timeouts-slow"])
+
+        results = suite.run_tests()
+
+        self.assertEqual(["failed", "passed", "skipped"], [r.status for r in results])
+        self.assertEqual("The test did not complete within 0.1 seconds.", results[0].message)
+
+    def test_run_tests_long_chain(self):
+        suite = ValidationSuite("Chain", max_workers=1)
+        suite.test_true(lambda: False, "Fails", test_case_id="0")
+        for i in range(1, 2000):
+            suite.test_true(lambda: True, f"Depends on {i - 1}", test_case_id=str(i))  # Depends on the previous test by default
+
+        results = suite.run_tests()
+
+        self.assertEqual(["failed"] + ["skipped"] * 1999, [r.status for r in results])
+
+    def test_diff_fake_data_frames(self):
+        from pyspark.sql.types import IntegerType, StringType
+
+        df_a = FakeDataFrame([("id", IntegerType()), ("name", StringType())], [(1, "a"), (2, "b"), (2, "b")])
+        df_b = FakeDataFrame([("name", StringType()), ("id", IntegerType())], [("b", 2), ("a", 1), ("b", 2)])
+        df_c = FakeDataFrame([("id", IntegerType()), ("name", StringType())], [(1, "a"), (2, "b"), (3, "c")])
+
+        self.assertTrue(ValidationSuite.compare_data_frames(df_a, df_b, test_row_order=False))
+        self.assertEqual("count", ValidationSuite.diff_data_frames(df_a, df_a.limit(2), test_row_order=False).reason)
+        self.assertEqual("schema", ValidationSuite.diff_data_frames(df_a, df_a.select("id"), test_row_order=False).reason)
+
+        comparison = ValidationSuite.diff_data_frames(df_a, df_c, test_row_order=False)
+        self.assertEqual("rows", comparison.reason)
+        self.assertEqual([(2, "b")], comparison.only_in_a)
+        self.assertEqual([(3, "c")], comparison.only_in_b)
+
+        # Not sampling any rows does not make the DataFrames equal
+        comparison = ValidationSuite.diff_data_frames(df_a, df_c, test_row_order=False, sample_size=0)
+        self.assertFalse(comparison)
+        self.assertEqual("rows", comparison.reason)
+        self.assertEqual([], comparison.only_in_a)
+        self.assertEqual([], comparison.only_in_b)
+
+    @unittest.skipIf(shutil.which("java") is None, "Spark requires Java")
+    def test_diff_data_frames(self):
+        from pyspark.sql import SparkSession
+
+        spark = SparkSession.builder.master("local[2]").getOrCreate()
+
+        df_a = spark.createDataFrame([(1, "a"), (2, "b"), (2, "b")], "id int, name string")
+        df_b = spark.createDataFrame([("b", 2), ("a", 1), ("b", 2)], "name string, id int")
+
+        self.assertFalse(ValidationSuite.compare_data_frames(df_a, df_b))
+        self.assertTrue(ValidationSuite.compare_data_frames(df_a, df_b, test_row_order=False))
+        self.assertTrue(ValidationSuite.compare_data_frames(df_a, df_a))
+
+        self.assertEqual("count", ValidationSuite.diff_data_frames(df_a, df_a.limit(2)).reason)
+        self.assertEqual("schema", ValidationSuite.diff_data_frames(df_a, df_a.select("id")).reason)
+
+        df_c = spark.createDataFrame([(1, "a"), (2, "b"), (3, "c")], "id int, name string")
+        comparison = ValidationSuite.diff_data_frames(df_a, df_c, test_row_order=False)
+
+        self.assertFalse(comparison)
+        self.assertEqual("rows", comparison.reason)
+        self.assertEqual([(2, "b")], [tuple(r) for r in comparison.only_in_a])
+        self.assertEqual([(3, "c")], [tuple(r) for r in comparison.only_in_b])
+        self.assertFalse(ValidationSuite.diff_data_frames(df_a, df_c, test_row_order=False, sample_size=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+__all__ = ["WorkspaceHelperTests"]
+
+import base64
+import hashlib
+import threading
+import unittest
+from typing import Any, Dict, List, Optional
+from dbacademy.clients import dbrest, ClientErrorHandler
+from dbacademy.dbhelper.supporting.courseware_cache import CoursewareCache
+from dbacademy.dbhelper.supporting.workspace_helper import WorkspaceHelper
+
+DBC_CONTENT = b"Some DBC's content" * 1000
+
+
+class FakeWorkspaceClient(dbrest.DBAcademyRestClient):
+    """Records the workspace's list, delete and import requests, failing the first import of the specified paths."""
+
+    def __init__(self, existing_paths: List[str] = None, flaky_paths: List[str] = None):
+        super().__init__(token="unused",
+                         endpoint="https://example.cloud.databricks.com",
+                         username=None,
+                         password=None,
+                         authorization_header=None,
+                         client=None,
+                         verbose=False,
+                         throttle_seconds=0,
+                         error_handler=ClientErrorHandler())
+
+        self.lock = threading.Lock()
+        self.existing_paths = set(existing_paths or list())
+        self.flaky_paths = set(flaky_paths or list())
+        self.imports: Dict[str, str] = dict()
+        self.deletes: List[str] = list()
+
+    def api(self, _http_method: str, _endpoint_path: str, _data: Optional[Dict[str, Any]] = None, **data: Any) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            if _endpoint_path.endswith("/workspace/list"):
+                path = data.get("path")
+                return {"objects": [{"path": f"{path}/Notebook"}]} if path in self.existing_paths else None
+
+            elif _endpoint_path.endswith("/workspace/delete"):
+                self.deletes.append(_data.get("path"))
+
+            elif _endpoint_path.endswith("/workspace/import"):
+                path = _data.get("path")
+                if path in self.flaky_paths:
+                    self.flaky_paths.remove(path)
+                    raise ConnectionError(f"Failed to import {path}")
+                self.imports[path] = _data.get("content")
+
+            return dict()
+
+
+class WorkspaceHelperTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.downloads: List[str] = list()
+
+    def download(self, url: str) -> bytes:
+        self.downloads.append(url)
+        return DBC_CONTENT
+
+    def test_install_courseware(self):
+        usernames = [f"user-{i:02d}@example.com" for i in range(20)]
+        client = FakeWorkspaceClient(existing_paths=["/Users/user-03@example.com/courses/example-course"],
+                                     flaky_paths=["/Users/user-07@example.com/courses/other-course"])
+        cache = CoursewareCache(download=self.download)
+
+        WorkspaceHelper(client).install_courseware("course=example-course&token=abc,course=other-course&token=abc",
+                                                   "courses",
+                                                   usernames,
+                                                   max_workers=4,
+                                                   retry_delay_seconds=0,
+                                                   cache=cache)
+
+        # Each course was downloaded, and its content encoded, exactly once
+        self.assertEqual(2, len(self.downloads))
+        self.assertEqual(39, len(client.imports))
+        self.assertEqual({base64.b64encode(DBC_CONTENT).decode("utf-8")}, set(client.imports.values()))
+        self.assertEqual(1, len({id(c) for c in client.imports.values()}))
+
+        self.assertNotIn("/Users/user-03@example.com/courses/example-course", client.imports)
+        self.assertIn("/Users/user-07@example.com/courses/other-course", client.imports)
+
+        # Both URLs served the same content, which is cached once under its digest
+        self.assertEqual(hashlib.sha256(DBC_CONTENT).hexdigest(), cache.digest_of(self.downloads[0]))
+        self.assertEqual(cache.digest_of(self.downloads[0]), cache.digest_of(self.downloads[1]))
+        self.assertIsNone(cache.digest_of("https://example.com/unknown.dbc"))
+
+    def test_install_courseware_failure(self):
+        client = FakeWorkspaceClient(flaky_paths=["/Users/user-01@example.com/example-course"])
+
+        # Without retries, the failing user is reported once every other user was installed
+        self.assertRaises(Exception, lambda: WorkspaceHelper(client).install_courseware("course=example-course&token=abc",
+                                                                                        None,
+                                                                                        ["user-00@example.com", "user-01@example.com", "user-02@example.com"],
+                                                                                        retries=0,
+                                                                                        cache=CoursewareCache(download=self.download)))
+
+        self.assertEqual(["/Users/user-00@example.com/example-course", "/Users/user-02@example.com/example-course"], sorted(client.imports))
+
+    def test_uninstall_courseware(self):
+        usernames = [f"user-{i:02d}@example.com" for i in range(10)]
+        client = FakeWorkspaceClient()
+
+        WorkspaceHelper(client).uninstall_courseware("course=example-course&token=abc", "courses", usernames, max_workers=3)
+
+        self.assertEqual(sorted(f"/Users/{u}/courses/example-course" for u in usernames), sorted(client.deletes))
+
+
+if __name__ == '__main__':
+    unittest.main()